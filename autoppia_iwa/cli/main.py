@@ -10,6 +10,7 @@ COMMAND_HELP = {
     "benchmark": "Run benchmark against a web agent",
     "generate-tasks": "Generate tasks to JSON",
     "verify": "Run web verification pipeline",
+    "replay": "Re-score recorded episodes offline",
     "debug": "Launch debugger UI for trace inspection",
 }
 
@@ -23,6 +24,8 @@ def _resolve_command(command: str) -> Callable[[], None]:
         from autoppia_iwa.entrypoints.generate_tasks.run import main as cmd
     elif command == "verify":
         from autoppia_iwa.entrypoints.web_verification.run import main as cmd
+    elif command == "replay":
+        from autoppia_iwa.entrypoints.replay.run import main as cmd
     elif command == "debug":
         from modules.debugger.server import main as cmd
     else:
@@ -16,6 +16,20 @@ def _env_bool(key: str, default: str = "false") -> bool:
 LLM_PROVIDER = os.getenv("LLM_PROVIDER", "openai")  # Can be "openai" or "chutes"
 LLM_THRESHOLD = int(os.getenv("LLM_THRESHOLD", 100))
 LLM_CONTEXT_WINDOW = int(os.getenv("LLM_CONTEXT_WINDOW", 10000))
+# Shared across providers; 0 disables the limit
+LLM_REQUESTS_PER_MINUTE = float(os.getenv("LLM_REQUESTS_PER_MINUTE", 0))
+LLM_TOKENS_PER_MINUTE = float(os.getenv("LLM_TOKENS_PER_MINUTE", 0))
+# Concurrent LLM calls while generating tasks
+TASK_GENERATION_MAX_CONCURRENCY = int(os.getenv("TASK_GENERATION_MAX_CONCURRENCY", 8))
+# Shared HTTP connection pools (LLM providers and remote agents)
+HTTP_POOL_MAX_CONNECTIONS = int(os.getenv("HTTP_POOL_MAX_CONNECTIONS", 100))
+HTTP_POOL_MAX_KEEPALIVE = int(os.getenv("HTTP_POOL_MAX_KEEPALIVE", 20))
+HTTP_POOL_KEEPALIVE_EXPIRY_S = float(os.getenv("HTTP_POOL_KEEPALIVE_EXPIRY_S", 30))
+HTTP_POOL_HTTP2 = _env_bool("HTTP_POOL_HTTP2")  # needs the optional "h2" package
+# Disk-backed LLM response cache: off | write_through | read_only | refresh | offline
+LLM_CACHE_MODE = os.getenv("LLM_CACHE_MODE", "off").strip().lower()
+LLM_CACHE_TTL_S = float(os.getenv("LLM_CACHE_TTL_S", 0))  # 0 keeps entries forever
+LLM_CACHE_MAX_BYTES = int(os.getenv("LLM_CACHE_MAX_BYTES", 512 * 1024 * 1024))  # 0 disables the cap
 
 # OpenAI Configuration
 OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
@@ -51,6 +65,17 @@ PROJECT_BASE_DIR = Path(__file__).resolve().parents[1]
 DEMO_WEBS_ENDPOINT = os.getenv("DEMO_WEBS_ENDPOINT", "http://localhost").strip("/")
 DEMO_WEBS_STARTING_PORT = int(os.getenv("DEMO_WEBS_STARTING_PORT", "8000"))
 DEMO_WEB_SERVICE_PORT = int(os.getenv("DEMO_WEB_SERVICE_PORT", "8090"))
+# /datasets/load cache: in-memory byte budget and on-disk store (empty dir disables disk)
+DATASET_CACHE_MAX_BYTES = int(os.getenv("DATASET_CACHE_MAX_BYTES", 64 * 1024 * 1024))
+# Persistent caches live in the user cache dir, outside the source tree
+IWA_CACHE_DIR = os.getenv("IWA_CACHE_DIR") or str(Path(os.getenv("XDG_CACHE_HOME") or Path.home() / ".cache") / "autoppia_iwa")
+DATASET_CACHE_DIR = os.getenv("DATASET_CACHE_DIR", str(Path(IWA_CACHE_DIR) / "datasets"))
+# Byte budget of the on-disk dataset store; least recently used files are evicted (0 = unbounded)
+DATASET_CACHE_DISK_MAX_BYTES = int(os.getenv("DATASET_CACHE_DISK_MAX_BYTES", 512 * 1024 * 1024))
+LLM_CACHE_PATH = os.getenv("LLM_CACHE_PATH", str(Path(IWA_CACHE_DIR) / "llm" / "responses.sqlite3"))
+# judge_tests_usage_logs.jsonl rotation (0 = never rotate) and number of rotated files kept
+JUDGE_USAGE_LOG_MAX_BYTES = int(os.getenv("JUDGE_USAGE_LOG_MAX_BYTES", 0))
+JUDGE_USAGE_LOG_BACKUPS = int(os.getenv("JUDGE_USAGE_LOG_BACKUPS", 3))
 
 # ============================
 # Agent Configurations
@@ -26,6 +26,7 @@ from autoppia_iwa.src.evaluation.classes import EvaluationResult, EvaluationStat
 from autoppia_iwa.src.evaluation.concurrent_evaluator import ConcurrentEvaluator
 from autoppia_iwa.src.evaluation.legacy.concurrent_config import EvaluatorConfig
 from autoppia_iwa.src.evaluation.stateful_evaluator import AsyncStatefulEvaluator, BrowserSnapshot, StepResult
+from autoppia_iwa.src.llms.http_client import aclose_llm_clients
 from autoppia_iwa.src.shared.visualizator import SubnetVisualizer
 from autoppia_iwa.src.web_agents.act_response_utils import actions_to_act_response
 from autoppia_iwa.src.web_agents.classes import IWebAgent, TaskSolution, sanitize_snapshot_html
@@ -934,9 +935,9 @@ class Benchmark:
         projects_to_run: list[WebProject] = []
         if getattr(self.config, "tasks_json_path", None):
             from autoppia_iwa.entrypoints.benchmark.utils.task_generation import load_tasks_from_custom_json
-            from autoppia_iwa.src.demo_webs.config import demo_web_projects
+            from autoppia_iwa.src.demo_webs.config import demo_web_projects, index_projects_by_id
 
-            projects_by_id = {p.id: p for p in self.config.projects} if self.config.projects else {p.id: p for p in demo_web_projects}
+            projects_by_id = index_projects_by_id(self.config.projects or demo_web_projects)
             if not projects_by_id:
                 raise RuntimeError("No projects available to resolve project_id from tasks file. Configure PROJECT_IDS or add demo_web_projects.")
             try:
@@ -991,6 +992,12 @@ class Benchmark:
             # Close it explicitly to avoid "Unclosed client session" warnings.
             with contextlib.suppress(Exception):
                 await close_async_session()
+            # Agents and LLM providers keep pooled keep-alive connections between calls.
+            for agent in self.config.agents:
+                with contextlib.suppress(Exception):
+                    await agent.aclose()
+            with contextlib.suppress(Exception):
+                await aclose_llm_clients()
 
         # Save consolidated results to a single file
         saved_path: Path | None = None
@@ -25,7 +25,7 @@ from autoppia_iwa.entrypoints.benchmark.benchmark import Benchmark
 from autoppia_iwa.entrypoints.benchmark.config import BenchmarkConfig
 from autoppia_iwa.entrypoints.benchmark.utils.logging import setup_logging
 from autoppia_iwa.entrypoints.benchmark.utils.task_generation import get_projects_by_ids
-from autoppia_iwa.src.demo_webs.config import demo_web_projects
+from autoppia_iwa.src.demo_webs.config import demo_web_projects, index_projects_by_id
 from autoppia_iwa.src.web_agents import ApifiedWebAgent
 from autoppia_iwa.src.web_agents.examples.random_clicker.agent import RandomClickerWebAgent
 
@@ -133,8 +133,7 @@ def _build_agent(agent: str):
 def _materialize_smoke_tasks_json() -> Path:
     """Create an env-specific smoke tasks file from the bundled fixture."""
     template = json.loads(SMOKE_TASKS_TEMPLATE.read_text(encoding="utf-8"))
-    projects_by_id = {project.id: project for project in demo_web_projects}
-    autocinema = projects_by_id["autocinema"]
+    autocinema = index_projects_by_id(demo_web_projects)["autocinema"]
 
     for task in template.get("tasks", []):
         task["url"] = autocinema.frontend_url
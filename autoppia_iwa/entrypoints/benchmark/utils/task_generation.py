@@ -2,6 +2,7 @@
 
 import asyncio
 import json
+from collections.abc import Mapping
 from datetime import datetime
 from pathlib import Path
 
@@ -10,6 +11,7 @@ from loguru import logger
 from autoppia_iwa.src.data_generation.tasks.classes import Task, TaskGenerationConfig
 from autoppia_iwa.src.data_generation.tasks.pipeline import TaskGenerationPipeline
 from autoppia_iwa.src.demo_webs.classes import WebProject
+from autoppia_iwa.src.demo_webs.config import index_projects_by_id
 
 
 def get_cache_filename(project: WebProject, task_cache_dir: str) -> Path:
@@ -84,7 +86,7 @@ def filter_tasks_by_use_cases(
 
 def load_tasks_from_custom_json(
     tasks_json_path: Path | str,
-    projects_by_id: dict[str, WebProject],
+    projects_by_id: Mapping[str, WebProject],
 ) -> tuple[WebProject, list[Task]]:
     """
     Load tasks from a custom JSON file. Same shape as cache: project_id, project_name, tasks.
@@ -204,7 +206,7 @@ def get_projects_by_ids(all_projects: list[WebProject], ids_to_run: list[str]) -
         logger.warning("No project IDs specified in ids_to_run")
         return []
 
-    projects_by_id = {p.id: p for p in all_projects}
+    projects_by_id = index_projects_by_id(all_projects)
     missing_ids = [pid for pid in ids_to_run if pid not in projects_by_id]
     if missing_ids:
         available_ids = list(projects_by_id.keys())
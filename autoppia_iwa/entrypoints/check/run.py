@@ -44,10 +44,10 @@ async def run(project_id: str | None = None):
 
     init_env()
     from autoppia_iwa.config.config import DEMO_WEB_SERVICE_PORT, DEMO_WEBS_ENDPOINT, DEMO_WEBS_STARTING_PORT
-    from autoppia_iwa.src.demo_webs.config import demo_web_projects
+    from autoppia_iwa.src.demo_webs.config import demo_web_projects, index_projects_by_id
 
     if project_id:
-        by_id = {p.id: p for p in demo_web_projects}
+        by_id = index_projects_by_id(demo_web_projects)
         if project_id not in by_id:
             raise ValueError(f"Unknown project: {project_id}. Available: {list(by_id.keys())}")
         projects = [by_id[project_id]]
@@ -0,0 +1,47 @@
+"""
+Re-score recorded evaluation episodes offline and report verdicts that changed.
+
+Episodes are recorded by the concurrent evaluator when
+``EvaluatorConfig.replay_recording_path`` is set.
+
+Usage:
+    python -m autoppia_iwa.entrypoints.replay.run recordings/
+    python -m autoppia_iwa.entrypoints.replay.run recordings/run.jsonl.gz --fail-on-diff
+    iwa replay recordings/
+"""
+
+import argparse
+import asyncio
+from pathlib import Path
+
+
+def _parse_args():
+    parser = argparse.ArgumentParser(prog="iwa replay", description="Replay recorded episodes against the current tests")
+    parser.add_argument("paths", nargs="+", type=Path, help="Recording files (.jsonl.gz) or directories containing them")
+    parser.add_argument("--fail-on-diff", action="store_true", help="Exit with status 1 if any verdict changed")
+    return parser.parse_args()
+
+
+async def run(paths: list[Path]):
+    from autoppia_iwa.src.evaluation.shared.replay import replay_recordings
+
+    missing = [str(path) for path in paths if not path.exists()]
+    if missing:
+        raise ValueError(f"Recording path(s) not found: {', '.join(missing)}")
+    return await replay_recordings(paths)
+
+
+def main():
+    args = _parse_args()
+
+    try:
+        report = asyncio.run(run(args.paths))
+    except ValueError as exc:
+        print(str(exc))
+        raise SystemExit(1) from exc
+    print(report.summary())
+    raise SystemExit(1 if args.fail_on_diff and report.changed else 0)
+
+
+if __name__ == "__main__":
+    main()
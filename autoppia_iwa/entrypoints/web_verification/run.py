@@ -65,6 +65,10 @@ def _parse_args():
         default=1,
         help="Seed value used to select data-extraction trajectories (default: 1)",
     )
+    parser.add_argument("--use-case-concurrency", type=int, default=3, help="Use cases verified at once; output stays in order (default: 3, 1 = sequential)")
+    parser.add_argument("--event-trajectory-concurrency", type=int, default=4, help="Event trajectories replayed at once in one shared browser (default: 4)")
+    parser.add_argument("--seed-concurrency", type=int, default=3, help="Seeds verified at once per task; output stays in order (default: 3, 1 = sequential)")
+    parser.add_argument("--llm-concurrency", type=int, default=4, help="Task generation / LLM review calls in flight at once (default: 4)")
     parser.add_argument("--verbose", "-v", action="store_true")
     return parser.parse_args()
 
@@ -89,6 +93,10 @@ async def run(
     no_event_trajectory_verification: bool = False,
     no_data_extraction_verification: bool = False,
     data_extraction_seed: int = 1,
+    use_case_concurrency: int = 3,
+    seed_concurrency: int = 3,
+    event_trajectory_concurrency: int = 4,
+    llm_concurrency: int = 4,
 ):
     from autoppia_iwa.entrypoints.benchmark.utils.task_generation import get_projects_by_ids
     from autoppia_iwa.src.bootstrap import AppBootstrap
@@ -121,6 +129,10 @@ async def run(
         event_trajectory_verification_enabled=not no_event_trajectory_verification,
         data_extraction_verification_enabled=not no_data_extraction_verification,
         data_extraction_seed=int(data_extraction_seed),
+        use_case_concurrency=use_case_concurrency,
+        seed_concurrency=seed_concurrency,
+        event_trajectory_concurrency=event_trajectory_concurrency,
+        llm_concurrency=llm_concurrency,
     )
 
     pipeline = WebVerificationPipeline(web_project=project, config=config)
@@ -155,6 +167,10 @@ async def _main_async(args) -> int:
             no_event_trajectory_verification=getattr(args, "no_event_trajectory_verification", False),
             no_data_extraction_verification=args.no_data_extraction_verification,
             data_extraction_seed=args.data_extraction_seed,
+            use_case_concurrency=getattr(args, "use_case_concurrency", 3),
+            seed_concurrency=getattr(args, "seed_concurrency", 3),
+            event_trajectory_concurrency=getattr(args, "event_trajectory_concurrency", 4),
+            llm_concurrency=getattr(args, "llm_concurrency", 4),
         )
     except ValueError as exc:
         print(str(exc))
@@ -5,7 +5,8 @@ import inspect
 import json
 import random
 import re
-from dataclasses import dataclass
+import types
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 from urllib.parse import parse_qs, urlencode, urlparse, urlunparse
@@ -13,6 +14,7 @@ from urllib.parse import parse_qs, urlencode, urlparse, urlunparse
 from dependency_injector.wiring import Provide
 from loguru import logger
 
+from autoppia_iwa.config.config import TASK_GENERATION_MAX_CONCURRENCY
 from autoppia_iwa.src.data_generation.tasks.classes import Task
 from autoppia_iwa.src.demo_webs.classes import UseCase, WebProject
 from autoppia_iwa.src.demo_webs.data_provider import get_seed_from_url
@@ -32,6 +34,52 @@ class ConstraintContext:
     seed: int
 
 
+@dataclass(slots=True)
+class _TaskDraft:
+    """A task waiting for (or holding) its LLM-generated prompt."""
+
+    use_case: UseCase
+    task_url: str
+    seed: int
+    dynamic: bool
+    dataset: Any
+    llm_prompt: str
+    prompt_list: list[str] = field(default_factory=list)
+
+
+class _RandomStream:
+    """A private ``random`` state for one use case's generation."""
+
+    def __init__(self, seed: int) -> None:
+        self.state = random.Random(seed).getstate()
+
+    @types.coroutine
+    def run(self, coro):
+        """
+        Await ``coro`` with this stream as the state of the ``random`` module.
+
+        Project helpers (constraints, replacements) draw from the module-level ``random``.
+        The stream is swapped in for each step of ``coro`` and swapped out again whenever it
+        suspends, so no other coroutine ever draws from (or advances) it, however the awaits
+        inside ``coro`` are scheduled.
+        """
+        value, error = None, None
+        while True:
+            outer_state = random.getstate()
+            random.setstate(self.state)
+            try:
+                yielded = coro.send(value) if error is None else coro.throw(error)
+            except StopIteration as stop:
+                return stop.value
+            finally:
+                self.state = random.getstate()
+                random.setstate(outer_state)
+            try:
+                value, error = (yield yielded), None
+            except BaseException as exc:
+                value, error = None, exc
+
+
 def _ensure_task_generation_level() -> None:
     """Ensure the TASK_GENERATION level exists when fallback logging is used."""
     try:
@@ -63,11 +111,15 @@ class SimpleTaskGenerator:
         llm_service: ILLM = Provide[DIContainer.llm_service],
         max_retries: int = 3,
         retry_delay: float = 0.1,
+        max_concurrency: int = TASK_GENERATION_MAX_CONCURRENCY,
     ):
         self.web_project = web_project
         self.llm_service = DIContainer.resolve_llm_service(llm_service)
         self.max_retries = max_retries
         self.retry_delay = retry_delay
+        self.max_concurrency = max(1, max_concurrency)
+        self._llm_semaphore: asyncio.Semaphore | None = None
+        self._llm_semaphore_loop: asyncio.AbstractEventLoop | None = None
         self._seed_cache: dict[str, int] = {}
         self._dataset_cache: dict[tuple, Any] = {}
 
@@ -123,7 +175,9 @@ class SimpleTaskGenerator:
                 return all_tasks
             _log_task_generation(f"Using {len(web_use_cases)} specified use cases: {[uc.name for uc in web_use_cases]}")
 
-        for use_case in web_use_cases:
+        # Use cases run concurrently; each draws from its own random stream, so the output
+        # does not depend on LLM latency or concurrency.
+        async def _generate_for(use_case: UseCase, random_seed: int) -> list[Task]:
             _log_task_generation(f"Generating tasks for use case: {use_case.name}", context="USE_CASE")
             try:
                 tasks_for_use_case = await self.generate_tasks_for_use_case(
@@ -131,18 +185,25 @@ class SimpleTaskGenerator:
                     number_of_prompts=prompts_per_use_case,
                     dynamic=dynamic,
                     test_types=test_types,
-                )
-                all_tasks.extend(tasks_for_use_case)
-                _log_task_generation(
-                    f"Generated {len(tasks_for_use_case)} tasks for use case '{use_case.name}' (requested {prompts_per_use_case})",
-                    context="USE_CASE",
+                    random_seed=random_seed,
                 )
             except Exception as e:
                 logger.error(f"Error generating tasks for {use_case.name}: {e!s}")
                 import traceback
 
                 traceback.print_exc()
-                continue
+                return []
+            _log_task_generation(
+                f"Generated {len(tasks_for_use_case)} tasks for use case '{use_case.name}' (requested {prompts_per_use_case})",
+                context="USE_CASE",
+            )
+            return tasks_for_use_case
+
+        # Stream seeds are drawn up front, in use-case order, before anything is awaited
+        random_seeds = [random.getrandbits(64) for _ in web_use_cases]
+        results = await asyncio.gather(*(_generate_for(use_case, random_seed) for use_case, random_seed in zip(web_use_cases, random_seeds, strict=True)))
+        for tasks_for_use_case in results:
+            all_tasks.extend(tasks_for_use_case)
 
         return all_tasks
 
@@ -153,24 +214,55 @@ class SimpleTaskGenerator:
         dynamic: bool = True,
         *,
         test_types: str = "event_only",
+        random_seed: int | None = None,
     ) -> list[Task]:
         """
         Generate tasks for a specific use case by calling the LLM with relevant context.
 
         Each prompt is generated independently with its own seed and constraints,
-        ensuring variety when multiple prompts are requested.
+        ensuring variety when multiple prompts are requested. The LLM calls of all
+        prompts run concurrently (bounded by ``max_concurrency``).
+
+        The random draws (seeds, constraints, replacements, shuffle) come from a private
+        stream seeded with ``random_seed``, so the result depends only on that seed, whatever
+        else runs concurrently. Callers starting several generations at once should draw
+        the seeds in order before starting them; without one, the stream is seeded from
+        the global ``random`` when the call starts.
 
         Args:
             use_case: The use case to generate tasks for
             number_of_prompts: Number of prompts to generate (each with unique seed/constraints)
             dynamic: If True, tasks will include random seeds for dynamic content
+            random_seed: Seed of this call's random stream
         """
-        tasks: list[Task] = []
-        _ = test_types
+        stream = _RandomStream(random.getrandbits(64) if random_seed is None else random_seed)
+        drafts = await stream.run(self._prepare_drafts(use_case, number_of_prompts, dynamic=dynamic, test_types=test_types))
+
+        await self._complete_drafts(drafts)
+
+        return await stream.run(self._assemble_tasks(drafts))
+
+    # ============================================================================
+    # CONCURRENT GENERATION
+    # ============================================================================
+
+    def _get_llm_semaphore(self) -> asyncio.Semaphore:
+        """Semaphore bounding in-flight LLM calls across use cases, bound to the running loop."""
+        loop = asyncio.get_running_loop()
+        if self._llm_semaphore is None or self._llm_semaphore_loop is not loop:
+            self._llm_semaphore = asyncio.Semaphore(self.max_concurrency)
+            self._llm_semaphore_loop = loop
+        return self._llm_semaphore
+
+    # ============================================================================
+    # TASK DRAFTS
+    # ============================================================================
+
+    async def _prepare_drafts(self, use_case: UseCase, number_of_prompts: int, *, dynamic: bool, test_types: str) -> list[_TaskDraft]:
+        """Pick a seed, load its dataset and build constraints plus the LLM prompt for each task."""
+        drafts: list[_TaskDraft] = []
 
-        # Generate each prompt independently
         for _ in range(number_of_prompts):
-            use_case.constraints = None
             # Build task URL with unique seed for each prompt
             task_url = self._build_task_url_with_seed(dynamic=dynamic)
             seed = get_seed_from_url(task_url) if dynamic else 1
@@ -178,8 +270,10 @@ class SimpleTaskGenerator:
             dataset: dict[str, list[dict]] = {}
 
             # IMPORTANT: Create a deep copy of use_case for this task to preserve constraints
-            # Each task needs its own copy so constraints aren't overwritten by subsequent iterations
+            # Each task needs its own copy so constraints aren't overwritten by subsequent iterations,
+            # and the caller's use_case is never mutated (concurrent calls may share it)
             use_case_copy = copy.deepcopy(use_case)
+            use_case_copy.constraints = None
             # Generate constraints specific to this seed's dataset
             if hasattr(use_case, "generate_constraints_async"):
                 dataset = await self._load_dataset(seed) or {}
@@ -201,9 +295,32 @@ class SimpleTaskGenerator:
                 use_case_copy.additional_prompt_info = f"GENERATE PROMPT LIKE: {use_case_copy.get_example_prompts_str()}"
 
             llm_prompt = build_event_generation_prompt(use_case_copy, constraints_info)
+            drafts.append(_TaskDraft(use_case=use_case_copy, task_url=task_url, seed=seed, dynamic=dynamic, dataset=dataset, llm_prompt=llm_prompt))
+
+        return drafts
+
+    async def _complete_drafts(self, drafts: list[_TaskDraft]) -> None:
+        """Run the LLM calls of all drafts with at most ``max_concurrency`` in flight."""
+        if not drafts:
+            return
+        semaphore = self._get_llm_semaphore()
+
+        async def _complete(draft: _TaskDraft) -> None:
+            async with semaphore:
+                draft.prompt_list = await self._call_llm_with_retry(draft.llm_prompt)
+
+        # Results land on their own draft, so task order never depends on completion order.
+        await asyncio.gather(*(_complete(draft) for draft in drafts))
+
+    async def _assemble_tasks(self, drafts: list[_TaskDraft]) -> list[Task]:
+        """Apply replacements to each draft's LLM prompt and build the Tasks."""
+        tasks: list[Task] = []
 
-            # Call the LLM and get a single prompt/question
-            prompt_list = await self._call_llm_with_retry(llm_prompt)
+        for draft in drafts:
+            use_case_copy = draft.use_case
+            dataset = draft.dataset
+            seed = draft.seed
+            prompt_list = draft.prompt_list
 
             # Process only the first prompt from the LLM response for this iteration
             # This ensures we generate exactly number_of_prompts tasks total
@@ -239,14 +356,13 @@ class SimpleTaskGenerator:
                 # Create and append task - use the COPY which has constraints preserved
                 task = Task(
                     web_project_id=self.web_project.id,
-                    url=task_url,
+                    url=draft.task_url,
                     prompt=replaced_prompt,
                     use_case=use_case_copy,  # Use the copy with preserved constraints
                 )
-                if dynamic:
+                if draft.dynamic:
                     task.assign_seed_to_url()
                 tasks.append(task)
-                use_case.constraints = None
             except Exception as ex:
                 logger.error(f"Could not assemble Task for prompt '{prompt_text}': {ex!s}")
 
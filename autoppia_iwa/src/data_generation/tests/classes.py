@@ -5,22 +5,28 @@ import time
 from abc import ABC, abstractmethod
 from datetime import UTC, datetime
 from pathlib import Path
-from typing import Any, Literal
+from typing import TYPE_CHECKING, Any, Literal
 
 from dependency_injector.wiring import Provide
 from loguru import logger
 from openai.types.chat import ChatCompletion
-from pydantic import BaseModel, ConfigDict, Field, ValidationError
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr, ValidationError
 
 from autoppia_iwa.config.config import PROJECT_BASE_DIR
 from autoppia_iwa.src.demo_webs.classes import BackendEvent, WebProject
 from autoppia_iwa.src.di_container import DIContainer
 from autoppia_iwa.src.execution.classes import BrowserSnapshot
+from autoppia_iwa.src.execution.screenshots import screenshot_data_url
 from autoppia_iwa.src.llms.interfaces import ILLM
 
+if TYPE_CHECKING:
+    from autoppia_iwa.src.demo_webs.base_events import Event
+
 # Avoid importing heavy optional deps (e.g., Pillow) at module import time.
 # Import helpers locally inside methods that need them.
+from .judge_cache import HTML_JUDGE_CACHE
 from .prompts import OPINION_BASED_HTML_TEST_SYS_MSG, SCREENSHOT_TEST_SYSTEM_PROMPT
+from .usage_log import get_usage_log_writer
 
 
 class ITest(ABC):
@@ -160,6 +166,11 @@ class CheckEventTest(BaseTaskTest):
     event_criteria: dict = Field(default_factory=dict)
     description: str = Field(default="Check if specific event was triggered")
 
+    # Criteria models compiled from event_criteria, keyed by (criteria class, web_agent_id).
+    # Event.validate_criteria resolves credential placeholders in place, hence the agent key.
+    _compiled_criteria: dict[tuple[Any, str | None], BaseModel | None] = PrivateAttr(default_factory=dict)
+    _compiled_from: dict | None = PrivateAttr(default=None)
+
     async def _execute_partial_test(
         self,
         web_project: WebProject,
@@ -179,23 +190,7 @@ class CheckEventTest(BaseTaskTest):
         if (current_iteration + 1) < total_iterations:
             return False
         parsed_events: list[Event] = Event.parse_all(snapshot.backend_events)
-        valid_events: list[Event] = []
-        for event in parsed_events:
-            if event.event_name == self.event_name:
-                valid_events.append(event)
-
-        for event in valid_events:
-            validation_model = event.ValidationCriteria
-            try:
-                parsed_criteria = validation_model(**self.event_criteria)
-            except ValidationError as e:
-                logger.warning(f"Invalid validation criteria: {e}")
-                return False
-
-            if event.validate_criteria(parsed_criteria):
-                return True
-
-        return False
+        return self.match_events(parsed_events) is True
 
     async def _execute_global_test(
         self,
@@ -209,23 +204,43 @@ class CheckEventTest(BaseTaskTest):
         from autoppia_iwa.src.demo_webs.base_events import Event
 
         parsed_events: list[Event] = Event.parse_all(backend_events)
-        valid_events: list[Event] = []
-        for event in parsed_events:
-            if event.event_name == self.event_name:
-                valid_events.append(event)
+        return self.match_events(parsed_events) is True
 
-        for event in valid_events:
-            validation_model = event.ValidationCriteria
-            try:
-                parsed_criteria = validation_model(**self.event_criteria)
-            except ValidationError as e:
-                logger.warning(f"Invalid validation criteria: {e}")
+    def match_events(self, parsed_events: list["Event"]) -> bool | None:
+        """
+        Check already-parsed events against this test.
+
+        Returns True when a matching event satisfies the criteria, False when the criteria
+        cannot be built for the event type (the test can never pass), and None when no
+        event decided the outcome yet.
+        """
+        for event in parsed_events:
+            if event.event_name != self.event_name:
+                continue
+            parsed_criteria = self._compile_criteria(event.ValidationCriteria, event.web_agent_id)
+            if parsed_criteria is None:
                 return False
 
             if event.validate_criteria(parsed_criteria):
                 return True
 
-        return False
+        return None
+
+    def _compile_criteria(self, validation_model: "type[BaseModel]", web_agent_id: str | None) -> BaseModel | None:
+        """Build the criteria model once per event type and agent; None if the criteria are invalid."""
+        if self._compiled_from is not self.event_criteria:
+            # event_criteria was reassigned (e.g. placeholder substitution): start over.
+            self._compiled_criteria.clear()
+            self._compiled_from = self.event_criteria
+
+        key = (validation_model, web_agent_id)
+        if key not in self._compiled_criteria:
+            try:
+                self._compiled_criteria[key] = validation_model(**self.event_criteria)
+            except ValidationError as e:
+                logger.warning(f"Invalid validation criteria: {e}")
+                self._compiled_criteria[key] = None
+        return self._compiled_criteria[key]
 
 
 class JudgeBaseOnHTML(BaseTaskTest):
@@ -252,16 +267,19 @@ class JudgeBaseOnHTML(BaseTaskTest):
             logger.warning("No HTML content found in browser snapshots.")
             return False
 
-        # Local import to avoid heavy deps during non-LLM tests
-        from autoppia_iwa.src.shared.web_utils import generate_html_differences
-
-        differences = generate_html_differences(all_htmls)
+        # Identical pages for the same test and prompt (e.g. many agents replaying one
+        # solution) are judged once per run; diffs are shared per page pair.
+        differences = HTML_JUDGE_CACHE.differences(all_htmls)
         # differences = generate_html_differences_with_xmldiff(all_htmls)
         if not differences:
             logger.info("No significant HTML differences detected.")
             return False
 
-        return await self._analyze_htmls(prompt, total_iterations, differences)
+        key = HTML_JUDGE_CACHE.verdict_key(self._judge_identity(), prompt, total_iterations, all_htmls)
+        return await HTML_JUDGE_CACHE.verdict(key, lambda: self._analyze_htmls(prompt, total_iterations, differences))
+
+    def _judge_identity(self) -> str:
+        return json.dumps(self.model_dump(mode="json"), sort_keys=True, default=str)
 
     @staticmethod
     def _collect_all_htmls(browser_snapshots: list[BrowserSnapshot]) -> list[str]:
@@ -289,9 +307,10 @@ class JudgeBaseOnHTML(BaseTaskTest):
 
         return cleaned_htmls
 
-    async def _analyze_htmls(self, task_prompt: str, total_iteration: int, differences: list[str], llm_service: ILLM = Provide[DIContainer.llm_service]) -> bool:
+    async def _analyze_htmls(self, task_prompt: str, total_iteration: int, differences: list[str], llm_service: ILLM = Provide[DIContainer.llm_service]) -> bool | None:
         """
         Analyzes HTML changes using an LLM to determine success.
+        Returns None when the LLM could not be reached, so the failure is not cached as a verdict.
         """
         json_schema = HTMLBasedTestResponse.model_json_schema()
         formatted_sys_msg = OPINION_BASED_HTML_TEST_SYS_MSG.format(json_schema=json_schema)
@@ -304,7 +323,7 @@ class JudgeBaseOnHTML(BaseTaskTest):
             result = await llm_service.async_predict(payload, json_format=True, return_raw=True)
         except Exception as e:
             logger.error(f"LLM service failed to predict: {e}")
-            return False
+            return None
 
         end_time = time.perf_counter()
         duration = round(end_time - start_time, 3)
@@ -317,7 +336,7 @@ class JudgeBaseOnHTML(BaseTaskTest):
 
         match = re.search(r'"evaluation_result"\s*:\s*(true|false)', result_str, re.IGNORECASE)
         final_result = match.group(1).lower() == "true" if match else False
-        save_usage_record(task_prompt, result, duration, self.type, final_result=final_result, total_iteration=total_iteration)
+        await save_usage_record(task_prompt, result, duration, self.type, final_result=final_result, total_iteration=total_iteration)
 
         return final_result
 
@@ -359,7 +378,7 @@ class JudgeBaseOnScreenshot(BaseTaskTest):
             logger.warning("No screenshots found in the latest browser snapshots.")
             return False
 
-        screenshot_content = [{"type": "image_url", "image_url": {"url": f"data:image/jpeg;base64,{screenshot}"}} for screenshot in screenshots_after]
+        screenshot_content = [{"type": "image_url", "image_url": {"url": screenshot_data_url(screenshot, default_mime="image/jpeg")}} for screenshot in screenshots_after]
         json_schema = ScreenshotTestResponse.model_json_schema()
         formatted_sys_msg = SCREENSHOT_TEST_SYSTEM_PROMPT.format(json_schema=json_schema)
         payload = [
@@ -379,7 +398,7 @@ class JudgeBaseOnScreenshot(BaseTaskTest):
 
         match = re.search(r'"evaluation_result"\s*:\s*(true|false)', result_str, re.IGNORECASE)
         final_result = match.group(1).lower() == "true" if match else False
-        save_usage_record(prompt, result, duration, self.type, final_result=final_result, total_iteration=total_iteration)
+        await save_usage_record(prompt, result, duration, self.type, final_result=final_result, total_iteration=total_iteration)
 
         return final_result
 
@@ -469,8 +488,8 @@ class DataExtractionTest(BaseTaskTest):
         return self._check_expected_answer(extracted_data)
 
 
-def save_usage_record(prompt, response: "ChatCompletion", time_taken, test_type, final_result: bool, total_iteration, log_file: Path = PROJECT_BASE_DIR / "judge_tests_usage_logs.jsonl"):
-    """Saves basic test execution info to log file."""
+async def save_usage_record(prompt, response: "ChatCompletion", time_taken, test_type, final_result: bool, total_iteration, log_file: Path = PROJECT_BASE_DIR / "judge_tests_usage_logs.jsonl"):
+    """Queues basic test execution info for the usage log file."""
     try:
         input_tokens = response.usage.prompt_tokens
         output_tokens = response.usage.completion_tokens
@@ -493,12 +512,8 @@ def save_usage_record(prompt, response: "ChatCompletion", time_taken, test_type,
         "total_iteration": total_iteration,
     }
 
-    try:
-        log_file.parent.mkdir(parents=True, exist_ok=True)
-        with log_file.open("a", encoding="utf-8") as f:
-            f.write(json.dumps(log_entry, ensure_ascii=False) + "\n")
-    except OSError as e:
-        logger.error(f"Failed to write to log file: {e}")
+    # Written in batches by a background thread; flushed at interpreter exit
+    await get_usage_log_writer(log_file).asubmit(log_entry)
 
 
 class ScreenshotTestResponse(BaseModel):
@@ -0,0 +1,134 @@
+"""
+Run-wide memo for ``JudgeBaseOnHTML``.
+
+Many agents often replay the same solution and land on the same pages. Their judge
+inputs are then identical, so the verdict is computed once and reused:
+
+- verdicts are keyed by the test (type + criteria), the task prompt, the iteration count
+  and a hash of the cleaned HTML states the LLM would see; concurrent evaluations of the same key share
+  one in-flight LLM call, which a cancelled evaluation does not cancel for the others,
+- unified diffs are memoized per (before, after) page pair, so a pair shared by several
+  trajectories is diffed once.
+
+Only real verdicts are cached: a judge call that fails (``None``) is retried next time.
+``Benchmark.run`` clears the memo (and its counters) when a run starts.
+
+Usage:
+    key = HTML_JUDGE_CACHE.verdict_key(test_identity, prompt, total_iterations, cleaned_htmls)
+    passed = await HTML_JUDGE_CACHE.verdict(key, lambda: judge(prompt, HTML_JUDGE_CACHE.differences(cleaned_htmls)))
+"""
+
+import hashlib
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, fields
+from itertools import pairwise
+
+from autoppia_iwa.src.shared.single_flight import SingleFlight
+
+_MAX_VERDICTS = 4096
+_MAX_DIFFS = 1024
+
+
+def _digest(text: str) -> bytes:
+    return hashlib.blake2b(text.encode("utf-8", "surrogatepass"), digest_size=16).digest()
+
+
+@dataclass
+class JudgeCacheMetrics:
+    """Counters for the HTML judge memo; ``merge`` folds in the counters of another process."""
+
+    verdict_hits: int = 0
+    verdict_misses: int = 0
+    coalesced: int = 0
+    uncached_failures: int = 0
+    diff_hits: int = 0
+    diff_misses: int = 0
+
+    @property
+    def llm_calls_saved(self) -> int:
+        return self.verdict_hits + self.coalesced
+
+    def merge(self, other: dict[str, int]) -> None:
+        for field in fields(self):
+            setattr(self, field.name, getattr(self, field.name) + int(other.get(field.name, 0)))
+
+    def as_dict(self) -> dict[str, int]:
+        data = {field.name: getattr(self, field.name) for field in fields(self)}
+        data["llm_calls_saved"] = self.llm_calls_saved
+        return data
+
+
+class HTMLJudgeCache:
+    """Verdict and diff memo shared by every ``JudgeBaseOnHTML`` of the process."""
+
+    def __init__(self, max_verdicts: int = _MAX_VERDICTS, max_diffs: int = _MAX_DIFFS) -> None:
+        self.max_verdicts = max_verdicts
+        self.max_diffs = max_diffs
+        self.metrics = JudgeCacheMetrics()
+        self._verdicts: OrderedDict[bytes, bool] = OrderedDict()
+        self._in_flight = SingleFlight()
+        self._diffs: OrderedDict[tuple[bytes, bytes], str] = OrderedDict()
+
+    @staticmethod
+    def verdict_key(test_identity: str, prompt: str, total_iterations: int, cleaned_htmls: list[str]) -> bytes:
+        hasher = hashlib.blake2b(digest_size=16)
+        for part in (test_identity, prompt, str(total_iterations), *cleaned_htmls):
+            hasher.update(_digest(part))
+        return hasher.digest()
+
+    async def verdict(self, key: bytes, judge: Callable[[], Awaitable[bool | None]]) -> bool:
+        """Cached verdict for ``key``, calling ``judge`` once per key (concurrent callers share it)."""
+        if key in self._verdicts:
+            self._verdicts.move_to_end(key)
+            self.metrics.verdict_hits += 1
+            return self._verdicts[key]
+        if key in self._in_flight:
+            self.metrics.coalesced += 1
+        return bool(await self._in_flight.run(key, lambda: self._judge(key, judge)))
+
+    async def _judge(self, key: bytes, judge: Callable[[], Awaitable[bool | None]]) -> bool | None:
+        self.metrics.verdict_misses += 1
+        result = await judge()
+        if result is None:
+            self.metrics.uncached_failures += 1
+            return None
+        self._verdicts[key] = result
+        if len(self._verdicts) > self.max_verdicts:
+            self._verdicts.popitem(last=False)
+        return result
+
+    def diff(self, before: str, after: str) -> str:
+        key = (_digest(before), _digest(after))
+        cached = self._diffs.get(key)
+        if cached is not None:
+            self._diffs.move_to_end(key)
+            self.metrics.diff_hits += 1
+            return cached
+        # Local import: web_utils pulls in BeautifulSoup
+        from autoppia_iwa.src.shared.web_utils import html_diff
+
+        self.metrics.diff_misses += 1
+        result = self._diffs[key] = html_diff(before, after)
+        if len(self._diffs) > self.max_diffs:
+            self._diffs.popitem(last=False)
+        return result
+
+    def differences(self, html_list: list[str]) -> list[str]:
+        """``generate_html_differences`` with every consecutive pair's diff memoized."""
+        if not html_list:
+            return []
+        diffs = [html_list[0]]
+        for before, after in pairwise(html_list):
+            diff = self.diff(before, after)
+            if diff:
+                diffs.append(diff)
+        return diffs
+
+    def clear(self) -> None:
+        self._verdicts.clear()
+        self._diffs.clear()
+        self.metrics = JudgeCacheMetrics()
+
+
+HTML_JUDGE_CACHE = HTMLJudgeCache()
@@ -0,0 +1,173 @@
+"""
+Append LLM judge usage records to a JSONL file without blocking the event loop.
+
+``save_usage_record`` used to open the log and append one line per judge call on the
+event loop. Records now go through a bounded queue to a background thread that writes
+them in batches (one open/append per batch):
+
+- memory is bounded by ``max_pending`` records; when the writer falls that far behind,
+  ``submit`` blocks until there is room (backpressure, nothing is dropped), and the async
+  ``asubmit`` used by the judges waits for room on a worker thread, not on the event loop,
+- ``close`` (run at interpreter exit) drains the queue and stops the thread; records
+  submitted after ``close`` are appended directly, so a normal exit loses nothing,
+- with ``max_bytes > 0`` the file is rotated like ``logging.handlers.RotatingFileHandler``:
+  ``log.jsonl`` -> ``log.jsonl.1`` -> ... -> ``log.jsonl.<backup_count>``.
+
+Usage:
+    await get_usage_log_writer(path).asubmit({"test_type": "html", ...})
+"""
+
+import asyncio
+import atexit
+import contextlib
+import json
+import os
+import queue
+import threading
+from pathlib import Path
+from typing import Any
+
+from loguru import logger
+
+from autoppia_iwa.config.config import JUDGE_USAGE_LOG_BACKUPS, JUDGE_USAGE_LOG_MAX_BYTES
+
+_STOP = object()
+
+
+class UsageLogWriter:
+    """Batched, background JSONL appender for one log file."""
+
+    def __init__(
+        self,
+        path: Path,
+        *,
+        max_pending: int = 10_000,
+        batch_size: int = 256,
+        max_bytes: int = 0,
+        backup_count: int = 3,
+    ) -> None:
+        self.path = Path(path)
+        self.batch_size = max(1, batch_size)
+        self.max_bytes = max_bytes
+        self.backup_count = max(0, backup_count)
+        self.written = 0
+        self._queue: queue.Queue = queue.Queue(maxsize=max(1, max_pending))
+        self._thread: threading.Thread | None = None
+        self._thread_lock = threading.Lock()
+        self._closed = False
+
+    def submit(self, record: dict[str, Any]) -> None:
+        """Queue ``record``, blocking while ``max_pending`` records are waiting; after ``close`` it is written directly."""
+        with self._thread_lock:
+            if not self._closed:
+                if self._thread is None or not self._thread.is_alive():
+                    self._thread = threading.Thread(target=self._drain, name=f"usage-log-{self.path.name}", daemon=True)
+                    self._thread.start()
+                # Blocking under the lock keeps close() from queueing _STOP ahead of this record;
+                # the writer thread never takes the lock, so it keeps draining meanwhile
+                self._queue.put(record)
+                return
+            # The thread is stopping or gone: let it finish what is queued, then append in order
+            self._queue.join()
+            try:
+                self._write([record])
+            except Exception as e:
+                logger.error(f"Failed to write to log file: {e}")
+
+    async def asubmit(self, record: dict[str, Any]) -> None:
+        """``submit`` for the event loop: queues at once, or waits for room on a worker thread."""
+        # Never wait for the lock here: a blocked submit holds it until the queue has room
+        if self._thread_lock.acquire(blocking=False):
+            try:
+                if not self._closed and self._thread is not None and self._thread.is_alive():
+                    with contextlib.suppress(queue.Full):
+                        self._queue.put_nowait(record)
+                        return
+            finally:
+                self._thread_lock.release()
+        await asyncio.to_thread(self.submit, record)
+
+    def _drain(self) -> None:
+        while True:
+            item = self._queue.get()
+            batch = [] if item is _STOP else [item]
+            stop = item is _STOP
+            while not stop and len(batch) < self.batch_size:
+                try:
+                    item = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if item is _STOP:
+                    stop = True
+                else:
+                    batch.append(item)
+            try:
+                if batch:
+                    self._write(batch)
+            except Exception as e:
+                logger.error(f"Failed to write to log file: {e}")
+            finally:
+                for _ in range(len(batch) + (1 if stop else 0)):
+                    self._queue.task_done()
+            if stop:
+                return
+
+    def _write(self, batch: list[dict[str, Any]]) -> None:
+        data = "".join(json.dumps(record, ensure_ascii=False) + "\n" for record in batch)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        if self.max_bytes > 0 and self.path.exists() and self.path.stat().st_size + len(data.encode("utf-8")) > self.max_bytes:
+            self._rotate()
+        with self.path.open("a", encoding="utf-8") as f:
+            f.write(data)
+        self.written += len(batch)
+
+    def _rotate(self) -> None:
+        if self.backup_count == 0:
+            self.path.unlink(missing_ok=True)
+            return
+        for index in range(self.backup_count - 1, 0, -1):
+            source = self.path.with_name(f"{self.path.name}.{index}")
+            if source.exists():
+                os.replace(source, self.path.with_name(f"{self.path.name}.{index + 1}"))
+        os.replace(self.path, self.path.with_name(f"{self.path.name}.1"))
+
+    def flush(self) -> None:
+        """Block until every record submitted so far is on disk."""
+        self._queue.join()
+
+    def close(self) -> None:
+        """Write out pending records and stop the writer thread; later records are appended directly."""
+        with self._thread_lock:
+            if self._closed:
+                return
+            self._closed = True
+            thread, self._thread = self._thread, None
+        # No submit queues anything once _closed is set, so _STOP is the last item
+        if thread is not None and thread.is_alive():
+            self._queue.put(_STOP)
+            thread.join()
+
+
+_WRITERS: dict[Path, UsageLogWriter] = {}
+_WRITERS_LOCK = threading.Lock()
+
+
+def get_usage_log_writer(path: Path) -> UsageLogWriter:
+    """Process-wide writer for ``path``, rotated per ``JUDGE_USAGE_LOG_MAX_BYTES``."""
+    key = Path(path).resolve()
+    with _WRITERS_LOCK:
+        writer = _WRITERS.get(key)
+        if writer is None:
+            writer = _WRITERS[key] = UsageLogWriter(key, max_bytes=JUDGE_USAGE_LOG_MAX_BYTES, backup_count=JUDGE_USAGE_LOG_BACKUPS)
+        return writer
+
+
+def close_usage_logs() -> None:
+    with _WRITERS_LOCK:
+        writers = list(_WRITERS.values())
+    for writer in writers:
+        writer.close()
+
+
+# Daemon threads are killed at exit, so drain them first
+atexit.register(close_usage_logs)
@@ -1,3 +1,5 @@
+import contextlib
+import functools
 from datetime import datetime
 from typing import TYPE_CHECKING, Any, ClassVar
 
@@ -12,6 +14,48 @@ if TYPE_CHECKING:
     from autoppia_iwa.src.demo_webs.classes import BackendEvent
 
 
+@functools.cache
+def get_backend_event_types() -> dict[str, type["Event"]]:
+    """Merged event_name -> Event class map of every demo web project, built once."""
+    # Imported lazily: the project events modules import this module.
+    from autoppia_iwa.src.demo_webs.projects.p01_autocinema.events import BACKEND_EVENT_TYPES as web_1_backend_types
+    from autoppia_iwa.src.demo_webs.projects.p02_autobooks.events import BACKEND_EVENT_TYPES as web_2_backend_types
+    from autoppia_iwa.src.demo_webs.projects.p03_autozone.events import BACKEND_EVENT_TYPES as web_3_backend_types
+    from autoppia_iwa.src.demo_webs.projects.p04_autodining.events import BACKEND_EVENT_TYPES as web_4_backend_types
+    from autoppia_iwa.src.demo_webs.projects.p05_autocrm.events import BACKEND_EVENT_TYPES as web_5_backend_types
+    from autoppia_iwa.src.demo_webs.projects.p06_automail.events import BACKEND_EVENT_TYPES as web_6_backend_types
+    from autoppia_iwa.src.demo_webs.projects.p07_autodelivery.events import BACKEND_EVENT_TYPES as web_7_backend_types
+    from autoppia_iwa.src.demo_webs.projects.p08_autolodge.events import BACKEND_EVENT_TYPES as web_8_backend_types
+    from autoppia_iwa.src.demo_webs.projects.p09_autoconnect.events import BACKEND_EVENT_TYPES as web_9_backend_types
+    from autoppia_iwa.src.demo_webs.projects.p10_autowork.events import BACKEND_EVENT_TYPES as web_10_backend_types
+    from autoppia_iwa.src.demo_webs.projects.p11_autocalendar.events import BACKEND_EVENT_TYPES as web_11_backend_types
+    from autoppia_iwa.src.demo_webs.projects.p12_autolist.events import BACKEND_EVENT_TYPES as web_12_backend_types
+    from autoppia_iwa.src.demo_webs.projects.p13_autodrive.events import BACKEND_EVENT_TYPES as web_13_backend_types
+    from autoppia_iwa.src.demo_webs.projects.p14_autohealth.events import BACKEND_EVENT_TYPES as web_14_backend_types
+    from autoppia_iwa.src.demo_webs.projects.p15_autostats.events import BACKEND_EVENT_TYPES as web_15_backend_types
+    from autoppia_iwa.src.demo_webs.projects.p16_autodiscord.events import BACKEND_EVENT_TYPES as web_16_backend_types
+
+    # TODO: If we have more types we should include here
+    return {
+        **web_1_backend_types,
+        **web_2_backend_types,
+        **web_3_backend_types,
+        **web_4_backend_types,
+        **web_5_backend_types,
+        **web_6_backend_types,
+        **web_7_backend_types,
+        **web_8_backend_types,
+        **web_9_backend_types,
+        **web_10_backend_types,
+        **web_11_backend_types,
+        **web_12_backend_types,
+        **web_13_backend_types,
+        **web_14_backend_types,
+        **web_15_backend_types,
+        **web_16_backend_types,
+    }
+
+
 class Event(BaseModel):
     """Base event class for all event types"""
 
@@ -68,56 +112,33 @@ class Event(BaseModel):
 
     @staticmethod
     def parse_all(backend_events: list["BackendEvent"]) -> list["Event"]:
-        """Parse all backend events and return appropriate typed events"""
+        """
+        Parse all backend events and return appropriate typed events.
+
+        Each BackendEvent remembers its typed Event, so re-parsing a growing history only
+        pays for the events that were not seen before.
+        """
+        event_class_map = get_backend_event_types()
         events: list[Event] = []
-        # TODO: If we have more types we should include here
-        # TODO: Moving (ALL_BACKEND_EVENT_TYPES) here to resolve circular import error
-        from autoppia_iwa.src.demo_webs.projects.p01_autocinema.events import BACKEND_EVENT_TYPES as web_1_backend_types
-        from autoppia_iwa.src.demo_webs.projects.p02_autobooks.events import BACKEND_EVENT_TYPES as web_2_backend_types
-        from autoppia_iwa.src.demo_webs.projects.p03_autozone.events import BACKEND_EVENT_TYPES as web_3_backend_types
-        from autoppia_iwa.src.demo_webs.projects.p04_autodining.events import BACKEND_EVENT_TYPES as web_4_backend_types
-        from autoppia_iwa.src.demo_webs.projects.p05_autocrm.events import BACKEND_EVENT_TYPES as web_5_backend_types
-        from autoppia_iwa.src.demo_webs.projects.p06_automail.events import BACKEND_EVENT_TYPES as web_6_backend_types
-        from autoppia_iwa.src.demo_webs.projects.p07_autodelivery.events import BACKEND_EVENT_TYPES as web_7_backend_types
-        from autoppia_iwa.src.demo_webs.projects.p08_autolodge.events import BACKEND_EVENT_TYPES as web_8_backend_types
-        from autoppia_iwa.src.demo_webs.projects.p09_autoconnect.events import BACKEND_EVENT_TYPES as web_9_backend_types
-        from autoppia_iwa.src.demo_webs.projects.p10_autowork.events import BACKEND_EVENT_TYPES as web_10_backend_types
-        from autoppia_iwa.src.demo_webs.projects.p11_autocalendar.events import BACKEND_EVENT_TYPES as web_11_backend_types
-        from autoppia_iwa.src.demo_webs.projects.p12_autolist.events import BACKEND_EVENT_TYPES as web_12_backend_types
-        from autoppia_iwa.src.demo_webs.projects.p13_autodrive.events import BACKEND_EVENT_TYPES as web_13_backend_types
-        from autoppia_iwa.src.demo_webs.projects.p14_autohealth.events import BACKEND_EVENT_TYPES as web_14_backend_types
-        from autoppia_iwa.src.demo_webs.projects.p15_autostats.events import BACKEND_EVENT_TYPES as web_15_backend_types
-        from autoppia_iwa.src.demo_webs.projects.p16_autodiscord.events import BACKEND_EVENT_TYPES as web_16_backend_types
-
-        ALL_BACKEND_EVENT_TYPES = {
-            **web_1_backend_types,
-            **web_2_backend_types,
-            **web_3_backend_types,
-            **web_4_backend_types,
-            **web_5_backend_types,
-            **web_6_backend_types,
-            **web_7_backend_types,
-            **web_8_backend_types,
-            **web_9_backend_types,
-            **web_10_backend_types,
-            **web_11_backend_types,
-            **web_12_backend_types,
-            **web_13_backend_types,
-            **web_14_backend_types,
-            **web_15_backend_types,
-            **web_16_backend_types,
-        }
-        event_class_map = ALL_BACKEND_EVENT_TYPES
 
         for event_data in backend_events:
+            cached = getattr(event_data, "_parsed_event", None)
+            if cached is not None:
+                events.append(cached)
+                continue
+
             event_name = event_data.event_name
             event_class = event_class_map.get(event_name, Event)
             try:
-                events.append(event_class.parse(event_data))
+                event = event_class.parse(event_data)
             except Exception as e:
                 logger.warning(f"Error parsing event {event_name}: {e}")
                 # Fallback to base Event class if specific parsing fails
-                events.append(Event.parse(event_data))
+                event = Event.parse(event_data)
+
+            with contextlib.suppress(AttributeError, ValueError):
+                event_data._parsed_event = event
+            events.append(event)
 
         return events
 
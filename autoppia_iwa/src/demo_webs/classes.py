@@ -9,7 +9,7 @@ from dataclasses import dataclass
 from hashlib import sha1
 from typing import TYPE_CHECKING, Any
 
-from pydantic import BaseModel, Field, ValidationError
+from pydantic import BaseModel, Field, PrivateAttr, ValidationError
 
 from autoppia_iwa.src.execution.actions.all_actions.navigate_action import NavigateAction
 from autoppia_iwa.src.execution.actions.base import BaseAction
@@ -310,6 +310,9 @@ class BackendEvent(BaseModel):
     web_agent_id: str | None = None
     timestamp: Any | None = None
 
+    # Typed Event built by Event.parse_all; backend events are not mutated once recorded
+    _parsed_event: Any = PrivateAttr(default=None)
+
 
 @dataclass
 class Trajectory:
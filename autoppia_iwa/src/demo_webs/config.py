@@ -1,40 +1,119 @@
+import importlib
 import sys
+from collections.abc import Iterable, Iterator, Mapping, Sequence
 from pathlib import Path
+from typing import TYPE_CHECKING, overload
 
-from .classes import WebProject
-from .projects.p01_autocinema.main import autocinema_project
-from .projects.p02_autobooks.main import autobooks_project
-from .projects.p03_autozone.main import autozone_project
-from .projects.p04_autodining.main import autodining_project
-from .projects.p05_autocrm.main import crm_project
-from .projects.p06_automail.main import automail_project
-from .projects.p07_autodelivery.main import autodelivery_project
-from .projects.p08_autolodge.main import lodge_project
-from .projects.p09_autoconnect.main import connect_project
-from .projects.p10_autowork.main import work_project
-from .projects.p11_autocalendar.main import autocalendar_project
-from .projects.p12_autolist.main import autolist_project
-from .projects.p13_autodrive.main import drive_project
-from .projects.p14_autohealth.main import health_project
-from .projects.p15_autostats.main import autostats_project
+if TYPE_CHECKING:
+    from .classes import WebProject
 
 sys.path.append(str(Path(__file__).resolve().parents[3]))
 
 
-demo_web_projects: list[WebProject] = [
-    autocinema_project,
-    autobooks_project,
-    autozone_project,
-    autodining_project,
-    crm_project,
-    automail_project,
-    lodge_project,
-    autodelivery_project,
-    work_project,
-    connect_project,
-    autocalendar_project,
-    autolist_project,
-    drive_project,
-    health_project,
-    autostats_project,
-]
+class _LazyProjectMapping(Mapping[str, "WebProject"]):
+    """Read-only ``project_id -> WebProject`` view that imports a project on first lookup."""
+
+    def __init__(self, registry: "LazyProjectRegistry"):
+        self._registry = registry
+
+    def __getitem__(self, project_id: str) -> "WebProject":
+        project = self._registry.get(project_id)
+        if project is None:
+            raise KeyError(project_id)
+        return project
+
+    def __contains__(self, project_id: object) -> bool:
+        return project_id in self._registry._index
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._registry.ids())
+
+    def __len__(self) -> int:
+        return len(self._registry)
+
+
+class LazyProjectRegistry(Sequence["WebProject"]):
+    """
+    Ordered list of demo web projects whose ``main`` modules are imported on first access.
+
+    Importing a project pulls in its use cases, events and data helpers, which takes
+    seconds for the whole catalogue; ``len()``, ``ids()`` and ``by_id`` lookups only
+    import what they touch.
+    """
+
+    def __init__(self, specs: Sequence[tuple[str, str, str]]):
+        # (project_id, module path, attribute holding the WebProject)
+        self._specs = tuple(specs)
+        self._index = {project_id: position for position, (project_id, _, _) in enumerate(self._specs)}
+        self._loaded: dict[int, WebProject] = {}
+
+    def _load(self, position: int) -> "WebProject":
+        project = self._loaded.get(position)
+        if project is None:
+            _, module_path, attribute = self._specs[position]
+            project = getattr(importlib.import_module(module_path), attribute)
+            self._loaded[position] = project
+        return project
+
+    def ids(self) -> list[str]:
+        return [project_id for project_id, _, _ in self._specs]
+
+    def loaded_ids(self) -> list[str]:
+        return [self._specs[position][0] for position in sorted(self._loaded)]
+
+    def get(self, project_id: str) -> "WebProject | None":
+        position = self._index.get(project_id)
+        return self._load(position) if position is not None else None
+
+    @property
+    def by_id(self) -> Mapping[str, "WebProject"]:
+        return _LazyProjectMapping(self)
+
+    def __len__(self) -> int:
+        return len(self._specs)
+
+    @overload
+    def __getitem__(self, index: int) -> "WebProject": ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list["WebProject"]: ...
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self._load(position) for position in range(len(self._specs))[index]]
+        return self._load(range(len(self._specs))[index])
+
+    def __iter__(self) -> Iterator["WebProject"]:
+        for position in range(len(self._specs)):
+            yield self._load(position)
+
+    def __repr__(self) -> str:
+        return f"LazyProjectRegistry(ids={self.ids()!r}, loaded={self.loaded_ids()!r})"
+
+
+def index_projects_by_id(projects: Iterable["WebProject"]) -> Mapping[str, "WebProject"]:
+    """Map project id to project; for the lazy registry only looked-up projects are imported."""
+    if isinstance(projects, LazyProjectRegistry):
+        return projects.by_id
+    return {project.id: project for project in projects}
+
+
+demo_web_projects: LazyProjectRegistry = LazyProjectRegistry(
+    [
+        ("autocinema", f"{__package__}.projects.p01_autocinema.main", "autocinema_project"),
+        ("autobooks", f"{__package__}.projects.p02_autobooks.main", "autobooks_project"),
+        ("autozone", f"{__package__}.projects.p03_autozone.main", "autozone_project"),
+        ("autodining", f"{__package__}.projects.p04_autodining.main", "autodining_project"),
+        ("autocrm", f"{__package__}.projects.p05_autocrm.main", "crm_project"),
+        ("automail", f"{__package__}.projects.p06_automail.main", "automail_project"),
+        ("autolodge", f"{__package__}.projects.p08_autolodge.main", "lodge_project"),
+        ("autodelivery", f"{__package__}.projects.p07_autodelivery.main", "autodelivery_project"),
+        ("autowork", f"{__package__}.projects.p10_autowork.main", "work_project"),
+        ("autoconnect", f"{__package__}.projects.p09_autoconnect.main", "connect_project"),
+        ("autocalendar", f"{__package__}.projects.p11_autocalendar.main", "autocalendar_project"),
+        ("autolist", f"{__package__}.projects.p12_autolist.main", "autolist_project"),
+        ("autodrive", f"{__package__}.projects.p13_autodrive.main", "drive_project"),
+        ("autohealth", f"{__package__}.projects.p14_autohealth.main", "health_project"),
+        ("autostats", f"{__package__}.projects.p15_autostats.main", "autostats_project"),
+    ]
+)
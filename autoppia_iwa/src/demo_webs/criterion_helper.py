@@ -1,4 +1,5 @@
 from enum import Enum
+from functools import lru_cache
 from typing import Any
 
 from pydantic import BaseModel
@@ -25,11 +26,20 @@ class CriterionValue(BaseModel):
 _STRIP = str.maketrans("", "", ".,")
 
 
+@lru_cache(maxsize=8192)
 def _normalize(s: str) -> str:
     """lowercase + sin ',' ni '.' al inicio/fin ni en medio"""
     return s.translate(_STRIP).lower().strip()
 
 
+def _list_item_contains(item: Any, val_norm: Any) -> bool:
+    """True if a list element equals (or, for strings, contains) the normalized criterion value."""
+    if isinstance(item, str):
+        item_norm = _normalize(item)
+        return item_norm == val_norm or val_norm in item_norm
+    return item == val_norm
+
+
 def validate_criterion(actual_value: Any, criterion: Any | CriterionValue) -> bool:
     """
     Validate a single criterion against an actual value.
@@ -62,14 +72,14 @@ def validate_criterion(actual_value: Any, criterion: Any | CriterionValue) -> bo
 
     if op == ComparisonOperator.CONTAINS:
         if isinstance(actual_value, list):
-            return any((_normalize(item) if isinstance(item, str) else item) == val_norm or (isinstance(item, str) and val_norm in _normalize(item)) for item in actual_value)
+            return any(_list_item_contains(item, val_norm) for item in actual_value)
         if isinstance(actual_value, str) and isinstance(val, str):
             return val_norm in actual_norm
         return False
 
     if op == ComparisonOperator.NOT_CONTAINS:
         if isinstance(actual_value, list):
-            return all((_normalize(item) if isinstance(item, str) else item) != val_norm and not (isinstance(item, str) and val_norm in _normalize(item)) for item in actual_value)
+            return not any(_list_item_contains(item, val_norm) for item in actual_value)
         if isinstance(actual_value, str) and isinstance(val, str):
             return val_norm not in actual_norm
         return False
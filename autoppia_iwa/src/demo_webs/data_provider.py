@@ -1,9 +1,11 @@
-import asyncio
 from urllib.parse import parse_qs, urljoin, urlparse
 
 import aiohttp
 from loguru import logger
 
+from autoppia_iwa.config.config import DATASET_CACHE_DIR, DATASET_CACHE_DISK_MAX_BYTES, DATASET_CACHE_MAX_BYTES
+from autoppia_iwa.src.demo_webs.dataset_cache import DatasetCache
+
 
 # ─────────────────────────── Seed Extraction ───────────────────────────
 def get_seed_from_url(task_url: str | None) -> int:
@@ -38,8 +40,7 @@ def get_seed_from_url(task_url: str | None) -> int:
 
 # ─────────────────────────── Async-compatible API ───────────────────────────
 _ASYNC_SESSION: "aiohttp.ClientSession | None" = None  # type: ignore
-_ASYNC_CACHE: dict[tuple, list[dict]] = {}
-_ASYNC_LOCK = asyncio.Lock()
+_ASYNC_CACHE = DatasetCache(max_bytes=DATASET_CACHE_MAX_BYTES, cache_dir=DATASET_CACHE_DIR or None, max_disk_bytes=DATASET_CACHE_DISK_MAX_BYTES)
 
 
 def _get_async_session() -> aiohttp.ClientSession:
@@ -50,6 +51,11 @@ def _get_async_session() -> aiohttp.ClientSession:
     return _ASYNC_SESSION
 
 
+def get_dataset_cache_metrics() -> dict[str, float | int]:
+    """Hit/miss/eviction counters of the shared dataset cache."""
+    return {**_ASYNC_CACHE.metrics.as_dict(), "memory_bytes": _ASYNC_CACHE.memory_bytes, "entries": len(_ASYNC_CACHE)}
+
+
 async def load_dataset_data(
     backend_url: str,
     project_key: str,
@@ -59,12 +65,15 @@ async def load_dataset_data(
     method: str = "select",
     filter_key: str | None = None,
     filter_values: str | None = None,
+    version: str | None = None,
 ) -> list[dict]:
     """
-    Async loader for /datasets/load using aiohttp with a simple in-memory cache.
+    Async loader for /datasets/load using aiohttp with a two-tier (memory + disk) cache.
 
     Args:
         limit: Number of items to fetch. Defaults to 50 and will be enforced to exactly 50.
+        version: Web version of the project. Enables the on-disk cache, which is
+            partitioned by version; without it results are only cached in memory.
     """
 
     # Keep dataset fetch size deterministic across callers.
@@ -86,8 +95,7 @@ async def load_dataset_data(
     if filter_values is not None:
         params["filter_values"] = filter_values  # CSV string
 
-    cache_key = (
-        url,
+    dataset_key = (
         params.get("project_key"),
         params.get("entity_type"),
         params.get("seed_value"),
@@ -96,27 +104,25 @@ async def load_dataset_data(
         params.get("filter_key"),
         params.get("filter_values"),
     )
+    cache_key = (url, *dataset_key)
 
-    # Fast-path cache check
-    async with _ASYNC_LOCK:
-        if cache_key in _ASYNC_CACHE:
-            return _ASYNC_CACHE[cache_key]
-
-    try:
-        session = _get_async_session()
-        async with session.get(url, params=params, timeout=10) as resp:
-            resp.raise_for_status()
-            body = await resp.json()
-            data = body.get("data") if isinstance(body, dict) else None
-            if isinstance(data, list):
-                async with _ASYNC_LOCK:
-                    _ASYNC_CACHE[cache_key] = data
-                return data
-            logger.warning("Unexpected response structure from /datasets/load: {}", type(body))
-            return []
-    except Exception as e:
-        logger.exception("Failed to fetch dataset (async) from {} with params {}: {}", url, params, e)
-        return []
+    async def _fetch() -> list[dict] | None:
+        try:
+            session = _get_async_session()
+            async with session.get(url, params=params, timeout=10) as resp:
+                resp.raise_for_status()
+                body = await resp.json()
+                data = body.get("data") if isinstance(body, dict) else None
+                if isinstance(data, list):
+                    return data
+                logger.warning("Unexpected response structure from /datasets/load: {}", type(body))
+                return None
+        except Exception as e:
+            logger.exception("Failed to fetch dataset (async) from {} with params {}: {}", url, params, e)
+            return None
+
+    data = await _ASYNC_CACHE.get_or_load(cache_key, _fetch, disk_key=dataset_key, version=version)
+    return data if data is not None else []
 
 
 async def close_async_session() -> None:
@@ -0,0 +1,278 @@
+"""
+Two-tier cache for ``/datasets/load`` payloads.
+
+Tier 1 is an in-memory LRU bounded by the serialized size of the cached payloads.
+Tier 2 is an on-disk store with one JSON file per dataset, named after a hash of
+(project, entity, seed, limit, method, filters) and grouped in one directory per
+web version, so a redeployed demo web never serves stale data. It is bounded by
+``max_disk_bytes``: files are touched when read, and once the store outgrows the
+budget the least recently used ones are deleted (so directories of old web versions
+age out), along with version directories left empty.
+
+Concurrent misses on the same key share a single in-flight load; cancelling one
+waiting caller does not cancel the others.
+
+Cached payloads are shared by every caller and must not be mutated. Each memory entry
+owns the ``DatasetIndex`` built for its payload (on first query, via
+``get_dataset_index``), so the index is evicted together with the entry.
+
+Usage:
+    cache = DatasetCache(max_bytes=64 * 1024 * 1024, cache_dir=Path(DATASET_CACHE_DIR), max_disk_bytes=512 * 1024 * 1024)
+    data = await cache.get_or_load(key, loader, disk_key=disk_key, version="1.2.0")
+"""
+
+import asyncio
+import contextlib
+import hashlib
+import json
+import os
+import re
+import threading
+import weakref
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Hashable
+from dataclasses import dataclass
+from pathlib import Path
+
+from loguru import logger
+
+from autoppia_iwa.src.demo_webs.dataset_index import DatasetIndex
+from autoppia_iwa.src.shared.single_flight import SingleFlight
+
+_LIVE_CACHES: "weakref.WeakSet[DatasetCache]" = weakref.WeakSet()
+
+
+@dataclass
+class DatasetCacheMetrics:
+    """Counters describing how requests are served by the cache tiers."""
+
+    memory_hits: int = 0
+    disk_hits: int = 0
+    misses: int = 0
+    coalesced: int = 0
+    evictions: int = 0
+    disk_evictions: int = 0
+    disk_errors: int = 0
+
+    @property
+    def hits(self) -> int:
+        return self.memory_hits + self.disk_hits
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def as_dict(self) -> dict[str, float | int]:
+        return {
+            "memory_hits": self.memory_hits,
+            "disk_hits": self.disk_hits,
+            "misses": self.misses,
+            "coalesced": self.coalesced,
+            "evictions": self.evictions,
+            "disk_evictions": self.disk_evictions,
+            "disk_errors": self.disk_errors,
+            "hit_rate": round(self.hit_rate, 4),
+        }
+
+
+_UNSAFE_PATH_CHARS = re.compile(r"[^A-Za-z0-9._-]")
+
+
+class DatasetCache:
+    """Byte-bounded LRU in front of a byte-bounded, versioned on-disk store, with per-key single-flight."""
+
+    def __init__(self, max_bytes: int, cache_dir: Path | str | None = None, max_disk_bytes: int = 0):
+        self.max_bytes = max(0, int(max_bytes))
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        # 0 = no limit on the disk tier
+        self.max_disk_bytes = max(0, int(max_disk_bytes))
+        # Size of the disk tier as last scanned plus what this process wrote since (None = not scanned yet)
+        self._disk_bytes: int | None = None
+        self._disk_lock = threading.Lock()
+        self.metrics = DatasetCacheMetrics()
+        self._entries: OrderedDict[Hashable, tuple[list[dict], int]] = OrderedDict()
+        self._bytes = 0
+        # id(payload) -> key of the entry holding it, and the indexes built for entries
+        self._keys_by_data: dict[int, Hashable] = {}
+        self._indexes: dict[Hashable, DatasetIndex] = {}
+        self._inflight = SingleFlight()
+        _LIVE_CACHES.add(self)
+
+    # ───────────────────────── Memory tier ─────────────────────────
+    @property
+    def memory_bytes(self) -> int:
+        return self._bytes
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._entries
+
+    def __getitem__(self, key: Hashable) -> list[dict]:
+        data, _ = self._entries[key]
+        self._entries.move_to_end(key)
+        return data
+
+    def __setitem__(self, key: Hashable, data: list[dict]) -> None:
+        self._store_in_memory(key, data, len(json.dumps(data, default=str)))
+
+    def pop(self, key: Hashable, default=None):
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return default
+        self._forget_entry(key, entry[0])
+        self._bytes -= entry[1]
+        return entry[0]
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._keys_by_data.clear()
+        self._indexes.clear()
+        self._bytes = 0
+
+    def index_for(self, data: list[dict]) -> DatasetIndex | None:
+        """Index of ``data`` if it is the payload of a memory entry (built on first use), else None."""
+        key = self._keys_by_data.get(id(data))
+        if key is None:
+            return None
+        index = self._indexes.get(key)
+        if index is None or index._size != len(data):
+            index = self._indexes[key] = DatasetIndex(data)
+        return index
+
+    def _forget_entry(self, key: Hashable, data: list[dict]) -> None:
+        self._indexes.pop(key, None)
+        if self._keys_by_data.get(id(data)) == key:
+            del self._keys_by_data[id(data)]
+
+    def _store_in_memory(self, key: Hashable, data: list[dict], size: int) -> None:
+        self.pop(key)
+        if size > self.max_bytes:
+            return
+        self._entries[key] = (data, size)
+        self._keys_by_data[id(data)] = key
+        self._bytes += size
+        while self._bytes > self.max_bytes and self._entries:
+            evicted_key, (evicted_data, evicted_size) = self._entries.popitem(last=False)
+            self._forget_entry(evicted_key, evicted_data)
+            self._bytes -= evicted_size
+            self.metrics.evictions += 1
+
+    # ───────────────────────── Disk tier ─────────────────────────
+    def disk_path(self, disk_key: tuple, version: str) -> Path | None:
+        if self.cache_dir is None:
+            return None
+        digest = hashlib.sha256(json.dumps(list(disk_key), default=str).encode("utf-8")).hexdigest()
+        return self.cache_dir / _UNSAFE_PATH_CHARS.sub("_", version) / f"{digest}.json"
+
+    def _read_disk(self, path: Path) -> list[dict] | None:
+        try:
+            payload = json.loads(path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            self.metrics.disk_errors += 1
+            logger.warning("Ignoring unreadable dataset cache file {}: {}", path, e)
+            return None
+        if not isinstance(payload, list):
+            return None
+        # The mtime orders files for eviction; atime is unreliable (noatime mounts)
+        with contextlib.suppress(OSError):
+            os.utime(path)
+        return payload
+
+    def _write_disk(self, path: Path, serialized: str) -> None:
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path.write_text(serialized, encoding="utf-8")
+            os.replace(tmp_path, path)
+        except OSError as e:
+            self.metrics.disk_errors += 1
+            logger.warning("Could not write dataset cache file {}: {}", path, e)
+            tmp_path.unlink(missing_ok=True)
+            return
+        if self.max_disk_bytes:
+            # Writes run on worker threads
+            with self._disk_lock:
+                if self._disk_bytes is None:
+                    self._disk_bytes = sum(size for _, _, size in self._disk_files())
+                else:
+                    self._disk_bytes += len(serialized.encode("utf-8"))
+                if self._disk_bytes > self.max_disk_bytes:
+                    self._prune_disk()
+
+    def _disk_files(self) -> list[tuple[float, Path, int]]:
+        """(mtime, path, size) of every cached file; other processes may delete them meanwhile."""
+        files = []
+        for path in self.cache_dir.glob("*/*.json"):
+            with contextlib.suppress(OSError):
+                stat = path.stat()
+                files.append((stat.st_mtime, path, stat.st_size))
+        return files
+
+    def _prune_disk(self) -> None:
+        """Delete least recently used files until the disk tier fits in ``max_disk_bytes``."""
+        files = sorted(self._disk_files())
+        total = sum(size for _, _, size in files)
+        for _, path, size in files:
+            if total <= self.max_disk_bytes:
+                break
+            with contextlib.suppress(FileNotFoundError):
+                path.unlink()
+                self.metrics.disk_evictions += 1
+            total -= size
+        self._disk_bytes = total
+        for version_dir in self.cache_dir.iterdir():
+            # rmdir only succeeds on a directory left empty
+            with contextlib.suppress(OSError):
+                version_dir.rmdir()
+
+    # ───────────────────────── Lookup ─────────────────────────
+    async def get_or_load(
+        self,
+        key: Hashable,
+        loader: Callable[[], Awaitable[list[dict] | None]],
+        disk_key: tuple | None = None,
+        version: str | None = None,
+    ) -> list[dict] | None:
+        """
+        Return the cached payload for ``key`` or load it once.
+
+        ``disk_key`` and ``version`` enable the on-disk tier; without a version the
+        payload is only cached in memory. A ``None`` result from ``loader`` is not cached.
+        """
+        if key in self._entries:
+            self.metrics.memory_hits += 1
+            return self[key]
+
+        if key in self._inflight:
+            self.metrics.coalesced += 1
+        return await self._inflight.run(key, lambda: self._load(key, loader, disk_key, version))
+
+    async def _load(
+        self,
+        key: Hashable,
+        loader: Callable[[], Awaitable[list[dict] | None]],
+        disk_key: tuple | None,
+        version: str | None,
+    ) -> list[dict] | None:
+        path = self.disk_path(disk_key, version) if disk_key is not None and version else None
+        if path is not None:
+            data = await asyncio.to_thread(self._read_disk, path)
+            if data is not None:
+                self.metrics.disk_hits += 1
+                self[key] = data
+                return data
+
+        self.metrics.misses += 1
+        data = await loader()
+        if data is None:
+            return None
+        serialized = json.dumps(data, default=str)
+        self._store_in_memory(key, data, len(serialized))
+        if path is not None:
+            await asyncio.to_thread(self._write_disk, path, serialized)
+        return data
@@ -0,0 +1,222 @@
+"""
+Per-dataset index for constraint matching.
+
+``DatasetIndex`` answers "which records satisfy all these constraints" with set
+intersections instead of evaluating every constraint against every record:
+
+- equals / not_equals / in_list / not_in_list use hash maps from the (normalized)
+  value to the rows holding it,
+- greater/less comparisons bisect a sorted array of the field's values,
+- contains / not_contains only scan the rows left after the indexed constraints,
+  against normalized strings computed once per field.
+
+Field indexes are built lazily, the first time a field is queried. Values the
+index cannot reason about (lists, dicts, NaN, mixed types under a range operator,
+...) fall back to ``validate_criterion`` on the affected rows, so results always
+match ``item_matches_all_constraints``.
+
+Datasets are treated as read-only. The index of a list cached by ``DatasetCache`` (what
+``load_dataset_data`` hands out for a (project, entity, seed)) is owned by its cache
+entry: built on the first query and evicted with the entry. Any other list gets an
+index for the call only, which nothing keeps alive or can serve stale.
+
+Usage:
+    index = get_dataset_index(books)
+    index.any_match([{"field": "year", "operator": "greater_than", "value": 1990}])
+"""
+
+import datetime
+import math
+from bisect import bisect_left, bisect_right
+from typing import Any
+
+from .criterion_helper import ComparisonOperator, CriterionValue, _normalize, validate_criterion
+
+_RANGE_OPERATORS = {
+    ComparisonOperator.GREATER_THAN,
+    ComparisonOperator.GREATER_EQUAL,
+    ComparisonOperator.LESS_THAN,
+    ComparisonOperator.LESS_EQUAL,
+}
+_SCAN_OPERATORS = {ComparisonOperator.CONTAINS, ComparisonOperator.NOT_CONTAINS}
+
+
+def _is_scalar(value: Any) -> bool:
+    """Hashable values whose == and hash agree, so a dict lookup equals a linear == scan."""
+    if value is None or isinstance(value, str | bool | int | datetime.date | datetime.time):
+        return True
+    return isinstance(value, float) and not math.isnan(value)
+
+
+def _is_number(value: Any) -> bool:
+    return isinstance(value, int | float) and not (isinstance(value, float) and math.isnan(value))
+
+
+class _FieldIndex:
+    """Lookup structures for one field of a dataset."""
+
+    def __init__(self, values: list[Any]):
+        self.values = values
+        self.none_rows: set[int] = set()
+        self.unindexed_rows: list[int] = []
+        self.str_rows: set[int] = set()
+        self.by_value: dict[Any, set[int]] = {}
+        self.by_normalized: dict[str, set[int]] = {}
+        self.normalized: dict[int, str] = {}
+        self._sorted: tuple[list[Any], list[int]] | None = None
+        self._sortable: bool | None = None
+
+        for row, value in enumerate(values):
+            if value is None:
+                self.none_rows.add(row)
+            elif not _is_scalar(value):
+                self.unindexed_rows.append(row)
+            else:
+                self.by_value.setdefault(value, set()).add(row)
+                if isinstance(value, str):
+                    normalized = _normalize(value)
+                    self.str_rows.add(row)
+                    self.normalized[row] = normalized
+                    self.by_normalized.setdefault(normalized, set()).add(row)
+        self.indexed_rows = set(range(len(values))).difference(self.unindexed_rows)
+
+    def _equal_rows(self, value: Any) -> set[int]:
+        if value is None:
+            return self.none_rows
+        if isinstance(value, str):
+            return self.by_normalized.get(_normalize(value), set())
+        return self.by_value.get(value, set())
+
+    def _in_list_rows(self, values: list[Any]) -> set[int]:
+        has_bool = any(isinstance(v, bool) for v in values)
+        rows: set[int] = set()
+        for v in values:
+            if v is None:
+                continue
+            if isinstance(v, str) and not has_bool:
+                rows |= self.by_normalized.get(_normalize(v), set())
+            else:
+                rows |= self.by_value.get(v, set())
+        return rows
+
+    def _sorted_values(self) -> tuple[list[Any], list[int]] | None:
+        if self._sortable is None:
+            present = [(value, row) for row, value in enumerate(self.values) if value is not None]
+            kinds = {"number" if _is_number(value) else "str" if isinstance(value, str) else "other" for value, _ in present}
+            self._sortable = len(kinds) == 1 and "other" not in kinds
+            if self._sortable:
+                present.sort(key=lambda pair: pair[0])
+                self._sorted = ([value for value, _ in present], [row for _, row in present])
+        return self._sorted
+
+    def _range_rows(self, operator: ComparisonOperator, value: Any) -> set[int] | None:
+        if not (_is_number(value) or isinstance(value, str)):
+            return None
+        if len(self.none_rows) == len(self.values):
+            return set()
+        sorted_values = self._sorted_values()
+        if sorted_values is None:
+            return None
+        keys, rows = sorted_values
+        if isinstance(value, str) != isinstance(keys[0], str):
+            return None
+        if operator == ComparisonOperator.GREATER_THAN:
+            return set(rows[bisect_right(keys, value) :])
+        if operator == ComparisonOperator.GREATER_EQUAL:
+            return set(rows[bisect_left(keys, value) :])
+        if operator == ComparisonOperator.LESS_THAN:
+            return set(rows[: bisect_left(keys, value)])
+        return set(rows[: bisect_right(keys, value)])
+
+    def lookup(self, criterion: CriterionValue) -> set[int] | None:
+        """Indexed rows satisfying ``criterion``, or None if it has to be checked row by row."""
+        operator, value = criterion.operator, criterion.value
+        if operator in _RANGE_OPERATORS:
+            return self._range_rows(operator, value)
+        if operator in (ComparisonOperator.EQUALS, ComparisonOperator.NOT_EQUALS):
+            if not _is_scalar(value):
+                return None
+            rows = self._equal_rows(value)
+            return set(rows) if operator == ComparisonOperator.EQUALS else self.indexed_rows - rows
+        if operator in (ComparisonOperator.IN_LIST, ComparisonOperator.NOT_IN_LIST):
+            if not isinstance(value, list):
+                return set()
+            if not all(_is_scalar(v) for v in value):
+                return None
+            rows = self._in_list_rows(value)
+            return rows if operator == ComparisonOperator.IN_LIST else self.indexed_rows - self.none_rows - rows
+        return None
+
+    def scan(self, criterion: CriterionValue, candidates: set[int]) -> set[int]:
+        """Filter ``candidates`` by ``criterion``, reusing normalized strings for (not_)contains."""
+        if criterion.operator in _SCAN_OPERATORS and isinstance(criterion.value, str):
+            needle = _normalize(criterion.value)
+            contains = criterion.operator == ComparisonOperator.CONTAINS
+            matched = set()
+            for row in candidates:
+                normalized = self.normalized.get(row)
+                if normalized is not None:
+                    if (needle in normalized) == contains:
+                        matched.add(row)
+                elif validate_criterion(self.values[row], criterion):
+                    matched.add(row)
+            return matched
+        return {row for row in candidates if validate_criterion(self.values[row], criterion)}
+
+
+class DatasetIndex:
+    """Constraint matching over one dataset via per-field hash maps and sorted arrays."""
+
+    def __init__(self, data: list[dict]):
+        self.data = data
+        self._size = len(data)
+        self._fields: dict[str, _FieldIndex] = {}
+
+    def field(self, name: str) -> _FieldIndex:
+        index = self._fields.get(name)
+        if index is None:
+            index = self._fields[name] = _FieldIndex([item.get(name) for item in self.data])
+        return index
+
+    def matching_rows(self, constraints: list[dict]) -> set[int]:
+        """Row positions of the records that satisfy *all* constraints."""
+        candidates = set(range(self._size))
+        if not candidates:
+            return candidates
+        deferred: list[tuple[_FieldIndex, CriterionValue]] = []
+        for c in constraints:
+            field = self.field(c["field"])
+            criterion = CriterionValue(value=c["value"], operator=c["operator"])
+            rows = field.lookup(criterion)
+            if rows is None:
+                deferred.append((field, criterion))
+                continue
+            unindexed = field.unindexed_rows
+            if unindexed:
+                rows = rows | field.scan(criterion, candidates.intersection(unindexed))
+            candidates &= rows
+            if not candidates:
+                return candidates
+        for field, criterion in deferred:
+            candidates = field.scan(criterion, candidates)
+            if not candidates:
+                break
+        return candidates
+
+    def filter(self, constraints: list[dict]) -> list[dict]:
+        """Records that satisfy *all* constraints, in dataset order."""
+        return [self.data[row] for row in sorted(self.matching_rows(constraints))]
+
+    def any_match(self, constraints: list[dict]) -> bool:
+        return bool(self.matching_rows(constraints))
+
+
+def get_dataset_index(data: list[dict]) -> DatasetIndex:
+    """Index for ``data``: the one of its ``DatasetCache`` entry, or a fresh one for other lists."""
+    from .dataset_cache import _LIVE_CACHES
+
+    for cache in list(_LIVE_CACHES):
+        index = cache.index_for(data)
+        if index is not None:
+            return index
+    return DatasetIndex(data)
@@ -1,7 +1,10 @@
 from __future__ import annotations
 
+import asyncio
 import json
 import os
+import time
+from collections.abc import Iterable
 from contextlib import suppress
 
 import aiohttp
@@ -16,6 +19,10 @@ EVALUATION_LEVEL_NO = 25
 
 # Constants
 RESETTING_DB_CONTEXT = "RESETTING DB"
+# Interval used to emulate long-polling against backends without cursor support
+LEGACY_POLL_INTERVAL_S = 0.1
+# Single-agent resets in flight when the backend has no batch reset route
+RESET_FALLBACK_CONCURRENCY = 4
 
 
 def _log_evaluation_event(message: str, context: str = "GENERAL") -> None:
@@ -55,6 +62,8 @@ class BackendDemoWebService:
         self.web_agent_id = web_agent_id
         # Allow environment overrides for validator id to ease local testing
         self.validator_id = str(validator_id or os.getenv("VALIDATOR_ID", VALIDATOR_ID or "validator_001")).strip() or "validator_001"
+        # Whether /reset_events/batch/ exists; None until the first batch reset tries it
+        self._batch_reset_supported: bool | None = None
 
         # Configure JSON parser (prefer orjson for performance)
         self._configure_json_parser()
@@ -133,6 +142,78 @@ class BackendDemoWebService:
             logger.warning(f"Failed to get backend events: {e}")
             return []
 
+    async def get_backend_events_since(self, web_agent_id: str, since_id: int = 0, wait_ms: int = 0) -> tuple[list[BackendEvent], int]:
+        """
+        Get only the events recorded after a cursor.
+
+        Events carry a per-agent monotonic sequence number starting at 1. The backend answers
+        ``{"events": [{"id": n, "data": {...}}, ...], "last_id": m}`` with the events whose id is
+        greater than ``since_id``; with ``wait_ms`` it holds the request until at least one new
+        event exists or the timeout expires. Backends that ignore the cursor and return the full
+        log are handled client-side (ids are positions in the log, waiting is emulated by polling).
+
+        Args:
+            web_agent_id: The agent ID to get events for.
+            since_id: Last sequence number already seen (0 for the whole log).
+            wait_ms: Long-poll timeout in milliseconds; 0 returns immediately.
+
+        Returns:
+            (new events, cursor to pass as ``since_id`` on the next call)
+        """
+
+        if self.web_project.is_web_real:
+            return [], since_id
+
+        deadline = time.monotonic() + max(wait_ms, 0) / 1000
+        while True:
+            remaining_ms = max(int((deadline - time.monotonic()) * 1000), 0)
+            payload = await self._fetch_events_payload(web_agent_id, since_id, remaining_ms)
+            if not isinstance(payload, dict | list):
+                return [], since_id
+
+            if isinstance(payload, dict):
+                entries = [entry for entry in payload.get("events") or [] if int(entry.get("id", 0)) > since_id]
+                last_id = int(payload.get("last_id", since_id))
+                if last_id < since_id:
+                    # The log was reset behind our back: start over from the beginning.
+                    logger.debug(f"Event cursor {since_id} ahead of backend ({last_id}); rewinding")
+                    since_id = 0
+                    continue
+                cursor = max([last_id, *(int(entry["id"]) for entry in entries)])
+                honours_wait = True
+            else:
+                if len(payload) < since_id:
+                    since_id = 0
+                entries = payload[since_id:]
+                cursor = len(payload)
+                honours_wait = False
+
+            if entries or remaining_ms == 0 or honours_wait:
+                return [BackendEvent(**entry.get("data", {})) for entry in entries], cursor
+            await asyncio.sleep(min(LEGACY_POLL_INTERVAL_S, remaining_ms / 1000))
+
+    async def _fetch_events_payload(self, web_agent_id: str, since_id: int, wait_ms: int) -> dict | list | None:
+        """GET /get_events/ with cursor parameters; returns the decoded body or None on failure."""
+
+        try:
+            endpoint = f"{self.base_url.rstrip('/')}/get_events/"
+            params = {
+                "web_url": (self.web_url or self.base_url).rstrip("/"),
+                "web_agent_id": web_agent_id,
+                "validator_id": self.validator_id,
+                "since_id": since_id,
+                "wait_ms": wait_ms,
+            }
+
+            session = self._get_session()
+
+            async with session.get(endpoint, params=params) as response:
+                response.raise_for_status()
+                return await response.json(loads=self._json_parser.loads)
+        except (aiohttp.ClientError, TimeoutError, ValueError, TypeError) as e:
+            logger.warning(f"Failed to get backend events since {since_id}: {e}")
+            return None
+
     async def reset_database(self, web_agent_id: str | None = None) -> bool:
         """
         Reset the entire database (requires admin/superuser permissions).
@@ -159,6 +240,71 @@ class BackendDemoWebService:
                 if response.status in (200, 202):
                     _log_evaluation_event("Database reset via API successful", context=RESETTING_DB_CONTEXT)
                     return True
+                logger.warning(f"API reset failed with HTTP {response.status}")
+                return False
         except (aiohttp.ClientError, TimeoutError, ValueError, TypeError) as e:
             logger.warning(f"API reset failed: {e}")
             return False
+
+    async def reset_databases(self, web_agent_ids: Iterable[str]) -> bool:
+        """
+        Reset the event logs of several web agents at once.
+
+        Sends a single ``POST /reset_events/batch/`` listing every id. A backend without that
+        route (404/405) is remembered, and it and any failed batch are served by concurrent
+        ``reset_database`` calls, at most ``RESET_FALLBACK_CONCURRENCY`` in flight.
+
+        Args:
+            web_agent_ids: Agents whose events should be cleared; duplicates are ignored.
+
+        Returns:
+            True when every agent was reset.
+        """
+
+        agent_ids = list(dict.fromkeys(agent_id for agent_id in web_agent_ids if agent_id))
+        if not agent_ids:
+            return True
+        if self.web_project.is_web_real:
+            _log_evaluation_event("Not resetting DB as it's a real website", context=RESETTING_DB_CONTEXT)
+            return False
+
+        if len(agent_ids) > 1 and self._batch_reset_supported is not False and await self._reset_events_batch(agent_ids):
+            return True
+
+        semaphore = asyncio.Semaphore(RESET_FALLBACK_CONCURRENCY)
+
+        async def _reset_one(agent_id: str) -> bool:
+            async with semaphore:
+                return await self.reset_database(agent_id)
+
+        return all(await asyncio.gather(*(_reset_one(agent_id) for agent_id in agent_ids)))
+
+    async def _reset_events_batch(self, web_agent_ids: list[str]) -> bool:
+        """POST /reset_events/batch/; False when the route is missing or the request failed."""
+
+        try:
+            endpoint = f"{self.base_url.rstrip('/')}/reset_events/batch/"
+            payload = {
+                "web_url": (self.web_url or self.base_url).rstrip("/"),
+                "web_agent_ids": web_agent_ids,
+                "validator_id": self.validator_id,
+            }
+            session = self._get_session()
+            # orjson.dumps returns bytes, which aiohttp's ``json=`` does not accept.
+            body = self._json_parser.dumps(payload)
+            headers = {"Content-Type": "application/json"}
+
+            async with session.post(endpoint, data=body, headers=headers) as response:
+                if response.status in (404, 405):
+                    self._batch_reset_supported = False
+                    logger.debug("Backend has no batch reset route; resetting agents one by one")
+                    return False
+                if response.status in (200, 202):
+                    self._batch_reset_supported = True
+                    _log_evaluation_event(f"Database reset via batch API successful ({len(web_agent_ids)} agents)", context=RESETTING_DB_CONTEXT)
+                    return True
+                logger.warning(f"Batch API reset failed with HTTP {response.status}")
+                return False
+        except (aiohttp.ClientError, TimeoutError, ValueError, TypeError) as e:
+            logger.warning(f"Batch API reset failed: {e}")
+            return False
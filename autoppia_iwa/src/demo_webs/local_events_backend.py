@@ -0,0 +1,172 @@
+"""
+In-process stand-in for the demo web events backend.
+
+Implements the endpoints ``BackendDemoWebService`` talks to, including the cursor
+contract of ``/get_events/`` (``since_id`` + ``wait_ms`` long-poll), so event fetching
+can be exercised offline without the demo web containers.
+
+Usage:
+    async with LocalEventsBackend() as backend:
+        project = WebProject(..., backend_url=backend.url, ...)
+        backend.record("agent-1", "LOGIN_BOOK", {"username": "user123"})
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+from datetime import UTC, datetime
+from typing import Any
+
+from aiohttp import web
+
+
+class LocalEventsBackend:
+    """
+    In-memory events backend serving ``/get_events/``, ``/save_events/``, ``/reset_events/``
+    and ``/reset_events/batch/``.
+
+    Each web agent has its own log; events get a monotonic sequence number starting at 1.
+    Resetting an agent's log keeps its numbering going, so a cursor taken before the reset
+    never hides the events recorded after it.
+
+    - ``GET /get_events/`` without ``since_id`` returns the legacy full log ``[{"data": {...}}]``.
+    - ``GET /get_events/?since_id=N&wait_ms=T`` returns ``{"events": [{"id", "data"}], "last_id"}``
+      with the events whose id is greater than N, waiting up to T ms for at least one.
+    - ``POST /reset_events/batch/`` with ``{"web_agent_ids": [...]}`` resets several logs;
+      ``batch_reset=False`` leaves the route out, like older backends.
+    """
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0, batch_reset: bool = True) -> None:
+        self.host = host
+        self.port = port
+        self.batch_reset = batch_reset
+        # Reset requests served, by route ("single" / "batch")
+        self.reset_requests: dict[str, int] = {"single": 0, "batch": 0}
+        self._logs: dict[str, list[dict[str, Any]]] = {}
+        # Last sequence number handed out per agent; survives reset()
+        self._last_ids: dict[str, int] = {}
+        # Replaced on every write; readers wait on the instance they saw.
+        self._changed = asyncio.Event()
+        self._runner: web.AppRunner | None = None
+
+    @property
+    def url(self) -> str:
+        return f"http://{self.host}:{self.port}"
+
+    async def start(self) -> str:
+        """Start serving on ``host:port`` (port 0 picks a free one). Returns the base URL."""
+        app = web.Application()
+        app.router.add_get("/get_events/", self._handle_get_events)
+        app.router.add_post("/save_events/", self._handle_save_event)
+        app.router.add_delete("/reset_events/", self._handle_reset)
+        if self.batch_reset:
+            app.router.add_post("/reset_events/batch/", self._handle_batch_reset)
+
+        self._runner = web.AppRunner(app)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, self.host, self.port)
+        await site.start()
+        self.port = site._server.sockets[0].getsockname()[1]  # type: ignore[union-attr]
+        return self.url
+
+    async def stop(self) -> None:
+        if self._runner is not None:
+            with contextlib.suppress(Exception):
+                await self._runner.cleanup()
+            self._runner = None
+
+    async def __aenter__(self) -> LocalEventsBackend:
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.stop()
+
+    # ============================================================================
+    # EVENT LOG
+    # ============================================================================
+
+    def record(self, web_agent_id: str, event_name: str, data: dict[str, Any] | None = None, timestamp: str | None = None) -> int:
+        """Append an event to the agent's log and wake up long-polling readers. Returns its id."""
+        log = self._logs.setdefault(web_agent_id, [])
+        event_id = self._last_ids[web_agent_id] = self._last_ids.get(web_agent_id, 0) + 1
+        log.append(
+            {
+                "id": event_id,
+                "data": {
+                    "event_name": event_name,
+                    "data": data or {},
+                    "web_agent_id": web_agent_id,
+                    "timestamp": timestamp or datetime.now(UTC).isoformat(),
+                },
+            }
+        )
+        self._signal_change()
+        return event_id
+
+    def reset(self, web_agent_id: str) -> None:
+        self._logs.pop(web_agent_id, None)
+        self._signal_change()
+
+    def events(self, web_agent_id: str) -> list[dict[str, Any]]:
+        return list(self._logs.get(web_agent_id, []))
+
+    def _signal_change(self) -> None:
+        changed, self._changed = self._changed, asyncio.Event()
+        changed.set()
+
+    # ============================================================================
+    # HTTP HANDLERS
+    # ============================================================================
+
+    async def _handle_get_events(self, request: web.Request) -> web.Response:
+        web_agent_id = request.query.get("web_agent_id", "")
+        if "since_id" not in request.query:
+            return web.json_response([{"data": entry["data"]} for entry in self.events(web_agent_id)])
+
+        try:
+            since_id = int(request.query["since_id"])
+            wait_ms = int(request.query.get("wait_ms", 0))
+        except ValueError:
+            raise web.HTTPBadRequest(text="since_id and wait_ms must be integers") from None
+
+        def _last_id() -> int:
+            return self._last_ids.get(web_agent_id, 0)
+
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + max(wait_ms, 0) / 1000
+        while _last_id() == since_id and loop.time() < deadline:
+            with contextlib.suppress(TimeoutError):
+                await asyncio.wait_for(self._changed.wait(), deadline - loop.time())
+
+        log = self.events(web_agent_id)
+        return web.json_response({"events": [entry for entry in log if entry["id"] > since_id], "last_id": _last_id()})
+
+    async def _handle_save_event(self, request: web.Request) -> web.Response:
+        body = await request.json()
+        event_id = self.record(
+            body.get("web_agent_id", ""),
+            body.get("event_name", ""),
+            body.get("data"),
+            timestamp=body.get("timestamp"),
+        )
+        return web.json_response({"id": event_id}, status=201)
+
+    async def _handle_reset(self, request: web.Request) -> web.Response:
+        self.reset_requests["single"] += 1
+        self.reset(request.query.get("web_agent_id", ""))
+        return web.json_response({"status": "ok"})
+
+    async def _handle_batch_reset(self, request: web.Request) -> web.Response:
+        self.reset_requests["batch"] += 1
+        body = await request.json()
+        web_agent_ids = body.get("web_agent_ids")
+        if not isinstance(web_agent_ids, list):
+            raise web.HTTPBadRequest(text="web_agent_ids must be a list")
+        for web_agent_id in web_agent_ids:
+            self.reset(str(web_agent_id))
+        return web.json_response({"status": "ok", "reset": len(web_agent_ids)})
+
+
+__all__ = ["LocalEventsBackend"]
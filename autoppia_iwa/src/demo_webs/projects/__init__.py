@@ -4,6 +4,8 @@ This module keeps backward-compatible import paths for legacy project package
 names (e.g. ``autobooks_2``) after the migration to ``pNN_*`` directories.
 """
 
+import importlib.abc
+import importlib.util
 import sys
 from importlib import import_module
 
@@ -27,40 +29,39 @@ _LEGACY_TO_NEW = {
 }
 
 
-_COMMON_SUBMODULES = (
-    "data",
-    "data_utils",
-    "dataExtractionUseCases",
-    "events",
-    "generation_functions",
-    "main",
-    "replace_functions",
-    "use_cases",
-    "utils",
-)
+class _LegacyPackageAliasFinder(importlib.abc.MetaPathFinder, importlib.abc.Loader):
+    """
+    Resolve ``projects.<legacy_name>[.submodule]`` to the ``pNN_*`` module on first import.
 
+    Aliases are created lazily so importing this package does not import every project.
+    """
 
-def _register_legacy_import_aliases() -> None:
-    base = __name__
-    for legacy_name, new_name in _LEGACY_TO_NEW.items():
-        legacy_package = f"{base}.{legacy_name}"
-        new_package = f"{base}.{new_name}"
+    def find_spec(self, fullname, path=None, target=None):
+        prefix = f"{__name__}."
+        if not fullname.startswith(prefix):
+            return None
+        legacy_name, _, submodule = fullname[len(prefix) :].partition(".")
+        new_name = _LEGACY_TO_NEW.get(legacy_name)
+        if new_name is None:
+            return None
+        target_name = f"{prefix}{new_name}" + (f".{submodule}" if submodule else "")
+        if importlib.util.find_spec(target_name) is None:
+            return None
+        return importlib.util.spec_from_loader(fullname, self, origin=target_name)
+
+    def create_module(self, spec):
+        module = import_module(spec.origin)
+        sys.modules[spec.name] = module
+        return module
 
-        try:
-            new_package_module = import_module(new_package)
-        except Exception:
-            continue
+    def exec_module(self, module):
+        # The aliased module was fully executed under its canonical name.
+        pass
 
-        sys.modules.setdefault(legacy_package, new_package_module)
 
-        for submodule in _COMMON_SUBMODULES:
-            new_submodule_name = f"{new_package}.{submodule}"
-            legacy_submodule_name = f"{legacy_package}.{submodule}"
-            try:
-                new_submodule = import_module(new_submodule_name)
-            except Exception:
-                continue
-            sys.modules.setdefault(legacy_submodule_name, new_submodule)
+def _register_legacy_import_aliases() -> None:
+    if not any(isinstance(finder, _LegacyPackageAliasFinder) for finder in sys.meta_path):
+        sys.meta_path.insert(0, _LegacyPackageAliasFinder())
 
 
 _register_legacy_import_aliases()
@@ -7,6 +7,7 @@ don't need to duplicate the logic.
 from typing import Any
 
 from autoppia_iwa.src.demo_webs.data_provider import load_dataset_data
+from autoppia_iwa.src.demo_webs.utils import resolve_web_version
 
 
 def _normalize_rating(value: Any) -> Any:
@@ -77,6 +78,7 @@ async def fetch_data(seed_value: int | None = None, count: int = 50) -> list[dic
 
     items = await load_dataset_data(
         backend_url=autocinema_project.backend_url,
+        version=await resolve_web_version(autocinema_project),
         project_key=project_key,
         entity_type=entity_type,
         seed_value=seed_value if seed_value is not None else 0,
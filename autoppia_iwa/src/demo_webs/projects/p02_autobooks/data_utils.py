@@ -4,6 +4,7 @@ Consolidates the dataset loading + mapping logic so other modules avoid duplicat
 """
 
 from autoppia_iwa.src.demo_webs.data_provider import load_dataset_data
+from autoppia_iwa.src.demo_webs.utils import resolve_web_version
 
 
 def _apply_mapping(record: dict, mapping: dict) -> dict:
@@ -43,6 +44,7 @@ async def fetch_data(seed_value: int | None = None, count: int = 50) -> list[dic
 
     items = await load_dataset_data(
         backend_url=autobooks_project.backend_url,
+        version=await resolve_web_version(autobooks_project),
         project_key=project_key,
         entity_type=entity_type,
         seed_value=seed_value if seed_value is not None else 0,
@@ -3,6 +3,7 @@ Shared data helpers for autozone_3.
 """
 
 from autoppia_iwa.src.demo_webs.data_provider import load_dataset_data
+from autoppia_iwa.src.demo_webs.utils import resolve_web_version
 
 
 async def fetch_data(seed_value: int | None = None, count: int = 50) -> list[dict]:
@@ -27,6 +28,7 @@ async def fetch_data(seed_value: int | None = None, count: int = 50) -> list[dic
 
     items = await load_dataset_data(
         backend_url=autozone_project.backend_url,
+        version=await resolve_web_version(autozone_project),
         project_key=project_key,
         entity_type="products",
         seed_value=seed_value if seed_value is not None else 1,
@@ -5,6 +5,7 @@ Shared restaurant dataset helpers for autodining_4.
 from loguru import logger
 
 from autoppia_iwa.src.demo_webs.data_provider import load_dataset_data
+from autoppia_iwa.src.demo_webs.utils import resolve_web_version
 
 _RESTAURANT_DATA_CACHE: dict[tuple[int | None, int], list[dict]] = {}
 
@@ -48,6 +49,7 @@ async def fetch_data(seed_value: int | None = None, count: int = 50) -> list[dic
     try:
         items = await load_dataset_data(
             backend_url=autodining_project.backend_url,
+            version=await resolve_web_version(autodining_project),
             project_key=project_key,
             entity_type="restaurants",
             seed_value=seed_value if seed_value is not None else 0,
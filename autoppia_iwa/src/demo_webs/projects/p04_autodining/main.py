@@ -1,6 +1,6 @@
 from autoppia_iwa.src.demo_webs.classes import WebProject
 
-from ...utils import get_backend_service_url, get_frontend_url, get_web_version
+from ...utils import get_backend_service_url, get_frontend_url
 from .dataExtractionUseCases import DATA_EXTRACTION_USE_CASES
 from .events import EVENTS
 from .use_cases import ALL_USE_CASES
@@ -12,7 +12,6 @@ autodining_project = WebProject(
     name="Autoppia Dining",
     frontend_url=_frontend_url,
     backend_url=get_backend_service_url(),
-    version=get_web_version("autodining", frontend_url=_frontend_url),
     events=EVENTS,
     use_cases=ALL_USE_CASES,
     data_extraction_use_cases=[item.name for item in DATA_EXTRACTION_USE_CASES],
@@ -3,6 +3,7 @@ Shared email dataset helpers for automail_6.
 """
 
 from autoppia_iwa.src.demo_webs.data_provider import load_dataset_data
+from autoppia_iwa.src.demo_webs.utils import resolve_web_version
 
 
 def _apply_mapping(record: dict, mapping: dict) -> dict:
@@ -47,6 +48,7 @@ async def fetch_data(
     project_key = f"web_{FRONTEND_PORT_INDEX + 1}_{automail_project.id}"
     items = await load_dataset_data(
         backend_url=automail_project.backend_url,
+        version=await resolve_web_version(automail_project),
         project_key=project_key,
         entity_type=entity_type,
         seed_value=seed_value if seed_value is not None else 1,
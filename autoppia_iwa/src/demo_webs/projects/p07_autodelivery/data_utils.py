@@ -3,6 +3,7 @@ Shared dataset helpers for autodelivery_7.
 """
 
 from autoppia_iwa.src.demo_webs.data_provider import load_dataset_data
+from autoppia_iwa.src.demo_webs.utils import resolve_web_version
 
 
 def _enrich_restaurants_menu_derived_fields(restaurants: list[dict]) -> list[dict]:
@@ -48,6 +49,7 @@ async def fetch_data(
 
     items = await load_dataset_data(
         backend_url=autodelivery_project.backend_url,
+        version=await resolve_web_version(autodelivery_project),
         project_key=project_key,
         entity_type="restaurants",
         seed_value=seed_value if seed_value is not None else 0,
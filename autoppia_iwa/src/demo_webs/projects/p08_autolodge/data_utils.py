@@ -3,6 +3,7 @@ Shared dataset helpers for autolodge_8.
 """
 
 from autoppia_iwa.src.demo_webs.data_provider import load_dataset_data
+from autoppia_iwa.src.demo_webs.utils import resolve_web_version
 
 
 async def fetch_data(seed_value: int | None = None, count: int = 50) -> list[dict]:
@@ -28,6 +29,7 @@ async def fetch_data(seed_value: int | None = None, count: int = 50) -> list[dic
 
     items = await load_dataset_data(
         backend_url=lodge_project.backend_url,
+        version=await resolve_web_version(lodge_project),
         project_key=project_key,
         entity_type="hotels",
         seed_value=seed_value if seed_value is not None else 0,
@@ -3,6 +3,7 @@ Shared dataset helpers for autowork_10.
 """
 
 from autoppia_iwa.src.demo_webs.data_provider import load_dataset_data
+from autoppia_iwa.src.demo_webs.utils import resolve_web_version
 
 
 async def fetch_data(
@@ -34,6 +35,7 @@ async def fetch_data(
     project_key = f"web_{FRONTEND_PORT_INDEX + 1}_{work_project.id}"
     items = await load_dataset_data(
         backend_url=work_project.backend_url,
+        version=await resolve_web_version(work_project),
         project_key=project_key,
         entity_type=entity_type,
         seed_value=seed_value if seed_value is not None else 0,
@@ -3,6 +3,7 @@ Shared dataset helpers for autocalendar_11.
 """
 
 from autoppia_iwa.src.demo_webs.data_provider import load_dataset_data
+from autoppia_iwa.src.demo_webs.utils import resolve_web_version
 
 
 def _apply_mapping(record: dict, mapping: dict) -> dict:
@@ -41,6 +42,7 @@ async def fetch_data(seed_value: int | None = None, count: int = 50) -> list[dic
 
     items = await load_dataset_data(
         backend_url=autocalendar_project.backend_url,
+        version=await resolve_web_version(autocalendar_project),
         project_key=project_key,
         entity_type="calendar_events",
         seed_value=seed_value if seed_value is not None else 1,
@@ -3,6 +3,7 @@ Shared dataset helpers for autolist_12.
 """
 
 from autoppia_iwa.src.demo_webs.data_provider import load_dataset_data
+from autoppia_iwa.src.demo_webs.utils import resolve_web_version
 
 
 async def fetch_data(seed_value: int | None = None, count: int = 50) -> list[dict]:
@@ -26,6 +27,7 @@ async def fetch_data(seed_value: int | None = None, count: int = 50) -> list[dic
     project_key = f"web_{FRONTEND_PORT_INDEX + 1}_{autolist_project.id}"
     items = await load_dataset_data(
         backend_url=autolist_project.backend_url,
+        version=await resolve_web_version(autolist_project),
         project_key=project_key,
         entity_type="tasks",
         seed_value=seed_value if seed_value is not None else 0,
@@ -5,6 +5,7 @@ Shared dataset helpers for autodrive_13.
 from typing import Any
 
 from autoppia_iwa.src.demo_webs.data_provider import load_dataset_data
+from autoppia_iwa.src.demo_webs.utils import resolve_web_version
 
 
 async def fetch_data(
@@ -36,6 +37,7 @@ async def fetch_data(
 
     items = await load_dataset_data(
         backend_url=drive_project.backend_url,
+        version=await resolve_web_version(drive_project),
         project_key=project_key,
         entity_type=entity_type,
         seed_value=seed_value if seed_value is not None else 0,
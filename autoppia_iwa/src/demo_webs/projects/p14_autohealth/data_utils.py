@@ -7,6 +7,7 @@ from typing import Any
 from loguru import logger
 
 from autoppia_iwa.src.demo_webs.data_provider import load_dataset_data
+from autoppia_iwa.src.demo_webs.utils import resolve_web_version
 
 
 def _load_initial_data_fallback(entity_type: str, count: int = 50) -> list[dict]:
@@ -47,6 +48,7 @@ async def fetch_data(
 
     items = await load_dataset_data(
         backend_url=health_project.backend_url,
+        version=await resolve_web_version(health_project),
         project_key=project_key,
         entity_type=entity_type,
         seed_value=seed_value if seed_value is not None else 0,
@@ -13,7 +13,7 @@ from typing import Any
 from loguru import logger
 
 from autoppia_iwa.src.demo_webs.data_provider import load_dataset_data
-from autoppia_iwa.src.demo_webs.utils import get_backend_service_url
+from autoppia_iwa.src.demo_webs.utils import get_backend_service_url, resolve_web_version
 
 PROJECT_KEY = "web_15_autostats"
 
@@ -166,6 +166,8 @@ async def fetch_data(
     Returns:
         List of dicts with UI-aligned fields (subnet_name, rank, epoch, etc.).
     """
+    from .main import autostats_project
+
     limit = min(max(1, count), 50)
     backend_url = get_backend_service_url().rstrip("/")
 
@@ -174,6 +176,7 @@ async def fetch_data(
             backend_url=backend_url,
             project_key=PROJECT_KEY,
             entity_type=entity_type,
+            version=await resolve_web_version(autostats_project),
             seed_value=seed_value,
             limit=limit,
         )
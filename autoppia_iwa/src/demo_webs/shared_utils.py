@@ -6,14 +6,15 @@ from dateutil import parser
 from loguru import logger
 
 from .criterion_helper import ComparisonOperator, CriterionValue, validate_criterion
+from .dataset_index import get_dataset_index
 
 
 def constraints_exist_in_db(data: list[dict], constraints: list[dict]) -> bool:
     """
     Returns True if *at least* one item satisfies ALL constraints.
+    Uses the dataset's index (built once per dataset list) instead of scanning every item.
     """
-    matching_items = [item for item in data if item_matches_all_constraints(item, constraints)]
-    return len(matching_items) > 0
+    return get_dataset_index(data).any_match(constraints)
 
 
 def item_matches_all_constraints(item: dict, constraints: list[dict]) -> bool:
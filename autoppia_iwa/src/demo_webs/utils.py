@@ -1,12 +1,19 @@
+import asyncio
 import json
 import os
 import sys
+from collections.abc import Iterable
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 from autoppia_iwa.config.config import DEMO_WEB_SERVICE_PORT, DEMO_WEBS_ENDPOINT, DEMO_WEBS_STARTING_PORT
+from autoppia_iwa.src.shared.single_flight import SingleFlight
 
 sys.path.append(str(Path(__file__).resolve().parents[3]))
 
+if TYPE_CHECKING:
+    from autoppia_iwa.src.demo_webs.classes import WebProject
+
 DEFAULT_WEB_VERSION = "0.0.0"
 
 
@@ -23,67 +30,44 @@ def get_backend_service_url():
     return f"{DEMO_WEBS_ENDPOINT}:{DEMO_WEB_SERVICE_PORT}/"
 
 
-def get_web_version(project_id: str, frontend_url: str | None = None) -> str | None:
-    """
-    Get the version of a web project.
+_PROJECT_TO_WEB_FOLDER = {
+    "autocinema": "web_1_autocinema",
+    "autobooks": "web_2_autobooks",
+    "autozone": "web_3_autozone",
+    "autodining": "web_4_autodining",
+    "autocrm": "web_5_autocrm",
+    "automail": "web_6_automail",
+    "autodelivery": "web_7_autodelivery",
+    "autolodge": "web_8_autolodge",
+    "autoconnect": "web_9_autoconnect",
+    "autowork": "web_10_autowork",
+    "autocalendar": "web_11_autocalendar",
+    "autolist": "web_12_autolist",
+    "autodrive": "web_13_autodrive",
+    "autohealth": "web_14_autohealth",
+}
 
-    Strategy:
-    1. Try HTTP GET to {frontend_url}/api/version (runtime, deployed version)
-    2. Fallback: Read package.json from filesystem (build time, local dev)
+WEB_VERSION_PROBE_TIMEOUT_S = 2.0
 
-    Args:
-        project_id: The project ID (e.g., "autobooks", "autodining")
-        frontend_url: Optional frontend URL to query the /api/version endpoint
+# (project_id, frontend_url) -> resolved version, filled by get_web_version_async
+_WEB_VERSION_CACHE: dict[tuple[str, str | None], str | None] = {}
+_WEB_VERSION_INFLIGHT = SingleFlight()
 
-    Returns:
-        Version string if found, None otherwise
-    """
-    # Strategy 1: Try HTTP endpoint first (runtime, deployed version)
-    if frontend_url:
-        try:
-            import urllib.error
-            import urllib.request
 
-            # Clean up frontend_url (remove trailing slash)
-            base_url = frontend_url.rstrip("/")
-            version_url = f"{base_url}/api/version"
+def _version_url(frontend_url: str) -> str:
+    return f"{frontend_url.rstrip('/')}/api/version"
 
-            # Make HTTP request to get version from deployed container
-            req = urllib.request.Request(version_url)
-            req.add_header("User-Agent", "IWA-Version-Checker/1.0")
-            with urllib.request.urlopen(req, timeout=2) as response:
-                if response.status == 200:
-                    data = json.loads(response.read().decode("utf-8"))
-                    version = data.get("version")
-                    if version and version != "unknown":
-                        return str(version)
-        except (urllib.error.URLError, TimeoutError, json.JSONDecodeError, KeyError, ImportError):
-            # HTTP request failed or urllib not available, continue to fallback
-            pass
-        except Exception:
-            # Any other error, continue to fallback
-            pass
 
-    # Strategy 2: Fallback to reading package.json from filesystem
-    # Map project IDs to web folder names
-    project_to_web_map = {
-        "autocinema": "web_1_autocinema",
-        "autobooks": "web_2_autobooks",
-        "autozone": "web_3_autozone",
-        "autodining": "web_4_autodining",
-        "autocrm": "web_5_autocrm",
-        "automail": "web_6_automail",
-        "autodelivery": "web_7_autodelivery",
-        "autolodge": "web_8_autolodge",
-        "autoconnect": "web_9_autoconnect",
-        "autowork": "web_10_autowork",
-        "autocalendar": "web_11_autocalendar",
-        "autolist": "web_12_autolist",
-        "autodrive": "web_13_autodrive",
-        "autohealth": "web_14_autohealth",
-    }
-
-    web_folder = project_to_web_map.get(project_id)
+def _version_from_payload(data) -> str | None:
+    version = data.get("version") if isinstance(data, dict) else None
+    if version and version != "unknown":
+        return str(version)
+    return None
+
+
+def _read_package_version(project_id: str) -> str | None:
+    """Read the version from the project's package.json (build time, local dev)."""
+    web_folder = _PROJECT_TO_WEB_FOLDER.get(project_id)
     if not web_folder:
         return None
 
@@ -116,3 +100,97 @@ def get_web_version(project_id: str, frontend_url: str | None = None) -> str | N
                 continue
 
     return DEFAULT_WEB_VERSION
+
+
+def get_web_version(project_id: str, frontend_url: str | None = None) -> str | None:
+    """
+    Get the version of a web project (blocking).
+
+    Strategy:
+    1. Try HTTP GET to {frontend_url}/api/version (runtime, deployed version)
+    2. Fallback: Read package.json from filesystem (build time, local dev)
+
+    Prefer ``get_web_version_async`` / ``resolve_web_version`` in async code: they
+    probe concurrently and cache the result per process.
+
+    Args:
+        project_id: The project ID (e.g., "autobooks", "autodining")
+        frontend_url: Optional frontend URL to query the /api/version endpoint
+
+    Returns:
+        Version string if found, None otherwise
+    """
+    # Strategy 1: Try HTTP endpoint first (runtime, deployed version)
+    if frontend_url:
+        try:
+            import urllib.error
+            import urllib.request
+
+            # Make HTTP request to get version from deployed container
+            req = urllib.request.Request(_version_url(frontend_url))
+            req.add_header("User-Agent", "IWA-Version-Checker/1.0")
+            with urllib.request.urlopen(req, timeout=WEB_VERSION_PROBE_TIMEOUT_S) as response:
+                if response.status == 200:
+                    version = _version_from_payload(json.loads(response.read().decode("utf-8")))
+                    if version:
+                        return version
+        except (urllib.error.URLError, TimeoutError, json.JSONDecodeError, KeyError, ImportError):
+            # HTTP request failed or urllib not available, continue to fallback
+            pass
+        except Exception:
+            # Any other error, continue to fallback
+            pass
+
+    # Strategy 2: Fallback to reading package.json from filesystem
+    return _read_package_version(project_id)
+
+
+async def _probe_web_version(project_id: str, frontend_url: str | None) -> str | None:
+    if frontend_url:
+        try:
+            import aiohttp
+
+            timeout = aiohttp.ClientTimeout(total=WEB_VERSION_PROBE_TIMEOUT_S)
+            async with (
+                aiohttp.ClientSession(timeout=timeout, headers={"User-Agent": "IWA-Version-Checker/1.0"}) as session,
+                session.get(_version_url(frontend_url)) as response,
+            ):
+                if response.status == 200:
+                    version = _version_from_payload(await response.json(content_type=None))
+                    if version:
+                        return version
+        except Exception:
+            # Frontend down or unexpected payload, continue to fallback
+            pass
+    return await asyncio.to_thread(_read_package_version, project_id)
+
+
+async def get_web_version_async(project_id: str, frontend_url: str | None = None) -> str | None:
+    """
+    Non-blocking ``get_web_version``, cached per (project_id, frontend_url).
+
+    Concurrent callers for the same project share one probe.
+    """
+    key = (project_id, frontend_url)
+    if key in _WEB_VERSION_CACHE:
+        return _WEB_VERSION_CACHE[key]
+
+    async def _probe() -> str | None:
+        version = _WEB_VERSION_CACHE[key] = await _probe_web_version(project_id, frontend_url)
+        return version
+
+    return await _WEB_VERSION_INFLIGHT.run(key, _probe)
+
+
+async def resolve_web_version(project: "WebProject") -> str | None:
+    """Return ``project.version``, probing (and storing) it on first use."""
+    if project.version is None:
+        project.version = await get_web_version_async(project.id, project.frontend_url)
+    return project.version
+
+
+async def resolve_web_versions(projects: Iterable["WebProject"]) -> dict[str, str | None]:
+    """Probe the versions of several projects concurrently."""
+    projects = list(projects)
+    versions = await asyncio.gather(*(resolve_web_version(project) for project in projects))
+    return {project.id: version for project, version in zip(projects, versions, strict=True)}
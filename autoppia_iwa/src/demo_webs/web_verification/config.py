@@ -34,13 +34,22 @@ class WebVerificationConfig:
     dynamic_verification_enabled: bool = True
     seed_values: list[int] | None = None  # Default seeds to test
 
+    # Concurrency: use cases verified at once, and seeds verified at once per task.
+    # Console output stays in use case / seed order; 1 = sequential (live output)
+    use_case_concurrency: int = 3
+    seed_concurrency: int = 3
+    # Task generation and LLM review calls in flight at once, across all use cases
+    llm_concurrency: int = 4
+
     # Trajectory evaluation (repo-local golden flows from trajectories.py)
     evaluate_trajectories: bool = False
     # Skip task generation, LLM review, and IWAP; only V2 + trajectory replay (no OpenAI init).
     evaluate_trajectories_only: bool = False
 
-    # Event trajectories verification (project-level)
+    # Event trajectories verification (project-level); replays share one browser,
+    # at most event_trajectory_concurrency at a time
     event_trajectory_verification_enabled: bool = True
+    event_trajectory_concurrency: int = 4
 
     # Data extraction (steps 2.5 + 2.6): trajectories + DE task generation verification
     data_extraction_verification_enabled: bool = True
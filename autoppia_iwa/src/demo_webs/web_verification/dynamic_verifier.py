@@ -23,6 +23,8 @@ from autoppia_iwa.src.evaluation.legacy.concurrent_evaluator import ConcurrentEv
 from autoppia_iwa.src.execution.actions.actions import BaseAction, NavigateAction
 from autoppia_iwa.src.web_agents.classes import TaskSolution
 
+from .ordered_output import gather_in_order
+
 
 class DynamicVerifier:
     """Verifies that dynamic functionality works correctly with different seed values"""
@@ -36,6 +38,7 @@ class DynamicVerifier:
         web_project: WebProject,
         llm_reviewer=None,
         llm_service_for_tasks=None,
+        seed_concurrency: int = 1,
     ):
         """
         Initialize Dynamic Verifier
@@ -45,9 +48,11 @@ class DynamicVerifier:
             llm_reviewer: Optional LLM reviewer for reviewing generated tasks
             llm_service_for_tasks: Optional LLM for ``SimpleTaskGenerator`` (defaults to DI container).
                 Pass the pipeline LLM (e.g. trajectories-only stub) to avoid loading OpenAI when unused.
+            seed_concurrency: Seeds verified at once; output and results stay in seed order.
         """
         self.web_project = web_project
         self.llm_reviewer = llm_reviewer
+        self.seed_concurrency = seed_concurrency
         task_llm = llm_service_for_tasks if llm_service_for_tasks is not None else DIContainer.llm_service()
         self.task_generator = SimpleTaskGenerator(
             web_project=web_project,
@@ -117,9 +122,12 @@ class DynamicVerifier:
                 "all_passed": False,
             }
 
-        # Process each seed
-        for seed in seed_values:
-            seed_result, seed_passed = await self._process_seed_verification(api_prompt, api_tests, api_start_url, use_case, seed, base_actions, solution_actions)
+        # Process the seeds concurrently, reporting them in seed order
+        seed_outcomes = await gather_in_order(
+            [lambda seed=seed: self._process_seed_verification(api_prompt, api_tests, api_start_url, use_case, seed, base_actions, solution_actions) for seed in seed_values],
+            limit=self.seed_concurrency,
+        )
+        for seed, (seed_result, seed_passed) in zip(seed_values, seed_outcomes, strict=True):
             results[seed] = seed_result
             if not seed_passed:
                 all_passed = False
@@ -943,8 +951,8 @@ class DynamicVerifier:
         datasets = {}
         datasets_info = {}
 
-        for seed in seed_values:
-            dataset, info = await self._load_dataset_for_seed(seed)
+        loaded = await gather_in_order([lambda seed=seed: self._load_dataset_for_seed(seed) for seed in seed_values], limit=self.seed_concurrency)
+        for seed, (dataset, info) in zip(seed_values, loaded, strict=True):
             if dataset is not None:
                 datasets[seed] = dataset
             datasets_info[seed] = info
@@ -3,11 +3,18 @@ Event-trajectory verifier for the web verification pipeline.
 
 Runs deterministic event trajectories (project-level or use-case-filtered) and
 validates them through the standard evaluator stack.
+
+A run keeps one Chromium for all of its trajectories: each replay leases a fresh,
+isolated context from a shared ``BrowserPool``, and up to ``max_concurrency``
+replays run at once. Browser startup is reported as ``setup_time``, apart from
+each trajectory's ``replay_time``.
 """
 
 from __future__ import annotations
 
+import asyncio
 import copy
+import time
 from typing import Any
 
 from loguru import logger
@@ -15,12 +22,15 @@ from loguru import logger
 from autoppia_iwa.src.data_generation.tasks.classes import BrowserSpecification, Task
 from autoppia_iwa.src.demo_webs.classes import Trajectory, WebProject
 from autoppia_iwa.src.demo_webs.trajectory_registry import get_trajectory_map, remap_url_to_frontend
-from autoppia_iwa.src.evaluation.concurrent_evaluator import ConcurrentEvaluator
+from autoppia_iwa.src.evaluation.concurrent_evaluator import ConcurrentEvaluator, _launch_args
 from autoppia_iwa.src.evaluation.legacy.concurrent_config import EvaluatorConfig
 from autoppia_iwa.src.execution.actions.actions import NavigateAction
 from autoppia_iwa.src.execution.actions.base import BaseAction
+from autoppia_iwa.src.execution.browser_pool import BrowserPool
 from autoppia_iwa.src.web_agents.classes import TaskSolution
 
+from .ordered_output import gather_in_order
+
 
 def _normalize_use_case_name(value: str | None) -> str:
     return str(value or "").strip().upper()
@@ -53,11 +63,17 @@ class EventTrajectoryVerifier:
         frontend_url: str | None = None,
         headless: bool = True,
         web_agent_id_for_replay: str = "1",
+        max_concurrency: int = 4,
     ) -> None:
         self.web_project = web_project
         self.frontend_url = frontend_url or getattr(web_project, "frontend_url", None)
         self.headless = headless
         self.web_agent_id_for_replay = str(web_agent_id_for_replay or "1")
+        self.max_concurrency = max(1, int(max_concurrency))
+        # Shared browser of the current run; the first replay launches it
+        self._browser_pool: BrowserPool | None = None
+        self._browser_warm_up: asyncio.Task | None = None
+        self._setup_time = 0.0
 
     async def verify_for_project(self, *, use_cases: list[str] | None = None) -> dict[str, Any]:
         trajectory_map = get_trajectory_map(self.web_project.id)
@@ -89,9 +105,23 @@ class EventTrajectoryVerifier:
                 "results": [],
             }
 
+        started = time.perf_counter()
+        self._browser_pool = BrowserPool(size=1, max_contexts_per_browser=self.max_concurrency, max_uses_per_browser=max(1, len(selected)), headless=self.headless)
+        self._browser_warm_up, self._setup_time = None, 0.0
+        try:
+            outcomes = await gather_in_order(
+                [
+                    lambda name=name, trajectory=trajectory, index=index: self._run_one(use_case_name=name, trajectory=trajectory, replay_agent_id=f"replay-{index}")
+                    for index, (name, trajectory) in enumerate(selected.items())
+                ],
+                limit=self.max_concurrency,
+            )
+        finally:
+            pool, self._browser_pool = self._browser_pool, None
+            await pool.aclose()
+
         results: list[dict[str, Any]] = []
-        for use_case_name, trajectory in selected.items():
-            ok, detail, meta = await self._run_one(use_case_name=use_case_name, trajectory=trajectory)
+        for use_case_name, (ok, detail, meta) in zip(selected, outcomes, strict=True):
             results.append(
                 {
                     "trajectory_id": use_case_name,
@@ -112,10 +142,13 @@ class EventTrajectoryVerifier:
             "total_count": total_count,
             "passed_count": passed_count,
             "all_passed": all_passed,
+            "setup_time": round(self._setup_time, 3),
+            "replay_time": round(sum(item.get("replay_time", 0.0) for item in results), 3),
+            "wall_time": round(time.perf_counter() - started, 3),
             "results": results,
         }
 
-    async def _run_one(self, *, use_case_name: str, trajectory: Trajectory) -> tuple[bool, str, dict[str, Any]]:
+    async def _run_one(self, *, use_case_name: str, trajectory: Trajectory, replay_agent_id: str) -> tuple[bool, str, dict[str, Any]]:
         raw_entry = _first_navigate_url(trajectory.actions)
         if not raw_entry:
             return False, "trajectory has no NavigateAction with url", {"score": 0.0, "tests_passed": 0, "total_tests": 0}
@@ -136,14 +169,18 @@ class EventTrajectoryVerifier:
             use_case=use_case,
         )
 
+        # Logins keep the seeded account of web_agent_id_for_replay; events and resets are
+        # keyed by replay_agent_id, so concurrent replays never see each other's events
         task_solution = TaskSolution(
             task_id=task.id,
             actions=actions,
-            web_agent_id=self.web_agent_id_for_replay,
+            web_agent_id=replay_agent_id,
         )
         task_solution.replace_credentials(self.web_agent_id_for_replay)
         task_solution.actions = task_solution.replace_web_agent_id()
 
+        await self._ensure_browser(task)
+        replay_started = time.perf_counter()
         try:
             evaluator = ConcurrentEvaluator(
                 self.web_project,
@@ -154,11 +191,14 @@ class EventTrajectoryVerifier:
                     verbose_logging=False,
                     headless=self.headless,
                 ),
+                browser_pool=self._browser_pool,
             )
             evaluation_result = await evaluator.evaluate_single_task_solution(task, task_solution)
         except Exception as exc:
             logger.exception(f"Event trajectory execution error: use_case={use_case_name} error={exc}")
-            return False, f"execution error: {exc}", {"score": 0.0, "tests_passed": 0, "total_tests": 0}
+            replay_time = round(time.perf_counter() - replay_started, 3)
+            return False, f"execution error: {exc}", {"score": 0.0, "tests_passed": 0, "total_tests": 0, "replay_time": replay_time}
+        replay_time = round(time.perf_counter() - replay_started, 3)
 
         score = float(getattr(evaluation_result, "final_score", 0.0) or 0.0)
         stats = getattr(evaluation_result, "stats", None)
@@ -166,7 +206,20 @@ class EventTrajectoryVerifier:
         total_tests = int(getattr(stats, "total_tests", 0) or 0)
         ok = abs(score - 1.0) < 1e-9
         detail = f"score={score:.3f} tests={tests_passed}/{total_tests}"
-        return ok, detail, {"score": score, "tests_passed": tests_passed, "total_tests": total_tests}
+        return ok, detail, {"score": score, "tests_passed": tests_passed, "total_tests": total_tests, "replay_time": replay_time}
+
+    async def _ensure_browser(self, task: Task) -> None:
+        """Launch the run's shared browser once; concurrent replays wait for the same launch."""
+        if self._browser_pool is None:
+            return
+        if self._browser_warm_up is None:
+            self._browser_warm_up = asyncio.ensure_future(self._warm_up_browser(self._browser_pool, task))
+        await asyncio.shield(self._browser_warm_up)
+
+    async def _warm_up_browser(self, pool: BrowserPool, task: Task) -> None:
+        started = time.perf_counter()
+        await pool.warm_up(1, launch_args=_launch_args(task.specifications or BrowserSpecification()))
+        self._setup_time = time.perf_counter() - started
 
     def _resolve_use_case(self, use_case_name: str):
         target = _normalize_use_case_name(use_case_name)
@@ -0,0 +1,92 @@
+"""
+Run verification steps concurrently while keeping their console output in order.
+
+Each job started by ``gather_in_order`` prints into its own buffer: ``sys.stdout`` is
+swapped for a proxy that routes writes to the buffer of the job running in the current
+task (a ``ContextVar``), so concurrent jobs never interleave. Buffers are flushed in
+job order as soon as every earlier job has finished, so the console reads exactly as a
+sequential run would. Nested calls flush into the enclosing job's buffer.
+
+Usage:
+    results = await gather_in_order([lambda uc=uc: process(uc) for uc in use_cases], limit=3)
+"""
+
+import asyncio
+import io
+import sys
+from collections.abc import Awaitable, Callable, Sequence
+from contextvars import ContextVar
+from typing import TypeVar
+
+T = TypeVar("T")
+
+_job_buffer: ContextVar[io.StringIO | None] = ContextVar("_job_buffer", default=None)
+
+
+class _RoutingStdout:
+    """``sys.stdout`` stand-in that writes to the current job's buffer, if any."""
+
+    def __init__(self, target):
+        self.target = target
+        self.users = 0
+
+    def write(self, text: str) -> int:
+        buffer = _job_buffer.get()
+        return (buffer if buffer is not None else self.target).write(text)
+
+    def flush(self) -> None:
+        if _job_buffer.get() is None:
+            self.target.flush()
+
+    def __getattr__(self, name):
+        return getattr(self.target, name)
+
+
+def _install_router() -> _RoutingStdout:
+    router = sys.stdout if isinstance(sys.stdout, _RoutingStdout) else _RoutingStdout(sys.stdout)
+    sys.stdout = router
+    router.users += 1
+    return router
+
+
+def _uninstall_router(router: _RoutingStdout) -> None:
+    router.users -= 1
+    if router.users == 0 and sys.stdout is router:
+        sys.stdout = router.target
+
+
+async def gather_in_order(jobs: Sequence[Callable[[], Awaitable[T]]], limit: int) -> list[T]:
+    """
+    Run ``jobs`` with at most ``limit`` in flight and return their results in job order.
+
+    Output printed by job i appears after that of jobs 0..i-1. With ``limit <= 1`` the
+    jobs simply run one after another and print live. If a job raises, the others are
+    cancelled and the exception propagates once the output before it has been flushed.
+    """
+    if limit <= 1 or len(jobs) <= 1:
+        return [await job() for job in jobs]
+
+    semaphore = asyncio.Semaphore(limit)
+    buffers = [io.StringIO() for _ in jobs]
+
+    async def _run(index: int) -> T:
+        async with semaphore:
+            _job_buffer.set(buffers[index])  # Tasks run in a copy of the context
+            return await jobs[index]()
+
+    router = _install_router()
+    tasks = [asyncio.create_task(_run(index)) for index in range(len(jobs))]
+    try:
+        results: list[T] = []
+        for task, buffer in zip(tasks, buffers, strict=True):
+            try:
+                await asyncio.wait([task])
+            finally:
+                sys.stdout.write(buffer.getvalue())
+                sys.stdout.flush()
+            results.append(task.result())
+        return results
+    finally:
+        for task in tasks:
+            task.cancel()
+        _uninstall_router(router)
@@ -13,10 +13,11 @@ Main pipeline that orchestrates:
 """
 
 import asyncio
-import copy
 import json
+import random
 import re
 import sys
+from collections.abc import Awaitable
 from pathlib import Path
 from typing import Any
 from urllib.parse import parse_qs, urlparse
@@ -37,6 +38,7 @@ from .dynamic_verifier import DynamicVerifier
 from .event_trajectory_verifier import EventTrajectoryVerifier
 from .iwap_client import IWAPClient
 from .llm_reviewer import LLMReviewer
+from .ordered_output import gather_in_order
 from .trajectory_doability import doability_result_from_trajectory
 
 # Constants
@@ -94,6 +96,11 @@ class WebVerificationPipeline:
         else:
             self.llm_service = DIContainer.llm_service()
 
+        # Shared by every use case, so concurrent use cases do not multiply the LLM fan-out
+        self._llm_semaphore = asyncio.Semaphore(max(1, config.llm_concurrency))
+        # Random seed of each use case's task generation, set by run()
+        self._generation_seeds: dict[str, int] = {}
+
         # Initialize components
         self.task_generator = SimpleTaskGenerator(
             web_project=web_project,
@@ -125,6 +132,7 @@ class WebVerificationPipeline:
                 web_project=web_project,
                 llm_reviewer=self.llm_reviewer,
                 llm_service_for_tasks=self.llm_service if config.evaluate_trajectories_only else None,
+                seed_concurrency=config.seed_concurrency,
             )
             if config.dynamic_verification_enabled
             else None
@@ -135,6 +143,7 @@ class WebVerificationPipeline:
                 web_project=web_project,
                 frontend_url=web_project.frontend_url,
                 headless=True,
+                max_concurrency=config.event_trajectory_concurrency,
             )
             if config.event_trajectory_verification_enabled
             else None
@@ -195,11 +204,20 @@ class WebVerificationPipeline:
             await self._save_results()
             return self.results
 
-        # Process each use case
-        for use_case in use_cases_to_run:
+        # Task generation seeds are drawn in use case order before any use case starts
+        self._generation_seeds = {use_case.name: random.getrandbits(64) for use_case in use_cases_to_run}
+
+        # Process use cases concurrently; output and results stay in use case order
+        async def _process(use_case: UseCase) -> dict[str, Any]:
             logger.info(f"Processing use case: {use_case.name}")
-            use_case_results = await self._process_use_case(use_case)
-            self.results["use_cases"][use_case.name] = use_case_results
+            return await self._process_use_case(use_case)
+
+        use_case_results = await gather_in_order(
+            [lambda use_case=use_case: _process(use_case) for use_case in use_cases_to_run],
+            limit=self.config.use_case_concurrency,
+        )
+        for use_case, results in zip(use_cases_to_run, use_case_results, strict=True):
+            self.results["use_cases"][use_case.name] = results
 
         # Save results
         await self._save_results()
@@ -235,9 +253,10 @@ class WebVerificationPipeline:
             total_count = event_result.get("total_count", 0)
             all_passed = event_result.get("all_passed", False)
             print(f"Event trajectories passed: {'✅ YES' if all_passed else '❌ NO'} ({passed_count}/{total_count})")
+            print(f"Browser setup: {event_result.get('setup_time', 0.0):.2f}s | replay: {event_result.get('replay_time', 0.0):.2f}s | wall: {event_result.get('wall_time', 0.0):.2f}s")
             for item in event_result.get("results", []):
                 status = "✓" if item.get("ok", False) else "✗"
-                print(f"  {status} [{item.get('use_case')}] {item.get('trajectory_id')}: {item.get('detail')}")
+                print(f"  {status} [{item.get('use_case')}] {item.get('trajectory_id')}: {item.get('detail')} ({item.get('replay_time', 0.0):.2f}s)")
         print("=" * 80 + "\n")
 
     async def _run_data_extraction_project_verification(self) -> None:
@@ -336,6 +355,11 @@ class WebVerificationPipeline:
             )
         return out
 
+    async def _llm_call(self, call: Awaitable[Any]) -> Any:
+        """Await one task generation / review call within ``config.llm_concurrency``."""
+        async with self._llm_semaphore:
+            return await call
+
     async def _process_use_case(self, use_case: UseCase) -> dict[str, Any]:
         """
         Process a single use case through all verification steps
@@ -377,35 +401,35 @@ class WebVerificationPipeline:
             )
 
             tasks = []
+            total_tasks = self.config.tasks_per_use_case
+
+            # Generate the tasks concurrently, one prompt per call so each gets its own seed
+            # and constraints. The generator works on its own copy of the use case, so the
+            # shared object is never mutated; results come back in task order. Each call's
+            # random seed comes from the use case's seed (drawn in run()), in task order, so
+            # scheduling cannot change the tasks.
+            use_case_seed = self._generation_seeds.pop(use_case.name, None)
+            use_case_random = random.Random(random.getrandbits(64) if use_case_seed is None else use_case_seed)
+            random_seeds = [use_case_random.getrandbits(64) for _ in range(total_tasks)]
+            task_lists = await asyncio.gather(
+                *(
+                    self._llm_call(
+                        self.task_generator.generate_tasks_for_use_case(
+                            use_case=use_case,
+                            number_of_prompts=1,
+                            dynamic=self.config.dynamic_enabled,
+                            random_seed=random_seed,
+                        )
+                    )
+                    for random_seed in random_seeds
+                )
+            )
 
-            for task_index in range(self.config.tasks_per_use_case):
+            for task_index, task_list in enumerate(task_lists):
                 task_num = task_index + 1
-                total_tasks = self.config.tasks_per_use_case
-
-                print(f"🔄 Generating task {task_num}/{total_tasks}...")
-
-                # Clear constraints from use_case before generating new task
-                # This ensures each task gets fresh constraints based on its own seed
-                use_case.constraints = None
-
-                # Generate one task at a time - each will get a different random seed
-                task_list = await self.task_generator.generate_tasks_for_use_case(
-                    use_case=use_case,
-                    number_of_prompts=1,  # Generate one at a time
-                    dynamic=self.config.dynamic_enabled,
-                )
 
                 if task_list and len(task_list) > 0:
                     task = task_list[0]
-                    # IMPORTANT: The task.use_case is a reference to the shared use_case object.
-                    # We need to create a copy of the use_case for this task to preserve the constraints
-                    # that were just generated, before they get overwritten by the next task generation.
-                    if use_case.constraints and task.use_case:
-                        # Create a copy of the use_case object so each task has its own independent use_case
-                        # with its own constraints. This prevents constraints from being overwritten.
-                        task.use_case = copy.deepcopy(use_case)
-                        logger.debug(f"Created independent use_case copy for task {task_num} with {len(task.use_case.constraints)} constraints")
-
                     tasks.append(task)
 
                     # Print successfully generated task details
@@ -438,7 +462,11 @@ class WebVerificationPipeline:
             # Step 1: LLM review (no retry logic)
             self._print_step_banner("🤖 STEP 1: LLM REVIEW", f"Use Case: {use_case.name}", f"Reviewing {len(tasks)} task(s)...")
 
-            # Review each task once
+            # Review each task once; the reviews run concurrently and are reported in task order
+            if self.llm_reviewer:
+                review_results = await asyncio.gather(*(self._llm_call(self.llm_reviewer.review_task_and_constraints(task)) for task in tasks))
+            else:
+                review_results = [None] * len(tasks)
             task_review_map = {}
             for task_index, task in enumerate(tasks):
                 task_num = task_index + 1
@@ -448,8 +476,8 @@ class WebVerificationPipeline:
                 if self.llm_reviewer:
                     self._print_step_banner(f"📋 Reviewing Task {task_num}/{len(tasks)}", f"Giving task {task_num} to LLM for review...", leading_newline=False, trailing_newline=True)
 
-                    logger.debug(f"Reviewing task {task.id} with LLM: checking if prompt matches constraints")
-                    review_result = await self.llm_reviewer.review_task_and_constraints(task)
+                    logger.debug(f"Reviewed task {task.id} with LLM: checking if prompt matches constraints")
+                    review_result = review_results[task_index]
                     review_result["task_id"] = task.id
                     review_result["retry_count"] = 0
 
@@ -16,6 +16,7 @@ from autoppia_iwa.config.config import (
 )
 from autoppia_iwa.src.llms.factory import LLMFactory
 from autoppia_iwa.src.llms.interfaces import LLMConfig
+from autoppia_iwa.src.llms.response_cache import maybe_cache_llm
 
 
 class DIContainer(containers.DeclarativeContainer):
@@ -67,11 +68,12 @@ class DIContainer(containers.DeclarativeContainer):
         except KeyError:
             raise ValueError(f"Unsupported LLM_PROVIDER: {LLM_PROVIDER}") from None
 
-        return LLMFactory.create_llm(
+        llm = LLMFactory.create_llm(
             llm_type=LLM_PROVIDER,
             config=provider["config"],
             **provider["kwargs"],
         )
+        return maybe_cache_llm(llm)
 
     @classmethod
     def resolve_llm_service(cls, llm_service=None):
@@ -4,8 +4,11 @@ Benchmark orchestrator: generate tasks, run agents, evaluate, persist results.
 Parallelization strategy:
 - Each (agent, task) pair runs as an independent evaluation job
 - Each job gets a unique web_agent_id for DB/event isolation on the shared backend
-- A semaphore controls max concurrent browser instances (max_parallel_evaluations)
+- A semaphore controls max concurrent browser instances (max_parallel_evaluations),
+  or an AIMD limiter adapts that number when adaptive_concurrency is set
 - Agent endpoints can handle multiple concurrent requests — no bottleneck there
+- With shards > 1, tasks are split by a hash of their id across worker processes,
+  each with its own event loop and browsers; results stream back to this process
 
 Usage:
     config = BenchmarkConfig(
@@ -18,8 +21,12 @@ Usage:
 
 import asyncio
 import contextlib
+import multiprocessing
+import queue
 import time
 import uuid
+from collections.abc import Awaitable, Callable
+from dataclasses import replace
 from datetime import datetime
 from typing import Any
 
@@ -27,15 +34,18 @@ from loguru import logger
 
 from autoppia_iwa.src.data_generation.tasks.classes import Task, TaskGenerationConfig
 from autoppia_iwa.src.data_generation.tasks.pipeline import TaskGenerationPipeline
+from autoppia_iwa.src.data_generation.tests.judge_cache import HTML_JUDGE_CACHE, JudgeCacheMetrics
 from autoppia_iwa.src.demo_webs.classes import WebProject
 from autoppia_iwa.src.evaluation.benchmark.config import BenchmarkConfig
 from autoppia_iwa.src.evaluation.benchmark.reporting import (
     aggregate_project_results,
+    build_missing_task_result,
     build_run_report,
     build_task_result,
     build_terminal_report,
     save_run_report,
 )
+from autoppia_iwa.src.evaluation.benchmark.sharding import ShardMessage, split_tasks_by_shard, tasks_for_shard
 from autoppia_iwa.src.evaluation.benchmark.trace_writer import TraceWriter
 from autoppia_iwa.src.evaluation.benchmark.utils.logging import setup_logging
 from autoppia_iwa.src.evaluation.benchmark.utils.metrics import TimingMetrics
@@ -45,7 +55,10 @@ from autoppia_iwa.src.evaluation.benchmark.utils.task_generation import (
     save_tasks_to_json,
 )
 from autoppia_iwa.src.evaluation.classes import EvaluationResult, EvaluationStats
+from autoppia_iwa.src.evaluation.shared.concurrency import BROWSER_ERROR_PREFIX, AdaptiveConcurrencyLimiter, record_evaluation_outcome
 from autoppia_iwa.src.evaluation.stateful_evaluator import TaskExecutionSession
+from autoppia_iwa.src.llms.http_client import aclose_llm_clients
+from autoppia_iwa.src.shared.profiling import PHASE_AGENT_STEP, PHASE_TRACE_WRITE, PhaseProfiler
 from autoppia_iwa.src.web_agents.classes import IWebAgent, sanitize_html
 
 
@@ -72,11 +85,17 @@ class Benchmark:
 
     def __init__(self, config: BenchmarkConfig) -> None:
         self.config = config
-        self._sem = asyncio.Semaphore(config.max_parallel_evaluations)
+        self._limiter = AdaptiveConcurrencyLimiter(config.max_parallel_evaluations, config.adaptive_concurrency) if config.adaptive_concurrency else None
+        self._sem = self._limiter or asyncio.Semaphore(config.max_parallel_evaluations)
         self._timing = TimingMetrics()
+        self._profiler = PhaseProfiler(enabled=config.profile_phases)
         self._results: dict[str, Any] = {}
         self._project_reports: dict[str, Any] = {}
         self._trace_writer: TraceWriter | None = None
+        # Adaptive-concurrency metrics reported by shard workers, by shard index
+        self._shard_concurrency: dict[int, dict[str, Any]] = {}
+        # HTML judge memo counters reported by shard processes (the local ones live in HTML_JUDGE_CACHE)
+        self._shard_judge_cache = JudgeCacheMetrics()
         self.last_run_report: dict[str, Any] | None = None
         self.last_results_path: str | None = None
 
@@ -96,7 +115,8 @@ class Benchmark:
             f"{len(self.config.agents)} agents, "
             f"{self.config.runs} runs, "
             f"mode={self.config.evaluator_mode}, "
-            f"parallel={self.config.max_parallel_evaluations}"
+            f"parallel={self.config.max_parallel_evaluations}, "
+            f"shards={self.config.shards}" + (f" (only shard {self.config.shard_index})" if self.config.shard_index is not None else "")
         )
 
     def _get_task_cache_dir(self) -> str:
@@ -109,6 +129,9 @@ class Benchmark:
     async def run(self) -> dict:
         """Execute the full benchmark. Returns per-project results dict."""
         logger.info("Starting benchmark")
+        # The judge memo is process-wide; start each run with empty verdicts and counters
+        HTML_JUDGE_CACHE.clear()
+        self._shard_judge_cache = JudgeCacheMetrics()
         self._timing.start()
 
         try:
@@ -126,6 +149,7 @@ class Benchmark:
                     self._aggregate_project(project, run_results)
         finally:
             self._timing.end()
+            await self._close_clients()
 
         self.last_run_report = self._build_run_report()
         if self.config.save_results_json and self._results:
@@ -136,6 +160,34 @@ class Benchmark:
         logger.success("Benchmark finished")
         return self._results
 
+    async def _close_clients(self) -> None:
+        # Agents and LLM providers keep pooled keep-alive connections between calls.
+        for agent in self.config.agents:
+            with contextlib.suppress(Exception):
+                await agent.aclose()
+        with contextlib.suppress(Exception):
+            await aclose_llm_clients()
+
+    @property
+    def concurrency_metrics(self) -> dict[str, Any] | None:
+        """Decisions and counters of the adaptive limiter, or None with a fixed limit."""
+        return self._limiter.metrics.as_dict() if self._limiter else None
+
+    @property
+    def phase_timings(self) -> dict[str, Any] | None:
+        """Per-phase and per-action-type latency percentiles, or None unless profile_phases is set."""
+        return self._profiler.as_dict() if self._profiler.enabled else None
+
+    @property
+    def judge_cache_metrics(self) -> dict[str, int] | None:
+        """JudgeBaseOnHTML verdict/diff memo counters for this process and its shards, or None if no HTML judge ran."""
+        metrics = JudgeCacheMetrics()
+        metrics.merge(HTML_JUDGE_CACHE.metrics.as_dict())
+        metrics.merge(self._shard_judge_cache.as_dict())
+        if not (metrics.verdict_hits or metrics.verdict_misses or metrics.coalesced):
+            return None
+        return metrics.as_dict()
+
     def build_terminal_report(self) -> str:
         """Return a concise terminal-friendly summary of the latest run."""
         return build_terminal_report(
@@ -186,9 +238,26 @@ class Benchmark:
         for t in tasks:
             t.should_record = self.config.record_gif
 
+        if self.config.shard_index is not None:
+            tasks = tasks_for_shard(tasks, self.config.shards, self.config.shard_index)
+            logger.info(f"Shard {self.config.shard_index}/{self.config.shards}: {len(tasks)} tasks of {project.name}")
+        elif self.config.shards > 1:
+            return await self._run_sharded(project, tasks, run_idx)
+
+        return await self._run_tasks(project, tasks, run_idx)
+
+    async def _run_tasks(
+        self,
+        project: WebProject,
+        tasks: list[Task],
+        run_idx: int,
+        on_result: Callable[[str, str, dict[str, Any]], None] | None = None,
+    ) -> dict[str, dict[str, dict[str, Any]]]:
+        """Evaluate every (agent, task) pair in this process; ``on_result`` sees each task result as it lands."""
         # Create trace writer for this run
         ts = datetime.now().strftime("%Y%m%dT%H%M%S")
-        trace_dir = self.config.traces_dir / f"{project.id}_{ts}_r{run_idx}"
+        shard_suffix = f"_s{self.config.shard_index}" if self.config.shard_index is not None else ""
+        trace_dir = self.config.traces_dir / f"{project.id}_{ts}_r{run_idx}{shard_suffix}"
         self._trace_writer = TraceWriter(
             trace_dir,
             run_metadata={
@@ -197,6 +266,7 @@ class Benchmark:
                 "max_steps": self.config.max_steps_per_task,
                 "agents": [a.name for a in self.config.agents],
             },
+            compression=self.config.trace_compression,
         )
 
         # Build all (agent, task) jobs and run them with concurrency control
@@ -224,20 +294,100 @@ class Benchmark:
                 continue
             if ev_result is None:
                 continue
-            results.setdefault(agent.id, {})[task.id] = build_task_result(
+            task_result = build_task_result(
                 agent=agent,
                 task=task,
                 evaluation_result=ev_result,
                 eval_id=getattr(ev_result.stats, "web_agent_id", None) or ev_result.web_agent_id,
                 run_idx=run_idx,
             )
+            results.setdefault(agent.id, {})[task.id] = task_result
+            if on_result is not None:
+                on_result(agent.id, task.id, task_result)
 
         # Flush traces for debugger
         if self._trace_writer:
-            self._trace_writer.flush()
+            with self._profiler.span(PHASE_TRACE_WRITE):
+                await asyncio.to_thread(self._trace_writer.flush)
 
         return results
 
+    # ── Sharded mode: one worker process per shard ──────────────────────
+
+    async def _run_sharded(self, project: WebProject, tasks: list[Task], run_idx: int) -> dict[str, dict[str, dict[str, Any]]]:
+        shards = self.config.shards
+        # Spawn (not fork): the parent's event loop, Playwright driver and pooled clients must not leak into workers.
+        context = multiprocessing.get_context("spawn")
+        results_queue = context.Queue()
+        workers: dict[int, Any] = {}
+        tasks_by_shard: dict[int, list[Task]] = {}
+        for shard_index, shard_tasks in enumerate(split_tasks_by_shard(tasks, shards)):
+            if not shard_tasks:
+                continue
+            tasks_by_shard[shard_index] = shard_tasks
+            worker = context.Process(
+                target=_run_shard_process,
+                args=(replace(self.config, shard_index=shard_index, print_summary=False, save_results_json=False), project, shard_tasks, run_idx, results_queue),
+                name=f"benchmark-shard-{shard_index}",
+            )
+            worker.start()
+            workers[shard_index] = worker
+            logger.info(f"Shard {shard_index}/{shards}: {len(shard_tasks)} tasks of {project.name} (pid={worker.pid})")
+
+        try:
+            return await self._collect_shard_results(workers, results_queue, project, tasks_by_shard, run_idx)
+        finally:
+            for worker in workers.values():
+                if worker.is_alive():
+                    worker.terminate()
+                await asyncio.to_thread(worker.join)
+
+    async def _collect_shard_results(
+        self,
+        workers: dict[int, Any],
+        results_queue: Any,
+        project: WebProject,
+        tasks_by_shard: dict[int, list[Task]],
+        run_idx: int,
+    ) -> dict[str, dict[str, dict[str, Any]]]:
+        """Merge results streamed by shard workers until each one reports done or dies; a dead shard's unreported tasks are recorded as failed."""
+        results: dict[str, dict[str, dict[str, Any]]] = {}
+        running = set(workers)
+        while running:
+            try:
+                message: ShardMessage = await asyncio.to_thread(results_queue.get, True, 0.5)
+            except queue.Empty:
+                # Nothing queued for a while: anything still running but dead has crashed.
+                for shard_index in sorted(running):
+                    worker = workers[shard_index]
+                    if not worker.is_alive():
+                        running.discard(shard_index)
+                        logger.error(
+                            f"Shard {shard_index}/{self.config.shards} of {project.name} exited with code {worker.exitcode} before finishing; "
+                            f"re-run it alone with shards={self.config.shards}, shard_index={shard_index}, use_cached_tasks=True"
+                        )
+                        error = f"shard {shard_index} exited with code {worker.exitcode} before reporting this task"
+                        for task in tasks_by_shard.get(shard_index, []):
+                            for agent in self.config.agents:
+                                if task.id not in results.get(agent.id, {}):
+                                    results.setdefault(agent.id, {})[task.id] = build_missing_task_result(agent=agent, task=task, run_idx=run_idx, error=error)
+                continue
+            if message[0] == "judge_cache":
+                self._shard_judge_cache.merge(message[2])
+                continue
+            if message[0] == "done":
+                _, shard_index, concurrency, phase_state = message
+                running.discard(shard_index)
+                if concurrency is not None:
+                    self._shard_concurrency[shard_index] = concurrency
+                if phase_state is not None:
+                    self._profiler.merge_state(phase_state)
+                continue
+            _, _, agent_id, task_id, task_result = message
+            results.setdefault(agent_id, {})[task_id] = task_result
+            self._timing.record_evaluation_time(agent_id, task_id, float(task_result.get("evaluation_time", 0.0)))
+        return results
+
     # ── Single evaluation job (semaphore-guarded) ───────────────────────
 
     async def _run_eval_job(
@@ -254,7 +404,10 @@ class Benchmark:
             validator_id = _make_validator_id(self.config.validator_id_prefix, run_idx)
             logger.info(f"[{job_num}/{total_jobs}] {agent.name} x {task.id} (eval_id={eval_id}, validator_id={validator_id})")
 
-            return await self._run_stateful(task, agent, eval_id, validator_id)
+            result = await self._run_stateful(task, agent, eval_id, validator_id)
+            if self._limiter is not None:
+                record_evaluation_outcome(self._limiter, result.stats)
+            return result
 
     # ── Stateful mode: step-by-step with live browser ───────────────────
 
@@ -267,6 +420,8 @@ class Benchmark:
             should_record_gif=self.config.record_gif,
             capture_screenshot=True,
             headless=self.config.headless,
+            screenshot_config=self.config.screenshots,
+            profiler=self._profiler,
         )
 
         # Start episode trace
@@ -286,9 +441,13 @@ class Benchmark:
         history: list = []
         step_result = None
         total_actions = 0
+        step_times: list[float] = []
+        setup_time = 0.0
+        error: Exception | None = None
 
         try:
-            step_result = await evaluator.reset()
+            step_result = await _in_browser(evaluator.reset())
+            setup_time = time.time() - start
             step_idx = 0
 
             while total_actions < max_steps and not step_result.score.success:
@@ -298,14 +457,15 @@ class Benchmark:
                 html = sanitize_html(before_html, eval_id)
 
                 try:
-                    actions = await agent.step(
-                        task=task,
-                        html=html,
-                        screenshot=step_result.snapshot.screenshot,
-                        url=before_url,
-                        step_index=step_idx,
-                        history=self._compact_history(history),
-                    )
+                    with self._profiler.span(PHASE_AGENT_STEP):
+                        actions = await agent.step(
+                            task=task,
+                            html=html,
+                            screenshot=step_result.snapshot.screenshot,
+                            url=before_url,
+                            step_index=step_idx,
+                            history=self._compact_history(history),
+                        )
                 except Exception as e:
                     logger.warning(f"{agent.name} step failed: {e}")
                     break
@@ -314,25 +474,28 @@ class Benchmark:
                     break
 
                 for action in actions[: max_steps - total_actions]:
-                    step_result = await evaluator.step(action)
+                    step_started = time.time()
+                    step_result = await _in_browser(evaluator.step(action))
+                    step_times.append(time.time() - step_started)
                     total_actions += 1
 
                     # Record trace step
                     if episode_trace:
                         ar = step_result.action_result
-                        episode_trace.record_step(
-                            step_index=total_actions - 1,
-                            before_url=before_url,
-                            before_html=before_html,
-                            before_score=before_score,
-                            after_url=step_result.snapshot.url or "",
-                            after_html=step_result.snapshot.html or "",
-                            after_score=step_result.score.raw_score,
-                            after_success=step_result.score.success,
-                            actions=[{"type": action.type, "raw": action.model_dump()}],
-                            exec_ok=bool(getattr(ar, "successfully_executed", True)) if ar else True,
-                            error=getattr(ar, "error", None) if ar else None,
-                        )
+                        with self._profiler.span(PHASE_TRACE_WRITE):
+                            episode_trace.record_step(
+                                step_index=total_actions - 1,
+                                before_url=before_url,
+                                before_html=before_html,
+                                before_score=before_score,
+                                after_url=step_result.snapshot.url or "",
+                                after_html=step_result.snapshot.html or "",
+                                after_score=step_result.score.raw_score,
+                                after_success=step_result.score.success,
+                                actions=[{"type": action.type, "raw": action.model_dump()}],
+                                exec_ok=bool(getattr(ar, "successfully_executed", True)) if ar else True,
+                                error=getattr(ar, "error", None) if ar else None,
+                            )
                         # Update before state for next iteration
                         before_html = step_result.snapshot.html or ""
                         before_url = step_result.snapshot.url or task.url
@@ -348,6 +511,7 @@ class Benchmark:
                 step_idx += 1
 
         except Exception as e:
+            error = e
             logger.error(f"{agent.name} stateful eval error: {e}")
         finally:
             with contextlib.suppress(Exception):
@@ -356,14 +520,15 @@ class Benchmark:
         # Close episode trace
         sr = step_result.score if step_result else None
         if episode_trace:
-            episode_trace.close(
-                success=sr.success if sr else False,
-                score=sr.raw_score if sr else 0.0,
-                total_steps=total_actions,
-                evaluation_time=time.time() - start,
-                agent_name=agent.name,
-                web_agent_id=eval_id,
-            )
+            with self._profiler.span(PHASE_TRACE_WRITE):
+                episode_trace.close(
+                    success=sr.success if sr else False,
+                    score=sr.raw_score if sr else 0.0,
+                    total_steps=total_actions,
+                    evaluation_time=time.time() - start,
+                    agent_name=agent.name,
+                    web_agent_id=eval_id,
+                )
 
         elapsed = time.time() - start
         sr = step_result.score if step_result else None
@@ -381,10 +546,15 @@ class Benchmark:
                 action_count=total_actions,
                 start_time=start,
                 total_time=elapsed,
+                browser_setup_time=setup_time,
+                action_execution_times=step_times,
+                skipped_phases=list(getattr(evaluator, "skipped_phases", ())),
                 raw_score=sr.raw_score if sr else 0.0,
                 final_score=sr.raw_score if sr else 0.0,
                 tests_passed=sr.tests_passed if sr else 0,
                 total_tests=sr.total_tests if sr else 0,
+                had_errors=error is not None,
+                error_message=(f"{BROWSER_ERROR_PREFIX}: {error}" if isinstance(error, _BrowserFailure) else str(error)) if error is not None else "",
             ),
         )
 
@@ -430,9 +600,57 @@ class Benchmark:
         logger.info(f"Results saved: {path}")
 
     def _build_run_report(self) -> dict[str, Any]:
+        concurrency = self.concurrency_metrics
+        if concurrency is None and self._shard_concurrency:
+            concurrency = {f"shard_{index}": metrics for index, metrics in sorted(self._shard_concurrency.items())}
         return build_run_report(
             config=self.config,
             timing=self._timing,
             project_reports=self._project_reports,
             summary=self._results,
+            concurrency=concurrency,
+            phase_timings=self.phase_timings,
+            judge_cache=self.judge_cache_metrics,
+        )
+
+
+# ── Browser failures ────────────────────────────────────────────────────
+
+
+class _BrowserFailure(Exception):
+    """A ``TaskExecutionSession`` call failed; unlike agent-side errors it counts against adaptive concurrency."""
+
+
+async def _in_browser(call: Awaitable[Any]) -> Any:
+    try:
+        return await call
+    except Exception as e:
+        raise _BrowserFailure(e) from e
+
+
+# ── Shard worker process ────────────────────────────────────────────────
+
+
+def _run_shard_process(config: BenchmarkConfig, project: WebProject, tasks: list[Task], run_idx: int, results: Any) -> None:
+    """Worker process entry point: evaluate one shard's tasks and stream results onto ``results``."""
+    from autoppia_iwa.src.bootstrap import AppBootstrap
+
+    # A spawned process starts with an unwired container; LLM-backed tests need it
+    AppBootstrap()
+    asyncio.run(_run_shard(config, project, tasks, run_idx, results))
+
+
+async def _run_shard(config: BenchmarkConfig, project: WebProject, tasks: list[Task], run_idx: int, results: Any) -> None:
+    benchmark = Benchmark(config)
+    shard_index = config.shard_index
+    try:
+        await benchmark._run_tasks(
+            project,
+            tasks,
+            run_idx,
+            on_result=lambda agent_id, task_id, task_result: results.put(("result", shard_index, agent_id, task_id, task_result)),
         )
+    finally:
+        await benchmark._close_clients()
+    results.put(("judge_cache", shard_index, HTML_JUDGE_CACHE.metrics.as_dict()))
+    results.put(("done", shard_index, benchmark.concurrency_metrics, benchmark._profiler.to_state() if config.profile_phases else None))
@@ -4,6 +4,8 @@ from typing import Literal
 
 from autoppia_iwa.config.config import PROJECT_BASE_DIR, VALIDATOR_ID
 from autoppia_iwa.src.demo_webs.classes import WebProject
+from autoppia_iwa.src.evaluation.shared.concurrency import AdaptiveConcurrencyConfig
+from autoppia_iwa.src.execution.screenshots import ScreenshotConfig
 from autoppia_iwa.src.web_agents.classes import IWebAgent
 
 TestTypes = Literal["event_only", "data_extraction_only"]
@@ -49,12 +51,27 @@ class BenchmarkConfig:
     # Execution
     runs: int = 1
     max_parallel_evaluations: int = 1
+    # Adapt the number of in-flight evaluations (starting at max_parallel_evaluations)
+    # to step latency, errors/timeouts and free memory. None keeps it fixed.
+    adaptive_concurrency: AdaptiveConcurrencyConfig | None = None
+    # Worker processes per run; each gets its own event loop and up to
+    # max_parallel_evaluations browsers. Tasks are assigned by a hash of their id.
+    shards: int = 1
+    # Run only this shard in-process (e.g. to re-run a crashed shard with use_cached_tasks=True)
+    shard_index: int | None = None
     web_agent_id_prefix: str = "benchmark-agent"
     validator_id_prefix: str = VALIDATOR_ID or "validator_001"
     record_gif: bool = False
+    # Screenshots sent to agents with each observation (None = full-page PNG every step)
+    screenshots: ScreenshotConfig | None = None
     headless: bool | None = None
     save_results_json: bool = True
     print_summary: bool = True
+    # Compression for streamed episode traces and their HTML/screenshot blobs
+    trace_compression: Literal["none", "gzip", "zstd"] = "gzip"
+    # Time browser launch, DB reset, actions, event fetch, tests, agent steps, trace writes...
+    # and add p50/p90/p99 per phase and action type to the run report
+    profile_phases: bool = False
 
     # Paths (auto-resolved)
     base_dir: Path = field(default_factory=lambda: PROJECT_BASE_DIR.parent)
@@ -72,16 +89,23 @@ class BenchmarkConfig:
             raise ValueError("runs must be > 0")
         if self.max_parallel_evaluations <= 0:
             raise ValueError("max_parallel_evaluations must be > 0")
+        if self.shards <= 0:
+            raise ValueError("shards must be > 0")
+        if self.shard_index is not None and not 0 <= self.shard_index < self.shards:
+            raise ValueError(f"shard_index must be in [0, {self.shards})")
         if self.prompts_per_use_case <= 0:
             raise ValueError("prompts_per_use_case must be > 0")
         if self.test_types not in ("event_only", "data_extraction_only"):
             raise ValueError(f"Invalid test_types: {self.test_types!r}")
+        if self.trace_compression not in ("none", "gzip", "zstd"):
+            raise ValueError(f"Invalid trace_compression: {self.trace_compression!r}")
         self.web_agent_id_prefix = str(self.web_agent_id_prefix or "benchmark-agent").strip() or "benchmark-agent"
         self.validator_id_prefix = str(self.validator_id_prefix or VALIDATOR_ID or "validator_001").strip() or "validator_001"
 
         benchmark_dir = self.base_dir / "benchmark-output"
         self.output_dir = benchmark_dir / "results"
-        self.log_file = benchmark_dir / "logs" / "benchmark.log"
+        log_name = "benchmark.log" if self.shard_index is None else f"benchmark_shard{self.shard_index}.log"
+        self.log_file = benchmark_dir / "logs" / log_name
         self.recordings_dir = benchmark_dir / "recordings"
         self.traces_dir = benchmark_dir / "traces"
 
@@ -102,9 +126,15 @@ class BenchmarkConfig:
             "max_steps_per_task": self.max_steps_per_task,
             "runs": self.runs,
             "max_parallel_evaluations": self.max_parallel_evaluations,
+            "adaptive_concurrency": self.adaptive_concurrency.serialize() if self.adaptive_concurrency else None,
+            "shards": self.shards,
+            "shard_index": self.shard_index,
             "web_agent_id_prefix": self.web_agent_id_prefix,
             "validator_id_prefix": self.validator_id_prefix,
             "record_gif": self.record_gif,
+            "screenshots": self.screenshots.serialize() if self.screenshots else None,
             "headless": self.headless,
             "save_results_json": self.save_results_json,
+            "trace_compression": self.trace_compression,
+            "profile_phases": self.profile_phases,
         }
@@ -41,6 +41,26 @@ def build_task_result(
     }
 
 
+def build_missing_task_result(*, agent: IWebAgent, task: Task, run_idx: int, error: str) -> dict[str, Any]:
+    """Failed entry for a task that never reported a result (e.g. its shard process crashed)."""
+    return {
+        "run": run_idx,
+        "agent_id": agent.id,
+        "agent_name": agent.name,
+        "task_id": task.id,
+        "eval_id": None,
+        "prompt": task.prompt,
+        "use_case": getattr(task.use_case, "name", "Unknown"),
+        "score": 0.0,
+        "success": False,
+        "evaluation_time": 0.0,
+        "action_count": 0,
+        "tests_passed": 0,
+        "total_tests": 0,
+        "error": error,
+    }
+
+
 def aggregate_project_results(
     *,
     project: WebProject,
@@ -82,14 +102,24 @@ def build_run_report(
     timing: TimingMetrics,
     project_reports: dict[str, Any],
     summary: dict[str, Any],
+    concurrency: dict[str, Any] | None = None,
+    phase_timings: dict[str, Any] | None = None,
+    judge_cache: dict[str, int] | None = None,
 ) -> dict[str, Any]:
-    return {
+    report = {
         "timestamp": datetime.now().isoformat(),
         "duration_seconds": timing.get_total_time(),
         "config": config.serialize(),
         "projects": project_reports,
         "summary": summary,
     }
+    if concurrency is not None:
+        report["concurrency"] = concurrency
+    if phase_timings is not None:
+        report["phase_timings"] = phase_timings
+    if judge_cache is not None:
+        report["judge_cache"] = judge_cache
+    return report
 
 
 def build_terminal_report(run_report: dict[str, Any], *, config: BenchmarkConfig, results_path: str | None = None) -> str:
@@ -112,6 +142,21 @@ def build_terminal_report(run_report: dict[str, Any], *, config: BenchmarkConfig
             lines.append(f"  {agent_name}: {stats['passed']}/{stats['total']} ({stats['success_rate'] * 100:.1f}%) avg={stats['avg_score']:.3f}")
         lines.append("")
 
+    phases = (run_report.get("phase_timings") or {}).get("phases") or {}
+    if phases:
+        lines.append("Phases (p50/p90/p99, total):")
+        for phase, stats in sorted(phases.items(), key=lambda item: item[1]["total_s"], reverse=True):
+            lines.append(f"  {phase}: {stats['p50_s']:.3f}/{stats['p90_s']:.3f}/{stats['p99_s']:.3f}s, {stats['total_s']:.2f}s over {stats['count']}")
+        lines.append("")
+
+    judge_cache = run_report.get("judge_cache")
+    if judge_cache:
+        lines.append(
+            f"HTML judge cache: {judge_cache['verdict_hits']} hits, {judge_cache['coalesced']} coalesced, {judge_cache['verdict_misses']} LLM calls; "
+            f"diffs {judge_cache['diff_hits']} hits/{judge_cache['diff_misses']} computed"
+        )
+        lines.append("")
+
     if results_path:
         lines.append(f"JSON: {results_path}")
     lines.append(f"Log: {config.log_file}")
@@ -0,0 +1,47 @@
+"""
+Deterministic task sharding for multi-process benchmark runs.
+
+With ``BenchmarkConfig.shards > 1`` the coordinator generates (or loads) a project's
+tasks once, assigns each one to a shard by a stable hash of its id, and evaluates every
+shard in its own process with its own event loop and browsers. Workers stream task
+results back over a queue and the coordinator merges them into the usual run report.
+
+The assignment depends only on the task id and the shard count, so a shard that
+crashed can be re-run alone with ``shard_index`` set (and ``use_cached_tasks=True`` so
+the same tasks are loaded again).
+"""
+
+from __future__ import annotations
+
+import hashlib
+from collections.abc import Iterable
+from typing import Any
+
+from autoppia_iwa.src.data_generation.tasks.classes import Task
+
+# Messages sent from shard workers to the coordinator:
+#   ("result", shard_index, agent_id, task_id, task_result)
+#   ("judge_cache", shard_index, html_judge_cache_metrics)
+#   ("done", shard_index, adaptive_concurrency_metrics_or_None, phase_profiler_state_or_None)
+ShardMessage = tuple[Any, ...]
+
+
+def shard_of(task_id: str, shards: int) -> int:
+    """Shard index of ``task_id``; stable across processes and Python versions (unlike ``hash``)."""
+    if shards <= 0:
+        raise ValueError("shards must be > 0")
+    digest = hashlib.blake2b(task_id.encode("utf-8"), digest_size=8).digest()
+    return int.from_bytes(digest, "big") % shards
+
+
+def split_tasks_by_shard(tasks: Iterable[Task], shards: int) -> list[list[Task]]:
+    """Partition ``tasks`` into ``shards`` lists, keeping the original order inside each."""
+    buckets: list[list[Task]] = [[] for _ in range(shards)]
+    for task in tasks:
+        buckets[shard_of(task.id, shards)].append(task)
+    return buckets
+
+
+def tasks_for_shard(tasks: Iterable[Task], shards: int, shard_index: int) -> list[Task]:
+    """The subset of ``tasks`` owned by ``shard_index``."""
+    return [task for task in tasks if shard_of(task.id, shards) == shard_index]
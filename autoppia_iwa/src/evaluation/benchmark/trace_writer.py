@@ -3,31 +3,125 @@ Writes per-step trace data for the debugger to consume.
 
 Trace format:
     traces/<run_id>/
-        trace_index.json          — run metadata + episode list
+        trace_index.json                 — run metadata + episode list (written when the run starts and on flush)
+        trace_index.jsonl                — while the run is live: run header, then one summary per episode start/close
         episodes/
-            <episode_task_id>.json — per-episode detail with steps
+            <episode_task_id>.jsonl[.gz|.zst] — one record per line: episode header, steps, end
+        blobs/
+            <sha256[:2]>/<sha256>[.gz|.zst] — HTML and screenshots, stored once by content hash
 
 Each step captures: before/after snapshots (url, score, html, screenshot),
-agent decision (actions, reasoning, done), and execution result.
+agent decision (actions, reasoning, done), and execution result. Steps are
+appended by a background thread as they are recorded, so memory stays flat and
+the event loop only waits on disk when ``max_pending`` writes are already queued;
+a crash loses at most the step in flight. Episode summaries are appended to
+``trace_index.jsonl`` (``load_trace_index`` folds it), so keeping the index current
+costs one line per update instead of a rewrite of the whole episode list.
+With compression each record is an independent gzip member / zstd frame, so a
+truncated file still decodes up to its last complete record.
+
+``load_episode`` turns an episode file back into the ``{"episode", "steps"}``
+shape with HTML and screenshots inlined.
 """
 
+import gzip
+import hashlib
 import json
+import os
+import queue
+import threading
+import zlib
+from collections.abc import Callable, Iterator
 from datetime import UTC, datetime
 from pathlib import Path
-from typing import Any
+from typing import Any, Literal
 
 from loguru import logger
 
+try:  # Optional: zstd gives better ratio/speed than gzip when available
+    import zstandard
+except ImportError:  # pragma: no cover - depends on the environment
+    zstandard = None
+
+TraceCompression = Literal["none", "gzip", "zstd"]
+
+_SUFFIXES: dict[str, str] = {"none": "", "gzip": ".gz", "zstd": ".zst"}
+_STOP = object()
+_INDEX_FILE = "trace_index.json"
+_LIVE_INDEX_FILE = "trace_index.jsonl"
+
+
+def _resolve_compression(compression: str | None) -> str:
+    codec = (compression or "none").lower()
+    if codec not in _SUFFIXES:
+        raise ValueError(f"Unsupported trace compression: {compression!r}")
+    if codec == "zstd" and zstandard is None:
+        logger.warning("zstandard is not installed; falling back to gzip trace compression")
+        return "gzip"
+    return codec
+
+
+def _encode(data: bytes, codec: str) -> bytes:
+    if codec == "gzip":
+        return gzip.compress(data, compresslevel=6, mtime=0)
+    if codec == "zstd":
+        return zstandard.ZstdCompressor(level=3).compress(data)
+    return data
+
+
+def _codec_for(path: Path) -> str:
+    if path.suffix == ".gz":
+        return "gzip"
+    if path.suffix == ".zst":
+        return "zstd"
+    return "none"
+
+
+def _decode(data: bytes, codec: str) -> bytes:
+    if codec in ("gzip", "zstd"):
+        if codec == "zstd" and zstandard is None:
+            raise RuntimeError("zstandard is required to read .zst traces")
+        # Concatenated members/frames; a torn trailing one is dropped.
+        chunks = []
+        while data:
+            member = zlib.decompressobj(wbits=31) if codec == "gzip" else zstandard.ZstdDecompressor().decompressobj()
+            try:
+                chunk = member.decompress(data)
+            except Exception:  # zlib.error / zstandard.ZstdError on corrupt data
+                break
+            if not member.eof:
+                break
+            chunks.append(chunk)
+            data = member.unused_data
+        return b"".join(chunks)
+    return data
+
+
+def _atomic_write(path: Path, data: bytes) -> None:
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    tmp_path.write_bytes(data)
+    os.replace(tmp_path, path)
+
 
 class TraceWriter:
-    """Accumulates trace data during a benchmark run and flushes to disk."""
+    """Streams trace data for a benchmark run to disk through a background writer thread."""
 
-    def __init__(self, trace_dir: Path, run_metadata: dict[str, Any] | None = None):
+    def __init__(self, trace_dir: Path, run_metadata: dict[str, Any] | None = None, compression: TraceCompression | None = "gzip", max_pending: int = 1000):
         self.trace_dir = trace_dir
         self.episodes_dir = trace_dir / "episodes"
+        self.blobs_dir = trace_dir / "blobs"
         self.episodes_dir.mkdir(parents=True, exist_ok=True)
-        self._episodes_index: list[dict[str, Any]] = []
+        self.compression = _resolve_compression(compression)
+        # Latest summary per episode_task_id, in first-seen order
+        self._episodes_index: dict[str, dict[str, Any]] = {}
+        self._live_index_started = False
         self._run_metadata = run_metadata or {}
+        self._created_at = datetime.now(UTC).isoformat()
+        self._known_blobs: set[str] = set()
+        # Bounded: when the disk falls behind, producers wait instead of queueing without limit
+        self._queue: queue.Queue = queue.Queue(maxsize=max(1, max_pending))
+        self._thread: threading.Thread | None = None
+        self._thread_lock = threading.Lock()
 
     def start_episode(self, episode_task_id: str, task_id: str, use_case: str, task_data: dict[str, Any] | None = None) -> "EpisodeTrace":
         return EpisodeTrace(
@@ -38,33 +132,124 @@ class TraceWriter:
             task_data=task_data,
         )
 
+    # ── Background writer ──────────────────────────────────────────────
+    def _submit(self, job: Callable[[], None]) -> None:
+        with self._thread_lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._drain, name=f"trace-writer-{self.trace_dir.name}", daemon=True)
+                self._thread.start()
+            self._queue.put(job)
+
+    def _drain(self) -> None:
+        while True:
+            job = self._queue.get()
+            try:
+                if job is _STOP:
+                    return
+                job()
+            except Exception as e:
+                logger.warning(f"Trace write failed in {self.trace_dir}: {e}")
+            finally:
+                self._queue.task_done()
+
+    # ── Writer-thread helpers ──────────────────────────────────────────
+    def _store_blob(self, content: str | None) -> str | None:
+        if not content:
+            return None
+        data = content.encode("utf-8")
+        digest = hashlib.sha256(data).hexdigest()
+        if digest not in self._known_blobs:
+            path = self.blobs_dir / digest[:2] / f"{digest}{_SUFFIXES[self.compression]}"
+            if not path.exists():
+                path.parent.mkdir(parents=True, exist_ok=True)
+                _atomic_write(path, _encode(data, self.compression))
+            self._known_blobs.add(digest)
+        return digest
+
+    def _append_record(self, path: Path, record: dict[str, Any]) -> None:
+        line = json.dumps(record, ensure_ascii=False, default=str).encode("utf-8") + b"\n"
+        with open(path, "ab") as f:
+            f.write(_encode(line, self.compression))
+            f.flush()
+
+    def _run_header(self) -> dict[str, Any]:
+        return {"created_at_utc": self._created_at, **self._run_metadata}
+
+    def _write_index(self) -> Path:
+        index = {**self._run_header(), "episodes": list(self._episodes_index.values())}
+        path = self.trace_dir / _INDEX_FILE
+        _atomic_write(path, json.dumps(index, indent=2, ensure_ascii=False, default=str).encode("utf-8"))
+        return path
+
     def _register_episode(self, summary: dict[str, Any]) -> None:
-        self._episodes_index.append(summary)
+        self._episodes_index[summary["episode_task_id"]] = summary
+        live_path = self.trace_dir / _LIVE_INDEX_FILE
+        if not self._live_index_started:
+            # The header line, plus an episode-less trace_index.json so the run is discoverable
+            live_path.write_bytes(json.dumps({"type": "run", **self._run_header()}, ensure_ascii=False, default=str).encode("utf-8") + b"\n")
+            self._live_index_started = True
+            if not (self.trace_dir / _INDEX_FILE).exists():
+                _atomic_write(self.trace_dir / _INDEX_FILE, json.dumps({**self._run_header(), "episodes": [], "live": True}, indent=2, default=str).encode("utf-8"))
+        with open(live_path, "ab") as f:
+            f.write(json.dumps({"type": "episode", **summary}, ensure_ascii=False, default=str).encode("utf-8") + b"\n")
 
     def flush(self) -> Path:
-        """Write trace_index.json with all registered episodes."""
-        index = {
-            "created_at_utc": datetime.now(UTC).isoformat(),
-            **self._run_metadata,
-            "episodes": self._episodes_index,
-        }
-        path = self.trace_dir / "trace_index.json"
-        path.write_text(json.dumps(index, indent=2, ensure_ascii=False, default=str))
+        """Wait for pending writes, stop the writer thread and write trace_index.json."""
+        with self._thread_lock:
+            thread = self._thread
+            if thread is not None and thread.is_alive():
+                self._queue.put(_STOP)
+            self._thread = None
+        if thread is not None:
+            thread.join()
+        path = self._write_index()
+        (self.trace_dir / _LIVE_INDEX_FILE).unlink(missing_ok=True)
+        self._live_index_started = False
         logger.info(f"Trace index written: {path} ({len(self._episodes_index)} episodes)")
         return path
 
 
 class EpisodeTrace:
-    """Accumulates steps for a single episode and writes to disk on close."""
+    """Streams the steps of a single episode to its JSONL file as they are recorded."""
 
     def __init__(self, writer: TraceWriter, episode_task_id: str, task_id: str, use_case: str, task_data: dict[str, Any] | None = None):
         self._writer = writer
         self.episode_task_id = episode_task_id
         self.task_id = task_id
         self.use_case = use_case
-        self._task_data = task_data
-        self._steps: list[dict[str, Any]] = []
-        self._meta: dict[str, Any] = {}
+        self.steps_recorded = 0
+        self.filename = f"{episode_task_id}.jsonl{_SUFFIXES[writer.compression]}"
+        self.path = writer.episodes_dir / self.filename
+        header = {
+            "type": "episode",
+            "episode": {
+                "task_id": task_id,
+                "episode_task_id": episode_task_id,
+                "use_case": use_case,
+                "task": task_data,
+                "started_at_utc": datetime.now(UTC).isoformat(),
+            },
+        }
+        summary = self._summary(status="running", success=False, score=0.0, steps=0)
+
+        def _start() -> None:
+            self.path.unlink(missing_ok=True)
+            writer._append_record(self.path, header)
+            writer._register_episode(summary)
+
+        writer._submit(_start)
+
+    def _summary(self, *, status: str, success: bool, score: float, steps: int) -> dict[str, Any]:
+        return {
+            "episode_task_id": self.episode_task_id,
+            "task_id": self.task_id,
+            "use_case": self.use_case,
+            "status": status,
+            "success": success,
+            "score": score,
+            "steps": steps,
+            "file": f"episodes/{self.filename}",
+        }
 
     def record_step(
         self,
@@ -86,64 +271,157 @@ class EpisodeTrace:
         exec_ok: bool = True,
         error: str | None = None,
     ) -> None:
-        self._steps.append(
-            {
-                "step_index": step_index,
-                "before": {
-                    "url": before_url,
-                    "score": before_score,
-                    "success": before_success,
-                    "html": before_html,
-                    "screenshot": before_screenshot,
-                },
-                "after": {
-                    "url": after_url,
-                    "score": after_score,
-                    "success": after_success,
-                    "html": after_html,
-                    "screenshot": after_screenshot,
-                },
-                "agent": {
-                    "done": done,
-                    "reasoning": reasoning,
-                },
-                "actions": actions or [],
-                "execution": {
-                    "executed": True,
-                    "exec_ok": exec_ok,
-                    "error": error,
+        writer = self._writer
+        self.steps_recorded += 1
+        actions = actions or []
+
+        def _write() -> None:
+            writer._append_record(
+                self.path,
+                {
+                    "type": "step",
+                    "step_index": step_index,
+                    "before": {
+                        "url": before_url,
+                        "score": before_score,
+                        "success": before_success,
+                        "html_blob": writer._store_blob(before_html),
+                        "screenshot_blob": writer._store_blob(before_screenshot),
+                    },
+                    "after": {
+                        "url": after_url,
+                        "score": after_score,
+                        "success": after_success,
+                        "html_blob": writer._store_blob(after_html),
+                        "screenshot_blob": writer._store_blob(after_screenshot),
+                    },
+                    "agent": {
+                        "done": done,
+                        "reasoning": reasoning,
+                    },
+                    "actions": actions,
+                    "execution": {
+                        "executed": True,
+                        "exec_ok": exec_ok,
+                        "error": error,
+                    },
                 },
-            }
-        )
+            )
+
+        writer._submit(_write)
 
     def close(self, *, success: bool, score: float, total_steps: int, evaluation_time: float = 0.0, **extra_meta) -> None:
-        """Write episode JSON and register in the trace index."""
-        filename = f"{self.episode_task_id}.json"
-        episode_data = {
+        """Append the episode result and mark it completed in the trace index."""
+        writer = self._writer
+        end = {
+            "type": "end",
             "episode": {
-                "task_id": self.task_id,
-                "episode_task_id": self.episode_task_id,
-                "use_case": self.use_case,
                 "success": success,
                 "score": score,
                 "steps": total_steps,
                 "evaluation_time": round(evaluation_time, 4),
-                "task": self._task_data,
                 **extra_meta,
             },
-            "steps": self._steps,
         }
-        path = self._writer.episodes_dir / filename
-        path.write_text(json.dumps(episode_data, indent=2, ensure_ascii=False, default=str))
-
-        self._writer._register_episode(
-            {
-                "episode_task_id": self.episode_task_id,
-                "task_id": self.task_id,
-                "use_case": self.use_case,
-                "success": success,
-                "score": score,
-                "steps": total_steps,
-                "file": f"episodes/{filename}",
-            }
-        )
+        summary = self._summary(status="completed", success=success, score=score, steps=total_steps)
+
+        def _finish() -> None:
+            writer._append_record(self.path, end)
+            writer._register_episode(summary)
+
+        writer._submit(_finish)
+
+
+# ── Reading ────────────────────────────────────────────────────────────
+
+
+def load_trace_index(trace_dir: Path) -> dict[str, Any]:
+    """
+    Return the ``trace_index.json`` payload of ``trace_dir``.
+
+    While a run is live its episodes are only in ``trace_index.jsonl``; the latest
+    summary of each episode is folded in, in first-seen order.
+    """
+    live_path = trace_dir / _LIVE_INDEX_FILE
+    if not live_path.is_file():
+        return json.loads((trace_dir / _INDEX_FILE).read_text(encoding="utf-8"))
+
+    index: dict[str, Any] = {}
+    episodes: dict[str, dict[str, Any]] = {}
+    for line in live_path.read_bytes().splitlines():
+        try:
+            record = json.loads(line)
+        except json.JSONDecodeError:
+            continue  # torn trailing line
+        if not isinstance(record, dict):
+            continue
+        kind = record.pop("type", None)
+        if kind == "run":
+            index.update(record)
+        elif kind == "episode":
+            episodes[str(record.get("episode_task_id"))] = record
+    index["episodes"] = list(episodes.values())
+    index["live"] = True
+    return index
+
+
+def iter_episode_records(path: Path) -> Iterator[dict[str, Any]]:
+    """Yield the records of an episode file, skipping a torn trailing line."""
+    data = _decode(path.read_bytes(), _codec_for(path))
+    for line in data.splitlines():
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+        except json.JSONDecodeError:
+            continue
+        if isinstance(record, dict):
+            yield record
+
+
+def read_blob(trace_dir: Path, digest: str | None) -> str | None:
+    """Return the content stored under ``digest`` in ``trace_dir/blobs``."""
+    if not digest:
+        return None
+    folder = trace_dir / "blobs" / digest[:2]
+    for suffix, codec in (("", "none"), (".gz", "gzip"), (".zst", "zstd")):
+        path = folder / f"{digest}{suffix}"
+        if path.is_file():
+            return _decode(path.read_bytes(), codec).decode("utf-8")
+    return None
+
+
+def load_episode(path: Path, trace_dir: Path | None = None, inline_blobs: bool = True) -> dict[str, Any]:
+    """
+    Rebuild ``{"episode": {...}, "steps": [...]}`` from an episode file.
+
+    HTML and screenshots are inlined from the blob store unless ``inline_blobs`` is False;
+    legacy ``.json`` episode files are returned as is.
+    """
+    if path.suffix == ".json":
+        return json.loads(path.read_text(encoding="utf-8"))
+
+    trace_dir = trace_dir or path.parent.parent
+    blob_cache: dict[str, str | None] = {}
+
+    def _blob(digest: str | None) -> str | None:
+        if not inline_blobs:
+            return None
+        if digest not in blob_cache:
+            blob_cache[digest] = read_blob(trace_dir, digest)
+        return blob_cache[digest]
+
+    episode: dict[str, Any] = {}
+    steps: list[dict[str, Any]] = []
+    for record in iter_episode_records(path):
+        kind = record.pop("type", None)
+        if kind in ("episode", "end"):
+            episode.update(record.get("episode") or {})
+        elif kind == "step":
+            for side in ("before", "after"):
+                snapshot = record.get(side) or {}
+                snapshot["html"] = _blob(snapshot.pop("html_blob", None)) or ""
+                snapshot["screenshot"] = _blob(snapshot.pop("screenshot_blob", None))
+                record[side] = snapshot
+            steps.append(record)
+    return {"episode": episode, "steps": steps}
@@ -9,6 +9,7 @@ from loguru import logger
 from autoppia_iwa.src.data_generation.tasks.classes import Task, TaskGenerationConfig
 from autoppia_iwa.src.data_generation.tasks.pipeline import TaskGenerationPipeline
 from autoppia_iwa.src.demo_webs.classes import WebProject
+from autoppia_iwa.src.demo_webs.config import index_projects_by_id
 
 
 # =====================
@@ -174,7 +175,7 @@ def get_projects_by_ids(all_projects: list[WebProject], ids_to_run: list[str]) -
         return []
 
     # Index by id for fast lookup
-    projects_by_id = {p.id: p for p in all_projects}
+    projects_by_id = index_projects_by_id(all_projects)
 
     # Check for missing projects
     missing_ids = [pid for pid in ids_to_run if pid not in projects_by_id]
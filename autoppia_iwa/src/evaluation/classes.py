@@ -41,6 +41,8 @@ class EvaluationStats(BaseModel):
     action_execution_times: list[float] = Field(default_factory=list)
     test_execution_time: float = 0
     random_clicker_time: float = 0
+    # Phases left out because the task's tests cannot observe them (e.g. "event_fetch")
+    skipped_phases: list[str] = Field(default_factory=list)
 
     # Performance stats
     raw_score: float = 0
@@ -65,6 +67,7 @@ class EvaluationStats(BaseModel):
             "time_actions": round(action_time, 2),
             "time_avg_per_action": round(action_time / max(1, len(self.action_execution_times)), 3),
             "time_random": round(self.random_clicker_time, 2),
+            "skipped_phases": list(self.skipped_phases),
             "tests_passed": f"{self.tests_passed}/{self.total_tests}",
             "success": not self.had_errors,
         }
@@ -8,6 +8,7 @@ from autoppia_iwa.src.evaluation.legacy.concurrent_evaluator import *  # noqa: F
 from autoppia_iwa.src.evaluation.legacy.concurrent_evaluator import (  # noqa: F401
     _ensure_evaluation_level,
     _is_navigation_url_allowed,
+    _launch_args,
     _url_hostname,
 )
 
@@ -1,16 +1,29 @@
 from pydantic import BaseModel, Field
 
+from autoppia_iwa.src.evaluation.shared.concurrency import AdaptiveConcurrencyConfig
+from autoppia_iwa.src.execution.screenshots import ScreenshotConfig
+
 
 class EvaluatorConfig(BaseModel):
     """Legacy concurrent-evaluator configuration."""
 
     task_delay_in_seconds: float = Field(default=0.1, gt=0)
     chunk_size: int = Field(default=20, gt=0)
+    adaptive_concurrency: AdaptiveConcurrencyConfig | None = Field(
+        default=None, description="Adapt in-flight evaluations (starting at chunk_size) to step latency, errors and free memory. None keeps chunk_size fixed."
+    )
     browser_timeout: float = Field(default=10000, gt=0)
     enable_grouping_tasks: bool = Field(default=True)
     normalize_scores: bool = Field(default=True)
     verbose_logging: bool = Field(default=False)
     debug_mode: bool = Field(default=False)
     should_record_gif: bool = Field(default=False, description="Record evaluation on browser executions.")
+    gif_max_width: int = Field(default=800, gt=0, description="Recorded GIF frames wider than this are scaled down.")
+    gif_colors: int = Field(default=128, ge=2, le=256, description="Palette size of each recorded GIF frame.")
+    replay_recording_path: str | None = Field(default=None, description="Append each evaluated episode to this .jsonl.gz file for offline replay. None disables recording.")
+    screenshots: ScreenshotConfig = Field(default_factory=ScreenshotConfig, description="When and how action screenshots are captured.")
     max_consecutive_action_failures: int = Field(default=2, gt=0, description="Maximum consecutive action failures before marking task as failed. Default: 2")
     headless: bool | None = Field(default=None, description="Override browser headless. None = use EVALUATOR_HEADLESS env.")
+    browser_pool_size: int = Field(default=2, ge=0, description="Long-lived browsers shared across solutions. 0 launches a fresh browser per solution.")
+    browser_pool_max_contexts: int = Field(default=10, gt=0, description="Maximum concurrent contexts hosted by each pooled browser.")
+    browser_pool_max_uses: int = Field(default=50, gt=0, description="Recycle a pooled browser after this many leases.")
@@ -2,13 +2,16 @@
 import asyncio
 import contextlib
 import json
+import math
 import os
 import time
 from collections import defaultdict
+from pathlib import Path
+from typing import Any
 from urllib.parse import urlparse
 
 from loguru import logger
-from playwright.async_api import async_playwright
+from playwright.async_api import BrowserContext, async_playwright
 
 from autoppia_iwa.config.config import EVALUATOR_HEADLESS, VALIDATOR_ID
 from autoppia_iwa.src.data_generation.tasks.classes import BrowserSpecification, Task
@@ -17,21 +20,28 @@ from autoppia_iwa.src.demo_webs.demo_webs_service import BackendDemoWebService
 from autoppia_iwa.src.evaluation.classes import EvaluationResult, EvaluationStats
 from autoppia_iwa.src.evaluation.interfaces import IEvaluator
 from autoppia_iwa.src.evaluation.legacy.concurrent_config import EvaluatorConfig
+from autoppia_iwa.src.evaluation.shared.concurrency import BROWSER_ERROR_PREFIX, AdaptiveConcurrencyLimiter, is_timeout_error, record_evaluation_outcome
+from autoppia_iwa.src.evaluation.shared.gif_recorder import GifRecorder
+from autoppia_iwa.src.evaluation.shared.replay import EpisodeRecording, RecordingWriter, final_partial_results
 from autoppia_iwa.src.evaluation.shared.utils import (
+    DATA_EXTRACTION_SKIPPED_PHASES,
     display_single_evaluation_summary,
     extract_seed_from_url,
     generate_feedback,
     hash_actions,
     initialize_test_results,
     log_progress,
-    make_gif_from_screenshots,
     run_global_tests,
+    task_uses_backend_events,
 )
 from autoppia_iwa.src.execution.actions.actions import NavigateAction
 from autoppia_iwa.src.execution.actions.base import BaseAction
+from autoppia_iwa.src.execution.browser_pool import BrowserPool, BrowserPoolMetrics
 from autoppia_iwa.src.execution.classes import ActionExecutionResult
 from autoppia_iwa.src.execution.playwright_browser_executor import PlaywrightBrowserExecutor
+from autoppia_iwa.src.execution.screenshots import task_has_screenshot_judge
 from autoppia_iwa.src.shared.logging import log_event
+from autoppia_iwa.src.shared.profiling import NULL_PROFILER, PHASE_BROWSER_LAUNCH, PHASE_DB_RESET, PHASE_EVENT_FETCH, PHASE_TEST_EVALUATION, PhaseProfiler
 from autoppia_iwa.src.web_agents.classes import TaskSolution
 
 EVALUATION_LEVEL_NAME = "EVALUATION"
@@ -106,10 +116,23 @@ def _is_navigation_url_allowed(*, is_web_real: bool, task_url: str | None, candi
     return True, None
 
 
+def _launch_args(browser_specifications: BrowserSpecification) -> list[str]:
+    return [f"--window-size={browser_specifications.screen_width},{browser_specifications.screen_height}"]
+
+
 class ConcurrentEvaluator(IEvaluator):
-    def __init__(self, web_project: WebProject, config: EvaluatorConfig):
+    def __init__(self, web_project: WebProject, config: EvaluatorConfig, browser_pool: BrowserPool | None = None, profiler: PhaseProfiler | None = None):
         self.config = config
+        self.profiler = profiler or NULL_PROFILER
+        # An injected pool outlives this evaluator; an owned one is created lazily and
+        # closed once the current evaluation call finishes.
+        self._browser_pool = browser_pool
+        self._owns_browser_pool = browser_pool is None
+        self._browser_pool_metrics = browser_pool.metrics if browser_pool else BrowserPoolMetrics()
+        # Persists across calls so the controller keeps what it learned about the backend.
+        self._concurrency_limiter = AdaptiveConcurrencyLimiter(config.chunk_size, config.adaptive_concurrency) if config.adaptive_concurrency else None
         self._random_clicker_cache: dict[str, tuple[list[int], float]] = {}
+        self._recording_writer = RecordingWriter(Path(config.replay_recording_path)) if config.replay_recording_path else None
         self.total_evaluation_time = 0.0
         self.evaluation_count = 0
         self.web_project = web_project
@@ -128,10 +151,16 @@ class ConcurrentEvaluator(IEvaluator):
         try:
             _log_evaluation_event(f"Evaluating single task solution for task {task.id}...")
 
-            _log_evaluation_event("Resetting Project Environment & Database.", context="RESETTING DATABASE")
-            await self.backend_demo_webs_service.reset_database(web_agent_id=task_solution.web_agent_id)
-
-            result = await self._evaluate_single_task_solution(task, task_solution)
+            warm_up = self._start_browser_warm_up(task, solution_count=1)
+            try:
+                if task_uses_backend_events(task):
+                    _log_evaluation_event("Resetting Project Environment & Database.", context="RESETTING DATABASE")
+                    with self.profiler.span(PHASE_DB_RESET):
+                        await self.backend_demo_webs_service.reset_database(web_agent_id=task_solution.web_agent_id)
+                result = await self._evaluate_single_task_solution(task, task_solution)
+            finally:
+                if warm_up is not None:
+                    await warm_up
 
             # Display final report for this single solution
             if result.stats:
@@ -140,8 +169,7 @@ class ConcurrentEvaluator(IEvaluator):
 
             return result
         finally:
-            if self.backend_demo_webs_service:
-                await self.backend_demo_webs_service.close()
+            await self.aclose()
 
     async def evaluate_task_solutions(self, task: Task, task_solutions: list[TaskSolution]) -> list[EvaluationResult]:
         """
@@ -150,12 +178,19 @@ class ConcurrentEvaluator(IEvaluator):
         try:
             _log_evaluation_event(f"Evaluating {len(task_solutions)} solutions for task {task.id}...")
 
-            _log_evaluation_event("Resetting Project Environment & Database.", context="RESETTING DATABASE")
-            web_agent_ids = {sol.web_agent_id for sol in task_solutions if sol.web_agent_id}
-            for web_agent_id in web_agent_ids:
-                await self.backend_demo_webs_service.reset_database(web_agent_id=web_agent_id)
-
-            results = await self._group_and_evaluate_task_solutions(task, task_solutions)
+            web_agent_ids = sorted({sol.web_agent_id for sol in task_solutions if sol.web_agent_id})
+            # Browsers start while the backend resets; only the reset gates evaluation.
+            warm_up = self._start_browser_warm_up(task, solution_count=len(task_solutions))
+            try:
+                # Without a CheckEventTest nothing reads the backend, so its state cannot change the score.
+                if task_uses_backend_events(task):
+                    _log_evaluation_event("Resetting Project Environment & Database.", context="RESETTING DATABASE")
+                    with self.profiler.span(PHASE_DB_RESET):
+                        await self.backend_demo_webs_service.reset_databases(web_agent_ids)
+                results = await self._group_and_evaluate_task_solutions(task, task_solutions)
+            finally:
+                if warm_up is not None:
+                    await warm_up
 
             # Save stats
             for r in results:
@@ -164,8 +199,67 @@ class ConcurrentEvaluator(IEvaluator):
 
             return results
         finally:
-            if self.backend_demo_webs_service:
-                await self.backend_demo_webs_service.close()
+            await self.aclose()
+
+    @property
+    def browser_pool_metrics(self) -> dict[str, float | int] | None:
+        """Lease metrics accumulated by the browser pool, or None when pooling is disabled."""
+        if self._browser_pool is None and (not self._owns_browser_pool or self.config.browser_pool_size <= 0):
+            return None
+        return self._browser_pool_metrics.as_dict()
+
+    @property
+    def concurrency_metrics(self) -> dict[str, Any] | None:
+        """Decisions and counters of the adaptive limiter, or None when chunk_size is fixed."""
+        return self._concurrency_limiter.metrics.as_dict() if self._concurrency_limiter else None
+
+    @property
+    def phase_timings(self) -> dict[str, Any] | None:
+        """Per-phase and per-action-type latency percentiles, or None when profiling is off."""
+        return self.profiler.as_dict() if self.profiler.enabled else None
+
+    async def aclose(self) -> None:
+        """Release the backend session and, if owned by this evaluator, the browser pool."""
+        if self.backend_demo_webs_service:
+            await self.backend_demo_webs_service.close()
+        if self._owns_browser_pool and self._browser_pool is not None:
+            pool, self._browser_pool = self._browser_pool, None
+            if self.config.verbose_logging:
+                _log_evaluation_event(f"Browser pool metrics: {pool.metrics.as_dict()}", context="BROWSER POOL")
+            await pool.aclose()
+
+    def _get_browser_pool(self) -> BrowserPool | None:
+        if self._browser_pool is None and self._owns_browser_pool and self.config.browser_pool_size > 0:
+            self._browser_pool = BrowserPool(
+                size=self.config.browser_pool_size,
+                max_contexts_per_browser=self.config.browser_pool_max_contexts,
+                max_uses_per_browser=self.config.browser_pool_max_uses,
+                headless=self.config.headless,
+                playwright_factory=async_playwright,
+                metrics=self._browser_pool_metrics,
+            )
+        return self._browser_pool
+
+    async def _record_episode(self, task: Task, result: EvaluationResult, backend_events: list, extracted_data: Any) -> None:
+        """Append the episode to the replay recording file, if recording is enabled."""
+        if self._recording_writer is None:
+            return
+        try:
+            partial_results = await final_partial_results(self.web_project, task, result, extracted_data=extracted_data)
+            recording = EpisodeRecording.from_evaluation(task, result, backend_events, extracted_data=extracted_data, partial_results=partial_results)
+            await self._recording_writer.append_async(recording)
+        except Exception as e:
+            logger.warning(f"Failed to record episode {task.id}/{result.web_agent_id} for replay: {e}")
+
+    def _start_browser_warm_up(self, task: Task, solution_count: int) -> asyncio.Task | None:
+        """Launch the pooled browsers this task will need in the background, if it needs any."""
+        if not task_uses_backend_events(task):
+            return None
+        browser_pool = self._get_browser_pool()
+        if browser_pool is None:
+            return None
+        count = math.ceil(min(solution_count, self.config.chunk_size) / self.config.browser_pool_max_contexts)
+        return asyncio.create_task(browser_pool.warm_up(count, launch_args=_launch_args(task.specifications or BrowserSpecification())))
 
     async def _evaluate_single_task_solution(self, task: Task, task_solution: TaskSolution) -> EvaluationResult:
         """
@@ -188,17 +282,18 @@ class ConcurrentEvaluator(IEvaluator):
             stats.action_types[action.type] = stats.action_types.get(action.type, 0) + 1
 
         # Option B: DataExtractionTest only — no evaluator (no browser). Compare agent's extracted_data to expected.
-        has_check_event_test = any(getattr(t, "type", None) == "CheckEventTest" for t in task.tests)
-        if not has_check_event_test:
+        if not task_uses_backend_events(task):
             _log_evaluation_event("DataExtractionTest only: skipping browser; evaluating extracted_data vs criteria", context=f"DATA EXTRACTION | agent={web_agent_id}")
+            stats.skipped_phases = ["browser", *DATA_EXTRACTION_SKIPPED_PHASES]
             test_start_time = time.time()
             extracted_data = getattr(task_solution, "extracted_data", None)
-            test_results = await run_global_tests(
-                task,
-                backend_events=[],
-                web_agent_id=web_agent_id,
-                extracted_data=extracted_data,
-            )
+            with self.profiler.span(PHASE_TEST_EVALUATION):
+                test_results = await run_global_tests(
+                    task,
+                    backend_events=[],
+                    web_agent_id=web_agent_id,
+                    extracted_data=extracted_data,
+                )
             stats.test_execution_time = time.time() - test_start_time
             raw_score = 0.0
             tests_passed_count = 0
@@ -214,7 +309,7 @@ class ConcurrentEvaluator(IEvaluator):
             stats.final_score = raw_score
             stats.total_time = time.time() - stats.start_time
             feedback = generate_feedback(task, [], test_results)
-            return EvaluationResult(
+            result = EvaluationResult(
                 web_agent_id=web_agent_id,
                 final_score=raw_score,
                 raw_score=raw_score,
@@ -225,6 +320,8 @@ class ConcurrentEvaluator(IEvaluator):
                 stats=stats,
                 gif_recording="",
             )
+            await self._record_episode(task, result, backend_events=[], extracted_data=extracted_data)
+            return result
 
         # If no actions, return an immediate error
         if not actions:
@@ -307,6 +404,8 @@ class ConcurrentEvaluator(IEvaluator):
 
         _log_evaluation_event("Executing actions in browser", context=f"ACTION EXECUTION | agent={web_agent_id}")
         evaluation_gif = ""
+        # Frames are encoded off the event loop as each action finishes
+        gif_recorder = GifRecorder(max_width=self.config.gif_max_width, colors=self.config.gif_colors) if self.config.should_record_gif else None
         try:
             # If simulated, reset the DB first
             browser_setup_start = time.time()
@@ -315,7 +414,7 @@ class ConcurrentEvaluator(IEvaluator):
             browser_execution_start = time.time()
             stats.browser_setup_time = browser_execution_start - browser_setup_start
 
-            execution_history, action_execution_times, early_stop_reason = await self._evaluate_in_browser(task, web_agent_id, actions, is_web_real)
+            execution_history, action_execution_times, early_stop_reason = await self._evaluate_in_browser(task, web_agent_id, actions, is_web_real, gif_recorder=gif_recorder)
 
             # If execution stopped early due to consecutive failures, mark task as failed
             task_failed_due_to_consecutive_failures = False
@@ -325,22 +424,11 @@ class ConcurrentEvaluator(IEvaluator):
                 task_failed_due_to_consecutive_failures = True
                 _log_evaluation_event(f"Task marked as FAILED: {early_stop_reason}", context=f"ACTION EXECUTION | agent={web_agent_id}")
 
-            if self.config.should_record_gif:
+            if gif_recorder is not None:
                 _log_gif_creation("🎬 GIF ENABLED", web_agent_id=web_agent_id)
-                all_screenshots = []
-                if execution_history:
-                    all_screenshots.append(execution_history[0].browser_snapshot.screenshot_before)
-
-                    for h in execution_history:
-                        all_screenshots.append(h.browser_snapshot.screenshot_after)
-
-                if all_screenshots:
-                    evaluation_gif = make_gif_from_screenshots(all_screenshots)
-                    if evaluation_gif:
-                        _log_gif_creation("✅ GIF CREATION SUCCESS", web_agent_id=web_agent_id)
-                    else:
-                        _log_gif_creation("❌ GIF CREATION ERROR", web_agent_id=web_agent_id)
-                        evaluation_gif = None
+                evaluation_gif = await gif_recorder.finish()
+                if evaluation_gif:
+                    _log_gif_creation(f"✅ GIF CREATION SUCCESS ({gif_recorder.encoder.frames} frames, {gif_recorder.encoder.duplicates} repeats merged)", web_agent_id=web_agent_id)
                 else:
                     _log_gif_creation("❌ GIF CREATION ERROR", web_agent_id=web_agent_id)
                     evaluation_gif = None
@@ -351,7 +439,8 @@ class ConcurrentEvaluator(IEvaluator):
 
             # Run tests
             test_start_time = time.time()
-            backend_events = await self.backend_demo_webs_service.get_backend_events(web_agent_id)
+            with self.profiler.span(PHASE_EVENT_FETCH):
+                backend_events = await self.backend_demo_webs_service.get_backend_events(web_agent_id)
 
             # 🔍 DEBUG: Log backend events (simplified)
             if self.config.debug_mode:
@@ -361,12 +450,14 @@ class ConcurrentEvaluator(IEvaluator):
                     for idx, event in enumerate(backend_events, 1):
                         logger.debug(f"   - Event {idx}: {event.event_name if hasattr(event, 'event_name') else 'unknown'}")
 
-            test_results = await run_global_tests(
-                task,
-                backend_events=backend_events,
-                web_agent_id=web_agent_id,
-                extracted_data=getattr(task_solution, "extracted_data", None),
-            )
+            extracted_data = getattr(task_solution, "extracted_data", None)
+            with self.profiler.span(PHASE_TEST_EVALUATION):
+                test_results = await run_global_tests(
+                    task,
+                    backend_events=backend_events,
+                    web_agent_id=web_agent_id,
+                    extracted_data=extracted_data,
+                )
 
             # 🔍 DEBUG: Log test results (simplified)
             if self.config.debug_mode:
@@ -426,7 +517,7 @@ class ConcurrentEvaluator(IEvaluator):
             # Generate feedback
             feedback = generate_feedback(task, execution_history, test_results)
 
-            return EvaluationResult(
+            result = EvaluationResult(
                 web_agent_id=web_agent_id,
                 final_score=final_score,  # Use actual score, don't artificially boost to 1.0
                 raw_score=raw_score,
@@ -437,8 +528,12 @@ class ConcurrentEvaluator(IEvaluator):
                 stats=stats,
                 gif_recording=evaluation_gif,
             )
+            await self._record_episode(task, result, backend_events=backend_events, extracted_data=extracted_data)
+            return result
 
         except Exception as e:
+            if gif_recorder is not None:
+                gif_recorder.discard()
             stats.had_errors = True
             stats.error_message = str(e)
             stats.total_time = time.time() - stats.start_time
@@ -468,6 +563,10 @@ class ConcurrentEvaluator(IEvaluator):
         if self.config.enable_grouping_tasks:
             for idx, solution in enumerate(task_solutions):
                 hash_key = hash_actions(solution.actions)
+                # The extracted answer is scored too; identical actions alone do not make identical results.
+                extracted_data = getattr(solution, "extracted_data", None)
+                if extracted_data is not None:
+                    hash_key = f"{hash_key}|{extracted_data}"
                 grouped_indices[hash_key].append(idx)
             if self.config.verbose_logging:
                 _log_evaluation_event(f"Grouped {len(task_solutions)} solutions into {len(grouped_indices)} groups", context="GROUPING")
@@ -486,7 +585,7 @@ class ConcurrentEvaluator(IEvaluator):
         grouped_task_list = list(grouped_indices.values())
         # random.shuffle(grouped_task_list)
 
-        semaphore = asyncio.Semaphore(self.config.chunk_size)
+        semaphore = self._concurrency_limiter or asyncio.Semaphore(self.config.chunk_size)
         tasks = [self._evaluate_group_with_semaphore(task, task_solutions, group_indices, final_results, semaphore) for group_indices in grouped_task_list]
 
         # If large, log minimal progress in background
@@ -517,7 +616,7 @@ class ConcurrentEvaluator(IEvaluator):
         task_solutions: list[TaskSolution],
         group_indices: list[int],
         final_results: list[EvaluationResult | None],
-        semaphore: asyncio.Semaphore,
+        semaphore: asyncio.Semaphore | AdaptiveConcurrencyLimiter,
     ) -> None:
         """
         Evaluates a group of identical solutions (all share the same actions).
@@ -537,6 +636,8 @@ class ConcurrentEvaluator(IEvaluator):
 
             try:
                 rep_result = await self._evaluate_single_task_solution(task, representative)
+                if isinstance(semaphore, AdaptiveConcurrencyLimiter):
+                    record_evaluation_outcome(semaphore, rep_result.stats)
 
                 # For each index in the group, we clone the rep_result
                 for idx in group_indices:
@@ -554,6 +655,8 @@ class ConcurrentEvaluator(IEvaluator):
             except Exception as e:
                 logger.error(f"Error evaluating group actions: {e}")
                 self.errors.append(str(e))
+                if isinstance(semaphore, AdaptiveConcurrencyLimiter):
+                    semaphore.record(None, error=not is_timeout_error(e), timeout=is_timeout_error(e))
                 # Return error in final_results for each solution
                 for idx in group_indices:
                     sol = task_solutions[idx]
@@ -578,36 +681,82 @@ class ConcurrentEvaluator(IEvaluator):
                     )
                     final_results[idx] = error_result
 
-    async def _evaluate_in_browser(self, task: Task, web_agent_id: str, actions: list[BaseAction], is_web_real: bool) -> tuple[list[ActionExecutionResult], list[float], str | None]:
+    async def _evaluate_in_browser(
+        self, task: Task, web_agent_id: str, actions: list[BaseAction], is_web_real: bool, gif_recorder: GifRecorder | None = None
+    ) -> tuple[list[ActionExecutionResult], list[float], str | None]:
         """
         Executes all actions in a Playwright browser context and returns the results + times + early stop reason.
 
+        With ``gif_recorder``, each action's screenshots are handed to it as the action finishes.
+
+        The context is leased from the evaluator's browser pool when pooling is enabled;
+        otherwise a dedicated browser is launched for this solution.
+
         Returns:
             Tuple of (action_results, action_execution_times, early_stop_reason)
             early_stop_reason is None if execution completed normally, or a string explaining why it stopped early
         """
+        browser_specifications = task.specifications or BrowserSpecification()
+        launch_args = _launch_args(browser_specifications)
+        context_options = {
+            "extra_http_headers": {"X-WebAgent-Id": web_agent_id, "X-Validator-Id": self.validator_id},
+            "no_viewport": True,
+        }
+
+        screenshot_judge = task_has_screenshot_judge(task)
+
+        browser_pool = self._get_browser_pool()
+        if browser_pool is not None:
+            try:
+                lease_started = time.perf_counter()
+                async with browser_pool.lease(launch_args=launch_args, **context_options) as context:
+                    self.profiler.record(PHASE_BROWSER_LAUNCH, time.perf_counter() - lease_started)
+                    return await self._execute_actions_in_context(context, browser_specifications, web_agent_id, actions, is_web_real, screenshot_judge, gif_recorder)
+            except Exception as e:
+                logger.error(f"{BROWSER_ERROR_PREFIX}: {e}")
+                return [], [], f"{BROWSER_ERROR_PREFIX}: {e}"
+
+        async with async_playwright() as playwright:
+            browser, context = None, None
+            try:
+                headless = self.config.headless if self.config.headless is not None else EVALUATOR_HEADLESS
+                with self.profiler.span(PHASE_BROWSER_LAUNCH):
+                    browser = await playwright.chromium.launch(headless=headless, args=launch_args)
+                    # browser = await playwright.chromium.launch(headless=EVALUATOR_HEADLESS, slow_mo=2000)
+                    context = await browser.new_context(**context_options)
+                return await self._execute_actions_in_context(context, browser_specifications, web_agent_id, actions, is_web_real, screenshot_judge, gif_recorder)
+
+            except Exception as e:
+                logger.error(f"{BROWSER_ERROR_PREFIX}: {e}")
+                return [], [], f"{BROWSER_ERROR_PREFIX}: {e}"
+            finally:
+                if context:
+                    await context.close()
+                if browser:
+                    await browser.close()
+
+    async def _execute_actions_in_context(
+        self,
+        context: BrowserContext,
+        browser_specifications: BrowserSpecification,
+        web_agent_id: str,
+        actions: list[BaseAction],
+        is_web_real: bool,
+        screenshot_judge: bool = False,
+        gif_recorder: GifRecorder | None = None,
+    ) -> tuple[list[ActionExecutionResult], list[float], str | None]:
+        """Run the solution's actions on a fresh page of ``context``."""
         action_execution_times: list[float] = []
         action_results: list[ActionExecutionResult] = []
         consecutive_failures = 0
         max_consecutive_failures = self.config.max_consecutive_action_failures
         early_stop_reason: str | None = None
 
-        async with async_playwright() as playwright:
-            browser, context = None, None
-            try:
-                browser_specifications = task.specifications or BrowserSpecification()
-                headless = self.config.headless if self.config.headless is not None else EVALUATOR_HEADLESS
-                browser = await playwright.chromium.launch(headless=headless, args=[f"--window-size={browser_specifications.screen_width},{browser_specifications.screen_height}"])
-                # browser = await playwright.chromium.launch(headless=EVALUATOR_HEADLESS, slow_mo=2000)
-                context = await browser.new_context(
-                    extra_http_headers={"X-WebAgent-Id": web_agent_id, "X-Validator-Id": self.validator_id},
-                    no_viewport=True,
-                )
-                # Keep attribution ids in localStorage too. Several demo fronts read these
-                # values from storage when emitting backend events.
-                with contextlib.suppress(Exception):
-                    await context.add_init_script(
-                        f"""
+        # Keep attribution ids in localStorage too. Several demo fronts read these
+        # values from storage when emitting backend events.
+        with contextlib.suppress(Exception):
+            await context.add_init_script(
+                f"""
 (() => {{
   try {{
     localStorage.setItem("web_agent_id", {json.dumps(web_agent_id)});
@@ -615,90 +764,92 @@ class ConcurrentEvaluator(IEvaluator):
   }} catch (e) {{}}
 }})();
 """
+            )
+        context.set_default_timeout(self.config.browser_timeout)
+        page = await context.new_page()
+
+        # Optional network debugging for log-event and webs_server traffic
+        debug_network = os.getenv("IWA_DEBUG_NETWORK", "").lower() in ("1", "true", "yes")
+        network_log: dict[str, list[str]] = {"requests": [], "responses": []}
+
+        if debug_network:
+
+            def _on_request(req):
+                url = req.url
+                if "log-event" in url or ":8090" in url:
+                    entry = f"{req.method} {url}"
+                    network_log["requests"].append(entry)
+
+            def _on_response(res):
+                url = res.url
+                if "log-event" in url or ":8090" in url:
+                    entry = f"{res.status} {url}"
+                    network_log["responses"].append(entry)
+
+            page.on("request", _on_request)
+            page.on("response", _on_response)
+
+        browser_executor = PlaywrightBrowserExecutor(
+            browser_specifications,
+            page,
+            self.backend_demo_webs_service,
+            screenshot_config=self.config.screenshots,
+            screenshot_judge=screenshot_judge,
+            profiler=self.profiler,
+        )
+
+        _log_action_execution(f"🎬 Starting execution of {len(actions)} actions", web_agent_id=web_agent_id)
+
+        for i, action in enumerate(actions):
+            start_time_action = time.time()
+            try:
+                result = await browser_executor.execute_single_action(action, web_agent_id, iteration=i, is_web_real=is_web_real, should_record=self.config.should_record_gif)
+                action_results.append(result)
+                elapsed = time.time() - start_time_action
+                if gif_recorder is not None and result and result.browser_snapshot:
+                    if len(action_results) == 1:
+                        gif_recorder.add_frame(result.browser_snapshot.screenshot_before)
+                    gif_recorder.add_frame(result.browser_snapshot.screenshot_after)
+                action_execution_times.append(elapsed)
+
+                # Track consecutive failures
+                if result and not result.successfully_executed:
+                    consecutive_failures += 1
+                    _log_action_execution(
+                        f"❌ Action {i + 1} FAILED in {elapsed:.2f}s - Error: {getattr(result, 'error', 'unknown')} (Consecutive failures: {consecutive_failures}/{max_consecutive_failures})",
+                        web_agent_id=web_agent_id,
                     )
-                context.set_default_timeout(self.config.browser_timeout)
-                page = await context.new_page()
-
-                # Optional network debugging for log-event and webs_server traffic
-                debug_network = os.getenv("IWA_DEBUG_NETWORK", "").lower() in ("1", "true", "yes")
-                network_log: dict[str, list[str]] = {"requests": [], "responses": []}
-
-                if debug_network:
-
-                    def _on_request(req):
-                        url = req.url
-                        if "log-event" in url or ":8090" in url:
-                            entry = f"{req.method} {url}"
-                            network_log["requests"].append(entry)
-
-                    def _on_response(res):
-                        url = res.url
-                        if "log-event" in url or ":8090" in url:
-                            entry = f"{res.status} {url}"
-                            network_log["responses"].append(entry)
-
-                    page.on("request", _on_request)
-                    page.on("response", _on_response)
-
-                browser_executor = PlaywrightBrowserExecutor(browser_specifications, page, self.backend_demo_webs_service)
-
-                _log_action_execution(f"🎬 Starting execution of {len(actions)} actions", web_agent_id=web_agent_id)
-
-                for i, action in enumerate(actions):
-                    start_time_action = time.time()
-                    try:
-                        result = await browser_executor.execute_single_action(action, web_agent_id, iteration=i, is_web_real=is_web_real, should_record=self.config.should_record_gif)
-                        action_results.append(result)
-                        elapsed = time.time() - start_time_action
-                        action_execution_times.append(elapsed)
-
-                        # Track consecutive failures
-                        if result and not result.successfully_executed:
-                            consecutive_failures += 1
-                            _log_action_execution(
-                                f"❌ Action {i + 1} FAILED in {elapsed:.2f}s - Error: {getattr(result, 'error', 'unknown')} (Consecutive failures: {consecutive_failures}/{max_consecutive_failures})",
-                                web_agent_id=web_agent_id,
-                            )
-
-                            # Check if we've reached the maximum consecutive failures
-                            if consecutive_failures >= max_consecutive_failures:
-                                early_stop_reason = f"Task marked as failed after {consecutive_failures} consecutive action failures (limit: {max_consecutive_failures})"
-                                _log_action_execution(f"🛑 Stopping execution: {early_stop_reason}", web_agent_id=web_agent_id)
-                                break
-                        else:
-                            # Reset counter on success
-                            consecutive_failures = 0
-
-                        self.action_type_timing[action.type].append(elapsed)
-
-                        # Optional pause between actions
-                        if i < len(actions) - 1 and self.config.task_delay_in_seconds > 0:
-                            await asyncio.sleep(self.config.task_delay_in_seconds)
-
-                    except Exception as e:
-                        consecutive_failures += 1
-                        _log_action_execution(f"❌ Action {i + 1}/{len(actions)} EXCEPTION: {e} (Consecutive failures: {consecutive_failures}/{max_consecutive_failures})", web_agent_id=web_agent_id)
-                        elapsed = time.time() - start_time_action
-                        action_execution_times.append(elapsed)
-
-                        # Check if exception counts as reaching the limit
-                        if consecutive_failures >= max_consecutive_failures:
-                            early_stop_reason = f"Task marked as failed after {consecutive_failures} consecutive action failures (limit: {max_consecutive_failures})"
-                            _log_action_execution(f"🛑 Stopping execution: {early_stop_reason}", web_agent_id=web_agent_id)
-                            break
-
-                if early_stop_reason:
-                    _log_action_execution(f"🏁 Finished executing {len(action_results)}/{len(actions)} actions (stopped early due to consecutive failures)", web_agent_id=web_agent_id)
+
+                    # Check if we've reached the maximum consecutive failures
+                    if consecutive_failures >= max_consecutive_failures:
+                        early_stop_reason = f"Task marked as failed after {consecutive_failures} consecutive action failures (limit: {max_consecutive_failures})"
+                        _log_action_execution(f"🛑 Stopping execution: {early_stop_reason}", web_agent_id=web_agent_id)
+                        break
                 else:
-                    _log_action_execution(f"🏁 Finished executing {len(action_results)}/{len(actions)} actions", web_agent_id=web_agent_id)
+                    # Reset counter on success
+                    consecutive_failures = 0
 
-                return action_results, action_execution_times, early_stop_reason
+                self.action_type_timing[action.type].append(elapsed)
+
+                # Optional pause between actions
+                if i < len(actions) - 1 and self.config.task_delay_in_seconds > 0:
+                    await asyncio.sleep(self.config.task_delay_in_seconds)
 
             except Exception as e:
-                logger.error(f"Browser evaluation error: {e}")
-                return [], [], f"Browser evaluation error: {e}"
-            finally:
-                if context:
-                    await context.close()
-                if browser:
-                    await browser.close()
+                consecutive_failures += 1
+                _log_action_execution(f"❌ Action {i + 1}/{len(actions)} EXCEPTION: {e} (Consecutive failures: {consecutive_failures}/{max_consecutive_failures})", web_agent_id=web_agent_id)
+                elapsed = time.time() - start_time_action
+                action_execution_times.append(elapsed)
+
+                # Check if exception counts as reaching the limit
+                if consecutive_failures >= max_consecutive_failures:
+                    early_stop_reason = f"Task marked as failed after {consecutive_failures} consecutive action failures (limit: {max_consecutive_failures})"
+                    _log_action_execution(f"🛑 Stopping execution: {early_stop_reason}", web_agent_id=web_agent_id)
+                    break
+
+        if early_stop_reason:
+            _log_action_execution(f"🏁 Finished executing {len(action_results)}/{len(actions)} actions (stopped early due to consecutive failures)", web_agent_id=web_agent_id)
+        else:
+            _log_action_execution(f"🏁 Finished executing {len(action_results)}/{len(actions)} actions", web_agent_id=web_agent_id)
+
+        return action_results, action_execution_times, early_stop_reason
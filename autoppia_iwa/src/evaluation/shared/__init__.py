@@ -2,14 +2,20 @@
 Utilidades compartidas para evaluadores
 
 Este módulo contiene utilidades comunes usadas por todos los evaluadores:
+- concurrency: Control adaptativo (AIMD) de evaluaciones simultáneas
 - feedback_generator: Generación de feedback de evaluaciones
+- gif_recorder: Codificación incremental de GIFs fuera del event loop
+- replay: Grabación y re-evaluación offline de episodios (sin navegador ni backend)
 - test_runner: Ejecución de tests sobre tasks
 - utils: Funciones utilitarias generales
 
 Estas utilidades están disponibles para todos los evaluadores.
 """
 
+from autoppia_iwa.src.evaluation.shared.concurrency import AdaptiveConcurrencyConfig, AdaptiveConcurrencyLimiter, ConcurrencyMetrics
 from autoppia_iwa.src.evaluation.shared.feedback_generator import FeedbackGenerator
+from autoppia_iwa.src.evaluation.shared.gif_recorder import GifEncoder, GifRecorder
+from autoppia_iwa.src.evaluation.shared.replay import EpisodeRecording, RecordingWriter, ReplayReport, iter_recordings, replay_recordings
 from autoppia_iwa.src.evaluation.shared.test_runner import TestRunner
 from autoppia_iwa.src.evaluation.shared.utils import (
     display_batch_evaluation_summary,
@@ -25,7 +31,15 @@ from autoppia_iwa.src.evaluation.shared.utils import (
 )
 
 __all__ = [
+    "AdaptiveConcurrencyConfig",
+    "AdaptiveConcurrencyLimiter",
+    "ConcurrencyMetrics",
+    "EpisodeRecording",
     "FeedbackGenerator",
+    "GifEncoder",
+    "GifRecorder",
+    "RecordingWriter",
+    "ReplayReport",
     "TestRunner",
     "display_batch_evaluation_summary",
     "display_single_evaluation_summary",
@@ -33,8 +47,10 @@ __all__ = [
     "generate_feedback",
     "hash_actions",
     "initialize_test_results",
+    "iter_recordings",
     "log_progress",
     "make_gif_from_screenshots",
+    "replay_recordings",
     "run_global_tests",
     "run_partial_tests",
 ]
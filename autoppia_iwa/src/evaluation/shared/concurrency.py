@@ -0,0 +1,290 @@
+"""
+AIMD concurrency control for evaluation jobs.
+
+``AdaptiveConcurrencyLimiter`` stands in for a fixed ``asyncio.Semaphore``. Every job
+reports its mean step latency and whether it failed or timed out when it finishes:
+
+- additive increase: while the limit is fully used and jobs are healthy, it grows by
+  about one per ``limit`` completions;
+- multiplicative decrease: a step-latency spike against the best latency seen so far,
+  too many errors/timeouts among the last ``window`` jobs, or low available memory
+  multiplies it by ``decrease_factor``, at most once every ``window`` completions.
+
+Usage:
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=2, config=AdaptiveConcurrencyConfig(max_limit=8))
+    async with limiter:
+        result = await run_job()
+        limiter.record(result.mean_step_latency, error=result.failed)
+    print(limiter.metrics.as_dict())
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import math
+import os
+import time
+from collections import deque
+from collections.abc import Callable
+from dataclasses import asdict, dataclass, field
+from typing import Any
+
+from loguru import logger
+
+# Weight of the newest sample in the step-latency moving average
+_LATENCY_EWMA_ALPHA = 0.3
+# How fast the latency baseline follows a slower steady state (per healthy sample)
+_BASELINE_DRIFT = 0.01
+_MAX_DECISIONS = 100
+# Error messages of evaluations that failed in the browser/backend (not in the agent) start with this
+BROWSER_ERROR_PREFIX = "Browser evaluation error"
+
+
+def available_memory_fraction() -> float | None:
+    """Fraction of physical memory available to new processes, or None when unknown."""
+    try:
+        values: dict[str, int] = {}
+        with open("/proc/meminfo", encoding="ascii") as meminfo:
+            for line in meminfo:
+                key, _, rest = line.partition(":")
+                if key in ("MemTotal", "MemAvailable"):
+                    values[key] = int(rest.split()[0])
+        return values["MemAvailable"] / values["MemTotal"]
+    except (OSError, ValueError, KeyError, ZeroDivisionError):
+        pass
+    try:
+        return os.sysconf("SC_AVPHYS_PAGES") / os.sysconf("SC_PHYS_PAGES")
+    except (AttributeError, ValueError, OSError, ZeroDivisionError):
+        return None
+
+
+def is_timeout_error(error: BaseException | str | None) -> bool:
+    """Whether an exception or error message describes a timeout (asyncio, Playwright, HTTP)."""
+    if error is None:
+        return False
+    if isinstance(error, TimeoutError | asyncio.TimeoutError):
+        return True
+    return "timeout" in str(error).lower() or "timed out" in str(error).lower()
+
+
+def mean_step_latency(stats: Any) -> float | None:
+    """Mean browser step time of an ``EvaluationStats``; None when no step ran."""
+    times = getattr(stats, "action_execution_times", None) or []
+    return sum(times) / len(times) if times else None
+
+
+def record_evaluation_outcome(limiter: AdaptiveConcurrencyLimiter, stats: Any) -> None:
+    """Report a finished evaluation; only browser/backend failures and timeouts count against concurrency, agent mistakes do not."""
+    message = stats.error_message if stats is not None and stats.had_errors else ""
+    timeout = is_timeout_error(message)
+    limiter.record(mean_step_latency(stats), error=message.startswith(BROWSER_ERROR_PREFIX) and not timeout, timeout=timeout)
+
+
+@dataclass(frozen=True, slots=True)
+class AdaptiveConcurrencyConfig:
+    """Bounds and thresholds of the AIMD controller."""
+
+    min_limit: int = 1
+    max_limit: int = 16
+    # Decrease when the step-latency average exceeds the best one seen by this factor
+    latency_tolerance: float = 2.0
+    # Decrease when more than this fraction of the last ``window`` jobs failed or timed out
+    error_rate_threshold: float = 0.2
+    # Decrease, and never increase, while less than this fraction of RAM is available
+    min_available_memory: float = 0.1
+    decrease_factor: float = 0.5
+    window: int = 10
+
+    def __post_init__(self) -> None:
+        if self.min_limit <= 0 or self.max_limit < self.min_limit:
+            raise ValueError("Require 0 < min_limit <= max_limit")
+        if self.latency_tolerance <= 1:
+            raise ValueError("latency_tolerance must be > 1")
+        if not 0 <= self.error_rate_threshold < 1:
+            raise ValueError("error_rate_threshold must be in [0, 1)")
+        if not 0 <= self.min_available_memory < 1:
+            raise ValueError("min_available_memory must be in [0, 1)")
+        if not 0 < self.decrease_factor < 1:
+            raise ValueError("decrease_factor must be in (0, 1)")
+        if self.window <= 0:
+            raise ValueError("window must be > 0")
+
+    def serialize(self) -> dict[str, Any]:
+        return asdict(self)
+
+
+@dataclass
+class ConcurrencyMetrics:
+    """Current limit, job outcomes and the controller's recent decisions."""
+
+    limit: int = 0
+    in_flight: int = 0
+    peak_in_flight: int = 0
+    completed: int = 0
+    errors: int = 0
+    timeouts: int = 0
+    increases: int = 0
+    decreases: int = 0
+    latency_ewma: float = 0.0
+    baseline_latency: float = 0.0
+    available_memory: float | None = None
+    total_wait_time: float = 0.0
+    decisions: deque[dict[str, Any]] = field(default_factory=lambda: deque(maxlen=_MAX_DECISIONS))
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "limit": self.limit,
+            "in_flight": self.in_flight,
+            "peak_in_flight": self.peak_in_flight,
+            "completed": self.completed,
+            "errors": self.errors,
+            "timeouts": self.timeouts,
+            "increases": self.increases,
+            "decreases": self.decreases,
+            "latency_ewma": round(self.latency_ewma, 4),
+            "baseline_latency": round(self.baseline_latency, 4),
+            "available_memory": round(self.available_memory, 4) if self.available_memory is not None else None,
+            "total_wait_time": round(self.total_wait_time, 4),
+            "decisions": list(self.decisions),
+        }
+
+
+class AdaptiveConcurrencyLimiter:
+    """
+    Semaphore whose size follows an AIMD controller.
+
+    ``async with limiter`` (or ``acquire``/``release``) takes a slot; waiters are served
+    FIFO. Lowering the limit never interrupts running jobs, it only delays new ones.
+    """
+
+    def __init__(
+        self,
+        initial_limit: int = 1,
+        config: AdaptiveConcurrencyConfig | None = None,
+        *,
+        memory_probe: Callable[[], float | None] = available_memory_fraction,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.config = config or AdaptiveConcurrencyConfig()
+        self._memory_probe = memory_probe
+        self._clock = clock
+        self._limit = float(min(max(initial_limit, self.config.min_limit), self.config.max_limit))
+        self._in_flight = 0
+        self._waiters: deque[asyncio.Future[None]] = deque()
+        # Failed (True) / healthy (False) outcomes of the last ``window`` jobs
+        self._outcomes: deque[bool] = deque(maxlen=self.config.window)
+        self._since_decrease = self.config.window
+        self._started = clock()
+        self.metrics = ConcurrencyMetrics(limit=self.limit)
+
+    @property
+    def limit(self) -> int:
+        return int(self._limit)
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    async def acquire(self) -> None:
+        if self._in_flight < self.limit and not self._waiters:
+            self._take_slot()
+            return
+        started = self._clock()
+        waiter: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                # The slot was handed over just before the cancellation landed.
+                self.release()
+            else:
+                with contextlib.suppress(ValueError):
+                    self._waiters.remove(waiter)
+            raise
+        self.metrics.total_wait_time += self._clock() - started
+
+    def release(self) -> None:
+        self._in_flight -= 1
+        self.metrics.in_flight = self._in_flight
+        self._wake()
+
+    async def __aenter__(self) -> AdaptiveConcurrencyLimiter:
+        await self.acquire()
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        self.release()
+
+    def record(self, latency_s: float | None, *, error: bool = False, timeout: bool = False) -> None:
+        """Report a finished job (call before releasing its slot) and adapt the limit."""
+        cfg = self.config
+        metrics = self.metrics
+        failed = error or timeout
+        metrics.completed += 1
+        metrics.errors += int(error)
+        metrics.timeouts += int(timeout)
+        self._outcomes.append(failed)
+        self._since_decrease += 1
+
+        if latency_s is not None and latency_s >= 0 and not failed:
+            ewma = latency_s if not metrics.latency_ewma else _LATENCY_EWMA_ALPHA * latency_s + (1 - _LATENCY_EWMA_ALPHA) * metrics.latency_ewma
+            metrics.latency_ewma = ewma
+            baseline = metrics.baseline_latency
+            metrics.baseline_latency = ewma if not baseline else min(ewma, baseline + (ewma - baseline) * _BASELINE_DRIFT)
+
+        memory = self._memory_probe()
+        metrics.available_memory = memory
+        reason = None
+        if memory is not None and memory < cfg.min_available_memory:
+            reason = "memory"
+        elif len(self._outcomes) >= max(1, cfg.window // 2) and sum(self._outcomes) / len(self._outcomes) > cfg.error_rate_threshold:
+            reason = "errors"
+        elif metrics.baseline_latency and metrics.latency_ewma > metrics.baseline_latency * cfg.latency_tolerance:
+            reason = "latency"
+
+        if reason is not None:
+            if self._since_decrease >= cfg.window:
+                self._set_limit(max(cfg.min_limit, math.floor(self._limit * cfg.decrease_factor)), reason)
+                self._since_decrease = 0
+                self._outcomes.clear()
+                # Judge the new limit against fresh latencies, not the spike that triggered it.
+                metrics.latency_ewma = metrics.baseline_latency
+        elif not failed and self._in_flight >= self.limit and self._limit < cfg.max_limit:
+            self._set_limit(min(cfg.max_limit, self._limit + 1 / self._limit), "increase")
+
+    def _set_limit(self, new_limit: float, reason: str) -> None:
+        old = self.limit
+        self._limit = float(new_limit)
+        if self.limit == old:
+            return
+        metrics = self.metrics
+        metrics.limit = self.limit
+        if self.limit > old:
+            metrics.increases += 1
+        else:
+            metrics.decreases += 1
+        metrics.decisions.append(
+            {
+                "t": round(self._clock() - self._started, 3),
+                "limit": self.limit,
+                "reason": reason,
+                "latency_ewma": round(metrics.latency_ewma, 4),
+                "available_memory": metrics.available_memory,
+            }
+        )
+        logger.info(f"Evaluation concurrency {old} -> {self.limit} ({reason})")
+        self._wake()
+
+    def _take_slot(self) -> None:
+        self._in_flight += 1
+        self.metrics.in_flight = self._in_flight
+        self.metrics.peak_in_flight = max(self.metrics.peak_in_flight, self._in_flight)
+
+    def _wake(self) -> None:
+        while self._waiters and self._in_flight < self.limit:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                self._take_slot()
+                waiter.set_result(None)
@@ -0,0 +1,252 @@
+"""
+Streaming GIF encoding for evaluation recordings.
+
+``GifEncoder`` turns screenshots into GIF frames one at a time: each screenshot is
+decoded, downscaled to ``max_width``, palette-quantized and written straight to the
+output, so only one decoded frame is alive at any moment however long the episode is.
+A frame identical to the previous one is not written again; the previous frame is
+shown longer instead.
+
+``GifRecorder`` feeds an encoder from the event loop: ``add_frame`` hands the screenshot
+to a small shared worker pool and returns immediately, and frames of one recording are
+encoded in order. ``await finish()`` returns the base64 GIF once the last frame is done.
+
+Usage:
+    recorder = GifRecorder()
+    recorder.add_frame(snapshot.screenshot_before)       # as each step finishes
+    gif_b64 = await recorder.finish()
+"""
+
+import asyncio
+import base64
+import binascii
+import hashlib
+import io
+import os
+import struct
+import threading
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+
+from loguru import logger
+
+DEFAULT_FRAME_DURATION_MS = 500
+DEFAULT_MAX_WIDTH = 800
+DEFAULT_COLORS = 128
+_MAX_GIF_DURATION_MS = 655_350  # 16-bit delay in hundredths of a second
+_FINISH = object()
+
+_executor: ThreadPoolExecutor | None = None
+_executor_lock = threading.Lock()
+
+
+def _gif_executor() -> ThreadPoolExecutor:
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(max_workers=min(4, os.cpu_count() or 1), thread_name_prefix="gif-encoder")
+        return _executor
+
+
+def _screenshot_bytes(screenshot: bytes | str) -> bytes:
+    if isinstance(screenshot, bytes):
+        return screenshot
+    if isinstance(screenshot, str):
+        # It must be ASCII bytes for b64decode
+        return base64.b64decode(screenshot.encode("ascii"))
+    raise TypeError(f"neither bytes nor a string (type: {type(screenshot)})")
+
+
+class GifEncoder:
+    """Incremental GIF writer; ``add`` and ``finish`` must be called from one thread at a time."""
+
+    def __init__(
+        self,
+        duration_ms: int = DEFAULT_FRAME_DURATION_MS,
+        loop_count: int = 0,
+        max_width: int = DEFAULT_MAX_WIDTH,
+        colors: int = DEFAULT_COLORS,
+    ) -> None:
+        self.duration_ms = duration_ms
+        self.loop_count = loop_count
+        self.max_width = max_width
+        self.colors = max(2, min(256, colors))
+        self.frames = 0
+        self.duplicates = 0
+        self._seen = 0
+        self._out = io.BytesIO()
+        self._canvas: tuple[int, int] | None = None
+        self._last_source: bytes | None = None
+        self._last_pixels: bytes | None = None
+        # The previous frame is held back so repeats can extend its duration
+        self._held = None
+        self._held_duration = 0
+
+    def add(self, screenshot: bytes | str | None, index: int | None = None) -> bool:
+        """Encode one screenshot; bad input is logged and skipped. Returns whether a frame was kept."""
+        index = self._seen if index is None else index
+        self._seen += 1
+        if not screenshot:
+            return False
+        try:
+            data = _screenshot_bytes(screenshot)
+        except UnicodeEncodeError:
+            logger.warning(f"Base64 string at index {index} contains non-ASCII characters and could not be encoded. Skipping.")
+            return False
+        except (binascii.Error, ValueError) as e_b64:
+            logger.warning(f"Could not decode base64 string at index {index}: {e_b64}. Skipping.")
+            return False
+        except TypeError as e_type:
+            logger.warning(f"Item at index {index} is {e_type}. Skipping.")
+            return False
+
+        source_digest = hashlib.blake2b(data, digest_size=16).digest()
+        if source_digest == self._last_source:
+            return self._repeat()
+
+        from PIL import UnidentifiedImageError  # type: ignore
+
+        try:
+            frame = self._prepare(data)
+        except UnidentifiedImageError:
+            logger.warning(f"Pillow could not identify image format from base64 string at index {index}. Skipping.")
+            return False
+        except OSError as e_pil:
+            logger.warning(f"Pillow I/O error for image from base64 string at index {index}: {e_pil}. Skipping.")
+            return False
+        except Exception as e_general:
+            logger.error(f"Unexpected error processing base64 string at index {index}: {e_general}.", exc_info=True)
+            return False
+
+        self._last_source = source_digest
+        pixels = hashlib.blake2b(frame.tobytes() + bytes(frame.getpalette() or ()), digest_size=16).digest()
+        if pixels == self._last_pixels:
+            frame.close()
+            return self._repeat()
+        self._last_pixels = pixels
+        self._write_held()
+        self._held, self._held_duration = frame, self.duration_ms
+        self.frames += 1
+        return True
+
+    def _repeat(self) -> bool:
+        if self._held is None:
+            return False
+        self._held_duration += self.duration_ms
+        self.duplicates += 1
+        return True
+
+    def _prepare(self, data: bytes):
+        from PIL import Image, ImageOps  # type: ignore
+
+        with Image.open(io.BytesIO(data)) as img:
+            if img.mode == "P" and "transparency" in img.info:
+                img = img.convert("RGBA")
+            rgb = img.convert("RGB")
+        if self._canvas is None:
+            if rgb.width > self.max_width:
+                rgb.thumbnail((self.max_width, max(1, rgb.height * self.max_width // rgb.width)), Image.Resampling.LANCZOS)
+            self._canvas = rgb.size
+        elif rgb.size != self._canvas:
+            # GIF frames share one canvas; fit later pages into the first one's size
+            fitted = ImageOps.contain(rgb, self._canvas, Image.Resampling.LANCZOS)
+            rgb = Image.new("RGB", self._canvas, (255, 255, 255))
+            rgb.paste(fitted, (0, 0))
+        return rgb.quantize(colors=self.colors, method=Image.Quantize.FASTOCTREE)
+
+    def _write_held(self) -> None:
+        if self._held is None:
+            return
+        from PIL import GifImagePlugin  # type: ignore
+
+        if self._out.tell() == 0:
+            width, height = self._canvas
+            # GIF89a header without a global palette (each frame carries its own) + loop extension
+            self._out.write(b"GIF89a" + struct.pack("<HHBBB", width, height, 0, 0, 0))
+            self._out.write(b"!\xff\x0bNETSCAPE2.0\x03\x01" + struct.pack("<H", self.loop_count) + b"\x00")
+        duration = min(self._held_duration, _MAX_GIF_DURATION_MS)
+        for chunk in GifImagePlugin.getdata(self._held, duration=duration, disposal=1, include_color_table=True):
+            self._out.write(chunk)
+        self._held.close()
+        self._held = None
+
+    def finish(self) -> bytes:
+        """Base64 of the finished GIF, or ``b""`` when no frame could be encoded."""
+        try:
+            self._write_held()
+        except Exception as e_gif:
+            logger.error(f"❌ GIF CREATION ERROR: {e_gif}", exc_info=True)
+            return b""
+        if self._out.tell() == 0:
+            return b""
+        self._out.write(b";")
+        encoded = base64.b64encode(self._out.getvalue())
+        self._out = io.BytesIO()
+        return encoded
+
+    def close(self) -> None:
+        if self._held is not None:
+            self._held.close()
+            self._held = None
+        self._out = io.BytesIO()
+
+
+class GifRecorder:
+    """Feeds a ``GifEncoder`` from the event loop; encoding runs on a shared worker pool."""
+
+    def __init__(self, **encoder_options) -> None:
+        self.encoder = GifEncoder(**encoder_options)
+        self._pending: deque = deque()
+        self._lock = threading.Lock()
+        self._draining = False
+        self._discarded = False
+        self._result: Future | None = None
+
+    def add_frame(self, screenshot: bytes | str | None) -> None:
+        if screenshot and self._result is None:
+            self._schedule(screenshot)
+
+    async def finish(self) -> bytes:
+        """Wait for queued frames and return the base64 GIF (``b""`` when empty)."""
+        if self._result is None:
+            self._result = Future()
+            self._schedule(_FINISH)
+        return await asyncio.wrap_future(self._result)
+
+    def discard(self) -> None:
+        """Drop queued frames and the partial GIF (e.g. when the evaluation failed)."""
+        with self._lock:
+            self._pending.clear()
+            self._discarded = True
+        if self._result is None:
+            self._result = Future()
+            self._schedule(_FINISH)
+
+    def _schedule(self, item) -> None:
+        with self._lock:
+            self._pending.append(item)
+            if self._draining:
+                return
+            self._draining = True
+        _gif_executor().submit(self._drain)
+
+    def _drain(self) -> None:
+        # Runs on the pool; ``_draining`` keeps one drain per recorder so frames stay in order
+        while True:
+            with self._lock:
+                if not self._pending:
+                    self._draining = False
+                    return
+                item = self._pending.popleft()
+            if item is _FINISH:
+                try:
+                    self._result.set_result(b"" if self._discarded else self.encoder.finish())
+                except Exception as e:
+                    self._result.set_exception(e)
+                finally:
+                    self.encoder.close()
+            else:
+                try:
+                    self.encoder.add(item)
+                except Exception as e_gif:
+                    logger.error(f"❌ GIF CREATION ERROR: {e_gif}", exc_info=True)
@@ -0,0 +1,369 @@
+"""
+Offline replay of recorded evaluation episodes.
+
+An ``EpisodeRecording`` keeps what the tests of an episode look at — the task with the
+tests that actually ran, the ``BackendEvent`` stream, per-step ``BrowserSnapshot``
+events/URLs and the agent's extracted data — together with the verdicts given at the
+time. HTML and screenshots are not kept, so a recording is a few KB.
+
+Recordings are appended to ``*.jsonl.gz`` files (one gzip member per episode, so a torn
+file still decodes up to its last complete episode). ``replay_recordings`` re-runs
+``run_global_tests`` / ``run_partial_tests`` against them with no browser or backend and
+reports every test verdict and score that changed.
+
+Only deterministic tests are replayed (``REPLAYABLE_TEST_TYPES``); LLM judges keep their
+recorded verdict so that replay never needs a model.
+
+Usage:
+    writer = RecordingWriter(Path("recordings/run.jsonl.gz"))
+    writer.append(EpisodeRecording.from_evaluation(task, result, backend_events, extracted_data))
+    report = await replay_recordings(Path("recordings"))
+    print(report.summary())
+"""
+
+from __future__ import annotations
+
+import asyncio
+import gzip
+import json
+import threading
+import time
+import zlib
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+from loguru import logger
+from pydantic import BaseModel, Field
+
+from autoppia_iwa.src.data_generation.tasks.classes import Task
+from autoppia_iwa.src.data_generation.tests.classes import BaseTaskTest
+from autoppia_iwa.src.demo_webs.classes import BackendEvent, WebProject
+from autoppia_iwa.src.evaluation.classes import EvaluationResult, TestResult
+from autoppia_iwa.src.evaluation.shared.utils import run_global_tests, run_partial_tests
+from autoppia_iwa.src.execution.actions.base import BaseAction
+from autoppia_iwa.src.execution.classes import ActionExecutionResult, BrowserSnapshot
+
+RECORDING_FORMAT_VERSION = 1
+RECORDING_SUFFIX = ".jsonl.gz"
+REPLAYABLE_TEST_TYPES = frozenset({"CheckEventTest", "DataExtractionTest"})
+
+# Test runner logs every test and event at INFO; replaying thousands of episodes would
+# spend most of its time there.
+_QUIET_MODULES = ("autoppia_iwa.src.evaluation.shared.test_runner", "autoppia_iwa.src.demo_webs")
+
+
+class RecordedStep(BaseModel):
+    """The parts of a ``BrowserSnapshot`` partial tests read, without HTML or screenshots."""
+
+    iteration: int
+    action: dict[str, Any]
+    current_url: str = ""
+    backend_events: list[BackendEvent] = Field(default_factory=list)
+    successfully_executed: bool = True
+
+    @classmethod
+    def from_action_result(cls, result: ActionExecutionResult) -> RecordedStep:
+        snapshot = result.browser_snapshot
+        return cls(
+            iteration=snapshot.iteration,
+            action=result.action.model_dump(),
+            current_url=snapshot.current_url,
+            backend_events=list(snapshot.backend_events),
+            successfully_executed=result.successfully_executed,
+        )
+
+    def to_action_result(self) -> ActionExecutionResult:
+        action = BaseAction.create_action(dict(self.action))
+        snapshot = BrowserSnapshot(
+            iteration=self.iteration,
+            action=action,
+            prev_html="",
+            current_html="",
+            screenshot_before="",
+            screenshot_after="",
+            backend_events=self.backend_events,
+            current_url=self.current_url,
+        )
+        return ActionExecutionResult(
+            action=action,
+            action_event=action.type,
+            successfully_executed=self.successfully_executed,
+            browser_snapshot=snapshot,
+        )
+
+
+class EpisodeRecording(BaseModel):
+    """Everything needed to re-score one evaluated episode offline."""
+
+    format_version: int = RECORDING_FORMAT_VERSION
+    episode_id: str
+    web_agent_id: str | None = None
+    task: dict[str, Any] = Field(..., description="Task.serialize() with the tests exactly as they ran (placeholders resolved)")
+    backend_events: list[BackendEvent] = Field(default_factory=list)
+    steps: list[RecordedStep] = Field(default_factory=list)
+    extracted_data: Any = None
+    global_results: list[bool] = Field(default_factory=list, description="Recorded run_global_tests verdicts, one per test")
+    partial_results: list[bool] | None = Field(default=None, description="Recorded final row of run_partial_tests, if it ran")
+    recorded_at_utc: str = Field(default_factory=lambda: datetime.now(UTC).isoformat())
+
+    @classmethod
+    def from_evaluation(
+        cls,
+        task: Task,
+        result: EvaluationResult,
+        backend_events: list[BackendEvent],
+        extracted_data: Any = None,
+        partial_results: list[TestResult] | None = None,
+        episode_id: str | None = None,
+    ) -> EpisodeRecording:
+        """
+        Build a recording from an evaluation result.
+
+        The tests are rebuilt from ``TestResult.extra_data`` (the dump of the test that ran),
+        so placeholders resolved at evaluation time are frozen into the recording and replay
+        never has to fetch seed data again.
+        """
+        tests = _tests_from_results(task.tests, result.test_results)
+        task_data = task.serialize()
+        task_data["tests"] = [test.serialize() for test in tests]
+        web_agent_id = result.web_agent_id
+        return cls(
+            episode_id=episode_id or f"{task.id}:{web_agent_id or 'unknown_agent'}",
+            web_agent_id=web_agent_id,
+            task=task_data,
+            backend_events=list(backend_events or []),
+            steps=[RecordedStep.from_action_result(step) for step in result.execution_history],
+            extracted_data=extracted_data,
+            global_results=[bool(r.success) for r in result.test_results],
+            partial_results=[bool(r.success) for r in partial_results] if partial_results is not None else None,
+        )
+
+    def build_task(self) -> Task:
+        return Task.deserialize(self.task)
+
+
+def _tests_from_results(tests: list[BaseTaskTest], results: list[TestResult]) -> list[BaseTaskTest]:
+    if len(results) != len(tests):
+        return list(tests)
+    rebuilt: list[BaseTaskTest] = []
+    for test, result in zip(tests, results, strict=True):
+        dumped = result.extra_data or {}
+        if dumped.get("type", getattr(test, "type", None)) != getattr(test, "type", None):
+            rebuilt.append(test)
+            continue
+        try:
+            rebuilt.append(BaseTaskTest.deserialize({**dumped, "description": getattr(test, "description", "")}))
+        except ValueError:
+            rebuilt.append(test)
+    return rebuilt
+
+
+async def final_partial_results(web_project: WebProject | None, task: Task, result: EvaluationResult, extracted_data: Any = None) -> list[TestResult] | None:
+    """
+    Final row of the ``run_partial_tests`` matrix of an evaluated episode, for ``EpisodeRecording.partial_results``.
+
+    Only replayable tests are run (over the recorded history, with the criteria that ran);
+    LLM judges keep their global verdict, as replay never re-runs them. None without a history.
+    """
+    if not result.execution_history or len(result.test_results) != len(task.tests):
+        return None
+    tests = _tests_from_results(task.tests, result.test_results)
+    replayable = [i for i, test in enumerate(tests) if test.type in REPLAYABLE_TEST_TYPES]
+    row = list(result.test_results)
+    if replayable:
+        partial_task = task.model_copy(update={"tests": [tests[i] for i in replayable]})
+        matrix = await run_partial_tests(web_project, partial_task, result.execution_history, extracted_data=extracted_data)
+        for index, test_result in zip(replayable, matrix[-1], strict=True):
+            row[index] = test_result
+    return row
+
+
+# ── Storage ────────────────────────────────────────────────────────────
+
+
+class RecordingWriter:
+    """Appends recordings to a ``.jsonl.gz`` file; safe to share between threads."""
+
+    def __init__(self, path: Path):
+        self.path = path
+        self._lock = threading.Lock()
+
+    def append(self, recording: EpisodeRecording) -> None:
+        line = json.dumps(recording.model_dump(), ensure_ascii=False, default=str).encode("utf-8") + b"\n"
+        member = gzip.compress(line, compresslevel=6, mtime=0)
+        with self._lock:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.path, "ab") as f:
+                f.write(member)
+
+    async def append_async(self, recording: EpisodeRecording) -> None:
+        await asyncio.to_thread(self.append, recording)
+
+
+def _recording_files(source: Path) -> list[Path]:
+    if source.is_dir():
+        return sorted(p for p in source.rglob(f"*{RECORDING_SUFFIX}") if p.is_file())
+    return [source]
+
+
+def _decode_members(data: bytes) -> bytes:
+    chunks = []
+    while data:
+        member = zlib.decompressobj(wbits=31)
+        try:
+            chunk = member.decompress(data)
+        except zlib.error:
+            break
+        if not member.eof:
+            break
+        chunks.append(chunk)
+        data = member.unused_data
+    return b"".join(chunks)
+
+
+def iter_recordings(source: Path | Iterable[Path]) -> Iterator[EpisodeRecording]:
+    """Yield recordings from a file, a directory of ``*.jsonl.gz`` files or several paths."""
+    paths = _recording_files(source) if isinstance(source, Path) else [p for s in source for p in _recording_files(Path(s))]
+    for path in paths:
+        data = path.read_bytes()
+        if path.suffix == ".gz":
+            data = _decode_members(data)
+        for line_no, line in enumerate(data.splitlines(), 1):
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                logger.warning(f"Skipping unreadable recording {path}:{line_no}")
+                continue
+            if record.get("format_version", RECORDING_FORMAT_VERSION) > RECORDING_FORMAT_VERSION:
+                logger.warning(f"Skipping recording {path}:{line_no} with newer format {record.get('format_version')}")
+                continue
+            yield EpisodeRecording.model_validate(record)
+
+
+# ── Replay ─────────────────────────────────────────────────────────────
+
+
+@dataclass
+class VerdictDiff:
+    episode_id: str
+    phase: str  # "global" or "partial"
+    test_index: int
+    test_type: str
+    description: str
+    recorded: bool
+    replayed: bool
+
+
+@dataclass
+class EpisodeReplay:
+    episode_id: str
+    recorded_score: float
+    replayed_score: float
+    diffs: list[VerdictDiff] = field(default_factory=list)
+    error: str | None = None
+
+    @property
+    def changed(self) -> bool:
+        return bool(self.diffs) or self.error is not None
+
+
+@dataclass
+class ReplayReport:
+    episodes: list[EpisodeReplay] = field(default_factory=list)
+    elapsed_seconds: float = 0.0
+
+    @property
+    def changed(self) -> list[EpisodeReplay]:
+        return [episode for episode in self.episodes if episode.changed]
+
+    @property
+    def errors(self) -> list[EpisodeReplay]:
+        return [episode for episode in self.episodes if episode.error is not None]
+
+    def summary(self) -> str:
+        changed = self.changed
+        lines = [f"Replayed {len(self.episodes)} episodes in {self.elapsed_seconds:.2f}s: {len(changed)} changed, {len(self.errors)} errors"]
+        for episode in changed:
+            if episode.error is not None:
+                lines.append(f"  {episode.episode_id}: ERROR {episode.error}")
+                continue
+            lines.append(f"  {episode.episode_id}: score {episode.recorded_score:.3f} -> {episode.replayed_score:.3f}")
+            for diff in episode.diffs:
+                lines.append(f"    [{diff.phase}] test {diff.test_index + 1} {diff.test_type} ({diff.description}): {diff.recorded} -> {diff.replayed}")
+        return "\n".join(lines)
+
+
+def _score(verdicts: list[bool]) -> float:
+    return sum(verdicts) / len(verdicts) if verdicts else 0.0
+
+
+def _compare(episode_id: str, phase: str, tests: list[BaseTaskTest], recorded: list[bool], replayed: dict[int, bool]) -> tuple[list[bool], list[VerdictDiff]]:
+    merged = list(recorded)
+    diffs: list[VerdictDiff] = []
+    for index, verdict in replayed.items():
+        if verdict != recorded[index]:
+            test = tests[index]
+            diffs.append(VerdictDiff(episode_id, phase, index, test.type, getattr(test, "description", ""), recorded[index], verdict))
+        merged[index] = verdict
+    return merged, diffs
+
+
+async def replay_recording(recording: EpisodeRecording, web_project: WebProject | None = None) -> EpisodeReplay:
+    """Re-run the deterministic tests of one recording and diff them against the recorded verdicts."""
+    task = recording.build_task()
+    recorded_score = _score(recording.global_results)
+    if len(recording.global_results) != len(task.tests):
+        return EpisodeReplay(recording.episode_id, recorded_score, recorded_score, error="recorded verdicts do not match the task's tests")
+
+    replayable = [i for i, test in enumerate(task.tests) if test.type in REPLAYABLE_TEST_TYPES]
+    replay_task = task.model_copy(update={"tests": [task.tests[i] for i in replayable]})
+
+    # web_agent_id=None: tests were recorded with their placeholders already resolved.
+    global_results = await run_global_tests(replay_task, backend_events=recording.backend_events, web_agent_id=None, extracted_data=recording.extracted_data)
+    merged, diffs = _compare(recording.episode_id, "global", task.tests, recording.global_results, {i: r.success for i, r in zip(replayable, global_results, strict=True)})
+
+    if recording.partial_results is not None and recording.steps and len(recording.partial_results) == len(task.tests):
+        history = [step.to_action_result() for step in recording.steps]
+        matrix = await run_partial_tests(web_project, replay_task, history, extracted_data=recording.extracted_data)
+        final_row = matrix[-1] if matrix else []
+        _, partial_diffs = _compare(recording.episode_id, "partial", task.tests, recording.partial_results, {i: r.success for i, r in zip(replayable, final_row, strict=True)})
+        diffs.extend(partial_diffs)
+
+    return EpisodeReplay(recording.episode_id, recorded_score, _score(merged), diffs)
+
+
+async def replay_recordings(source: Path | Iterable[Path] | Iterable[EpisodeRecording], web_projects: dict[str, WebProject] | None = None) -> ReplayReport:
+    """
+    Replay every recording in ``source`` and collect the episodes whose verdicts changed.
+
+    ``web_projects`` (by id) is only handed to partial tests; the replayable test types do
+    not read it, so it can be omitted.
+    """
+    if isinstance(source, Path):
+        recordings: Iterable[EpisodeRecording] = iter_recordings(source)
+    else:
+        items = list(source)
+        recordings = items if all(isinstance(item, EpisodeRecording) for item in items) else iter_recordings(items)
+
+    web_projects = web_projects or {}
+    report = ReplayReport()
+    start = time.perf_counter()
+    for module in _QUIET_MODULES:
+        logger.disable(module)
+    try:
+        for recording in recordings:
+            project = web_projects.get(recording.task.get("web_project_id") or "")
+            try:
+                report.episodes.append(await replay_recording(recording, project))
+            except Exception as e:
+                report.episodes.append(EpisodeReplay(recording.episode_id, _score(recording.global_results), 0.0, error=f"{type(e).__name__}: {e}"))
+    finally:
+        for module in _QUIET_MODULES:
+            logger.enable(module)
+    report.elapsed_seconds = time.perf_counter() - start
+    return report
@@ -136,3 +136,82 @@ class TestRunner:
 
         _log_backend_test(f"   - Total results: {len(snapshot_results)}", web_agent_id=web_agent_id)
         return snapshot_results
+
+
+class IncrementalTestRunner:
+    """
+    Step-by-step scorer equivalent to the final round of ``run_partial_tests``.
+
+    ``run_partial_tests`` rebuilds the whole results matrix from the execution history, so
+    re-scoring after every step of an N-step episode costs O(N²) test evaluations. This runner
+    keeps per-test state between steps instead:
+
+    - Snapshots and backend events are fed as they arrive (``add_snapshot`` / ``add_events``).
+    - ``CheckEventTest`` only looks at events it has not seen yet, and once a verdict is
+      reached it is final (events are never retracted within a session).
+    - Every other test runs once per ``evaluate`` call on the latest snapshot with the
+      accumulated snapshot list, exactly like the final row of ``run_partial_tests``.
+    """
+
+    def __init__(self, web_project: WebProject, prompt: str, tests: list[BaseTaskTest]):
+        self.web_project = web_project
+        self.prompt = prompt
+        self.tests = tests
+        self._snapshots: list[BrowserSnapshot] = []
+        self._pending_events: list[BackendEvent] = []
+        self._event_verdicts: dict[int, bool] = {}
+        self._extra_data = [{key: value for key, value in test.model_dump().items() if key not in {"description", "test_type"}} for test in tests]
+
+    @property
+    def snapshot_count(self) -> int:
+        return len(self._snapshots)
+
+    def add_snapshot(self, snapshot: BrowserSnapshot) -> None:
+        self._snapshots.append(snapshot)
+
+    def add_events(self, backend_events: list[BackendEvent]) -> None:
+        self._pending_events.extend(backend_events)
+
+    async def evaluate(self, extracted_data: object | None = None, log_round: bool = True) -> list[TestResult]:
+        """Return one TestResult per test for the latest snapshot, or [] before the first snapshot."""
+        if not self._snapshots:
+            return []
+
+        from autoppia_iwa.src.data_generation.tests.classes import CheckEventTest
+        from autoppia_iwa.src.demo_webs.base_events import Event
+
+        pending, self._pending_events = self._pending_events, []
+        parsed_events = None
+        total_iterations = len(self._snapshots)
+
+        results: list[TestResult] = []
+        for test_idx, test in enumerate(self.tests):
+            if isinstance(test, CheckEventTest):
+                if test_idx not in self._event_verdicts and pending:
+                    if parsed_events is None:
+                        parsed_events = Event.parse_all(pending)
+                    verdict = test.match_events(parsed_events)
+                    if verdict is not None:
+                        self._event_verdicts[test_idx] = verdict
+                success = self._event_verdicts.get(test_idx, False)
+            else:
+                success = await test.execute_test(
+                    web_project=self.web_project,
+                    current_iteration=total_iterations - 1,
+                    prompt=self.prompt,
+                    snapshot=self._snapshots[-1],
+                    browser_snapshots=self._snapshots,
+                    total_iterations=total_iterations,
+                    extracted_data=extracted_data,
+                )
+
+            if log_round:
+                logger.info(f"  🧪 Test {test_idx + 1}/{len(self.tests)}: {test.type} - Criteria: {_criteria_for_log(test)}")
+                if success:
+                    logger.info(f"  ✅ Test {test_idx + 1} PASSED")
+                else:
+                    logger.warning(f"  ❌ Test {test_idx + 1} FAILED")
+
+            results.append(TestResult(success=success, extra_data=dict(self._extra_data[test_idx])))
+
+        return results
@@ -1,9 +1,7 @@
 # evaluation_helper.py
 import asyncio
-import base64
 import copy
 import hashlib
-import io
 from collections import defaultdict
 
 from loguru import logger
@@ -17,6 +15,7 @@ from autoppia_iwa.src.demo_webs.projects.p01_autocinema.data_utils import fetch_
 from autoppia_iwa.src.demo_webs.projects.p02_autobooks.data_utils import fetch_data as fetch_books_data
 from autoppia_iwa.src.evaluation.classes import EvaluationStats, Feedback, TestResult
 from autoppia_iwa.src.evaluation.shared.feedback_generator import FeedbackGenerator
+from autoppia_iwa.src.evaluation.shared.gif_recorder import DEFAULT_COLORS, DEFAULT_MAX_WIDTH, GifEncoder
 from autoppia_iwa.src.evaluation.shared.test_runner import TestRunner
 from autoppia_iwa.src.execution.actions.base import BaseAction
 from autoppia_iwa.src.execution.classes import ActionExecutionResult
@@ -60,6 +59,8 @@ def display_single_evaluation_summary(stats: EvaluationStats, debug_mode: bool =
     logger.info(f" - Actions Execution: {action_time:.2f}s ({action_pct:.1f}%)")
     logger.info(f" - Test Execution: {stats.test_execution_time:.2f}s ({test_pct:.1f}%)")
     logger.info(f" - Random Evaluation: {stats.random_clicker_time:.2f}s ({random_pct:.1f}%)")
+    if stats.skipped_phases:
+        logger.info(f" - Skipped: {', '.join(stats.skipped_phases)}")
 
     if stats.action_execution_times:
         avg_time = sum(stats.action_execution_times) / len(stats.action_execution_times)
@@ -188,6 +189,20 @@ def display_batch_evaluation_summary(
 # ---------------------------------------------------------------------------------
 # TEST / FEEDBACK HELPERS
 # ---------------------------------------------------------------------------------
+# Phases an evaluator leaves out when the task's tests cannot observe them.
+DATA_EXTRACTION_SKIPPED_PHASES = ("db_reset", "event_fetch", "partial_tests", "html_capture")
+
+
+def task_uses_backend_events(task: Task) -> bool:
+    """True if any test reads backend events, i.e. the backend must be reset and polled."""
+    return any(getattr(test, "type", None) == "CheckEventTest" for test in task.tests)
+
+
+def is_data_extraction_only(task: Task) -> bool:
+    """True if every test is a DataExtractionTest, so the verdict depends only on the agent's answer."""
+    return bool(task.tests) and all(getattr(test, "type", None) == "DataExtractionTest" for test in task.tests)
+
+
 async def run_global_tests(
     task: Task,
     backend_events: list[BackendEvent],
@@ -527,103 +542,41 @@ def initialize_test_results(task: Task):
     return test_results
 
 
-def make_gif_from_screenshots(all_base64_strings, duration_ms=500, loop_count=0):
+def make_gif_from_screenshots(all_base64_strings, duration_ms=500, loop_count=0, max_width=DEFAULT_MAX_WIDTH, colors=DEFAULT_COLORS):
     """
-    Creates an animated GIF from a list of base64 encoded image strings.
+    Creates an animated GIF from a list of screenshots.
+
+    Frames are encoded one at a time (see ``GifEncoder``): downscaled to ``max_width``,
+    quantized to ``colors`` and merged with the previous frame when identical. Inside an
+    event loop prefer ``GifRecorder``, which encodes off the loop as screenshots arrive.
 
     Args:
-        all_base64_strings: A list of strings, where each string is a
-                            base64-encoded representation of an image.
+        all_base64_strings: A list of screenshots, each either raw image bytes or a
+                            base64-encoded string. Empty entries are skipped.
         duration_ms: The display duration for each frame in the GIF,
                      in milliseconds.
         loop_count: The number of times the GIF should loop.
                     Set to 0 for infinite looping. Defaults to 0.
+        max_width: Frames wider than this are scaled down, keeping the aspect ratio.
+        colors: Palette size of each frame (2-256).
 
     Returns:
         str: The base64 encoded content of the generated GIF image. Returns empty bytes (b"") if an error occurs
                or no images are processed.
     """
-    # Local import to avoid hard dependency when GIF generation is unused
-    from PIL import Image, UnidentifiedImageError  # type: ignore
-
-    pil_images: list = []
-
     if not all_base64_strings:
         return b""
 
-    for idx, b64_string in enumerate(all_base64_strings):
-        try:
-            if not isinstance(b64_string, str):
-                logger.warning(f"Item at index {idx} is not a string (type: {type(b64_string)}). Skipping.")
-                continue
-
-            # Decode the base64 string. It must be ASCII bytes for b64decode.
-            image_data_bytes = base64.b64decode(b64_string.encode("ascii"))
-
-            # Create a PIL Image object from the image bytes
-            image_file_like = io.BytesIO(image_data_bytes)
-            img = Image.open(image_file_like)
-
-            # Ensure the image is in a mode compatible with GIF.
-            # Converting to RGBA handles various input modes and alpha transparency.
-            # Pillow will convert RGBA to P (palette) mode when saving as GIF.
-            # L: Luminance (grayscale), P: Palette, RGB: Truecolor
-            if img.mode not in ("L", "P", "RGB"):
-                logger.debug(f"Converting image {idx} from mode {img.mode} to RGBA for GIF compatibility.")
-                img = img.convert("RGBA")
-            elif img.mode == "P" and "transparency" in img.info:
-                # If it's already a palette image with transparency, ensure it's handled correctly.
-                # Often, converting to RGBA and letting PIL re-palette for GIF is more robust.
-                logger.debug(f"Image {idx} is in Palette mode with transparency. Converting to RGBA to preserve alpha.")
-                img = img.convert("RGBA")
-
-            pil_images.append(img)
-
-        except UnicodeEncodeError:
-            logger.warning(f"Base64 string at index {idx} contains non-ASCII characters and could not be encoded. Skipping.")
-            continue
-        # ValueError for incorrect padding etc.
-        except (base64.binascii.Error, ValueError) as e_b64:
-            logger.warning(f"Could not decode base64 string at index {idx}: {e_b64}. Skipping.")
-            continue
-        except UnidentifiedImageError:
-            logger.warning(f"Pillow could not identify image format from base64 string at index {idx}. Skipping.")
-            continue
-        except OSError as e_pil:
-            logger.warning(f"Pillow I/O error for image from base64 string at index {idx}: {e_pil}. Skipping.")
-            continue
-        except Exception as e_general:
-            logger.error(f"Unexpected error processing base64 string at index {idx}: {e_general}.", exc_info=True)
-            continue
-
-    if not pil_images:
-        return b""
-    gif_buffer = io.BytesIO()
+    encoder = GifEncoder(duration_ms=duration_ms, loop_count=loop_count, max_width=max_width, colors=colors)
     try:
-        pil_images[0].save(
-            gif_buffer,
-            format="GIF",
-            save_all=True,  # Important: save all frames
-            append_images=pil_images[1:],  # Append the rest of the images
-            duration=duration_ms,  # Time per frame in milliseconds
-            loop=loop_count,  # 0 for infinite loop
-            optimize=True,  # Optimize for smaller file size (ENABLED to avoid 413 errors)
-            # 2: Graphic is to be restored to background color before rendering next frame.
-            disposal=1,
-            # Use 1 if frames should not be disposed (e.g., drawn on top of each other).
-        )
-        raw_gif_bytes = gif_buffer.getvalue()
+        for b64_string in all_base64_strings:
+            encoder.add(b64_string)
+        return encoder.finish()
     except Exception as e_gif:
         logger.error(f"❌ GIF CREATION ERROR: {e_gif}", exc_info=True)
         return b""
     finally:
-        for img_obj in pil_images:
-            img_obj.close()
-        if not gif_buffer.closed:
-            gif_buffer.close()
-
-    encoded_gif = base64.b64encode(raw_gif_bytes)
-    return encoded_gif
+        encoder.close()
 
 
 def extract_seed_from_url(url: str) -> int | None:
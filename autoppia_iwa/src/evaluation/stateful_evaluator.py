@@ -12,7 +12,7 @@ import asyncio
 import contextlib
 import json
 import os
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from datetime import UTC, datetime
 from typing import Any
 from urllib.parse import urlparse
@@ -26,11 +26,14 @@ from autoppia_iwa.src.demo_webs.classes import WebProject
 from autoppia_iwa.src.demo_webs.config import demo_web_projects
 from autoppia_iwa.src.demo_webs.demo_webs_service import BackendDemoWebService
 from autoppia_iwa.src.evaluation.scoring import ScoreDetails, TaskExecutionScorer
-from autoppia_iwa.src.evaluation.shared.utils import extract_seed_from_url, run_partial_tests
+from autoppia_iwa.src.evaluation.shared.test_runner import IncrementalTestRunner
+from autoppia_iwa.src.evaluation.shared.utils import DATA_EXTRACTION_SKIPPED_PHASES, extract_seed_from_url, is_data_extraction_only
 from autoppia_iwa.src.execution.actions.actions import NavigateAction
 from autoppia_iwa.src.execution.actions.base import BaseAction
 from autoppia_iwa.src.execution.classes import ActionExecutionResult, BrowserSnapshot as ExecutionBrowserSnapshot
 from autoppia_iwa.src.execution.playwright_browser_executor import PlaywrightBrowserExecutor
+from autoppia_iwa.src.execution.screenshots import ScreenshotConfig, capture_screenshot, task_has_screenshot_judge
+from autoppia_iwa.src.shared.profiling import NULL_PROFILER, PHASE_BROWSER_LAUNCH, PHASE_DB_RESET, PHASE_EVENT_FETCH, PHASE_SNAPSHOT_CAPTURE, PHASE_TEST_EVALUATION, PhaseProfiler
 from autoppia_iwa.src.web_agents.classes import replace_credentials_in_action
 from autoppia_iwa.src.web_agents.interfaces import AsyncTaskExecutionSession
 
@@ -156,6 +159,8 @@ class TaskExecutionSession(AsyncTaskExecutionSession):
         capture_screenshot: bool = False,
         config: TaskExecutionSessionConfig | None = None,
         headless: bool | None = None,
+        screenshot_config: ScreenshotConfig | None = None,
+        profiler: PhaseProfiler | None = None,
     ) -> None:
         self.task = task
         self.web_agent_id = web_agent_id
@@ -163,8 +168,15 @@ class TaskExecutionSession(AsyncTaskExecutionSession):
         self.enable_score_cheating = bool(enable_score_cheating)
         self.should_record_gif = should_record_gif
         self.capture_screenshot = capture_screenshot
+        # ``capture_screenshot`` keeps its historical meaning: a full-page PNG on every step.
+        if screenshot_config is None:
+            screenshot_config = ScreenshotConfig(policy="every_n", image_format="png", full_page=True) if capture_screenshot else ScreenshotConfig()
+        self.screenshot_config = screenshot_config
         self.config = config or TaskExecutionSessionConfig()
         self._headless = headless
+        self.profiler = profiler or NULL_PROFILER
+        # With only DataExtractionTests the score depends on latest_extracted_data alone.
+        self._data_extraction_only = is_data_extraction_only(task)
 
         self._playwright = None
         self._browser = None
@@ -179,6 +191,10 @@ class TaskExecutionSession(AsyncTaskExecutionSession):
         # Latest agent-reported answer for DataExtractionTest (partial tests); updated by benchmark per /act response.
         self.latest_extracted_data: Any | None = None
         self._scorer = TaskExecutionScorer()
+        # Incremental scoring state, rebuilt on every reset().
+        self._test_runner: IncrementalTestRunner | None = None
+        self._seen_event_ids: set[str] = set()
+        self._session_events: list[Any] = []
 
     async def reset(self) -> StepResult:
         logger.info("[AsyncStatefulEvaluator] reset start")
@@ -208,9 +224,11 @@ class TaskExecutionSession(AsyncTaskExecutionSession):
         )
         self._history.clear()
         self._history.append(res)
+        self._reset_scoring_state()
 
         score = await self._score_async()
-        snapshot = await self._snapshot_async()
+        with self.profiler.span(PHASE_SNAPSHOT_CAPTURE):
+            snapshot = await self._snapshot_async()
         return StepResult(score=score, snapshot=snapshot, action_result=res)
 
     async def step(self, action: BaseAction | None) -> StepResult:
@@ -221,6 +239,11 @@ class TaskExecutionSession(AsyncTaskExecutionSession):
         )
         return await self._step_async(action)
 
+    @property
+    def skipped_phases(self) -> tuple[str, ...]:
+        """Phases this session leaves out because the task's tests cannot observe them."""
+        return DATA_EXTRACTION_SKIPPED_PHASES if self._data_extraction_only else ()
+
     async def get_score_details(self) -> ScoreDetails:
         return await self._score_async()
 
@@ -251,30 +274,46 @@ class TaskExecutionSession(AsyncTaskExecutionSession):
             web_agent_id=self.web_agent_id,
             validator_id=self.validator_id,
         )
-        logger.info("[TaskExecutionSession] reset backend")
-        await self._backend.reset_database()
-        logger.info("[TaskExecutionSession] backend ok")
+        if self._data_extraction_only:
+            logger.info("[TaskExecutionSession] data-extraction-only task: skipping backend reset")
+        else:
+            logger.info("[TaskExecutionSession] reset backend")
+            with self.profiler.span(PHASE_DB_RESET):
+                await self._backend.reset_database()
+            logger.info("[TaskExecutionSession] backend ok")
 
         logger.info("[TaskExecutionSession] launching browser")
-        self._playwright = await async_playwright().start()
         specs = self.task.specifications or BrowserSpecification()
-        headless = self._headless if self._headless is not None else EVALUATOR_HEADLESS
-        self._browser = await self._playwright.chromium.launch(
-            headless=headless,
-            args=[f"--window-size={specs.screen_width},{specs.screen_height}"],
-        )
-        self._context = await self._browser.new_context(
-            no_viewport=True,
-            extra_http_headers={
-                "X-WebAgent-Id": self.web_agent_id,
-                "X-Validator-Id": self.validator_id,
-            },
+        with self.profiler.span(PHASE_BROWSER_LAUNCH):
+            self._playwright = await async_playwright().start()
+            headless = self._headless if self._headless is not None else EVALUATOR_HEADLESS
+            self._browser = await self._playwright.chromium.launch(
+                headless=headless,
+                args=[f"--window-size={specs.screen_width},{specs.screen_height}"],
+            )
+            self._context = await self._browser.new_context(
+                no_viewport=True,
+                extra_http_headers={
+                    "X-WebAgent-Id": self.web_agent_id,
+                    "X-Validator-Id": self.validator_id,
+                },
+            )
+            await self._setup_attribution_init_script()
+            self._context.set_default_timeout(self.config.page_default_timeout_ms)
+            self._page = await self._context.new_page()
+
+        self._executor = PlaywrightBrowserExecutor(
+            specs,
+            self._page,
+            self._backend,
+            # every_n governs the observations returned to the agent; the executor only
+            # keeps per-action images for GIF recording and screenshot judges.
+            screenshot_config=replace(self.screenshot_config, policy="judge") if self.screenshot_config.policy == "every_n" else self.screenshot_config,
+            screenshot_judge=task_has_screenshot_judge(self.task),
+            fetch_backend_events=not self._data_extraction_only,
+            capture_html=not self._data_extraction_only,
+            profiler=self.profiler,
         )
-        await self._setup_attribution_init_script()
-        self._context.set_default_timeout(self.config.page_default_timeout_ms)
-        self._page = await self._context.new_page()
-
-        self._executor = PlaywrightBrowserExecutor(specs, self._page, self._backend)
 
     async def _setup_attribution_init_script(self) -> None:
         """Inject localStorage attribution ids so demo web event logging is correctly attributed."""
@@ -303,8 +342,8 @@ class TaskExecutionSession(AsyncTaskExecutionSession):
                 action=action,
                 prev_html="",
                 current_html="",
-                screenshot_before="",
-                screenshot_after="",
+                screenshot_before=b"",
+                screenshot_after=b"",
                 backend_events=[],
                 timestamp=datetime.now(UTC),
                 current_url=current_url,
@@ -364,56 +403,46 @@ class TaskExecutionSession(AsyncTaskExecutionSession):
             self._history.append(action_result)
 
         score = await self._score_async()
-        snapshot = await self._snapshot_async()
+        with self.profiler.span(PHASE_SNAPSHOT_CAPTURE):
+            snapshot = await self._snapshot_async()
         return StepResult(score=score, snapshot=snapshot, action_result=action_result)
 
     async def _score_async(self) -> ScoreDetails:
         if not self._project:
             self._last_score = ScoreDetails()
             return self._last_score
+        if self._data_extraction_only:
+            with self.profiler.span(PHASE_TEST_EVALUATION):
+                return await self._score_extracted_data_async()
+
+        runner = self._test_runner
+        if runner is None:
+            runner = self._test_runner = IncrementalTestRunner(self._project, self.task.prompt, self.task.tests)
+
+        # Feed only what is new since the previous scoring round.
+        for action_result in self._history[runner.snapshot_count :]:
+            snapshot = action_result.browser_snapshot
+            runner.add_snapshot(snapshot)
+            runner.add_events(self._take_new_events(getattr(snapshot, "backend_events", None) or []))
+
         # Some frontends log events asynchronously after the UI action.
         # Merge backend events for the current evaluator session and ignore
         # stale events from previous runs.
         with contextlib.suppress(Exception):
             if self._backend and self._history:
-                latest_events = await self._backend.get_backend_events(self.web_agent_id)
+                with self.profiler.span(PHASE_EVENT_FETCH):
+                    latest_events = await self._backend.get_backend_events(self.web_agent_id)
                 if latest_events:
-                    last_snapshot = getattr(self._history[-1], "browser_snapshot", None)
-                    if last_snapshot is not None:
-                        baseline_events = list(getattr(last_snapshot, "backend_events", []) or [])
-                        session_floor = self._session_start_utc
-
-                        merged: list[Any] = []
-                        seen_ids: set[str] = set()
-                        for event in baseline_events:
-                            event_dt = _event_timestamp_utc(event)
-                            if session_floor is not None and event_dt is not None and event_dt < session_floor:
-                                continue
-                            event_id = _event_identity(event)
-                            if event_id in seen_ids:
-                                continue
-                            seen_ids.add(event_id)
-                            merged.append(event)
-                        for event in latest_events:
-                            event_dt = _event_timestamp_utc(event)
-                            if session_floor is not None and event_dt is not None and event_dt < session_floor:
-                                continue
-                            event_id = _event_identity(event)
-                            if event_id in seen_ids:
-                                continue
-                            seen_ids.add(event_id)
-                            merged.append(event)
-                        last_snapshot.backend_events = merged
-        matrix = await run_partial_tests(
-            self._project,
-            self.task,
-            self._history,
-            extracted_data=self.latest_extracted_data,
-        )
-        if not matrix:
+                    runner.add_events(self._take_new_events(latest_events))
+                last_snapshot = getattr(self._history[-1], "browser_snapshot", None)
+                if last_snapshot is not None and self._session_events:
+                    last_snapshot.backend_events = list(self._session_events)
+
+        with self.profiler.span(PHASE_TEST_EVALUATION):
+            last = await runner.evaluate(extracted_data=self.latest_extracted_data)
+        if not last:
             self._last_score = ScoreDetails()
             return self._last_score
-        last = matrix[-1] if matrix else []
         passed = sum(1 for r in last if getattr(r, "success", False))
         total = len(last)
         raw = (passed / total) if total > 0 else 0.0
@@ -425,17 +454,67 @@ class TaskExecutionSession(AsyncTaskExecutionSession):
         )
         return self._last_score
 
+    async def _score_extracted_data_async(self) -> ScoreDetails:
+        """Score a DataExtractionTest-only task from the agent's answer, without events or snapshots."""
+        if not self._history:
+            self._last_score = ScoreDetails()
+            return self._last_score
+        passed = 0
+        for test in self.task.tests:
+            if await test.execute_global_test([], extracted_data=self.latest_extracted_data):
+                passed += 1
+        total = len(self.task.tests)
+        self._last_score = ScoreDetails(
+            raw_score=passed / total,
+            tests_passed=passed,
+            total_tests=total,
+            success=passed == total,
+        )
+        return self._last_score
+
+    def _take_new_events(self, events: list[Any]) -> list[Any]:
+        """Drop events already seen in this session or older than its start; remember the rest."""
+        session_floor = self._session_start_utc
+        fresh: list[Any] = []
+        for event in events:
+            event_dt = _event_timestamp_utc(event)
+            if session_floor is not None and event_dt is not None and event_dt < session_floor:
+                continue
+            event_id = _event_identity(event)
+            if event_id in self._seen_event_ids:
+                continue
+            self._seen_event_ids.add(event_id)
+            fresh.append(event)
+        self._session_events.extend(fresh)
+        return fresh
+
+    def _reset_scoring_state(self) -> None:
+        self._test_runner = None
+        self._seen_event_ids = set()
+        self._session_events = []
+
+    async def take_screenshot(self) -> bytes | None:
+        """Capture the current page on demand with the session's screenshot settings."""
+        if not self._page or self.screenshot_config.policy == "never":
+            return None
+        try:
+            return await capture_screenshot(self._page, self.screenshot_config)
+        except Exception as e:
+            logger.warning(f"[TaskExecutionSession] screenshot failed: {e}")
+            return None
+
     async def _snapshot_async(self) -> BrowserSnapshot:
         if not self._page:
             return BrowserSnapshot(html="", url="", screenshot=None)
         html = await self._page.content()
         url = self._page.url
         screenshot = None
-        if self.capture_screenshot:
-            try:
-                screenshot = await self._page.screenshot(full_page=True)
-            except Exception as e:
-                logger.warning(f"[TaskExecutionSession] screenshot failed: {e}")
+        step_index = max(len(self._history) - 1, 0)
+        if self.screenshot_config.policy == "every_n" and self.screenshot_config.wants(step_index):
+            # The executor may already have captured this exact state for the action.
+            last_snapshot = getattr(self._history[-1], "browser_snapshot", None) if self._history else None
+            after = getattr(last_snapshot, "screenshot_after", None)
+            screenshot = after if isinstance(after, bytes) and after and last_snapshot.current_url == url else await self.take_screenshot()
         return BrowserSnapshot(html=html, url=url, screenshot=screenshot)
 
     async def _close_async(self) -> None:
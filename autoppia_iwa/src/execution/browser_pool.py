@@ -0,0 +1,342 @@
+"""
+Reusable Chromium browser pool.
+
+Launching Chromium dominates the cost of evaluating a short solution. ``BrowserPool``
+keeps a few long-lived browser processes and hands out one fresh ``BrowserContext``
+per lease, so every solution still runs with isolated cookies, storage and routes.
+
+Usage:
+    pool = BrowserPool(size=2, max_contexts_per_browser=10, max_uses_per_browser=50)
+    async with pool.lease(extra_http_headers={"X-WebAgent-Id": "agent-1"}, no_viewport=True) as context:
+        page = await context.new_page()
+        ...
+    await pool.aclose()
+"""
+
+import asyncio
+import contextlib
+import time
+from collections.abc import AsyncIterator, Callable, Sequence
+from dataclasses import dataclass
+from typing import Any
+
+from loguru import logger
+from playwright.async_api import Browser, BrowserContext, async_playwright
+
+from autoppia_iwa.config.config import EVALUATOR_HEADLESS
+
+
+@dataclass
+class BrowserPoolMetrics:
+    """Counters describing how well the pool absorbs lease traffic."""
+
+    leases: int = 0
+    hits: int = 0
+    launches: int = 0
+    launch_failures: int = 0
+    recycles: int = 0
+    total_wait_time: float = 0.0
+    max_wait_time: float = 0.0
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of leases served by an already running browser."""
+        return self.hits / self.leases if self.leases else 0.0
+
+    @property
+    def avg_wait_time(self) -> float:
+        return self.total_wait_time / self.leases if self.leases else 0.0
+
+    def record_lease(self, wait_time: float, hit: bool) -> None:
+        self.leases += 1
+        if hit:
+            self.hits += 1
+        self.total_wait_time += wait_time
+        self.max_wait_time = max(self.max_wait_time, wait_time)
+
+    def as_dict(self) -> dict[str, float | int]:
+        return {
+            "leases": self.leases,
+            "hits": self.hits,
+            "hit_rate": round(self.hit_rate, 4),
+            "launches": self.launches,
+            "launch_failures": self.launch_failures,
+            "recycles": self.recycles,
+            "total_wait_time": round(self.total_wait_time, 4),
+            "avg_wait_time": round(self.avg_wait_time, 4),
+            "max_wait_time": round(self.max_wait_time, 4),
+        }
+
+
+@dataclass(eq=False)
+class _BrowserWorker:
+    browser: Browser
+    launch_args: tuple[str, ...]
+    uses: int = 0
+    active: int = 0
+    retiring: bool = False
+
+    def is_alive(self) -> bool:
+        with contextlib.suppress(Exception):
+            return bool(self.browser.is_connected())
+        return False
+
+
+class BrowserPool:
+    """
+    Long-lived pool of Chromium processes handing out isolated contexts.
+
+    - At most ``size`` browsers run at once, each hosting up to ``max_contexts_per_browser``
+      concurrent contexts. Leases beyond that wait for a context to be returned.
+    - Browsers are launched lazily and recycled after ``max_uses_per_browser`` leases, or as
+      soon as they disconnect.
+    - Browsers are keyed by their launch arguments (e.g. ``--window-size``); a lease asking
+      for different arguments never reuses a mismatched browser.
+    - Returned contexts have their routes and cookies dropped before being closed, which also
+      discards local/session storage.
+    """
+
+    def __init__(
+        self,
+        size: int = 2,
+        max_contexts_per_browser: int = 10,
+        max_uses_per_browser: int = 50,
+        headless: bool | None = None,
+        playwright_factory: Callable[[], Any] = async_playwright,
+        metrics: BrowserPoolMetrics | None = None,
+    ) -> None:
+        if size <= 0:
+            raise ValueError("size must be > 0")
+        if max_contexts_per_browser <= 0:
+            raise ValueError("max_contexts_per_browser must be > 0")
+        if max_uses_per_browser <= 0:
+            raise ValueError("max_uses_per_browser must be > 0")
+
+        self.size = size
+        self.max_contexts_per_browser = max_contexts_per_browser
+        self.max_uses_per_browser = max_uses_per_browser
+        self.headless = EVALUATOR_HEADLESS if headless is None else headless
+        # Metrics may be shared so that successive short-lived pools accumulate into one view.
+        self.metrics = metrics or BrowserPoolMetrics()
+
+        self._playwright_factory = playwright_factory
+        self._playwright = None
+        self._start_lock = asyncio.Lock()
+        self._cond = asyncio.Condition()
+        self._workers: list[_BrowserWorker] = []
+        self._launching = 0
+        self._closed = False
+
+    # ============================================================================
+    # PUBLIC API
+    # ============================================================================
+
+    @property
+    def capacity(self) -> int:
+        """Maximum number of contexts that can be leased at the same time."""
+        return self.size * self.max_contexts_per_browser
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    @property
+    def browser_count(self) -> int:
+        return len(self._workers)
+
+    @contextlib.asynccontextmanager
+    async def lease(self, *, launch_args: Sequence[str] = (), **context_options: Any) -> AsyncIterator[BrowserContext]:
+        """
+        Lease an isolated ``BrowserContext``.
+
+        Args:
+            launch_args: Chromium launch arguments the hosting browser must have been started with.
+            **context_options: Forwarded to ``Browser.new_context``.
+        """
+        started = time.perf_counter()
+        worker, hit = await self._acquire(tuple(launch_args))
+        self.metrics.record_lease(time.perf_counter() - started, hit)
+
+        context: BrowserContext | None = None
+        try:
+            try:
+                context = await worker.browser.new_context(**context_options)
+            except Exception:
+                # A browser that cannot open contexts is not worth keeping around.
+                worker.retiring = True
+                raise
+            yield context
+        finally:
+            if context is not None:
+                await self._scrub_context(context)
+            await self._release(worker)
+
+    async def warm_up(self, count: int = 1, *, launch_args: Sequence[str] = ()) -> int:
+        """
+        Launch browsers ahead of the first leases so their startup overlaps other setup work.
+
+        Starts up to ``count`` browsers with ``launch_args`` (bounded by ``size``, counting the
+        ones already running). Launch failures are logged and left to the leases to retry.
+        Returns the number of browsers started.
+        """
+        launch_args = tuple(launch_args)
+        async with self._cond:
+            if self._closed:
+                return 0
+            running = sum(1 for w in self._workers if w.launch_args == launch_args and not w.retiring)
+            missing = max(0, min(count - running, self.size - len(self._workers) - self._launching))
+            self._launching += missing
+
+        results = await asyncio.gather(*(self._launch_worker(launch_args, reserve=False) for _ in range(missing)), return_exceptions=True)
+        failures = [result for result in results if isinstance(result, BaseException)]
+        if failures:
+            logger.warning(f"BrowserPool warm-up failed to launch {len(failures)} browser(s): {failures[0]}")
+        return len(results) - len(failures)
+
+    async def aclose(self) -> None:
+        """Close every pooled browser and stop Playwright. Pending leases fail."""
+        async with self._cond:
+            self._closed = True
+            workers, self._workers = self._workers, []
+            self._cond.notify_all()
+
+        for worker in workers:
+            await self._close_browser(worker.browser)
+
+        if self._playwright is not None:
+            with contextlib.suppress(Exception):
+                await self._playwright.stop()
+            self._playwright = None
+
+    async def __aenter__(self) -> "BrowserPool":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.aclose()
+
+    # ============================================================================
+    # LEASE BOOKKEEPING
+    # ============================================================================
+
+    async def _acquire(self, launch_args: tuple[str, ...]) -> tuple[_BrowserWorker, bool]:
+        """Reserve a slot on a running browser or launch a new one. Returns (worker, hit)."""
+        to_close: list[_BrowserWorker] = []
+        async with self._cond:
+            while True:
+                if self._closed:
+                    raise RuntimeError("BrowserPool is closed")
+
+                to_close.extend(self._drop_dead_workers())
+                worker = self._pick_worker(launch_args)
+                if worker is not None:
+                    self._reserve(worker)
+                    break
+
+                if len(self._workers) + self._launching < self.size:
+                    self._launching += 1
+                    break
+
+                # Make room by retiring an idle browser launched with other arguments.
+                stale = next((w for w in self._workers if w.active == 0 and w.launch_args != launch_args), None)
+                if stale is not None:
+                    self._workers.remove(stale)
+                    to_close.append(stale)
+                    self.metrics.recycles += 1
+                    self._launching += 1
+                    break
+
+                await self._cond.wait()
+
+        for stale_worker in to_close:
+            await self._close_browser(stale_worker.browser)
+
+        if worker is not None:
+            return worker, True
+        return await self._launch_worker(launch_args), False
+
+    def _pick_worker(self, launch_args: tuple[str, ...]) -> _BrowserWorker | None:
+        candidates = [w for w in self._workers if not w.retiring and w.launch_args == launch_args and w.active < self.max_contexts_per_browser]
+        if not candidates:
+            return None
+        return min(candidates, key=lambda w: w.active)
+
+    def _drop_dead_workers(self) -> list[_BrowserWorker]:
+        dead = [w for w in self._workers if w.active == 0 and (w.retiring or not w.is_alive())]
+        for worker in dead:
+            self._workers.remove(worker)
+            self.metrics.recycles += 1
+        return dead
+
+    def _reserve(self, worker: _BrowserWorker) -> None:
+        worker.active += 1
+        worker.uses += 1
+        if worker.uses >= self.max_uses_per_browser:
+            worker.retiring = True
+
+    async def _launch_worker(self, launch_args: tuple[str, ...], reserve: bool = True) -> _BrowserWorker:
+        try:
+            playwright = await self._ensure_playwright()
+            browser = await playwright.chromium.launch(headless=self.headless, args=list(launch_args))
+        except BaseException:
+            async with self._cond:
+                self._launching -= 1
+                self.metrics.launch_failures += 1
+                self._cond.notify_all()
+            raise
+
+        async with self._cond:
+            self._launching -= 1
+            if self._closed:
+                self._cond.notify_all()
+                closed = True
+            else:
+                closed = False
+                worker = _BrowserWorker(browser=browser, launch_args=launch_args)
+                if reserve:
+                    self._reserve(worker)
+                self._workers.append(worker)
+                self.metrics.launches += 1
+                # Leases waiting for a slot can use a warmed-up browser right away.
+                self._cond.notify_all()
+
+        if closed:
+            await self._close_browser(browser)
+            raise RuntimeError("BrowserPool is closed")
+        logger.debug(f"BrowserPool launched browser {len(self._workers)}/{self.size}")
+        return worker
+
+    async def _release(self, worker: _BrowserWorker) -> None:
+        async with self._cond:
+            worker.active -= 1
+            recycle = worker.active == 0 and (worker.retiring or not worker.is_alive()) and worker in self._workers
+            if recycle:
+                self._workers.remove(worker)
+                self.metrics.recycles += 1
+            self._cond.notify_all()
+
+        if recycle:
+            logger.debug(f"BrowserPool recycling browser after {worker.uses} uses")
+            await self._close_browser(worker.browser)
+
+    async def _ensure_playwright(self):
+        async with self._start_lock:
+            if self._playwright is None:
+                self._playwright = await self._playwright_factory().start()
+            return self._playwright
+
+    @staticmethod
+    async def _scrub_context(context: BrowserContext) -> None:
+        with contextlib.suppress(Exception):
+            await context.unroute_all(behavior="ignoreErrors")
+        with contextlib.suppress(Exception):
+            await context.clear_cookies()
+        with contextlib.suppress(Exception):
+            await context.close()
+
+    @staticmethod
+    async def _close_browser(browser: Browser) -> None:
+        with contextlib.suppress(Exception):
+            await browser.close()
+
+
+__all__ = ["BrowserPool", "BrowserPoolMetrics"]
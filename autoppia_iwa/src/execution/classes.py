@@ -1,28 +1,61 @@
 from datetime import UTC, datetime
-from typing import Any
+from typing import Annotated, Any
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, PlainSerializer, PlainValidator, WithJsonSchema, field_serializer
 
 from autoppia_iwa.src.demo_webs.classes import BackendEvent
 from autoppia_iwa.src.execution.actions.base import BaseAction
+from autoppia_iwa.src.execution.html_history import HtmlRef
+from autoppia_iwa.src.execution.screenshots import screenshot_to_base64
+
+
+def _validate_html(value: Any) -> str | HtmlRef:
+    if isinstance(value, str | HtmlRef):
+        return value
+    raise ValueError("HTML must be a string")
+
+
+# Stored as given (an ``HtmlRef`` stays a handle); validated, dumped and documented as a string
+LazyHtml = Annotated[Any, PlainValidator(_validate_html), PlainSerializer(str, return_type=str), WithJsonSchema({"type": "string"})]
+
+
+def _materialized_html(name: str, doc: str) -> property:
+    def _get(self) -> str:
+        return str(self.__dict__[name])
+
+    def _set(self, value: str | HtmlRef) -> None:
+        self.__dict__[name] = value
+
+    return property(_get, _set, doc=doc)
 
 
 class BrowserSnapshot(BaseModel):
     """
     Represents a snapshot of the browser state before and after executing an action.
     Captures HTML content, screenshots, backend events, and metadata.
+
+    ``prev_html`` / ``current_html`` accept plain strings or ``HtmlRef`` handles into an
+    episode's ``HtmlHistory``; handles are materialized only when the attribute is read
+    or the snapshot is dumped. Screenshot bytes are dumped as base64 in JSON mode.
     """
 
+    # JSON dumps carry screenshot bytes as base64; read them back as bytes
+    model_config = ConfigDict(val_json_bytes="base64")
+
     iteration: int = Field(..., description="The current iteration of the evaluation process")
     action: BaseAction = Field(..., description="The action that was executed")
-    prev_html: str = Field(..., description="HTML content before actions were executed")
-    current_html: str = Field(..., description="HTML content after actions were executed")
-    screenshot_before: str = Field(..., description="Base64-encoded screenshot before actions")
-    screenshot_after: str = Field(..., description="Base64-encoded screenshot after actions")
+    prev_html: LazyHtml = Field(..., description="HTML content before actions were executed")
+    current_html: LazyHtml = Field(..., description="HTML content after actions were executed")
+    screenshot_before: bytes | str = Field(..., description="Raw screenshot bytes before actions (base64 str accepted); empty when not captured")
+    screenshot_after: bytes | str = Field(..., description="Raw screenshot bytes after actions (base64 str accepted); empty when not captured")
     backend_events: list[BackendEvent] = Field(..., description="List of backend events after execution")
     timestamp: datetime = Field(default_factory=lambda: datetime.now(UTC), description="Timestamp of the snapshot")
     current_url: str = Field(..., description="Current URL of the browser")
 
+    @field_serializer("screenshot_before", "screenshot_after", when_used="json")
+    def _serialize_screenshot(self, value: bytes | str) -> str:
+        return screenshot_to_base64(value)
+
     def model_dump(self, *args, **kwargs):
         base_dump = super().model_dump(*args, **kwargs)
         base_dump["timestamp"] = self.timestamp.isoformat() if self.timestamp else None
@@ -38,6 +71,11 @@ class BrowserSnapshot(BaseModel):
         return base_dump
 
 
+# Reading the fields returns text; the stored value may still be a handle
+BrowserSnapshot.prev_html = _materialized_html("prev_html", "HTML content before actions were executed.")
+BrowserSnapshot.current_html = _materialized_html("current_html", "HTML content after actions were executed.")
+
+
 class ActionExecutionResult(BaseModel):
     """Log of the execution result of an action."""
 
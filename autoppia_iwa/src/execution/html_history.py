@@ -0,0 +1,176 @@
+"""
+Delta-encoded storage for the DOM snapshots taken during one episode.
+
+Every executed action records the page HTML before and after it, and consecutive pages
+usually differ in a small region (a counter, a modal, a list item). ``HtmlHistory``
+keeps a full keyframe every ``keyframe_interval`` versions and, in between, only the
+changed spans against the previous version. Identical documents share one version, so
+a step's "after" and the next step's "before" cost nothing extra.
+
+Snapshots hold ``HtmlRef`` handles; the full text is rebuilt only when read.
+"""
+
+from __future__ import annotations
+
+DEFAULT_KEYFRAME_INTERVAL = 32
+# A changed region longer than this is split around an anchor found in both versions.
+_MIN_SPLIT_CHARS = 512
+_ANCHOR_CHARS = 64
+_MAX_SPLIT_DEPTH = 16
+
+# A delta op copies ``previous[start:end]`` (tuple) or inserts literal text (str).
+_Op = tuple[int, int] | str
+
+
+def _common_prefix_len(a: str, a0: int, b: str, b0: int, limit: int) -> int:
+    """Length of the common prefix of ``a[a0:]`` and ``b[b0:]``; binary search over C-level compares."""
+    lo, hi = 0, limit
+    while lo < hi:
+        mid = (lo + hi + 1) // 2
+        if a.startswith(b[b0 + lo : b0 + mid], a0 + lo):
+            lo = mid
+        else:
+            hi = mid - 1
+    return lo
+
+
+def _common_suffix_len(a: str, a1: int, b: str, b1: int, limit: int) -> int:
+    """Length of the common suffix of ``a[:a1]`` and ``b[:b1]``."""
+    lo, hi = 0, limit
+    while lo < hi:
+        mid = (lo + hi + 1) // 2
+        if a.endswith(b[b1 - mid : b1 - lo], 0, a1 - lo):
+            lo = mid
+        else:
+            hi = mid - 1
+    return lo
+
+
+def _append(ops: list[_Op], op: _Op) -> None:
+    if ops and isinstance(op, tuple) and isinstance(ops[-1], tuple) and ops[-1][1] == op[0]:
+        ops[-1] = (ops[-1][0], op[1])
+    elif ops and isinstance(op, str) and isinstance(ops[-1], str):
+        ops[-1] += op
+    else:
+        ops.append(op)
+
+
+def _encode(old: str, new: str, a0: int, a1: int, b0: int, b1: int, ops: list[_Op], depth: int = 0) -> None:
+    """Append ops rebuilding ``new[b0:b1]`` from ``old[a0:a1]``: common ends, then split the middle."""
+    prefix = _common_prefix_len(old, a0, new, b0, min(a1 - a0, b1 - b0))
+    suffix = _common_suffix_len(old, a1, new, b1, min(a1 - a0, b1 - b0) - prefix)
+    if prefix:
+        _append(ops, (a0, a0 + prefix))
+    a0, a1, b0, b1 = a0 + prefix, a1 - suffix, b0 + prefix, b1 - suffix
+    if b1 > b0:
+        split = -1
+        if b1 - b0 > _MIN_SPLIT_CHARS and a1 > a0 and depth < _MAX_SPLIT_DEPTH:
+            mid = (b0 + b1) // 2
+            split = old.find(new[mid : mid + _ANCHOR_CHARS], a0, a1)
+        if split >= 0:
+            _encode(old, new, a0, split, b0, mid, ops, depth + 1)
+            _encode(old, new, split, a1, mid, b1, ops, depth + 1)
+        else:
+            _append(ops, new[b0:b1])
+    if suffix:
+        _append(ops, (a1, a1 + suffix))
+
+
+class HtmlRef:
+    """Immutable handle to one version of an ``HtmlHistory``; ``str()`` materializes it."""
+
+    __slots__ = ("_history", "_version")
+
+    def __init__(self, history: HtmlHistory, version: int):
+        self._history = history
+        self._version = version
+
+    def __str__(self) -> str:
+        return self._history.materialize(self._version)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, HtmlRef):
+            if other._history is self._history:
+                return other._version == self._version
+            return str(other) == str(self)
+        if isinstance(other, str):
+            return other == str(self)
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash(str(self))
+
+    def __deepcopy__(self, memo: dict) -> HtmlRef:
+        # Versions never change once written, so copies can share the history.
+        return self
+
+    def __repr__(self) -> str:
+        return f"HtmlRef(version={self._version})"
+
+
+class HtmlHistory:
+    """
+    Append-only sequence of HTML documents stored as keyframes plus deltas.
+
+    A delta is a short list of ops that copy spans of the previous version or insert new
+    text. When the inserted text is more than half the document a keyframe is stored
+    instead.
+    """
+
+    def __init__(self, keyframe_interval: int = DEFAULT_KEYFRAME_INTERVAL):
+        if keyframe_interval < 1:
+            raise ValueError("keyframe_interval must be >= 1")
+        self.keyframe_interval = keyframe_interval
+        # Each entry is either a keyframe (str) or a delta against the previous entry.
+        self._entries: list[str | tuple[_Op, ...]] = []
+        self._latest: str | None = None
+        self._latest_ref: HtmlRef | None = None
+        self._since_keyframe = 0
+        # Last materialized version, so forward scans apply one delta per read.
+        self._cursor: tuple[int, str] | None = None
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def stored_chars(self) -> int:
+        """Characters held by keyframes and deltas (excluding the cached latest document)."""
+        return sum(len(entry) if isinstance(entry, str) else sum(len(op) for op in entry if isinstance(op, str)) for entry in self._entries)
+
+    def add(self, html: str) -> HtmlRef | str:
+        """Store ``html`` and return a handle to it; empty documents are returned as-is."""
+        if not html:
+            return html
+        previous = self._latest
+        if previous is not None and (html is previous or html == previous):
+            return self._latest_ref
+        entry: str | tuple[_Op, ...] = html
+        if previous is not None and self._since_keyframe + 1 < self.keyframe_interval:
+            ops: list[_Op] = []
+            _encode(previous, html, 0, len(previous), 0, len(html), ops)
+            if sum(len(op) for op in ops if isinstance(op, str)) * 2 <= len(html):
+                entry = tuple(ops)
+        self._since_keyframe = 0 if isinstance(entry, str) else self._since_keyframe + 1
+        self._entries.append(entry)
+        self._latest = html
+        self._latest_ref = HtmlRef(self, len(self._entries) - 1)
+        return self._latest_ref
+
+    def materialize(self, version: int) -> str:
+        if version == len(self._entries) - 1 and self._latest is not None:
+            return self._latest
+        cursor = self._cursor
+        if cursor is not None and cursor[0] == version:
+            return cursor[1]
+        start = version
+        while not isinstance(self._entries[start], str):
+            start -= 1
+        if cursor is not None and start <= cursor[0] < version:
+            start, text = cursor
+        else:
+            text = self._entries[start]
+        for position in range(start + 1, version + 1):
+            previous = text
+            text = "".join(op if isinstance(op, str) else previous[op[0] : op[1]] for op in self._entries[position])
+        self._cursor = (version, text)
+        return text
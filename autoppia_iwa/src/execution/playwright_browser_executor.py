@@ -1,5 +1,4 @@
 import asyncio
-import base64
 import contextlib
 import json
 from datetime import UTC, datetime
@@ -11,6 +10,17 @@ from autoppia_iwa.src.data_generation.tasks.classes import BrowserSpecification
 from autoppia_iwa.src.demo_webs.demo_webs_service import BackendDemoWebService
 from autoppia_iwa.src.execution.actions.base import BaseAction
 from autoppia_iwa.src.execution.classes import ActionExecutionResult, BrowserSnapshot
+from autoppia_iwa.src.execution.html_history import HtmlHistory, HtmlRef
+from autoppia_iwa.src.execution.screenshots import ScreenshotConfig, capture_screenshot
+from autoppia_iwa.src.shared.profiling import (
+    NULL_PROFILER,
+    PHASE_ACTION_EXECUTION,
+    PHASE_EVENT_FETCH,
+    PHASE_NAVIGATION,
+    PHASE_SNAPSHOT_CAPTURE,
+    PHASE_STABILIZATION,
+    PhaseProfiler,
+)
 
 
 def _parse_event_timestamp(event: Any) -> datetime | None:
@@ -37,9 +47,19 @@ def _parse_event_timestamp(event: Any) -> datetime | None:
         return None
 
 
-def _minimal_snapshot(html: str = "", url: str = "", error: str = "") -> dict[str, str]:
+def _events_since(events: list[Any], start_time: datetime) -> list[Any]:
+    """Keep events stamped at or after ``start_time``; events without a parsable timestamp are kept."""
+    filtered_events: list[Any] = []
+    for event in events:
+        event_ts = _parse_event_timestamp(event)
+        if event_ts is None or event_ts >= start_time:
+            filtered_events.append(event)
+    return filtered_events
+
+
+def _minimal_snapshot(html: str = "", url: str = "", error: str = "") -> dict[str, Any]:
     """Build a minimal snapshot dict (no screenshot) for lightweight recording paths."""
-    return {"html": html, "screenshot": "", "url": url, "error": error}
+    return {"html": html, "screenshot": b"", "url": url, "error": error}
 
 
 def _action_execution_exception_types():
@@ -63,21 +83,52 @@ _NON_NAVIGATING_ACTIONS = {
     "SendKeysIWAAction",
 }
 _STABILIZE_LOAD_STATE_TIMEOUT_MS = 1200
+# Long-poll budget while no event has been seen yet (matches the former 3 x 0.2s retries)
+_BACKEND_EVENTS_WAIT_MS = 600
 
 
 class PlaywrightBrowserExecutor:
-    def __init__(self, browser_config: BrowserSpecification, page: Page | None = None, backend_demo_webs_service: BackendDemoWebService = None):
+    def __init__(
+        self,
+        browser_config: BrowserSpecification,
+        page: Page | None = None,
+        backend_demo_webs_service: BackendDemoWebService = None,
+        screenshot_config: ScreenshotConfig | None = None,
+        screenshot_judge: bool = False,
+        fetch_backend_events: bool = True,
+        capture_html: bool = True,
+        profiler: PhaseProfiler | None = None,
+    ):
         """
         Initializes the PlaywrightBrowserExecutor with a backend service and an optional Playwright page.
 
         Args:
             backend_demo_webs_service: Service for interacting with the backend.
             page: Optional Playwright page object.
+            screenshot_config: When and how action screenshots are taken.
+            screenshot_judge: Whether the task has a screenshot-based judge test.
+            fetch_backend_events: Poll the backend for the events of each action. Off when no test reads them.
+            capture_html: Keep page HTML in snapshots taken without a screenshot. Off when no test reads it.
+            profiler: Receives action, stabilization, event-fetch and snapshot spans.
         """
         self.browser_config = browser_config
         self.page: Page | None = page
         self.action_execution_results: list[ActionExecutionResult] = []
         self.backend_demo_webs_service: BackendDemoWebService = backend_demo_webs_service
+        # Cursor into the backend event log and the events read through it so far; the
+        # cursor is seeded at the end of the log before the first action
+        self._backend_events_cursor = 0
+        self._backend_events_cursor_seeded = False
+        self._backend_events: list[Any] = []
+        # Every snapshot HTML of this episode, stored as keyframes plus per-step deltas
+        self._html_history = HtmlHistory()
+        self.screenshot_config = screenshot_config or ScreenshotConfig()
+        self.screenshot_judge = screenshot_judge
+        self.fetch_backend_events = fetch_backend_events
+        self.capture_html = capture_html
+        self.profiler = profiler or NULL_PROFILER
+        # (html, url, image) of the latest capture, reused when the page has not changed since
+        self._last_screenshot: tuple[HtmlRef | str, str, bytes] | None = None
 
     @staticmethod
     def _normalize_action_output(value: Any) -> Any:
@@ -101,6 +152,7 @@ class PlaywrightBrowserExecutor:
             action: The action to execute.
             web_agent_id: Identifier for the web agent.
             iteration: The iteration number of the action.
+            should_record: Explicitly request before/after screenshots (e.g. for GIF recording).
 
         Returns:
             ActionExecutionResult: The result of the action execution.
@@ -108,41 +160,53 @@ class PlaywrightBrowserExecutor:
         if not self.page:
             raise RuntimeError("Playwright page is not initialized.")
 
+        if not self._backend_events_cursor_seeded:
+            await self._seed_backend_events_cursor(web_agent_id, is_web_real)
+
         start_time = datetime.now(UTC)
+        capture = self.screenshot_config.wants(iteration, requested=should_record, judge=self.screenshot_judge)
+        profiler = self.profiler
+        action_phase = PHASE_NAVIGATION if action.type == "NavigateAction" else PHASE_ACTION_EXECUTION
         try:
             await self._before_action(action, iteration)
 
             # Capture state before action execution
-            if should_record:
-                snapshot_before = await self._capture_snapshot()
+            if capture:
+                with profiler.span(PHASE_SNAPSHOT_CAPTURE):
+                    snapshot_before = await self._capture_snapshot(reuse_previous=True)
             else:
                 snapshot_before = _minimal_snapshot()
             # Execute the action
-            action_output = await action.execute(self.page, self.backend_demo_webs_service, web_agent_id)
+            with profiler.span(action_phase, action_type=action.type):
+                action_output = await action.execute(self.page, self.backend_demo_webs_service, web_agent_id)
             execution_time = (datetime.now(UTC) - start_time).total_seconds()
 
             # Capture backend events and updated browser state. Do not force
             # text-entry and other non-navigation actions through a full
             # navigation-style load wait.
-            await self._stabilize_after_action(action)
+            with profiler.span(PHASE_STABILIZATION):
+                await self._stabilize_after_action(action)
             await self._after_action(action, iteration)
 
             # backend_events = await self._get_backend_events(web_agent_id, is_web_real)
-            if should_record:
-                snapshot_after = await self._capture_snapshot()
-            else:
-                snapshot_after = await self._get_minimal_snapshot_from_page()
+            with profiler.span(PHASE_SNAPSHOT_CAPTURE):
+                if capture:
+                    snapshot_after = await self._capture_snapshot()
+                else:
+                    snapshot_after = await self._get_minimal_snapshot_from_page()
 
-            backend_events = await self._get_backend_events_for_action(web_agent_id, start_time, is_web_real)
+            with profiler.span(PHASE_EVENT_FETCH):
+                backend_events = await self._get_backend_events_for_action(web_agent_id, start_time, is_web_real)
 
-            if not should_record:
-                snapshot_after = await self._get_minimal_snapshot_from_page()
+            if not capture:
+                with profiler.span(PHASE_SNAPSHOT_CAPTURE):
+                    snapshot_after = await self._get_minimal_snapshot_from_page()
 
             browser_snapshot = BrowserSnapshot(
                 iteration=iteration,
                 action=action,
-                prev_html=snapshot_before["html"],
-                current_html=snapshot_after["html"],
+                prev_html=self._intern_html(snapshot_before["html"]),
+                current_html=self._intern_html(snapshot_after["html"]),
                 backend_events=backend_events,
                 timestamp=datetime.now(UTC),
                 current_url=snapshot_after["url"],
@@ -162,24 +226,27 @@ class PlaywrightBrowserExecutor:
 
         except _action_execution_exception_types() as e:
             await self._on_action_error(action, iteration, e)
-            if should_record:
-                snapshot_error = await self._capture_snapshot()
-            else:
-                snapshot_error = await self._get_minimal_snapshot_from_page(error=str(e))
+            with profiler.span(PHASE_SNAPSHOT_CAPTURE):
+                if capture:
+                    snapshot_error = await self._capture_snapshot()
+                else:
+                    snapshot_error = await self._get_minimal_snapshot_from_page(error=str(e))
 
-            backend_events = await self._get_backend_events_for_action(web_agent_id, start_time, is_web_real)
+            with profiler.span(PHASE_EVENT_FETCH):
+                backend_events = await self._get_backend_events_for_action(web_agent_id, start_time, is_web_real)
 
             # Create error snapshot
+            error_html = self._intern_html(snapshot_error.get("html", ""))
             browser_snapshot = BrowserSnapshot(
                 iteration=iteration,
                 action=action,
-                prev_html=snapshot_error.get("html", ""),
-                current_html=snapshot_error.get("html", ""),
+                prev_html=error_html,
+                current_html=error_html,
                 backend_events=backend_events,
                 timestamp=datetime.now(UTC),
                 current_url=snapshot_error.get("url", ""),
-                screenshot_before=snapshot_error.get("screenshot", ""),
-                screenshot_after=snapshot_error.get("screenshot", ""),
+                screenshot_before=snapshot_error.get("screenshot", b""),
+                screenshot_after=snapshot_error.get("screenshot", b""),
             )
 
             return ActionExecutionResult(
@@ -192,10 +259,53 @@ class PlaywrightBrowserExecutor:
                 browser_snapshot=browser_snapshot,
             )
 
+    def _intern_html(self, html: HtmlRef | str) -> HtmlRef | str:
+        """Store page HTML in the episode history unless it already came from there."""
+        return html if isinstance(html, HtmlRef) else self._html_history.add(html)
+
+    def _uses_backend_events_cursor(self, is_web_real: bool) -> bool:
+        return self.fetch_backend_events and isinstance(self.backend_demo_webs_service, BackendDemoWebService) and not is_web_real
+
+    async def _seed_backend_events_cursor(self, web_agent_id: str, is_web_real: bool) -> None:
+        """
+        Start the event cursor at the current end of the backend log.
+
+        The executor is created after the backend reset, so anything already in the log
+        (e.g. events left over when the reset did not clear them) predates this episode.
+        """
+        self._backend_events_cursor_seeded = True
+        if not self._uses_backend_events_cursor(is_web_real):
+            return
+        with contextlib.suppress(RuntimeError, ConnectionError, TimeoutError):
+            _, self._backend_events_cursor = await self.backend_demo_webs_service.get_backend_events_since(web_agent_id, since_id=self._backend_events_cursor)
+
+    async def _fetch_backend_events_since_cursor(self, web_agent_id: str, start_time: datetime) -> list[Any]:
+        """
+        Fetch only the events recorded since the previous action and return the accumulated log
+        of this episode, filtered by the action's ``start_time`` like the full-log path.
+
+        While nothing has been seen yet, long-poll so an event emitted just after the action
+        settles is still attributed to it.
+        """
+        wait_ms = 0 if self._backend_events else _BACKEND_EVENTS_WAIT_MS
+        try:
+            new_events, self._backend_events_cursor = await self.backend_demo_webs_service.get_backend_events_since(
+                web_agent_id,
+                since_id=self._backend_events_cursor,
+                wait_ms=wait_ms,
+            )
+        except (RuntimeError, ConnectionError, TimeoutError):
+            new_events = []
+        self._backend_events.extend(new_events)
+        return _events_since(self._backend_events, start_time)
+
     async def _fetch_backend_events_filtered(self, web_agent_id: str, start_time: datetime) -> list[Any]:
         """
         Fetch backend events with retries.
         """
+        if isinstance(self.backend_demo_webs_service, BackendDemoWebService):
+            return await self._fetch_backend_events_since_cursor(web_agent_id, start_time)
+
         backend_events: list[Any] = []
         for _ in range(3):
             try:
@@ -205,42 +315,54 @@ class PlaywrightBrowserExecutor:
             if backend_events:
                 break
             await asyncio.sleep(0.2)
-        if not backend_events:
-            return []
-
-        filtered_events: list[Any] = []
-        for event in backend_events:
-            event_ts = _parse_event_timestamp(event)
-            if event_ts is None or event_ts >= start_time:
-                filtered_events.append(event)
-        return filtered_events
+        return _events_since(backend_events, start_time)
 
     async def _get_backend_events_for_action(self, web_agent_id: str, start_time: datetime, is_web_real: bool) -> list[Any]:
         """Fetch backend events for this action or return empty list (centralizes duplicate condition)."""
-        if self.backend_demo_webs_service and not is_web_real:
+        if self.fetch_backend_events and self.backend_demo_webs_service and not is_web_real:
             return await self._fetch_backend_events_filtered(web_agent_id, start_time)
         return []
 
     async def _get_minimal_snapshot_from_page(self, error: str = "") -> dict[str, str]:
         """Build minimal snapshot from current page state (html/url) with suppressed exceptions."""
         html, url = "", ""
-        with contextlib.suppress(*_SUPPRESS_PLAYWRIGHT):
-            html = await self.page.content()
+        if self.capture_html:
+            with contextlib.suppress(*_SUPPRESS_PLAYWRIGHT):
+                html = await self.page.content()
         with contextlib.suppress(*_SUPPRESS_PLAYWRIGHT):
             url = self.page.url
         return _minimal_snapshot(html=html, url=url, error=error)
 
-    async def _capture_snapshot(self) -> dict:
-        """Helper function to capture browser state."""
+    async def _capture_snapshot(self, reuse_previous: bool = False) -> dict:
+        """
+        Helper function to capture browser state.
+
+        With ``reuse_previous`` (the "before" capture) the previous "after" image is reused
+        when neither the DOM nor the URL changed since it was taken.
+        """
         try:
             html = await self.page.content()
-            screenshot = await self.page.screenshot(type="jpeg", full_page=False, quality=85)
-            encoded_screenshot = base64.b64encode(screenshot).decode("utf-8")
             current_url = self.page.url
-            return {"html": html, "screenshot": encoded_screenshot, "url": current_url}
-        except (PlaywrightError, PWTimeout, RuntimeError, ValueError) as e:
+            html_ref = self._html_history.add(html)
+            last = self._last_screenshot
+            if reuse_previous and last is not None and last[0] is html_ref and last[1] == current_url:
+                screenshot = last[2]
+            else:
+                screenshot = await capture_screenshot(self.page, self.screenshot_config)
+            self._last_screenshot = (html_ref, current_url, screenshot)
+            return {"html": html_ref, "screenshot": screenshot, "url": current_url}
+        except (PlaywrightError, PWTimeout, RuntimeError, ValueError, OSError) as e:
             return _minimal_snapshot(error=str(e))
 
+    async def capture_screenshot(self) -> bytes:
+        """Take a screenshot of the current page now (on-demand), honouring the ``never`` policy."""
+        if not self.page or self.screenshot_config.policy == "never":
+            return b""
+        try:
+            return await capture_screenshot(self.page, self.screenshot_config)
+        except (PlaywrightError, PWTimeout, RuntimeError, ValueError, OSError):
+            return b""
+
     async def _stabilize_after_action(self, action: BaseAction) -> None:
         if not self.page:
             return
@@ -0,0 +1,163 @@
+"""
+Screenshot capture policy, encoding and serialization helpers.
+
+Screenshots are kept as raw image bytes while an episode runs and are base64-encoded
+only where they leave the process (LLM judge payloads, agent requests, GIFs, dumps).
+``ScreenshotConfig`` decides which steps are captured at all and in which format.
+"""
+
+from __future__ import annotations
+
+import base64
+import binascii
+import io
+from dataclasses import asdict, dataclass
+from typing import Any, Literal
+
+from loguru import logger
+
+ScreenshotPolicy = Literal["never", "on_demand", "judge", "every_n"]
+ScreenshotFormat = Literal["jpeg", "webp", "png"]
+
+SCREENSHOT_POLICIES: tuple[str, ...] = ("never", "on_demand", "judge", "every_n")
+SCREENSHOT_FORMATS: tuple[str, ...] = ("jpeg", "webp", "png")
+
+_MIME_TYPES = {"jpeg": "image/jpeg", "webp": "image/webp", "png": "image/png"}
+
+
+@dataclass(frozen=True, slots=True)
+class ScreenshotConfig:
+    """
+    When and how browser screenshots are taken.
+
+    Policies:
+        never:     no screenshots, even when a caller asks for one.
+        on_demand: only when a caller explicitly asks (GIF recording, ``take_screenshot()``).
+        judge:     on demand, plus every step of tasks with a screenshot-based judge test.
+        every_n:   on demand, plus every ``every_n``-th step.
+    """
+
+    policy: ScreenshotPolicy = "judge"
+    every_n: int = 1
+    image_format: ScreenshotFormat = "jpeg"
+    quality: int = 85
+    full_page: bool = False
+    # Downscale factor applied after capture (1.0 keeps the captured size)
+    scale: float = 1.0
+
+    def __post_init__(self) -> None:
+        if self.policy not in SCREENSHOT_POLICIES:
+            raise ValueError(f"Invalid screenshot policy: {self.policy!r}")
+        if self.image_format not in SCREENSHOT_FORMATS:
+            raise ValueError(f"Invalid screenshot format: {self.image_format!r}")
+        if self.every_n <= 0:
+            raise ValueError("every_n must be > 0")
+        if not 0 <= self.quality <= 100:
+            raise ValueError("quality must be between 0 and 100")
+        if not 0 < self.scale <= 1:
+            raise ValueError("scale must be in (0, 1]")
+
+    @property
+    def mime_type(self) -> str:
+        return _MIME_TYPES[self.image_format]
+
+    def wants(self, step_index: int, *, requested: bool = False, judge: bool = False) -> bool:
+        """Whether step ``step_index`` should be captured; ``judge`` means the task has a screenshot judge."""
+        if self.policy == "never":
+            return False
+        if requested:
+            return True
+        if self.policy == "judge":
+            return judge
+        if self.policy == "every_n":
+            return step_index % self.every_n == 0
+        return False
+
+    def serialize(self) -> dict[str, Any]:
+        return asdict(self)
+
+
+def task_has_screenshot_judge(task: Any) -> bool:
+    """True when any of the task's tests judges the run from screenshots."""
+    return any(getattr(test, "type", None) == "JudgeBaseOnScreenshot" for test in getattr(task, "tests", None) or [])
+
+
+def _pil_image():
+    # Pillow is only needed for WebP output and downscaling; import it on first use.
+    try:
+        from PIL import Image
+    except ImportError:  # pragma: no cover - optional dependency
+        return None
+    return Image
+
+
+def _reencode(png: bytes, config: ScreenshotConfig) -> bytes:
+    Image = _pil_image()
+    image = Image.open(io.BytesIO(png))
+    if config.scale < 1:
+        size = (max(1, round(image.width * config.scale)), max(1, round(image.height * config.scale)))
+        image = image.resize(size, Image.Resampling.BILINEAR)
+    out = io.BytesIO()
+    if config.image_format == "png":
+        image.save(out, format="PNG")
+    else:
+        image.convert("RGB").save(out, format=config.image_format.upper(), quality=config.quality)
+    return out.getvalue()
+
+
+async def capture_screenshot(page: Any, config: ScreenshotConfig) -> bytes:
+    """Take one screenshot of ``page`` as raw bytes in the configured format."""
+    image_format = config.image_format
+    needs_reencode = image_format == "webp" or config.scale < 1
+    if needs_reencode and _pil_image() is None:
+        logger.warning("Pillow is not installed; taking JPEG screenshots without WebP/downscaling")
+        image_format, needs_reencode = "jpeg", False
+    # Playwright encodes JPEG and PNG itself; anything else is re-encoded from a lossless capture.
+    shot_type = "png" if needs_reencode else image_format
+    kwargs: dict[str, Any] = {"type": shot_type, "full_page": config.full_page}
+    if shot_type == "jpeg":
+        kwargs["quality"] = config.quality
+    data = await page.screenshot(**kwargs)
+    return _reencode(data, config) if needs_reencode else data
+
+
+def screenshot_to_bytes(value: bytes | str | None) -> bytes:
+    """Raw image bytes from raw bytes or a (legacy) base64 string / data URL."""
+    if not value:
+        return b""
+    if isinstance(value, bytes | bytearray):
+        return bytes(value)
+    text = value.split(",", 1)[1] if value.startswith("data:") else value
+    try:
+        return base64.b64decode(text.encode("ascii"), validate=False)
+    except (binascii.Error, ValueError):
+        return b""
+
+
+def screenshot_to_base64(value: bytes | str | None) -> str:
+    """Base64 text for serialization; base64 strings pass through unchanged."""
+    if not value:
+        return ""
+    if isinstance(value, str):
+        return value.split(",", 1)[1] if value.startswith("data:") else value
+    return base64.b64encode(value).decode("ascii")
+
+
+def screenshot_mime_type(value: bytes | str | None, default: str = "image/png") -> str:
+    head = screenshot_to_bytes(value[:32] if isinstance(value, str) and not value.startswith("data:") else value)[:12]
+    if head.startswith(b"\x89PNG"):
+        return "image/png"
+    if head.startswith(b"\xff\xd8"):
+        return "image/jpeg"
+    if head[:4] == b"RIFF" and head[8:12] == b"WEBP":
+        return "image/webp"
+    return default
+
+
+def screenshot_data_url(value: bytes | str | None, default_mime: str = "image/png") -> str | None:
+    """``data:`` URL for an LLM or agent payload; None when there is no screenshot."""
+    if not value:
+        return None
+    if isinstance(value, str) and value.startswith("data:"):
+        return value
+    return f"data:{screenshot_mime_type(value, default_mime)};base64,{screenshot_to_base64(value)}"
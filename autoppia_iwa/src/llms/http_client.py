@@ -0,0 +1,117 @@
+"""
+Shared, connection-pooled HTTP clients for the HTTP-based LLM providers.
+
+Opening an ``httpx`` client per request pays a TCP (and TLS) handshake on every call and
+leaves the server to reap the dead connection. ``PooledHTTPClient`` keeps one sync and one
+async client per provider, with keep-alive and pool limits from ``HTTP_POOL_*`` settings.
+
+The async client is bound to the event loop that created it and is rebuilt if a different
+loop asks for it; the stale client is closed on its own loop when that loop still runs,
+otherwise its pooled sockets are shut down directly. Every live pool is tracked so ``aclose_llm_clients()`` can release them
+from the benchmark shutdown path, which also logs the LLM response cache summaries.
+"""
+
+import asyncio
+import socket
+import weakref
+from contextlib import suppress
+
+import httpx
+from loguru import logger
+
+from autoppia_iwa.config.config import (
+    HTTP_POOL_HTTP2,
+    HTTP_POOL_KEEPALIVE_EXPIRY_S,
+    HTTP_POOL_MAX_CONNECTIONS,
+    HTTP_POOL_MAX_KEEPALIVE,
+)
+from autoppia_iwa.src.llms.response_cache import log_llm_cache_summaries
+
+_LIVE_POOLS: "weakref.WeakSet[PooledHTTPClient]" = weakref.WeakSet()
+
+
+def pool_limits() -> httpx.Limits:
+    return httpx.Limits(
+        max_connections=HTTP_POOL_MAX_CONNECTIONS,
+        max_keepalive_connections=HTTP_POOL_MAX_KEEPALIVE,
+        keepalive_expiry=HTTP_POOL_KEEPALIVE_EXPIRY_S,
+    )
+
+
+def http2_available() -> bool:
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+class PooledHTTPClient:
+    """Lazily created ``httpx.Client`` / ``httpx.AsyncClient`` pair shared by one provider."""
+
+    def __init__(self, *, sync_timeout: float = 180.0, async_timeout: float = 120.0, http2: bool | None = None):
+        self.sync_timeout = sync_timeout
+        self.async_timeout = async_timeout
+        self.http2 = HTTP_POOL_HTTP2 if http2 is None else http2
+        if self.http2 and not http2_available():
+            logger.warning("HTTP/2 requested for LLM clients but the 'h2' package is not installed; using HTTP/1.1")
+            self.http2 = False
+        self._sync_client: httpx.Client | None = None
+        self._async_client: httpx.AsyncClient | None = None
+        self._async_loop: asyncio.AbstractEventLoop | None = None
+        _LIVE_POOLS.add(self)
+
+    @property
+    def sync_client(self) -> httpx.Client:
+        if self._sync_client is None or self._sync_client.is_closed:
+            self._sync_client = httpx.Client(timeout=self.sync_timeout, limits=pool_limits(), http2=self.http2)
+        return self._sync_client
+
+    @property
+    def async_client(self) -> httpx.AsyncClient:
+        loop = asyncio.get_running_loop()
+        if self._async_client is None or self._async_client.is_closed or self._async_loop is not loop:
+            # Connections of a client built on another (possibly closed) loop cannot be reused.
+            if self._async_client is not None:
+                self._release_stale_client(self._async_client, self._async_loop)
+            self._async_client = httpx.AsyncClient(timeout=self.async_timeout, limits=pool_limits(), http2=self.http2)
+            self._async_loop = loop
+        return self._async_client
+
+    @staticmethod
+    def _release_stale_client(client: httpx.AsyncClient, loop: asyncio.AbstractEventLoop | None) -> None:
+        """Close an async client left behind by another event loop so its pooled connections are not leaked."""
+        if client.is_closed:
+            return
+        if loop is not None and loop.is_running():
+            # Still serving another thread: close it on its own loop
+            asyncio.run_coroutine_threadsafe(client.aclose(), loop)
+            return
+        # Nothing can await aclose() on a finished loop: shut the pooled sockets down
+        # synchronously so the server sees the connections go away now, not at GC time
+        pool = getattr(client._transport, "_pool", None)
+        for connection in list(getattr(pool, "connections", ())):
+            with suppress(Exception):
+                connection._connection._network_stream.get_extra_info("socket").shutdown(socket.SHUT_RDWR)
+
+    async def aclose(self) -> None:
+        async_client, self._async_client = self._async_client, None
+        loop, self._async_loop = self._async_loop, None
+        if async_client is not None:
+            if loop is asyncio.get_running_loop():
+                await async_client.aclose()
+            else:
+                self._release_stale_client(async_client, loop)
+        sync_client, self._sync_client = self._sync_client, None
+        if sync_client is not None:
+            sync_client.close()
+
+
+async def aclose_llm_clients() -> None:
+    """Close the pooled clients of every provider instance still alive."""
+    log_llm_cache_summaries()
+    for pool in list(_LIVE_POOLS):
+        try:
+            await pool.aclose()
+        except Exception as exc:
+            logger.debug(f"Failed to close pooled LLM HTTP client: {exc}")
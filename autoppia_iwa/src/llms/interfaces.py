@@ -33,3 +33,6 @@ class ILLM(ABC):
         Args:
             temperature: Optional temperature override. If None, uses config temperature.
         """
+
+    async def aclose(self) -> None:  # noqa: B027
+        """Release pooled connections held by the provider. No-op by default."""
@@ -1,6 +1,8 @@
 import httpx
 
+from autoppia_iwa.src.llms.http_client import PooledHTTPClient
 from autoppia_iwa.src.llms.interfaces import ILLM, LLMConfig
+from autoppia_iwa.src.llms.rate_limiter import estimate_tokens, get_llm_rate_limiter, retry_after_seconds
 
 
 class ChutesLLMService(ILLM):
@@ -11,6 +13,7 @@ class ChutesLLMService(ILLM):
         self.base_url = base_url.rstrip("/")
         self.api_key = api_key
         self.use_bearer = use_bearer
+        self._http = PooledHTTPClient(sync_timeout=180.0, async_timeout=120.0)
 
     def _prepare_payload(self, messages: list[dict[str, str]], json_format: bool = False, schema: dict | None = None, temperature: float | None = None) -> dict:
         payload = {
@@ -53,27 +56,34 @@ class ChutesLLMService(ILLM):
     def predict(self, messages: list[dict[str, str]], json_format: bool = False, schema: dict | None = None, return_raw: bool = False, temperature: float | None = None) -> str:
         url = f"{self.base_url}/chat/completions"
         try:
-            with httpx.Client(timeout=180.0) as client:
-                payload = self._prepare_payload(messages, json_format, schema, temperature)
-                response = client.post(url, headers=self._headers(), json=payload)
-                response.raise_for_status()
-                data = response.json()
-                if return_raw:
-                    return data
-                return data["choices"][0]["message"]["content"]
+            client = self._http.sync_client
+            payload = self._prepare_payload(messages, json_format, schema, temperature)
+            response = client.post(url, headers=self._headers(), json=payload)
+            response.raise_for_status()
+            data = response.json()
+            if return_raw:
+                return data
+            return data["choices"][0]["message"]["content"]
         except httpx.HTTPError as e:
             raise RuntimeError(f"Chutes LLM Sync Error: {e}") from e
 
     async def async_predict(self, messages: list[dict[str, str]], json_format: bool = False, schema: dict | None = None, return_raw: bool = False, temperature: float | None = None) -> str:
         url = f"{self.base_url}/chat/completions"
+        rate_limiter = get_llm_rate_limiter()
         try:
-            async with httpx.AsyncClient(timeout=120.0) as client:
-                payload = self._prepare_payload(messages, json_format, schema, temperature)
-                response = await client.post(url, headers=self._headers(), json=payload)
-                response.raise_for_status()
-                data = response.json()
-                if return_raw:
-                    return data
-                return data["choices"][0]["message"]["content"]
+            client = self._http.async_client
+            payload = self._prepare_payload(messages, json_format, schema, temperature)
+            await rate_limiter.acquire(estimate_tokens(payload["messages"], payload["max_tokens"]))
+            response = await client.post(url, headers=self._headers(), json=payload)
+            response.raise_for_status()
+            data = response.json()
+            if return_raw:
+                return data
+            return data["choices"][0]["message"]["content"]
         except httpx.HTTPError as e:
+            if isinstance(e, httpx.HTTPStatusError) and e.response.status_code == 429:
+                rate_limiter.pause(retry_after_seconds(e.response.headers))
             raise RuntimeError(f"Chutes LLM Async Error: {e}") from e
+
+    async def aclose(self) -> None:
+        await self._http.aclose()
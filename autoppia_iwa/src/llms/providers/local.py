@@ -1,6 +1,8 @@
 import httpx
 
+from autoppia_iwa.src.llms.http_client import PooledHTTPClient
 from autoppia_iwa.src.llms.interfaces import ILLM, LLMConfig
+from autoppia_iwa.src.llms.rate_limiter import estimate_tokens, get_llm_rate_limiter, retry_after_seconds
 
 
 class LocalLLMService(ILLM):
@@ -9,6 +11,7 @@ class LocalLLMService(ILLM):
     def __init__(self, config: LLMConfig, endpoint_url: str):
         self.config = config
         self.endpoint_url = endpoint_url
+        self._http = PooledHTTPClient(sync_timeout=180.0, async_timeout=120.0)
 
     def _prepare_payload(self, messages: list[dict[str, str]], json_format: bool = False, schema: dict | None = None, temperature: float | None = None) -> dict:
         payload = {
@@ -24,26 +27,33 @@ class LocalLLMService(ILLM):
 
     def predict(self, messages: list[dict[str, str]], json_format: bool = False, schema: dict | None = None, return_raw: bool = False, temperature: float | None = None) -> str:
         try:
-            with httpx.Client(timeout=180.0) as client:
-                payload = self._prepare_payload(messages, json_format, schema, temperature)
-                response = client.post(self.endpoint_url, json=payload)
-                response.raise_for_status()
-                data = response.json()
-                if return_raw:
-                    return data
-                return data.get("output", "")
+            client = self._http.sync_client
+            payload = self._prepare_payload(messages, json_format, schema, temperature)
+            response = client.post(self.endpoint_url, json=payload)
+            response.raise_for_status()
+            data = response.json()
+            if return_raw:
+                return data
+            return data.get("output", "")
         except httpx.HTTPError as e:
             raise RuntimeError(f"Local LLM Sync Error: {e}") from e
 
     async def async_predict(self, messages: list[dict[str, str]], json_format: bool = False, schema: dict | None = None, return_raw: bool = False, temperature: float | None = None) -> str:
+        rate_limiter = get_llm_rate_limiter()
         try:
-            async with httpx.AsyncClient(timeout=120.0) as client:
-                payload = self._prepare_payload(messages, json_format, schema, temperature)
-                response = await client.post(self.endpoint_url, json=payload)
-                response.raise_for_status()
-                data = response.json()
-                if return_raw:
-                    return data
-                return data.get("output", "")
+            client = self._http.async_client
+            payload = self._prepare_payload(messages, json_format, schema, temperature)
+            await rate_limiter.acquire(estimate_tokens(payload["messages"], payload["max_tokens"]))
+            response = await client.post(self.endpoint_url, json=payload)
+            response.raise_for_status()
+            data = response.json()
+            if return_raw:
+                return data
+            return data.get("output", "")
         except httpx.HTTPError as e:
+            if isinstance(e, httpx.HTTPStatusError) and e.response.status_code == 429:
+                rate_limiter.pause(retry_after_seconds(e.response.headers))
             raise RuntimeError(f"Local LLM Async Error: {e}") from e
+
+    async def aclose(self) -> None:
+        await self._http.aclose()
@@ -1,6 +1,7 @@
 from openai import APIConnectionError, APIError, APITimeoutError, AsyncOpenAI, OpenAI, RateLimitError
 
 from autoppia_iwa.src.llms.interfaces import ILLM, LLMConfig
+from autoppia_iwa.src.llms.rate_limiter import estimate_tokens, get_llm_rate_limiter, retry_after_seconds
 
 
 class OpenAIService(ILLM):
@@ -35,11 +36,20 @@ class OpenAIService(ILLM):
             raise RuntimeError(f"OpenAI Sync Error: {e}") from e
 
     async def async_predict(self, messages: list[dict[str, str]], json_format: bool = False, schema: dict | None = None, return_raw: bool = False, temperature: float | None = None) -> str:
+        rate_limiter = get_llm_rate_limiter()
         try:
             payload = self._prepare_payload(messages, json_format, schema, temperature)
+            await rate_limiter.acquire(estimate_tokens(payload["messages"], payload["max_tokens"]))
             response = await self.async_client.chat.completions.create(**payload)
             if return_raw:
                 return response
             return response.choices[0].message.content
-        except (APIError, APIConnectionError, APITimeoutError, RateLimitError, ValueError, TypeError) as e:
+        except RateLimitError as e:
+            rate_limiter.pause(retry_after_seconds(getattr(e.response, "headers", None)))
+            raise RuntimeError(f"OpenAI Async Error: {e}") from e
+        except (APIError, APIConnectionError, APITimeoutError, ValueError, TypeError) as e:
             raise RuntimeError(f"OpenAI Async Error: {e}") from e
+
+    async def aclose(self) -> None:
+        await self.async_client.close()
+        self.sync_client.close()
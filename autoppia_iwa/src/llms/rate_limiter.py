@@ -0,0 +1,140 @@
+"""
+Process-wide token-bucket rate limiting for LLM calls.
+
+Every provider acquires from the same ``LLMRateLimiter`` before sending a request, so
+concurrent task generation stays under the account's requests/min and tokens/min quotas
+whichever provider is configured. A 429 from any provider pauses all callers.
+
+Limits come from ``LLM_REQUESTS_PER_MINUTE`` / ``LLM_TOKENS_PER_MINUTE`` (0 disables).
+"""
+
+import asyncio
+import time
+from collections.abc import Awaitable, Callable, Mapping
+
+from loguru import logger
+
+from autoppia_iwa.config.config import LLM_REQUESTS_PER_MINUTE, LLM_TOKENS_PER_MINUTE
+
+DEFAULT_RATE_LIMIT_PAUSE_S = 1.0
+
+
+class _TokenBucket:
+    """Bucket holding up to ``per_minute`` units, refilled continuously."""
+
+    def __init__(self, per_minute: float, now: float) -> None:
+        self.capacity = float(per_minute)
+        self.rate = self.capacity / 60.0
+        self.level = self.capacity
+        self.updated = now
+
+    def _refill(self, now: float) -> None:
+        self.level = min(self.capacity, self.level + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def wait_time(self, amount: float, now: float) -> float:
+        self._refill(now)
+        # A single request larger than the bucket would never fit: let it drain the bucket.
+        needed = min(amount, self.capacity)
+        return 0.0 if self.level >= needed else (needed - self.level) / self.rate
+
+    def consume(self, amount: float) -> None:
+        self.level -= min(amount, self.capacity)
+
+
+class LLMRateLimiter:
+    """
+    Token-bucket limiter on requests/min and tokens/min.
+
+    ``acquire`` waits (FIFO) until both buckets can cover the request, then debits them.
+    ``pause`` blocks every caller for a while, e.g. after an HTTP 429.
+    """
+
+    def __init__(
+        self,
+        requests_per_minute: float = 0,
+        tokens_per_minute: float = 0,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], Awaitable[None]] = asyncio.sleep,
+    ) -> None:
+        self._clock = clock
+        self._sleep = sleep
+        now = clock()
+        self._requests = _TokenBucket(requests_per_minute, now) if requests_per_minute > 0 else None
+        self._tokens = _TokenBucket(tokens_per_minute, now) if tokens_per_minute > 0 else None
+        self._paused_until = 0.0
+        self._lock: asyncio.Lock | None = None
+
+    @property
+    def enabled(self) -> bool:
+        return self._requests is not None or self._tokens is not None or self._paused_until > self._clock()
+
+    async def acquire(self, tokens: int = 0) -> float:
+        """Wait for capacity for one request of ``tokens`` tokens. Returns the time waited."""
+        if not self.enabled:
+            return 0.0
+
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        started = self._clock()
+        async with self._lock:
+            while True:
+                now = self._clock()
+                wait = self._paused_until - now
+                if self._requests is not None:
+                    wait = max(wait, self._requests.wait_time(1, now))
+                if self._tokens is not None:
+                    wait = max(wait, self._tokens.wait_time(tokens, now))
+                if wait <= 0:
+                    break
+                await self._sleep(wait)
+
+            if self._requests is not None:
+                self._requests.consume(1)
+            if self._tokens is not None:
+                self._tokens.consume(tokens)
+        return self._clock() - started
+
+    def pause(self, seconds: float | None = None) -> None:
+        """Hold back every caller for ``seconds`` (default when the server gave no hint)."""
+        seconds = DEFAULT_RATE_LIMIT_PAUSE_S if seconds is None or seconds <= 0 else seconds
+        self._paused_until = max(self._paused_until, self._clock() + seconds)
+        logger.warning(f"LLM rate limited, pausing requests for {seconds:.2f}s")
+
+
+def estimate_tokens(messages: list[dict[str, str]], max_tokens: int = 0) -> int:
+    """Rough token cost of a request: ~4 characters per prompt token plus the completion budget."""
+    prompt_chars = sum(len(str(message.get("content", ""))) for message in messages)
+    return prompt_chars // 4 + max(max_tokens, 0)
+
+
+def retry_after_seconds(headers: Mapping[str, str] | None) -> float | None:
+    """Parse the ``Retry-After`` / ``retry-after-ms`` hints of a 429 response."""
+    if not headers:
+        return None
+    try:
+        if headers.get("retry-after-ms"):
+            return float(headers["retry-after-ms"]) / 1000
+        if headers.get("retry-after"):
+            return float(headers["retry-after"])
+    except (TypeError, ValueError):
+        return None
+    return None
+
+
+_shared_rate_limiter = LLMRateLimiter(LLM_REQUESTS_PER_MINUTE, LLM_TOKENS_PER_MINUTE)
+
+
+def get_llm_rate_limiter() -> LLMRateLimiter:
+    """Limiter shared by every LLM provider in this process."""
+    return _shared_rate_limiter
+
+
+def configure_llm_rate_limiter(requests_per_minute: float = 0, tokens_per_minute: float = 0) -> LLMRateLimiter:
+    """Replace the shared limiter (e.g. from CLI flags); 0 disables a limit."""
+    global _shared_rate_limiter
+    _shared_rate_limiter = LLMRateLimiter(requests_per_minute, tokens_per_minute)
+    return _shared_rate_limiter
+
+
+__all__ = ["LLMRateLimiter", "configure_llm_rate_limiter", "estimate_tokens", "get_llm_rate_limiter", "retry_after_seconds"]
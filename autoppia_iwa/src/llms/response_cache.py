@@ -0,0 +1,384 @@
+"""
+Disk-backed cache of LLM responses, as an opt-in ``ILLM`` wrapper.
+
+``CachedLLM`` fingerprints every request (provider, model, messages, temperature,
+max tokens, JSON mode and schema) with a canonical SHA-256 and stores the answer in a
+local SQLite file shared by every process of a run. Entries expire after a TTL and the
+least recently used ones are evicted past a size cap.
+
+Modes (``LLM_CACHE_MODE``):
+    off            no caching (default)
+    write_through  serve hits, call the provider on a miss and store the answer
+    read_only      serve hits, call the provider on a miss without storing it
+    refresh        always call the provider and overwrite the stored answer
+    offline        serve hits (ignoring the TTL) and raise ``LLMCacheMissError`` on a
+                   miss, so a whole generation run can be replayed from the cache alone
+
+Raw responses (``return_raw=True``) are cached when they are JSON data or pydantic
+models (e.g. OpenAI ``ChatCompletion``), and rebuilt as the same type on a hit.
+
+Usage:
+    llm = CachedLLM(LLMFactory.create_llm("openai", config, api_key=key), LLMResponseCache(path), mode="write_through")
+    await llm.async_predict(messages)
+"""
+
+import asyncio
+import hashlib
+import importlib
+import json
+import sqlite3
+import threading
+import time
+import weakref
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Literal
+
+from loguru import logger
+
+from autoppia_iwa.config.config import LLM_CACHE_MAX_BYTES, LLM_CACHE_MODE, LLM_CACHE_PATH, LLM_CACHE_TTL_S
+from autoppia_iwa.src.llms.interfaces import ILLM
+from autoppia_iwa.src.llms.rate_limiter import estimate_tokens
+from autoppia_iwa.src.shared.single_flight import SingleFlight
+
+LLMCacheMode = Literal["off", "write_through", "read_only", "refresh", "offline"]
+CACHE_MODES: tuple[str, ...] = ("off", "write_through", "read_only", "refresh", "offline")
+
+
+class LLMCacheMissError(RuntimeError):
+    """Raised in offline mode when a request has no cached response."""
+
+
+@dataclass
+class LLMCacheMetrics:
+    """Counters describing how LLM requests are served by the cache."""
+
+    hits: int = 0
+    misses: int = 0
+    coalesced: int = 0
+    writes: int = 0
+    expired: int = 0
+    evictions: int = 0
+    errors: int = 0
+    saved_prompt_tokens: int = 0
+    saved_completion_tokens: int = 0
+    # Lookups and writes run in worker threads (asyncio.to_thread)
+    _lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False, compare=False)
+
+    def add(self, **counts: int) -> None:
+        with self._lock:
+            for name, amount in counts.items():
+                setattr(self, name, getattr(self, name) + amount)
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    @property
+    def saved_tokens(self) -> int:
+        return self.saved_prompt_tokens + self.saved_completion_tokens
+
+    def as_dict(self) -> dict[str, float | int]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "coalesced": self.coalesced,
+            "writes": self.writes,
+            "expired": self.expired,
+            "evictions": self.evictions,
+            "errors": self.errors,
+            "saved_prompt_tokens": self.saved_prompt_tokens,
+            "saved_completion_tokens": self.saved_completion_tokens,
+            "hit_rate": round(self.hit_rate, 4),
+        }
+
+
+@dataclass
+class CachedResponse:
+    """A stored answer plus the token usage it would have cost."""
+
+    payload: dict[str, Any]
+    prompt_tokens: int
+    completion_tokens: int
+
+
+def request_fingerprint(request: dict[str, Any]) -> str:
+    """Canonical SHA-256 of a request: key order and whitespace do not matter."""
+    canonical = json.dumps(request, sort_keys=True, separators=(",", ":"), ensure_ascii=False, default=str)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+class LLMResponseCache:
+    """SQLite store of responses keyed by request fingerprint, with TTL and LRU size cap."""
+
+    def __init__(self, path: Path | str, ttl_s: float = 0, max_bytes: int = 0):
+        self.path = Path(path)
+        self.ttl_s = max(0.0, float(ttl_s))
+        self.max_bytes = max(0, int(max_bytes))
+        self.metrics = LLMCacheMetrics()
+        self._lock = threading.Lock()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        # Benchmark shards and the generation pipeline may share the file
+        self._conn = sqlite3.connect(self.path, timeout=30, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            "key TEXT PRIMARY KEY, model TEXT, payload TEXT NOT NULL, size INTEGER NOT NULL, "
+            "prompt_tokens INTEGER NOT NULL, completion_tokens INTEGER NOT NULL, "
+            "created_at REAL NOT NULL, last_used_at REAL NOT NULL)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS responses_last_used ON responses (last_used_at)")
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+
+    @property
+    def size_bytes(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+
+    def get(self, key: str, *, ignore_ttl: bool = False, touch: bool = True) -> CachedResponse | None:
+        now = time.time()
+        try:
+            with self._lock:
+                row = self._conn.execute("SELECT payload, prompt_tokens, completion_tokens, created_at FROM responses WHERE key = ?", (key,)).fetchone()
+                if row is None:
+                    return None
+                payload, prompt_tokens, completion_tokens, created_at = row
+                if self.ttl_s and not ignore_ttl and now - created_at > self.ttl_s:
+                    self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                    self.metrics.add(expired=1)
+                    return None
+                if touch:
+                    self._conn.execute("UPDATE responses SET last_used_at = ? WHERE key = ?", (now, key))
+            return CachedResponse(json.loads(payload), prompt_tokens, completion_tokens)
+        except (sqlite3.Error, ValueError) as e:
+            self.metrics.add(errors=1)
+            logger.warning(f"Ignoring unreadable LLM cache entry {key[:12]}: {e}")
+            return None
+
+    def put(self, key: str, model: str, response: CachedResponse) -> None:
+        serialized = json.dumps(response.payload, ensure_ascii=False)
+        size = len(serialized.encode("utf-8"))
+        if self.max_bytes and size > self.max_bytes:
+            return
+        now = time.time()
+        try:
+            with self._lock:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                    (key, model, serialized, size, response.prompt_tokens, response.completion_tokens, now, now),
+                )
+                self.metrics.add(writes=1)
+                if self.max_bytes:
+                    self._evict_locked()
+        except sqlite3.Error as e:
+            self.metrics.add(errors=1)
+            logger.warning(f"Could not write LLM cache entry {key[:12]}: {e}")
+
+    def _evict_locked(self) -> None:
+        total = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        victims = []
+        for key, size in self._conn.execute("SELECT key, size FROM responses ORDER BY last_used_at"):
+            if total <= self.max_bytes:
+                break
+            victims.append((key,))
+            total -= size
+        self._conn.executemany("DELETE FROM responses WHERE key = ?", victims)
+        self.metrics.add(evictions=len(victims))
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+def _usage_tokens(raw: Any) -> tuple[int, int] | None:
+    usage = raw.get("usage") if isinstance(raw, dict) else getattr(raw, "usage", None)
+    if usage is None:
+        return None
+    get = usage.get if isinstance(usage, dict) else lambda name: getattr(usage, name, None)
+    prompt_tokens, completion_tokens = get("prompt_tokens"), get("completion_tokens")
+    if not isinstance(prompt_tokens, int) or not isinstance(completion_tokens, int):
+        return None
+    return prompt_tokens, completion_tokens
+
+
+def _encode_raw(raw: Any) -> dict[str, Any] | None:
+    """JSON form of a raw provider response, or None if it cannot be rebuilt later."""
+    if hasattr(raw, "model_dump") and hasattr(type(raw), "model_validate"):
+        return {"raw": raw.model_dump(mode="json"), "raw_type": f"{type(raw).__module__}:{type(raw).__qualname__}"}
+    try:
+        json.dumps(raw)
+    except (TypeError, ValueError):
+        return None
+    return {"raw": raw}
+
+
+def _decode_raw(payload: dict[str, Any]) -> Any:
+    raw_type = payload.get("raw_type")
+    if not raw_type:
+        return payload["raw"]
+    module_name, _, qualname = raw_type.partition(":")
+    cls: Any = importlib.import_module(module_name)
+    for attr in qualname.split("."):
+        cls = getattr(cls, attr)
+    return cls.model_validate(payload["raw"])
+
+
+_LIVE_CACHED_LLMS: "weakref.WeakSet[CachedLLM]" = weakref.WeakSet()
+
+
+def log_llm_cache_summaries() -> None:
+    """Log the hit/savings summary of every ``CachedLLM`` still alive (run from ``aclose_llm_clients``)."""
+    for llm in list(_LIVE_CACHED_LLMS):
+        llm.log_summary()
+
+
+class CachedLLM(ILLM):
+    """``ILLM`` that answers repeated requests from an ``LLMResponseCache``."""
+
+    def __init__(self, llm: ILLM, cache: LLMResponseCache, mode: LLMCacheMode = "write_through"):
+        if mode not in CACHE_MODES or mode == "off":
+            raise ValueError(f"Unsupported LLM cache mode: {mode}")
+        self.llm = llm
+        self.cache = cache
+        self.mode = mode
+        self._inflight = SingleFlight()
+        _LIVE_CACHED_LLMS.add(self)
+
+    @property
+    def config(self):
+        return self.llm.config
+
+    @property
+    def metrics(self) -> LLMCacheMetrics:
+        return self.cache.metrics
+
+    def _request(self, messages, json_format, schema, return_raw, temperature) -> tuple[str, str]:
+        config = getattr(self.llm, "config", None)
+        model = str(getattr(config, "model", ""))
+        request = {
+            "provider": type(self.llm).__name__,
+            "model": model,
+            "messages": messages,
+            "temperature": temperature if temperature is not None else getattr(config, "temperature", None),
+            "max_tokens": getattr(config, "max_tokens", None),
+            "json_format": json_format,
+            "schema": schema,
+            "return_raw": return_raw,
+        }
+        return request_fingerprint(request), model
+
+    def _lookup(self, key: str, messages) -> tuple[bool, Any]:
+        if self.mode == "refresh":
+            return False, None
+        offline = self.mode == "offline"
+        entry = self.cache.get(key, ignore_ttl=offline, touch=self.mode == "write_through")
+        if entry is None:
+            self.metrics.add(misses=1)
+            if offline:
+                raise LLMCacheMissError(f"No cached LLM response for request {key[:12]} (offline mode)")
+            return False, None
+        try:
+            value = _decode_raw(entry.payload) if "raw" in entry.payload else entry.payload["content"]
+        except (ImportError, AttributeError, KeyError, ValueError) as e:
+            self.metrics.add(errors=1, misses=1)
+            logger.warning(f"Could not rebuild cached LLM response {key[:12]}: {e}")
+            if offline:
+                raise LLMCacheMissError(f"Unusable cached LLM response for request {key[:12]}") from e
+            return False, None
+        self.metrics.add(hits=1, saved_prompt_tokens=entry.prompt_tokens, saved_completion_tokens=entry.completion_tokens)
+        logger.debug(f"LLM cache hit {key[:12]} (~{entry.prompt_tokens + entry.completion_tokens} tokens saved)")
+        return True, value
+
+    def _store(self, key: str, model: str, messages, result: Any, return_raw: bool) -> None:
+        if self.mode == "read_only":
+            return
+        if return_raw:
+            payload = _encode_raw(result)
+            if payload is None:
+                return
+        elif isinstance(result, str):
+            payload = {"content": result}
+        else:
+            return
+        usage = _usage_tokens(result) if return_raw else None
+        if usage is None:
+            content = payload.get("content", json.dumps(payload.get("raw"), default=str))
+            usage = (estimate_tokens(messages), len(content) // 4)
+        self.cache.put(key, model, CachedResponse(payload, *usage))
+
+    def predict(self, messages: list[dict[str, str]], json_format: bool = False, schema: dict | None = None, return_raw: bool = False, temperature: float | None = None) -> str:
+        key, model = self._request(messages, json_format, schema, return_raw, temperature)
+        hit, value = self._lookup(key, messages)
+        if hit:
+            return value
+        result = self.llm.predict(messages, json_format=json_format, schema=schema, return_raw=return_raw, temperature=temperature)
+        self._store(key, model, messages, result, return_raw)
+        return result
+
+    async def async_predict(self, messages: list[dict[str, str]], json_format: bool = False, schema: dict | None = None, return_raw: bool = False, temperature: float | None = None) -> str:
+        key, model = self._request(messages, json_format, schema, return_raw, temperature)
+
+        async def _answer():
+            hit, result = await asyncio.to_thread(self._lookup, key, messages)
+            if not hit:
+                result = await self.llm.async_predict(messages, json_format=json_format, schema=schema, return_raw=return_raw, temperature=temperature)
+                await asyncio.to_thread(self._store, key, model, messages, result, return_raw)
+            return result
+
+        if self.mode == "refresh":
+            # Every refresh call must reach the provider
+            return await _answer()
+        if key in self._inflight:
+            self.metrics.add(coalesced=1)
+        return await self._inflight.run(key, _answer)
+
+    def log_summary(self) -> None:
+        m = self.metrics
+        lookups = m.hits + m.misses
+        if lookups or m.writes:
+            logger.info(
+                f"LLM cache ({self.mode}): {m.hits}/{lookups} hits ({m.hit_rate:.1%}), "
+                f"~{m.saved_tokens} tokens saved ({m.saved_prompt_tokens} prompt, {m.saved_completion_tokens} completion), "
+                f"{m.writes} writes, {m.evictions} evictions"
+            )
+
+    async def aclose(self) -> None:
+        self.log_summary()
+        await self.llm.aclose()
+
+
+def maybe_cache_llm(
+    llm: ILLM,
+    mode: str = LLM_CACHE_MODE,
+    path: Path | str = LLM_CACHE_PATH,
+    ttl_s: float = LLM_CACHE_TTL_S,
+    max_bytes: int = LLM_CACHE_MAX_BYTES,
+) -> ILLM:
+    """Wrap ``llm`` in a ``CachedLLM`` as configured by ``LLM_CACHE_*``; unchanged when the mode is off."""
+    mode = (mode or "off").lower()
+    if mode == "off":
+        return llm
+    if mode not in CACHE_MODES:
+        raise ValueError(f"Unsupported LLM_CACHE_MODE: {mode} (expected one of {', '.join(CACHE_MODES)})")
+    logger.info(f"LLM response cache enabled: mode={mode}, path={path}")
+    return CachedLLM(llm, LLMResponseCache(path, ttl_s=ttl_s, max_bytes=max_bytes), mode=mode)  # type: ignore[arg-type]
+
+
+__all__ = [
+    "CACHE_MODES",
+    "CachedLLM",
+    "CachedResponse",
+    "LLMCacheMetrics",
+    "LLMCacheMissError",
+    "LLMCacheMode",
+    "LLMResponseCache",
+    "log_llm_cache_summaries",
+    "maybe_cache_llm",
+    "request_fingerprint",
+]
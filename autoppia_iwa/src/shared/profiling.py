@@ -0,0 +1,180 @@
+"""
+Per-phase span profiler for evaluation episodes.
+
+``PhaseProfiler`` aggregates span durations into streaming log-bucketed histograms, one
+per phase and one per action type, so memory stays constant however many episodes run
+and p50/p90/p99 come out within ~1% relative error. Histograms from several profilers
+(e.g. benchmark shards) merge exactly.
+
+A disabled profiler hands out one shared no-op context manager, so instrumented code
+pays a single attribute check per span.
+
+Usage:
+    profiler = PhaseProfiler(enabled=True)
+    with profiler.span(PHASE_ACTION_EXECUTION, action_type="ClickAction"):
+        await action.execute(page, backend, web_agent_id)
+    profiler.as_dict()  # {"phases": {...}, "action_types": {...}}
+"""
+
+from __future__ import annotations
+
+import contextlib
+import math
+import threading
+import time
+from collections.abc import Iterator
+from typing import Any
+
+PHASE_BROWSER_LAUNCH = "browser_launch"
+PHASE_DB_RESET = "db_reset"
+PHASE_NAVIGATION = "navigation"
+PHASE_ACTION_EXECUTION = "action_execution"
+PHASE_STABILIZATION = "stabilization"
+PHASE_EVENT_FETCH = "event_fetch"
+PHASE_SNAPSHOT_CAPTURE = "snapshot_capture"
+PHASE_TEST_EVALUATION = "test_evaluation"
+PHASE_AGENT_STEP = "agent_step"
+PHASE_TRACE_WRITE = "trace_write"
+
+# Bucket i holds values in (gamma^(i-1), gamma^i]; gamma = (1 + a) / (1 - a) bounds the relative error by a.
+_RELATIVE_ACCURACY = 0.01
+_GAMMA = (1 + _RELATIVE_ACCURACY) / (1 - _RELATIVE_ACCURACY)
+_LOG_GAMMA = math.log(_GAMMA)
+# Durations below this (seconds) share one bucket
+_MIN_VALUE = 1e-6
+_QUANTILES = (("p50", 0.5), ("p90", 0.9), ("p99", 0.99))
+_NOOP_SPAN = contextlib.nullcontext()
+
+
+class StreamingHistogram:
+    """Log-bucketed histogram of non-negative durations with bounded relative error."""
+
+    __slots__ = ("buckets", "count", "max", "min", "total")
+
+    def __init__(self) -> None:
+        self.buckets: dict[int, int] = {}
+        self.count = 0
+        self.total = 0.0
+        self.min = math.inf
+        self.max = 0.0
+
+    def add(self, value: float) -> None:
+        value = max(float(value), 0.0)
+        index = math.ceil(math.log(value / _MIN_VALUE) / _LOG_GAMMA) if value > _MIN_VALUE else 0
+        self.buckets[index] = self.buckets.get(index, 0) + 1
+        self.count += 1
+        self.total += value
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+
+    def merge(self, other: StreamingHistogram) -> None:
+        for index, count in other.buckets.items():
+            self.buckets[index] = self.buckets.get(index, 0) + count
+        self.count += other.count
+        self.total += other.total
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+
+    def quantile(self, q: float) -> float:
+        if not self.count:
+            return 0.0
+        rank = q * (self.count - 1)
+        seen = 0
+        for index in sorted(self.buckets):
+            seen += self.buckets[index]
+            if seen > rank:
+                if index == 0:
+                    return self.min
+                # Midpoint of the bucket in relative terms, clamped to what was observed
+                estimate = _MIN_VALUE * 2 * _GAMMA**index / (_GAMMA + 1)
+                return min(max(estimate, self.min), self.max)
+        return self.max
+
+    def summary(self) -> dict[str, float | int]:
+        summary: dict[str, float | int] = {
+            "count": self.count,
+            "total_s": round(self.total, 6),
+            "mean_s": round(self.total / self.count, 6) if self.count else 0.0,
+        }
+        for name, q in _QUANTILES:
+            summary[f"{name}_s"] = round(self.quantile(q), 6)
+        summary["max_s"] = round(self.max, 6)
+        return summary
+
+    def to_state(self) -> dict[str, Any]:
+        return {"buckets": {str(k): v for k, v in self.buckets.items()}, "count": self.count, "total": self.total, "min": self.min if self.count else None, "max": self.max}
+
+    @classmethod
+    def from_state(cls, state: dict[str, Any]) -> StreamingHistogram:
+        histogram = cls()
+        histogram.buckets = {int(k): int(v) for k, v in (state.get("buckets") or {}).items()}
+        histogram.count = int(state.get("count", 0))
+        histogram.total = float(state.get("total", 0.0))
+        histogram.min = math.inf if state.get("min") is None else float(state["min"])
+        histogram.max = float(state.get("max", 0.0))
+        return histogram
+
+
+class PhaseProfiler:
+    """Collects span durations per phase and per action type; a no-op when disabled."""
+
+    def __init__(self, enabled: bool = True) -> None:
+        self.enabled = enabled
+        self._phases: dict[str, StreamingHistogram] = {}
+        self._action_types: dict[str, StreamingHistogram] = {}
+        # Trace and shard bookkeeping may record from other threads
+        self._lock = threading.Lock()
+
+    def span(self, phase: str, action_type: str | None = None) -> contextlib.AbstractContextManager:
+        """Time the enclosed block as ``phase`` (and ``action_type``, if given)."""
+        if not self.enabled:
+            return _NOOP_SPAN
+        return self._timed(phase, action_type)
+
+    @contextlib.contextmanager
+    def _timed(self, phase: str, action_type: str | None) -> Iterator[None]:
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(phase, time.perf_counter() - start, action_type)
+
+    def record(self, phase: str, seconds: float, action_type: str | None = None) -> None:
+        if not self.enabled:
+            return
+        with self._lock:
+            self._histogram(self._phases, phase).add(seconds)
+            if action_type:
+                self._histogram(self._action_types, action_type).add(seconds)
+
+    @staticmethod
+    def _histogram(histograms: dict[str, StreamingHistogram], key: str) -> StreamingHistogram:
+        histogram = histograms.get(key)
+        if histogram is None:
+            histogram = histograms[key] = StreamingHistogram()
+        return histogram
+
+    def merge_state(self, state: dict[str, Any]) -> None:
+        """Fold in the histograms of another profiler, as returned by ``to_state``."""
+        with self._lock:
+            for attr, key in ((self._phases, "phases"), (self._action_types, "action_types")):
+                for name, histogram_state in (state.get(key) or {}).items():
+                    self._histogram(attr, name).merge(StreamingHistogram.from_state(histogram_state))
+
+    def to_state(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                "phases": {name: h.to_state() for name, h in self._phases.items()},
+                "action_types": {name: h.to_state() for name, h in self._action_types.items()},
+            }
+
+    def as_dict(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                "phases": {name: self._phases[name].summary() for name in sorted(self._phases)},
+                "action_types": {name: self._action_types[name].summary() for name in sorted(self._action_types)},
+            }
+
+
+# Shared disabled profiler for callers that were not given one
+NULL_PROFILER = PhaseProfiler(enabled=False)
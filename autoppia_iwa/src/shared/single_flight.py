@@ -0,0 +1,77 @@
+"""
+Per-key de-duplication of concurrent async loads.
+
+The first caller for a key starts the load as its own task; callers arriving while it
+runs join it instead of loading again. Every caller, the first one included, awaits the
+task through ``asyncio.shield``, so cancelling one caller only cancels that caller: the
+others still get the result. The load itself is cancelled once no caller is waiting for
+it any more. A key is forgotten as soon as its load finishes, so failures are retried by
+the next caller.
+
+Usage:
+    flights = SingleFlight()
+    if key in flights:
+        metrics.coalesced += 1
+    data = await flights.run(key, lambda: load(key))
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable, Hashable
+from typing import Any, TypeVar
+
+T = TypeVar("T")
+
+
+class _Flight:
+    __slots__ = ("task", "waiters")
+
+    def __init__(self, task: asyncio.Task) -> None:
+        self.task = task
+        self.waiters = 0
+
+
+class SingleFlight:
+    """Shares one in-flight load per key between concurrent callers."""
+
+    def __init__(self) -> None:
+        self._flights: dict[Hashable, _Flight] = {}
+
+    def __contains__(self, key: Hashable) -> bool:
+        """Whether a call for ``key`` would join a running load (on the current loop)."""
+        flight = self._flights.get(key)
+        return flight is not None and not flight.task.done() and flight.task.get_loop() is _running_loop()
+
+    def __len__(self) -> int:
+        return len(self._flights)
+
+    async def run(self, key: Hashable, load: Callable[[], Awaitable[T]]) -> T:
+        """Result of the load running for ``key``, starting ``load()`` when there is none."""
+        flight = self._flights.get(key)
+        if flight is None or flight.task.done() or flight.task.get_loop() is not asyncio.get_running_loop():
+            flight = self._flights[key] = _Flight(asyncio.ensure_future(load()))
+            flight.task.add_done_callback(lambda _task, key=key, flight=flight: self._forget(key, flight))
+
+        flight.waiters += 1
+        try:
+            return await asyncio.shield(flight.task)
+        finally:
+            flight.waiters -= 1
+            if flight.waiters == 0 and not flight.task.done():
+                # Every caller gave up (was cancelled); nobody wants the result
+                flight.task.cancel()
+
+    def _forget(self, key: Hashable, flight: _Flight) -> None:
+        if self._flights.get(key) is flight:
+            del self._flights[key]
+
+
+def _running_loop() -> Any:
+    try:
+        return asyncio.get_running_loop()
+    except RuntimeError:
+        return None
+
+
+__all__ = ["SingleFlight"]
@@ -1,90 +1,143 @@
 """Web utilities for HTML cleaning and processing."""
 
 import contextlib
+import hashlib
+from collections import OrderedDict
+from functools import lru_cache
 
-from bs4 import BeautifulSoup, Comment
+from bs4 import BeautifulSoup, Comment, Tag
+from bs4.builder import builder_registry
 
+DEFAULT_HTML_PARSER = "html.parser"
 
-def clean_html(html_content: str) -> str:
+_REMOVED_TAGS = frozenset({"script", "style", "noscript", "meta", "link"})
+_CLEAN_HTML_CACHE: OrderedDict[tuple[bytes, str], str] = OrderedDict()
+_CLEAN_HTML_CACHE_SIZE = 256
+
+
+@lru_cache(maxsize=16)
+def _resolve_parser(parser: str) -> str:
+    """``parser`` if BeautifulSoup has a builder for it (e.g. "lxml" when installed), else html.parser."""
+    return parser if builder_registry.lookup(parser) is not None else DEFAULT_HTML_PARSER
+
+
+def _is_hidden(tag: Tag) -> bool:
+    if tag.has_attr("style") and tag["style"]:
+        try:
+            style_lc = tag["style"].lower()
+        except Exception:
+            style_lc = ""
+        if "display: none" in style_lc or "visibility: hidden" in style_lc:
+            return True
+    return tag.has_attr("hidden")
+
+
+def _strip_attributes(tag: Tag) -> None:
+    """Drop inline event handlers and style/id/class attributes."""
+    for attr in [attr for attr in tag.attrs if attr.startswith("on") or attr in ["class", "id", "style"]]:
+        with contextlib.suppress(Exception):
+            del tag[attr]
+
+
+def _clean_tree(soup: BeautifulSoup) -> None:
+    """
+    Clean ``soup`` in place in one depth-first walk.
+
+    Drops scripts/styles/metas/links/noscript, comments and hidden elements (with their
+    subtrees), strips inline events and style/id/class, and finally removes tags that
+    were left with no child elements and only whitespace text. A tag that still had
+    child elements after the first steps is kept even if those children end up removed
+    as empty, exactly like the previous multi-pass version.
+    """
+    # Frames: [node, iterator over its children, whether an element child was kept]
+    stack = [[soup, iter(list(soup.contents)), False]]
+    while stack:
+        frame = stack[-1]
+        child = next(frame[1], None)
+        if child is None:
+            stack.pop()
+            node = frame[0]
+            if node is not soup and not frame[2]:
+                with contextlib.suppress(Exception):
+                    if not node.get_text().strip():
+                        node.decompose()
+            continue
+        if isinstance(child, Comment):
+            with contextlib.suppress(Exception):
+                child.extract()
+            continue
+        if not isinstance(child, Tag):
+            continue
+        try:
+            removed = child.name in _REMOVED_TAGS or _is_hidden(child)
+        except Exception:
+            removed = False
+        if removed:
+            with contextlib.suppress(Exception):
+                child.decompose()
+            continue
+        with contextlib.suppress(Exception):
+            _strip_attributes(child)
+        frame[2] = True
+        stack.append([child, iter(list(child.contents)), False])
+
+
+def clean_html(html_content: str, parser: str = DEFAULT_HTML_PARSER) -> str:
     """
     Removes scripts, styles, hidden tags, inline event handlers, etc.,
     returning a 'clean' version of the DOM.
 
     Used by test generation to create cleaner HTML for validation.
-    This version is exception resistant.
+    This version is exception resistant. Results are memoized by content hash,
+    so the unchanged snapshots of a trajectory are only cleaned once.
 
     Args:
         html_content: Raw HTML string
+        parser: BeautifulSoup parser backend (e.g. "lxml" for speed); falls back to
+            html.parser when the requested one is not installed. Backends may differ
+            slightly in how they repair malformed markup.
 
     Returns:
         Cleaned HTML string with unnecessary elements removed
     """
+    parser = _resolve_parser(parser)
     try:
-        soup = BeautifulSoup(html_content, "html.parser")
-    except Exception:
-        return ""
-
-    # Remove scripts, styles, metas, links, noscript
-    try:
-        for tag in soup(["script", "style", "noscript", "meta", "link"]):
-            with contextlib.suppress(Exception):
-                tag.decompose()
+        key = (hashlib.blake2b(html_content.encode("utf-8", "surrogatepass"), digest_size=16).digest(), parser)
     except Exception:
-        pass
+        key = None
+    if key is not None and key in _CLEAN_HTML_CACHE:
+        _CLEAN_HTML_CACHE.move_to_end(key)
+        return _CLEAN_HTML_CACHE[key]
 
-    # Remove HTML comments
     try:
-        for comment in soup.find_all(string=lambda t: isinstance(t, Comment)):
-            with contextlib.suppress(Exception):
-                comment.extract()
+        soup = BeautifulSoup(html_content, parser)
     except Exception:
-        pass
+        return ""
 
-    # Remove hidden elements and inline events
-    try:
-        for tag in soup.find_all(True):
-            try:
-                if tag.has_attr("style") and tag["style"]:
-                    try:
-                        style_lc = tag["style"].lower()
-                    except Exception:
-                        style_lc = ""
-                    if "display: none" in style_lc or "visibility: hidden" in style_lc:
-                        with contextlib.suppress(Exception):
-                            tag.decompose()
-                        continue
-                if tag.has_attr("hidden"):
-                    with contextlib.suppress(Exception):
-                        tag.decompose()
-                    continue
-                # Remove inline event handlers and style/id/class attributes
-                attrs_to_remove = [attr for attr in tag.attrs if attr.startswith("on") or attr in ["class", "id", "style"]]
-                for attr in attrs_to_remove:
-                    with contextlib.suppress(Exception):
-                        del tag[attr]
-            except Exception:
-                pass
-    except Exception:
-        pass
-
-    # Remove empty tags
-    try:
-        for tag in soup.find_all():
-            try:
-                if not tag.text.strip() and not tag.find_all():
-                    tag.decompose()
-            except Exception:
-                pass
-    except Exception:
-        pass
+    with contextlib.suppress(Exception):
+        _clean_tree(soup)
 
     # Return the cleaned HTML
     try:
         clean_soup = soup.body if soup.body else soup
-        return clean_soup.prettify()
+        cleaned = clean_soup.prettify()
     except Exception:
         return ""
 
+    if key is not None:
+        _CLEAN_HTML_CACHE[key] = cleaned
+        if len(_CLEAN_HTML_CACHE) > _CLEAN_HTML_CACHE_SIZE:
+            _CLEAN_HTML_CACHE.popitem(last=False)
+    return cleaned
+
+
+def html_diff(before: str, after: str) -> str:
+    """Unified diff between two HTML states ("" when they have the same lines)."""
+    import difflib
+
+    diff_generator = difflib.unified_diff(before.splitlines(keepends=True), after.splitlines(keepends=True), lineterm="")
+    return "".join(diff_generator)
+
 
 def generate_html_differences(html_list: list[str]) -> list[str]:
     """
@@ -98,8 +151,6 @@ def generate_html_differences(html_list: list[str]) -> list[str]:
     Returns:
         List with first HTML + diffs between consecutive states
     """
-    import difflib
-
     if not html_list:
         return []
 
@@ -107,10 +158,7 @@ def generate_html_differences(html_list: list[str]) -> list[str]:
     prev_html = html_list[0]
 
     for current_html in html_list[1:]:
-        prev_lines = prev_html.splitlines(keepends=True)
-        current_lines = current_html.splitlines(keepends=True)
-        diff_generator = difflib.unified_diff(prev_lines, current_lines, lineterm="")
-        diff_str = "".join(diff_generator)
+        diff_str = html_diff(prev_html, current_html)
         if diff_str:
             diffs.append(diff_str)
         prev_html = current_html
@@ -1,17 +1,19 @@
 from __future__ import annotations
 
-import base64
+import asyncio
 import json
 import re
+from contextlib import suppress
 from typing import Any
 from urllib.parse import urlparse, urlunparse
 
 import aiohttp
 from loguru import logger
 
-from autoppia_iwa.config.config import DEMO_WEBS_ENDPOINT
+from autoppia_iwa.config.config import DEMO_WEBS_ENDPOINT, HTTP_POOL_KEEPALIVE_EXPIRY_S, HTTP_POOL_MAX_CONNECTIONS
 from autoppia_iwa.src.data_generation.tasks.classes import Task
 from autoppia_iwa.src.execution.actions.actions import BaseAction, NavigateAction
+from autoppia_iwa.src.execution.screenshots import screenshot_data_url
 from autoppia_iwa.src.shared.utils import generate_random_web_agent_id
 from autoppia_iwa.src.web_agents.classes import IWebAgent
 from autoppia_iwa.src.web_agents.protocol import StepRequest, StepResponse, StepToolCall
@@ -63,17 +65,16 @@ class ApifiedWebAgent(IWebAgent):
         self.tools: list[dict[str, Any]] = self._build_tools() if self.send_allowed_tools else []
         self.allowed_tools = self.tools
         self._step_rewrite_page_url: str | None = None
+        self._session: aiohttp.ClientSession | None = None
+        self._session_loop: asyncio.AbstractEventLoop | None = None
 
     @staticmethod
     def _screenshot_for_json(screenshot: str | bytes | None) -> str | None:
-        """PNG bytes cannot be JSON-encoded for /step; use a data URL string."""
+        """Image bytes cannot be JSON-encoded for /step; use a data URL string."""
         if screenshot is None:
             return None
         if isinstance(screenshot, bytes):
-            if not screenshot:
-                return None
-            b64 = base64.b64encode(screenshot).decode("ascii")
-            return f"data:image/png;base64,{b64}"
+            return screenshot_data_url(screenshot)
         s = str(screenshot).strip()
         return s or None
 
@@ -105,32 +106,39 @@ class ApifiedWebAgent(IWebAgent):
         )
         payload = request.model_dump(mode="json", exclude_none=True)
 
-        timeout = aiohttp.ClientTimeout(total=self.timeout)
-        async with aiohttp.ClientSession(timeout=timeout) as session:
-            try:
-                async with session.post(f"{self.base_url}/step", json=payload) as response:
-                    response.raise_for_status()
-                    data: dict[str, Any] | None = None
+        session = self._get_session()
+        try:
+            async with session.post(f"{self.base_url}/step", json=payload) as response:
+                response.raise_for_status()
+                data: dict[str, Any] | None = None
+                try:
+                    parsed_json = await response.json()
+                    if isinstance(parsed_json, dict):
+                        data = parsed_json
+                except Exception:
+                    data = None
+
+                if data is None:
+                    text_payload = await response.text()
                     try:
-                        parsed_json = await response.json()
-                        if isinstance(parsed_json, dict):
-                            data = parsed_json
+                        parsed_text = json.loads(text_payload)
                     except Exception:
-                        data = None
-
-                    if data is None:
-                        text_payload = await response.text()
-                        try:
-                            parsed_text = json.loads(text_payload)
-                        except Exception:
-                            parsed_text = {}
-                        data = parsed_text if isinstance(parsed_text, dict) else {}
-
-                    return self._parse_actions_response(data)
-            except Exception as exc:
-                logger.warning(f"ApifiedWebAgent.step failed: {exc}")
+                        parsed_text = {}
+                    data = parsed_text if isinstance(parsed_text, dict) else {}
+
+                return self._parse_actions_response(data)
+        except Exception as exc:
+            logger.warning(f"ApifiedWebAgent.step failed: {exc}")
         return []
 
+    async def aclose(self) -> None:
+        """Close the pooled /step session; the next step() opens a new one."""
+        session, self._session = self._session, None
+        loop, self._session_loop = self._session_loop, None
+        if session is not None and loop is asyncio.get_running_loop():
+            with suppress(Exception):
+                await session.close()
+
     async def act(self, **kwargs) -> list[BaseAction]:
         """Backward-compatible alias for local callers; HTTP contract is /step."""
         return await self.step(**kwargs)
@@ -141,6 +149,38 @@ class ApifiedWebAgent(IWebAgent):
     # ------------------------------------------------------------------ #
     # Helpers
     # ------------------------------------------------------------------ #
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Keep-alive session shared by every step of this agent, rebuilt per event loop."""
+        loop = asyncio.get_running_loop()
+        if self._session is None or self._session.closed or self._session_loop is not loop:
+            if self._session is not None and self._session_loop is not loop:
+                self._release_stale_session(self._session, self._session_loop)
+            connector = aiohttp.TCPConnector(
+                limit=HTTP_POOL_MAX_CONNECTIONS,
+                limit_per_host=HTTP_POOL_MAX_CONNECTIONS,
+                keepalive_timeout=HTTP_POOL_KEEPALIVE_EXPIRY_S,
+            )
+            self._session = aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=self.timeout), connector=connector)
+            self._session_loop = loop
+        return self._session
+
+    @staticmethod
+    def _release_stale_session(session: aiohttp.ClientSession, loop: asyncio.AbstractEventLoop | None) -> None:
+        """Close a session left behind by another event loop so its pooled connections are not leaked."""
+        if session.closed:
+            return
+        if loop is not None and loop.is_running():
+            # Still serving another thread: close it on its own loop
+            asyncio.run_coroutine_threadsafe(session.close(), loop)
+            return
+        # Nothing can await the close on a finished loop: detach, then close the pooled
+        # transports synchronously (what the connector's finalizer does, without the warning)
+        connector = session.connector
+        session.detach()
+        if connector is not None:
+            with suppress(Exception):
+                connector._close()
+
     def _cache_parsed_response(self, parsed: StepResponse) -> None:
         self.last_act_response = parsed.model_dump(mode="json", exclude_none=True)
         self.last_reasoning = self._strip_optional_text(parsed.reasoning, allow_empty=True)
@@ -105,6 +105,9 @@ class IWebAgent(ABC):
         """
         pass
 
+    async def aclose(self) -> None:  # noqa: B027
+        """Release network resources held by the agent. No-op by default."""
+
 
 class BaseAgent(IWebAgent):
     """Helper base class with common agent functionality."""
@@ -162,21 +162,36 @@ def _resolved_lookup_keys(raw: str) -> list[str]:
     return [normalized] if normalized is not None else []
 
 
+_EPISODE_FILE_SUFFIXES = (".json", ".jsonl", ".jsonl.gz", ".jsonl.zst")
+
+
 def _episode_file_map(trace_dir: Path) -> dict[str, Path]:
-    """Allow episode file access only for direct *.json children discovered on disk."""
+    """Allow episode file access only for episode files discovered on disk (top level or ``episodes/``)."""
     out: dict[str, Path] = {}
-    for candidate in trace_dir.glob("*.json"):
-        if candidate.name == "trace_index.json":
-            continue
-        resolved = _resolved_if_valid(candidate)
-        if resolved is None:
-            continue
-        if resolved.parent != trace_dir:
+    for folder, prefix in ((trace_dir, ""), (trace_dir / "episodes", "episodes/")):
+        if not folder.is_dir():
             continue
-        out[candidate.name] = resolved
+        for candidate in folder.iterdir():
+            if candidate.name in ("trace_index.json", "trace_index.jsonl") or not candidate.name.endswith(_EPISODE_FILE_SUFFIXES):
+                continue
+            resolved = _resolved_if_valid(candidate)
+            if resolved is None:
+                continue
+            if resolved.parent != folder.resolve():
+                continue
+            out[f"{prefix}{candidate.name}"] = resolved
     return out
 
 
+def _load_episode_file(path: Path, trace_dir: Path, *, inline_blobs: bool = True) -> dict[str, Any]:
+    """Load a legacy JSON episode or a streamed JSONL episode (HTML/screenshots inlined from blobs)."""
+    if path.suffix == ".json":
+        return _load_json(path)
+    from autoppia_iwa.src.evaluation.benchmark.trace_writer import load_episode
+
+    return load_episode(path, trace_dir, inline_blobs=inline_blobs)
+
+
 def _resolve_trace_dir(raw: str | None = None) -> Path:
     value = str(raw if raw is not None else DEFAULT_TRACE_DIR or "").strip()
     if not value or "\x00" in value:
@@ -241,7 +256,7 @@ def _scan_trace_dirs() -> list[dict[str, Any]]:
         for idx_path in root.rglob("trace_index.json"):
             trace_dir = idx_path.parent.resolve()
             with contextlib.suppress(Exception):
-                idx = _load_json(idx_path)
+                idx = _load_trace_index(trace_dir)
                 episodes = idx.get("episodes") if isinstance(idx.get("episodes"), list) else []
                 items.append(
                     {
@@ -260,8 +275,16 @@ def _scan_trace_dirs() -> list[dict[str, Any]]:
 # ── Trace loading ───────────────────────────────────────────────────────
 
 
+def _load_trace_index(trace_dir: Path) -> dict[str, Any]:
+    # Live runs keep their episode list in trace_index.jsonl until the writer flushes
+    from autoppia_iwa.src.evaluation.benchmark.trace_writer import load_trace_index
+
+    idx = load_trace_index(trace_dir)
+    return idx if isinstance(idx, dict) else {}
+
+
 def _load_trace_bundle(trace_dir: Path) -> dict[str, Any]:
-    idx = _load_json(trace_dir / "trace_index.json")
+    idx = _load_trace_index(trace_dir)
     raw_episodes = idx.get("episodes") if isinstance(idx.get("episodes"), list) else []
     episode_files = _episode_file_map(trace_dir)
     episodes = []
@@ -281,7 +304,7 @@ def _load_trace_bundle(trace_dir: Path) -> dict[str, Any]:
         }
         if ep_file is not None:
             with contextlib.suppress(Exception):
-                ep = _load_json(ep_file)
+                ep = _load_episode_file(ep_file, trace_dir, inline_blobs=False)
                 meta = ep.get("episode") if isinstance(ep.get("episode"), dict) else {}
                 summary["task_seconds"] = float(meta.get("task_seconds") or meta.get("evaluation_time") or 0.0)
                 summary["llm_calls"] = int(meta.get("llm_calls") or 0)
@@ -336,7 +359,7 @@ def _load_episode(trace_dir: Path, episode_task_id: str) -> dict[str, Any]:
         path = episode_files.get(file_name)
         if path is None:
             raise HTTPException(status_code=404, detail=f"episode_file_not_found:{episode_task_id}")
-        payload = _load_json(path)
+        payload = _load_episode_file(path, trace_dir)
         steps = payload.get("steps") if isinstance(payload.get("steps"), list) else []
         annotated = [_annotate_step(s) for s in steps if isinstance(s, dict)]
         payload["steps"] = annotated
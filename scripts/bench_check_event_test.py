@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""
+Microbenchmark: cost of one CheckEventTest check against a long event history.
+
+Compares a cold check (registry rebuilt, every BackendEvent parsed, criteria compiled)
+with the warm path used when the same history is scored again step after step.
+
+  PYTHONPATH=. python scripts/bench_check_event_test.py --events 5000 --repeats 20
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--events", type=int, default=5000, help="Number of backend events in the history")
+    parser.add_argument("--repeats", type=int, default=20, help="Checks to time per scenario")
+    args = parser.parse_args()
+
+    from autoppia_iwa.src.data_generation.tests.classes import CheckEventTest
+    from autoppia_iwa.src.demo_webs.base_events import Event, get_backend_event_types
+    from autoppia_iwa.src.demo_webs.classes import BackendEvent
+
+    def make_history() -> list[BackendEvent]:
+        history = [BackendEvent(event_name="SEARCH_BOOK", data={"query": f"book {i}"}, web_agent_id="1", timestamp="2025-01-01T00:00:00") for i in range(args.events - 1)]
+        history.append(BackendEvent(event_name="LOGIN_BOOK", data={"username": "user1"}, web_agent_id="1", timestamp="2025-01-01T00:00:00"))
+        return history
+
+    def check(test: CheckEventTest, history: list[BackendEvent]) -> bool:
+        return test.match_events(Event.parse_all(history)) is True
+
+    cold = 0.0
+    for _ in range(args.repeats):
+        history = make_history()
+        test = CheckEventTest(event_name="LOGIN_BOOK", event_criteria={"username": "<username>"})
+        get_backend_event_types.cache_clear()
+        started = time.perf_counter()
+        assert check(test, history)
+        cold += time.perf_counter() - started
+
+    history = make_history()
+    test = CheckEventTest(event_name="LOGIN_BOOK", event_criteria={"username": "<username>"})
+    check(test, history)
+    warm = 0.0
+    for _ in range(args.repeats):
+        started = time.perf_counter()
+        assert check(test, history)
+        warm += time.perf_counter() - started
+
+    cold_ms = cold / args.repeats * 1000
+    warm_ms = warm / args.repeats * 1000
+    print(f"events={args.events} repeats={args.repeats}")
+    print(f"cold check: {cold_ms:8.3f} ms")
+    print(f"warm check: {warm_ms:8.3f} ms  ({cold_ms / warm_ms:.1f}x faster)")
+
+
+if __name__ == "__main__":
+    main()
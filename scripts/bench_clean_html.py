@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+"""
+Microbenchmark: ``clean_html`` (single tree walk, memoized, pluggable parser) vs the
+previous multi-pass implementation, on real demo-web pages.
+
+Pages come from saved snapshots (``--pages`` files or directories of *.html) and/or live
+demo webs (``--url``, e.g. a running frontend). Every page is first checked to clean to
+exactly the same output as the previous implementation with html.parser; then each
+variant is timed. "cold" clears the memo cache before every call, "memoized" repeats
+the same snapshot as a trajectory of unchanged states would.
+
+  PYTHONPATH=. python scripts/bench_clean_html.py --url http://localhost:8000 --url http://localhost:8001/books
+  PYTHONPATH=. python scripts/bench_clean_html.py --pages snapshots/ --parser lxml --repeats 50
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import sys
+import time
+import urllib.request
+from pathlib import Path
+
+from bs4 import BeautifulSoup, Comment
+
+
+def reference_clean_html(html_content: str) -> str:
+    """Multi-pass html.parser implementation ``clean_html`` replaced (kept verbatim)."""
+    try:
+        soup = BeautifulSoup(html_content, "html.parser")
+    except Exception:
+        return ""
+
+    # Remove scripts, styles, metas, links, noscript
+    try:
+        for tag in soup(["script", "style", "noscript", "meta", "link"]):
+            with contextlib.suppress(Exception):
+                tag.decompose()
+    except Exception:
+        pass
+
+    # Remove HTML comments
+    try:
+        for comment in soup.find_all(string=lambda t: isinstance(t, Comment)):
+            with contextlib.suppress(Exception):
+                comment.extract()
+    except Exception:
+        pass
+
+    # Remove hidden elements and inline events
+    try:
+        for tag in soup.find_all(True):
+            try:
+                if tag.has_attr("style") and tag["style"]:
+                    try:
+                        style_lc = tag["style"].lower()
+                    except Exception:
+                        style_lc = ""
+                    if "display: none" in style_lc or "visibility: hidden" in style_lc:
+                        with contextlib.suppress(Exception):
+                            tag.decompose()
+                        continue
+                if tag.has_attr("hidden"):
+                    with contextlib.suppress(Exception):
+                        tag.decompose()
+                    continue
+                # Remove inline event handlers and style/id/class attributes
+                attrs_to_remove = [attr for attr in tag.attrs if attr.startswith("on") or attr in ["class", "id", "style"]]
+                for attr in attrs_to_remove:
+                    with contextlib.suppress(Exception):
+                        del tag[attr]
+            except Exception:
+                pass
+    except Exception:
+        pass
+
+    # Remove empty tags
+    try:
+        for tag in soup.find_all():
+            try:
+                if not tag.text.strip() and not tag.find_all():
+                    tag.decompose()
+            except Exception:
+                pass
+    except Exception:
+        pass
+
+    # Return the cleaned HTML
+    try:
+        clean_soup = soup.body if soup.body else soup
+        return clean_soup.prettify()
+    except Exception:
+        return ""
+
+
+def _load_pages(paths: list[str], urls: list[str]) -> dict[str, str]:
+    pages: dict[str, str] = {}
+    for raw in paths:
+        path = Path(raw)
+        for file in sorted(path.rglob("*.html")) if path.is_dir() else [path]:
+            pages[str(file)] = file.read_text(encoding="utf-8", errors="replace")
+    for url in urls:
+        with urllib.request.urlopen(url, timeout=30) as response:
+            pages[url] = response.read().decode("utf-8", errors="replace")
+    return pages
+
+
+def _time_per_call(fn, pages: list[str], repeats: int, before_call=None, consecutive: bool = False) -> float:
+    # consecutive: each page is cleaned ``repeats`` times in a row, like the unchanged states of a trajectory
+    calls = [html for html in pages for _ in range(repeats)] if consecutive else pages * repeats
+    started = time.perf_counter()
+    for html in calls:
+        if before_call is not None:
+            before_call()
+        fn(html)
+    return (time.perf_counter() - started) / len(calls)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--pages", action="append", default=[], help="HTML snapshot file or directory (repeatable)")
+    parser.add_argument("--url", action="append", default=[], help="Live demo-web page to fetch (repeatable)")
+    parser.add_argument("--parser", default="lxml", help="Faster backend to time as well (falls back to html.parser if missing)")
+    parser.add_argument("--repeats", type=int, default=20, help="Passes over all pages per variant")
+    args = parser.parse_args()
+
+    from autoppia_iwa.src.shared import web_utils
+    from autoppia_iwa.src.shared.web_utils import _resolve_parser, clean_html
+
+    pages = _load_pages(args.pages, args.url)
+    if not pages:
+        parser.error("no pages: pass --pages and/or --url")
+
+    mismatches = [name for name, html in pages.items() if clean_html(html) != reference_clean_html(html)]
+    total_kb = sum(len(html) for html in pages.values()) / 1024
+    print(f"pages={len(pages)} ({total_kb:.0f} KiB) repeats={args.repeats} output identical to previous implementation: {len(pages) - len(mismatches)}/{len(pages)}")
+    for name in mismatches:
+        print(f"  MISMATCH: {name}")
+
+    htmls = list(pages.values())
+    clear_cache = web_utils._CLEAN_HTML_CACHE.clear
+    fast_parser = _resolve_parser(args.parser)
+    baseline = _time_per_call(reference_clean_html, htmls, args.repeats)
+    rows = [
+        ("previous (html.parser, multi-pass)", baseline),
+        ("single pass (html.parser), cold", _time_per_call(clean_html, htmls, args.repeats, clear_cache)),
+        (f"single pass ({fast_parser}), cold", _time_per_call(lambda html: clean_html(html, parser=fast_parser), htmls, args.repeats, clear_cache)),
+        ("single pass, memoized", _time_per_call(clean_html, htmls, args.repeats, consecutive=True)),
+    ]
+    for label, per_call in rows:
+        print(f"{label:<40} {per_call * 1000:9.3f} ms/page  ({baseline / per_call:6.1f}x)")
+    if mismatches:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
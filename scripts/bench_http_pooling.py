@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+Load test: per-request HTTP clients vs the pooled clients used by LLM providers and ApifiedWebAgent.
+
+Starts a local aiohttp echo server, fires ``--requests`` calls with ``--concurrency`` in
+flight, and reports how many TCP connections the server accepted plus p50/p99 latency.
+
+  PYTHONPATH=. python scripts/bench_http_pooling.py --requests 2000 --concurrency 32
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import statistics
+import time
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=2000, help="Requests per scenario")
+    parser.add_argument("--concurrency", type=int, default=32, help="Requests in flight")
+    args = parser.parse_args()
+
+    import aiohttp
+    import httpx
+    from aiohttp import web
+
+    from autoppia_iwa.src.data_generation.tasks.classes import Task
+    from autoppia_iwa.src.llms.interfaces import LLMConfig
+    from autoppia_iwa.src.llms.providers.local import LocalLLMService
+    from autoppia_iwa.src.web_agents.apified_web_agent import ApifiedWebAgent
+
+    # Distinct client (host, port) pairs seen by the server = TCP connections opened.
+    peers: set[tuple] = set()
+
+    async def echo(request: web.Request) -> web.Response:
+        peers.add(request.transport.get_extra_info("peername"))
+        return web.json_response({"output": "ok", "actions": []})
+
+    app = web.Application()
+    app.router.add_post("/generate", echo)
+    app.router.add_post("/step", echo)
+    app_runner = web.AppRunner(app)
+    await app_runner.setup()
+    site = web.TCPSite(app_runner, "127.0.0.1", 0)
+    await site.start()
+    base = f"http://127.0.0.1:{site._server.sockets[0].getsockname()[1]}"
+    messages = [{"role": "user", "content": "ping"}]
+    task = Task(url="https://example.com", prompt="P", web_project_id="dummy")
+
+    async def per_request_httpx() -> None:
+        async with httpx.AsyncClient(timeout=120.0) as client:
+            (await client.post(f"{base}/generate", json={"messages": messages})).raise_for_status()
+
+    async def per_request_aiohttp() -> None:
+        async with aiohttp.ClientSession() as session, session.post(f"{base}/step", json={}) as response:
+            response.raise_for_status()
+
+    llm = LocalLLMService(LLMConfig(model="local"), endpoint_url=f"{base}/generate")
+    agent = ApifiedWebAgent(base_url=base)
+
+    async def pooled_llm() -> None:
+        await llm.async_predict(messages)
+
+    async def pooled_agent() -> None:
+        await agent.step(task=task, html="", url="http://localhost:8000/", step_index=0)
+
+    async def run(name: str, call) -> None:
+        peers.clear()
+        semaphore = asyncio.Semaphore(args.concurrency)
+        latencies: list[float] = []
+
+        async def one() -> None:
+            async with semaphore:
+                started = time.perf_counter()
+                await call()
+                latencies.append((time.perf_counter() - started) * 1000)
+
+        started = time.perf_counter()
+        await asyncio.gather(*(one() for _ in range(args.requests)))
+        elapsed = time.perf_counter() - started
+        cuts = statistics.quantiles(latencies, n=100)
+        print(f"{name:<28} connections={len(peers):>5}  p50={cuts[49]:6.2f}ms  p99={cuts[98]:6.2f}ms  throughput={args.requests / elapsed:8.0f} req/s")
+
+    try:
+        await run("httpx per-request client", per_request_httpx)
+        await run("LLM provider (pooled)", pooled_llm)
+        await run("aiohttp per-request session", per_request_aiohttp)
+        await run("ApifiedWebAgent (pooled)", pooled_agent)
+    finally:
+        await llm.aclose()
+        await agent.aclose()
+        await app_runner.cleanup()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
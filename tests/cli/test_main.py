@@ -34,6 +34,7 @@ def test_cli_main_dash_help_prints_command_help(capsys):
         ("benchmark", "autoppia_iwa.entrypoints.benchmark.run.main"),
         ("generate-tasks", "autoppia_iwa.entrypoints.generate_tasks.run.main"),
         ("verify", "autoppia_iwa.entrypoints.web_verification.run.main"),
+        ("replay", "autoppia_iwa.entrypoints.replay.run.main"),
         ("debug", "modules.debugger.server.main"),
     ],
 )
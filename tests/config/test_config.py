@@ -77,3 +77,17 @@ class TestConfigValidation:
             assert reloaded.HAS_CHUTES_CREDENTIALS is False
 
         importlib.reload(config_module)
+
+    def test_disk_caches_default_to_user_cache_dir(self, tmp_path):
+        import autoppia_iwa.config.config as config_module
+
+        env = {"XDG_CACHE_HOME": str(tmp_path), "IWA_CACHE_DIR": "", "DATASET_CACHE_DIR": "", "LLM_CACHE_PATH": ""}
+        with patch.dict(os.environ, env, clear=False):
+            os.environ.pop("DATASET_CACHE_DIR")
+            os.environ.pop("LLM_CACHE_PATH")
+            reloaded = importlib.reload(config_module)
+            assert Path(reloaded.DATASET_CACHE_DIR) == tmp_path / "autoppia_iwa" / "datasets"
+            assert not Path(reloaded.DATASET_CACHE_DIR).is_relative_to(reloaded.PROJECT_BASE_DIR.parent)
+            assert Path(reloaded.LLM_CACHE_PATH) == tmp_path / "autoppia_iwa" / "llm" / "responses.sqlite3"
+
+        importlib.reload(config_module)
@@ -0,0 +1,79 @@
+"""Tests for the cached event registry, parsed-event memoization and compiled CheckEventTest criteria."""
+
+from unittest.mock import patch
+
+from autoppia_iwa.src.data_generation.tests.classes import CheckEventTest
+from autoppia_iwa.src.demo_webs.base_events import Event, get_backend_event_types
+from autoppia_iwa.src.demo_webs.classes import BackendEvent
+from autoppia_iwa.src.demo_webs.projects.p02_autobooks.events import LoginEvent, SearchBookEvent
+
+
+def _login(agent: str, username: str) -> BackendEvent:
+    return BackendEvent(event_name="LOGIN_BOOK", data={"username": username}, web_agent_id=agent, timestamp="2025-01-01T00:00:00")
+
+
+def test_backend_event_types_built_once():
+    types = get_backend_event_types()
+    assert types is get_backend_event_types()
+    assert types["LOGIN_BOOK"] is LoginEvent
+    assert types["SEARCH_BOOK"] is SearchBookEvent
+
+
+def test_parse_all_memoizes_typed_event_per_backend_event():
+    event = _login("1", "user1")
+
+    with patch.object(LoginEvent, "parse", wraps=LoginEvent.parse) as parse:
+        first = Event.parse_all([event])
+        second = Event.parse_all([event, _login("1", "user1")])
+
+    assert isinstance(first[0], LoginEvent)
+    assert second[0] is first[0]
+    assert parse.call_count == 2
+
+
+def test_parse_all_unknown_event_falls_back_to_base_event():
+    parsed = Event.parse_all([BackendEvent(event_name="NOT_A_REAL_EVENT", web_agent_id="1")])
+    assert type(parsed[0]) is Event
+
+
+def test_parsed_event_cache_is_not_serialized():
+    event = _login("1", "user1")
+    Event.parse_all([event])
+    assert "_parsed_event" not in event.model_dump()
+
+
+def test_check_event_test_compiles_criteria_once():
+    test = CheckEventTest(event_name="LOGIN_BOOK", event_criteria={"username": "user1"})
+    events = Event.parse_all([_login("1", f"user{i}") for i in range(50)])
+
+    with patch.object(LoginEvent, "ValidationCriteria", wraps=LoginEvent.ValidationCriteria) as criteria_model:
+        assert test.match_events(events) is True
+        assert test.match_events(events) is True
+
+    assert criteria_model.call_count == 1
+
+
+def test_check_event_test_resolves_placeholders_per_agent():
+    test = CheckEventTest(event_name="LOGIN_BOOK", event_criteria={"username": "<username>"})
+
+    assert test.match_events(Event.parse_all([_login("7", "user7")])) is True
+    # A different agent must not see the placeholder already resolved for agent 7.
+    assert test.match_events(Event.parse_all([_login("8", "user8")])) is True
+    assert test.match_events(Event.parse_all([_login("8", "user7")])) is None
+
+
+def test_check_event_test_recompiles_when_criteria_reassigned():
+    test = CheckEventTest(event_name="LOGIN_BOOK", event_criteria={"username": "user1"})
+    events = Event.parse_all([_login("1", "user2")])
+
+    assert test.match_events(events) is None
+    test.event_criteria = {"username": "user2"}
+    assert test.match_events(events) is True
+
+
+def test_check_event_test_invalid_criteria_stays_false():
+    test = CheckEventTest(event_name="LOGIN_BOOK", event_criteria={"username": {"not": "valid"}})
+    events = Event.parse_all([_login("1", "user1")])
+
+    assert test.match_events(events) is False
+    assert test.match_events(events) is False
@@ -0,0 +1,73 @@
+"""Tests for the lazy demo web project registry in demo_webs.config."""
+
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+from autoppia_iwa.src.demo_webs.config import LazyProjectRegistry, demo_web_projects, index_projects_by_id
+
+_IMPORT_PROBE = """
+import json, sys, time
+started = time.perf_counter()
+import autoppia_iwa.src.demo_webs.config as config
+elapsed = time.perf_counter() - started
+loaded = sorted(name for name in sys.modules if name.startswith("autoppia_iwa.src.demo_webs.projects."))
+from autoppia_iwa.src.demo_webs.projects.autobooks_2 import main as legacy_main
+print(json.dumps({"elapsed": elapsed, "loaded": loaded, "count": len(config.demo_web_projects), "legacy": legacy_main.autobooks_project.id}))
+"""
+
+
+def _registry() -> LazyProjectRegistry:
+    return LazyProjectRegistry(list(demo_web_projects._specs))
+
+
+def test_importing_config_is_fast_and_loads_no_project():
+    # An unroutable endpoint makes any network access at import time blow the budget.
+    env = {**os.environ, "DEMO_WEBS_ENDPOINT": "http://10.255.255.1"}
+    result = subprocess.run([sys.executable, "-c", _IMPORT_PROBE], capture_output=True, text=True, env=env, timeout=60, check=True)
+    report = json.loads(result.stdout.strip().splitlines()[-1])
+
+    assert report["elapsed"] < 0.3
+    assert report["loaded"] == []
+    assert report["count"] == 15
+    assert report["legacy"] == "autobooks"
+
+
+def test_registry_imports_only_the_requested_project():
+    registry = _registry()
+
+    assert len(registry) == 15
+    assert registry.ids()[:2] == ["autocinema", "autobooks"]
+    assert registry.loaded_ids() == []
+
+    project = registry.get("autobooks")
+    assert project.id == "autobooks"
+    assert registry.loaded_ids() == ["autobooks"]
+    assert registry[1] is project
+    assert registry.get("missing") is None
+
+
+def test_registry_behaves_like_an_ordered_list():
+    registry = _registry()
+
+    assert [project.id for project in registry] == registry.ids()
+    assert [project.id for project in registry[:2]] == ["autocinema", "autobooks"]
+    assert registry[-1].id == "autostats"
+
+
+def test_index_projects_by_id_is_lazy_for_registry_and_plain_for_lists():
+    registry = _registry()
+    by_id = index_projects_by_id(registry)
+
+    assert "autozone" in by_id
+    assert registry.loaded_ids() == []
+    assert by_id["autozone"].id == "autozone"
+    assert registry.loaded_ids() == ["autozone"]
+    with pytest.raises(KeyError):
+        by_id["missing"]
+
+    project = registry.get("autozone")
+    assert index_projects_by_id([project]) == {"autozone": project}
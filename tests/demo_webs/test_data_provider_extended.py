@@ -1,10 +1,12 @@
 from __future__ import annotations
 
+import asyncio
 from unittest.mock import AsyncMock
 
 import pytest
 
 from autoppia_iwa.src.demo_webs import data_provider
+from autoppia_iwa.src.demo_webs.dataset_cache import DatasetCache
 
 
 class _FakeResponse:
@@ -96,6 +98,26 @@ async def test_load_dataset_data_returns_empty_when_request_raises(monkeypatch):
     assert result == []
 
 
+@pytest.mark.asyncio
+async def test_load_dataset_data_collapses_concurrent_misses_and_persists_by_version(monkeypatch, tmp_path):
+    monkeypatch.setattr(data_provider, "_ASYNC_CACHE", DatasetCache(max_bytes=1_000_000, cache_dir=tmp_path))
+    session = _FakeSession(response=_FakeResponse({"data": [{"id": 7}]}))
+    monkeypatch.setattr(data_provider, "_get_async_session", lambda: session)
+    kwargs = {"backend_url": "http://example.com/", "project_key": "proj", "entity_type": "films", "seed_value": 12, "version": "1.0.0"}
+
+    results = await asyncio.gather(*(data_provider.load_dataset_data(**kwargs) for _ in range(4)))
+
+    assert results == [[{"id": 7}]] * 4
+    assert len(session.calls) == 1
+    assert len(list(tmp_path.glob("1.0.0/*.json"))) == 1
+
+    # A new process (empty memory tier) with a different backend host reuses the disk entry.
+    monkeypatch.setattr(data_provider, "_ASYNC_CACHE", DatasetCache(max_bytes=1_000_000, cache_dir=tmp_path))
+    assert await data_provider.load_dataset_data(**{**kwargs, "backend_url": "http://other:9000/"}) == [{"id": 7}]
+    assert len(session.calls) == 1
+    assert data_provider.get_dataset_cache_metrics()["disk_hits"] == 1
+
+
 @pytest.mark.asyncio
 async def test_close_async_session_closes_and_resets_session():
     session = type("Session", (), {"closed": False, "close": AsyncMock()})()
@@ -0,0 +1,166 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+import time
+
+import pytest
+
+from autoppia_iwa.src.demo_webs.dataset_cache import DatasetCache
+
+
+def _payload(n: int, width: int = 10) -> list[dict]:
+    return [{"id": i, "name": "x" * width} for i in range(n)]
+
+
+def _loader(data, calls: list):
+    async def load():
+        calls.append(1)
+        await asyncio.sleep(0)
+        return data
+
+    return load
+
+
+def test_memory_tier_evicts_least_recently_used_by_bytes():
+    item_size = len(json.dumps(_payload(2)))
+    cache = DatasetCache(max_bytes=item_size * 2)
+
+    cache["a"] = _payload(2)
+    cache["b"] = _payload(2)
+    assert cache["a"] == _payload(2)  # "a" becomes most recently used
+    cache["c"] = _payload(2)
+
+    assert "a" in cache and "c" in cache
+    assert "b" not in cache
+    assert cache.metrics.evictions == 1
+    assert cache.memory_bytes == item_size * 2
+
+
+def test_payload_larger_than_budget_is_not_kept_in_memory():
+    cache = DatasetCache(max_bytes=10)
+    cache["big"] = _payload(5)
+    assert len(cache) == 0
+    assert cache.memory_bytes == 0
+
+
+@pytest.mark.asyncio
+async def test_concurrent_misses_share_one_load():
+    cache = DatasetCache(max_bytes=1_000_000)
+    calls: list = []
+    loader = _loader(_payload(3), calls)
+
+    results = await asyncio.gather(*(cache.get_or_load("k", loader) for _ in range(5)))
+
+    assert calls == [1]
+    assert all(result == _payload(3) for result in results)
+    assert cache.metrics.misses == 1
+    assert cache.metrics.coalesced == 4
+
+    assert await cache.get_or_load("k", loader) == _payload(3)
+    assert cache.metrics.memory_hits == 1
+
+
+@pytest.mark.asyncio
+async def test_cancelled_first_caller_does_not_cancel_coalesced_callers():
+    cache = DatasetCache(max_bytes=1_000_000)
+    gate, calls = asyncio.Event(), []
+
+    async def load():
+        calls.append(1)
+        await gate.wait()
+        return _payload(3)
+
+    leader = asyncio.create_task(cache.get_or_load("k", load))
+    await asyncio.sleep(0)
+    follower = asyncio.create_task(cache.get_or_load("k", load))
+    await asyncio.sleep(0)
+    leader.cancel()
+    await asyncio.sleep(0)
+    gate.set()
+
+    assert await follower == _payload(3)
+    assert leader.cancelled()
+    assert calls == [1]
+    assert cache.metrics.coalesced == 1
+    assert "k" in cache
+
+
+@pytest.mark.asyncio
+async def test_failed_load_is_not_cached():
+    cache = DatasetCache(max_bytes=1_000_000)
+    calls: list = []
+
+    assert await cache.get_or_load("k", _loader(None, calls)) is None
+    assert await cache.get_or_load("k", _loader(None, calls)) is None
+    assert len(calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_disk_tier_survives_new_process_and_is_partitioned_by_version(tmp_path):
+    disk_key = ("web_1_autocinema", "movies", 7, 50, "select", None, None)
+    calls: list = []
+    first = DatasetCache(max_bytes=1_000_000, cache_dir=tmp_path)
+    await first.get_or_load("k", _loader(_payload(3), calls), disk_key=disk_key, version="1.0.0")
+    assert first.disk_path(disk_key, "1.0.0").exists()
+
+    # A fresh cache (new process) reads the payload back without loading.
+    second = DatasetCache(max_bytes=1_000_000, cache_dir=tmp_path)
+    result = await second.get_or_load("k", _loader(_payload(1), calls), disk_key=disk_key, version="1.0.0")
+    assert result == _payload(3)
+    assert second.metrics.disk_hits == 1
+    assert len(calls) == 1
+
+    # A new web version misses the disk tier.
+    third = DatasetCache(max_bytes=1_000_000, cache_dir=tmp_path)
+    result = await third.get_or_load("k", _loader(_payload(1), calls), disk_key=disk_key, version="2.0.0")
+    assert result == _payload(1)
+    assert len(calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_disk_tier_requires_version_and_ignores_corrupt_files(tmp_path):
+    disk_key = ("proj", "films", 1, 50, "select", None, None)
+    calls: list = []
+    cache = DatasetCache(max_bytes=1_000_000, cache_dir=tmp_path)
+
+    await cache.get_or_load("k", _loader(_payload(1), calls), disk_key=disk_key, version=None)
+    assert list(tmp_path.iterdir()) == []
+
+    path = cache.disk_path(disk_key, "1.0.0")
+    path.parent.mkdir(parents=True)
+    path.write_text("{not json", encoding="utf-8")
+    fresh = DatasetCache(max_bytes=1_000_000, cache_dir=tmp_path)
+    result = await fresh.get_or_load("k", _loader(_payload(2), calls), disk_key=disk_key, version="1.0.0")
+
+    assert result == _payload(2)
+    assert fresh.metrics.disk_errors == 1
+    assert json.loads(path.read_text(encoding="utf-8")) == _payload(2)
+
+
+@pytest.mark.asyncio
+async def test_disk_tier_evicts_least_recently_used_files_over_its_budget(tmp_path):
+    item_size = len(json.dumps(_payload(20)))
+    calls: list = []
+    cache = DatasetCache(max_bytes=1_000_000, cache_dir=tmp_path, max_disk_bytes=item_size * 2)
+    keys = {name: ("proj", name, 1, 50, "select", None, None) for name in ("old", "used", "new")}
+
+    await cache.get_or_load("old", _loader(_payload(20), calls), disk_key=keys["old"], version="1.0.0")
+    await cache.get_or_load("used", _loader(_payload(20), calls), disk_key=keys["used"], version="2.0.0")
+    for age, name in enumerate(("old", "used"), start=1):  # "used" is the oldest file on disk
+        path = cache.disk_path(keys[name], "2.0.0" if name == "used" else "1.0.0")
+        os.utime(path, (time.time() - 100 * age, time.time() - 100 * age))
+    # A disk hit (fresh process) makes "used" the most recently used file
+    reader = DatasetCache(max_bytes=1_000_000, cache_dir=tmp_path)
+    await reader.get_or_load("used", _loader(None, calls), disk_key=keys["used"], version="2.0.0")
+    assert reader.metrics.disk_hits == 1
+
+    await cache.get_or_load("new", _loader(_payload(20), calls), disk_key=keys["new"], version="2.0.0")
+
+    assert not cache.disk_path(keys["old"], "1.0.0").exists()
+    assert not (tmp_path / "1.0.0").exists()
+    assert cache.disk_path(keys["used"], "2.0.0").exists()
+    assert cache.disk_path(keys["new"], "2.0.0").exists()
+    assert cache.metrics.disk_evictions == 1
+    assert sum(path.stat().st_size for path in tmp_path.glob("*/*.json")) <= item_size * 2
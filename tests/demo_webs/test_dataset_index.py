@@ -0,0 +1,126 @@
+"""Unit tests for demo_webs.dataset_index: indexed matching must agree with the row-by-row check."""
+
+import random
+
+import pytest
+
+from autoppia_iwa.src.demo_webs.criterion_helper import ComparisonOperator
+from autoppia_iwa.src.demo_webs.dataset_cache import DatasetCache
+from autoppia_iwa.src.demo_webs.dataset_index import DatasetIndex, get_dataset_index
+from autoppia_iwa.src.demo_webs.shared_utils import constraints_exist_in_db, item_matches_all_constraints
+
+NAMES = ["Dune", "dune.", "The Hobbit", "Hobbit, The", "Emma", "EMMA", "It", ""]
+GENRES = ["Drama", "sci-fi", "Comedy.", "drama"]
+
+# Operators whose row-by-row check never raises for the values each field can hold
+FIELD_OPERATORS = {
+    "name": list(ComparisonOperator),
+    "year": list(ComparisonOperator),
+    "price": [op for op in ComparisonOperator if op not in (ComparisonOperator.CONTAINS, ComparisonOperator.NOT_CONTAINS)],
+    "genres": [ComparisonOperator.CONTAINS, ComparisonOperator.NOT_CONTAINS, ComparisonOperator.EQUALS, ComparisonOperator.NOT_EQUALS],
+    "available": [ComparisonOperator.EQUALS, ComparisonOperator.NOT_EQUALS, ComparisonOperator.IN_LIST, ComparisonOperator.NOT_IN_LIST],
+    "code": [ComparisonOperator.EQUALS, ComparisonOperator.NOT_EQUALS, ComparisonOperator.IN_LIST, ComparisonOperator.NOT_IN_LIST],
+}
+
+
+def _record(rng: random.Random) -> dict:
+    record = {
+        "name": rng.choice(NAMES),
+        "year": rng.choice([1990, 2001, 2001, 2015, None]),
+        "price": rng.choice([9.99, 10, 10.0, 25.5, None]),
+        "genres": rng.sample(GENRES, rng.randint(0, 3)),
+        "available": rng.choice([True, False, None, 1, 0]),
+        "code": rng.choice(["A1", "a1", 1, 2.0, None]),
+    }
+    if rng.random() < 0.1:
+        del record["year"]
+    return record
+
+
+def _value(rng: random.Random, field: str, operator: ComparisonOperator):
+    if operator in (ComparisonOperator.IN_LIST, ComparisonOperator.NOT_IN_LIST):
+        if rng.random() < 0.05:
+            return "not-a-list"
+        pool = {"name": NAMES, "year": [1990, 2015, 1999, None], "price": [10, 9.99, 30], "available": [True, False, 1, None], "code": ["A1", "a.1", 1, 2, True]}[field]
+        return rng.sample(pool, rng.randint(0, min(3, len(pool))))
+    if field == "name":
+        return rng.choice([*NAMES, "hob", "THE", "zz"])
+    if field == "year":
+        return rng.choice([1990, 2001, 2000.5, 2016]) if operator not in (ComparisonOperator.CONTAINS, ComparisonOperator.NOT_CONTAINS) else rng.choice([None, 2001])
+    if field == "price":
+        return rng.choice([9.99, 10, 25.5, 0, True])
+    if field == "genres":
+        if operator in (ComparisonOperator.EQUALS, ComparisonOperator.NOT_EQUALS) and rng.random() < 0.3:
+            return ["Drama"]
+        return rng.choice(["drama", "SCI", "comedy"])
+    if field == "available":
+        return rng.choice([True, False, 1, None])
+    return rng.choice(["A1", "a,1", 1, 2, None])
+
+
+@pytest.mark.parametrize("seed", range(25))
+def test_index_matches_row_by_row_check(seed):
+    rng = random.Random(seed)
+    data = [_record(rng) for _ in range(rng.randint(0, 60))]
+    index = DatasetIndex(data)
+
+    for _ in range(40):
+        constraints = []
+        for field in rng.sample(sorted(FIELD_OPERATORS), rng.randint(1, 3)):
+            operator = rng.choice(FIELD_OPERATORS[field])
+            constraints.append({"field": field, "operator": operator.value, "value": _value(rng, field, operator)})
+
+        expected = [item for item in data if item_matches_all_constraints(item, constraints)]
+        assert index.filter(constraints) == expected, constraints
+        assert constraints_exist_in_db(data, constraints) is bool(expected)
+
+
+def test_range_operators_on_strings_and_numbers():
+    data = [{"name": "b", "year": 2000}, {"name": "a", "year": None}, {"name": "c", "year": 1990.5}, {"year": 2000}]
+    index = DatasetIndex(data)
+
+    assert index.filter([{"field": "year", "operator": "greater_equal", "value": 2000}]) == [data[0], data[3]]
+    assert index.filter([{"field": "year", "operator": "less_than", "value": 2000}]) == [data[2]]
+    assert index.filter([{"field": "name", "operator": "greater_than", "value": "a"}]) == [data[0], data[2]]
+
+
+def test_mixed_types_under_range_operator_still_raise():
+    data = [{"year": 2000}, {"year": "2001"}]
+    with pytest.raises(TypeError):
+        DatasetIndex(data).filter([{"field": "year", "operator": "greater_than", "value": 1999}])
+
+
+def test_index_is_owned_by_the_dataset_cache_entry():
+    cache = DatasetCache(max_bytes=1024)
+    cache["a"] = data = [{"x": 1}, {"x": 2}]
+    index = get_dataset_index(data)
+
+    assert get_dataset_index(data) is index
+    assert get_dataset_index(list(data)) is not index
+    data.append({"x": 3})
+    assert get_dataset_index(data).filter([{"field": "x", "operator": "equals", "value": 3}]) == [{"x": 3}]
+
+    cache.pop("a")
+    assert cache.index_for(data) is None
+    assert get_dataset_index(data) is not index
+
+
+def test_index_is_evicted_with_its_cache_entry():
+    cache = DatasetCache(max_bytes=len('[{"x": 1}]') * 2)
+    cache["a"] = first = [{"x": 1}]
+    get_dataset_index(first)
+    cache["b"] = [{"x": 2}]
+    cache["c"] = [{"x": 3}]
+
+    assert "a" not in cache
+    assert cache.index_for(first) is None
+    assert len(cache._indexes) <= len(cache)
+
+
+def test_uncached_list_is_never_served_a_stale_index():
+    data = [{"x": 1}, {"x": 2}]
+    assert not constraints_exist_in_db(data, [{"field": "x", "operator": "equals", "value": 3}])
+
+    data[0] = {"x": 3}
+
+    assert constraints_exist_in_db(data, [{"field": "x", "operator": "equals", "value": 3}])
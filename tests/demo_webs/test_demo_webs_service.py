@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import asyncio
+import time
 from unittest.mock import AsyncMock, Mock
 
 import aiohttp
@@ -168,3 +170,198 @@ async def test_close_closes_open_session():
 
     session.close.assert_awaited_once()
     assert service._session is None
+
+
+@pytest.mark.asyncio
+async def test_get_backend_events_since_returns_only_new_events():
+    from autoppia_iwa.src.demo_webs.local_events_backend import LocalEventsBackend
+
+    async with LocalEventsBackend() as backend:
+        service = BackendDemoWebService(_make_project(backend_url=backend.url, frontend_url=backend.url), web_agent_id="agent-1")
+        backend.record("agent-1", "LOGIN", {"user": "alice"})
+        backend.record("agent-2", "OTHER")
+
+        first, cursor = await service.get_backend_events_since("agent-1")
+        backend.record("agent-1", "LOGOUT")
+        second, cursor = await service.get_backend_events_since("agent-1", since_id=cursor)
+        third, cursor = await service.get_backend_events_since("agent-1", since_id=cursor)
+
+        # The legacy full-log endpoint keeps working side by side.
+        full_log = await service.get_backend_events("agent-1")
+        await service.close()
+
+    assert [e.event_name for e in first] == ["LOGIN"]
+    assert first[0].data == {"user": "alice"}
+    assert [e.event_name for e in second] == ["LOGOUT"]
+    assert third == []
+    assert cursor == 2
+    assert [e.event_name for e in full_log] == ["LOGIN", "LOGOUT"]
+
+
+@pytest.mark.asyncio
+async def test_get_backend_events_since_long_polls_until_event_arrives():
+    from autoppia_iwa.src.demo_webs.local_events_backend import LocalEventsBackend
+
+    async with LocalEventsBackend() as backend:
+        service = BackendDemoWebService(_make_project(backend_url=backend.url, frontend_url=backend.url), web_agent_id="agent-1")
+
+        async def _emit_later():
+            await asyncio.sleep(0.05)
+            backend.record("agent-1", "LATE")
+
+        emitter = asyncio.create_task(_emit_later())
+        started = time.monotonic()
+        events, cursor = await service.get_backend_events_since("agent-1", wait_ms=2000)
+        elapsed = time.monotonic() - started
+        await emitter
+
+        started = time.monotonic()
+        timed_out, _ = await service.get_backend_events_since("agent-1", since_id=cursor, wait_ms=100)
+        timeout_elapsed = time.monotonic() - started
+        await service.close()
+
+    assert [e.event_name for e in events] == ["LATE"]
+    assert cursor == 1
+    assert elapsed < 1.0
+    assert timed_out == []
+    assert timeout_elapsed >= 0.09
+
+
+@pytest.mark.asyncio
+async def test_get_backend_events_since_sees_every_event_after_reset_and_regrow():
+    from autoppia_iwa.src.demo_webs.local_events_backend import LocalEventsBackend
+
+    async with LocalEventsBackend() as backend:
+        service = BackendDemoWebService(_make_project(backend_url=backend.url, frontend_url=backend.url), web_agent_id="agent-1")
+        for name in ("A", "B", "C"):
+            backend.record("agent-1", name)
+        _, cursor = await service.get_backend_events_since("agent-1")
+
+        assert await service.reset_database() is True
+        # The new log grows past the old cursor before the next fetch
+        for name in ("D", "E", "F", "G"):
+            backend.record("agent-1", name)
+        events, cursor = await service.get_backend_events_since("agent-1", since_id=cursor)
+        await service.close()
+
+    assert [e.event_name for e in events] == ["D", "E", "F", "G"]
+    assert cursor == 7
+
+
+@pytest.mark.asyncio
+async def test_get_backend_events_since_rewinds_when_backend_renumbers_after_reset():
+    response = Mock()
+    response.raise_for_status = Mock()
+    response.json = AsyncMock(
+        side_effect=[
+            {"events": [{"id": 1, "data": {"event_name": "AFTER_RESET"}}], "last_id": 1},
+            {"events": [{"id": 1, "data": {"event_name": "AFTER_RESET"}}], "last_id": 1},
+        ]
+    )
+    session = Mock()
+    session.closed = False
+    session.get = Mock(side_effect=lambda *args, **kwargs: _AsyncContextManager(response))
+
+    service = BackendDemoWebService(_make_project())
+    service._session = session
+
+    events, cursor = await service.get_backend_events_since("agent-1", since_id=3)
+
+    assert [e.event_name for e in events] == ["AFTER_RESET"]
+    assert cursor == 1
+    assert session.get.call_args.kwargs["params"]["since_id"] == 0
+
+
+@pytest.mark.asyncio
+async def test_get_backend_events_since_handles_legacy_full_log_backend():
+    log = [{"data": {"event_name": name}} for name in ("A", "B", "C")]
+    response = Mock()
+    response.raise_for_status = Mock()
+    response.json = AsyncMock(side_effect=[log[:2], log, log])
+    session = Mock()
+    session.closed = False
+    session.get = Mock(side_effect=lambda *args, **kwargs: _AsyncContextManager(response))
+
+    service = BackendDemoWebService(_make_project())
+    service._session = session
+
+    first, cursor = await service.get_backend_events_since("agent-1")
+    second, cursor = await service.get_backend_events_since("agent-1", since_id=cursor)
+    # A legacy backend ignores wait_ms, so the client polls until the deadline.
+    third, cursor = await service.get_backend_events_since("agent-1", since_id=cursor, wait_ms=1)
+
+    assert [e.event_name for e in first] == ["A", "B"]
+    assert [e.event_name for e in second] == ["C"]
+    assert third == []
+    assert cursor == 3
+    assert session.get.call_args.kwargs["params"]["since_id"] == 3
+
+
+@pytest.mark.asyncio
+async def test_get_backend_events_since_keeps_cursor_on_error():
+    session = Mock()
+    session.closed = False
+    session.get = Mock(side_effect=aiohttp.ClientError("boom"))
+
+    service = BackendDemoWebService(_make_project())
+    service._session = session
+
+    assert await service.get_backend_events_since("agent-1", since_id=7) == ([], 7)
+
+
+@pytest.mark.asyncio
+async def test_reset_databases_clears_all_agents_in_one_batch_request():
+    from autoppia_iwa.src.demo_webs.local_events_backend import LocalEventsBackend
+
+    async with LocalEventsBackend() as backend:
+        service = BackendDemoWebService(_make_project(backend_url=backend.url, frontend_url=backend.url))
+        for agent_id in ("a", "b", "c"):
+            backend.record(agent_id, "LOGIN")
+
+        assert await service.reset_databases(["a", "b", "b", "c"]) is True
+        await service.close()
+
+    assert backend.reset_requests == {"single": 0, "batch": 1}
+    assert all(backend.events(agent_id) == [] for agent_id in ("a", "b", "c"))
+
+
+@pytest.mark.asyncio
+async def test_reset_databases_falls_back_to_single_resets_without_batch_route():
+    from autoppia_iwa.src.demo_webs.local_events_backend import LocalEventsBackend
+
+    async with LocalEventsBackend(batch_reset=False) as backend:
+        service = BackendDemoWebService(_make_project(backend_url=backend.url, frontend_url=backend.url))
+        for agent_id in ("a", "b", "c"):
+            backend.record(agent_id, "LOGIN")
+
+        assert await service.reset_databases(["a", "b", "c"]) is True
+        assert service._batch_reset_supported is False
+        assert await service.reset_databases(["a", "b"]) is True
+        await service.close()
+
+    assert backend.reset_requests == {"single": 5, "batch": 0}
+    assert backend.events("c") == []
+
+
+@pytest.mark.asyncio
+async def test_reset_databases_fallback_runs_concurrently_under_a_cap(monkeypatch):
+    from autoppia_iwa.src.demo_webs.demo_webs_service import RESET_FALLBACK_CONCURRENCY
+
+    service = BackendDemoWebService(_make_project())
+    service._batch_reset_supported = False
+    in_flight = peak = 0
+
+    async def _reset(web_agent_id=None):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return web_agent_id != "bad"
+
+    monkeypatch.setattr(service, "reset_database", _reset)
+
+    assert await service.reset_databases([f"agent-{i}" for i in range(10)]) is True
+    assert peak == RESET_FALLBACK_CONCURRENCY
+    assert await service.reset_databases(["ok", "bad"]) is False
+    assert await service.reset_databases([]) is True
@@ -1,8 +1,14 @@
 """Tests for demo_webs.utils helpers."""
 
+import asyncio
 import json
+import time
+from types import SimpleNamespace
 from unittest.mock import patch
 
+import pytest
+from aiohttp import web
+
 from autoppia_iwa.src.demo_webs import utils
 
 
@@ -70,3 +76,88 @@ def test_get_web_version_returns_none_for_invalid_package_json(tmp_path, monkeyp
 
     version = utils.get_web_version("autocinema", "http://localhost:8000/")
     assert version is not None
+
+
+@pytest.fixture
+def clear_web_version_cache(monkeypatch):
+    monkeypatch.setattr(utils, "_WEB_VERSION_CACHE", {})
+    monkeypatch.setattr(utils, "_WEB_VERSION_INFLIGHT", utils.SingleFlight())
+
+
+async def _start_version_server(payload: dict, delay: float = 0.0):
+    hits: list[str] = []
+
+    async def handle(request: web.Request) -> web.Response:
+        hits.append(request.path)
+        await asyncio.sleep(delay)
+        return web.json_response(payload)
+
+    app = web.Application()
+    app.router.add_get("/api/version", handle)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    return runner, f"http://127.0.0.1:{port}/", hits
+
+
+@pytest.mark.asyncio
+async def test_get_web_version_async_probes_once_for_concurrent_callers(clear_web_version_cache):
+    runner, frontend_url, hits = await _start_version_server({"version": "4.5.6"}, delay=0.05)
+    try:
+        versions = await asyncio.gather(*(utils.get_web_version_async("autocinema", frontend_url) for _ in range(5)))
+        assert await utils.get_web_version_async("autocinema", frontend_url) == "4.5.6"
+    finally:
+        await runner.cleanup()
+
+    assert versions == ["4.5.6"] * 5
+    assert hits == ["/api/version"]
+
+
+@pytest.mark.asyncio
+async def test_cancelled_version_probe_caller_does_not_cancel_the_others(clear_web_version_cache):
+    runner, frontend_url, hits = await _start_version_server({"version": "4.5.6"}, delay=0.05)
+    try:
+        first = asyncio.create_task(utils.get_web_version_async("autocinema", frontend_url))
+        await asyncio.sleep(0)
+        second = asyncio.create_task(utils.get_web_version_async("autocinema", frontend_url))
+        await asyncio.sleep(0.01)
+        first.cancel()
+
+        assert await second == "4.5.6"
+    finally:
+        await runner.cleanup()
+
+    assert first.cancelled()
+    assert hits == ["/api/version"]
+
+
+@pytest.mark.asyncio
+async def test_resolve_web_versions_probes_projects_concurrently_and_stores_version(clear_web_version_cache):
+    runner, frontend_url, hits = await _start_version_server({"version": "7.0.0"}, delay=0.2)
+    projects = [SimpleNamespace(id=project_id, frontend_url=frontend_url, version=None) for project_id in ("autocinema", "autobooks", "autozone")]
+    try:
+        started = time.perf_counter()
+        versions = await utils.resolve_web_versions(projects)
+        elapsed = time.perf_counter() - started
+    finally:
+        await runner.cleanup()
+
+    assert versions == {"autocinema": "7.0.0", "autobooks": "7.0.0", "autozone": "7.0.0"}
+    assert [project.version for project in projects] == ["7.0.0"] * 3
+    assert len(hits) == 3
+    assert elapsed < 0.5
+
+
+@pytest.mark.asyncio
+async def test_resolve_web_version_falls_back_to_package_json_when_frontend_is_down(clear_web_version_cache, tmp_path, monkeypatch):
+    webs_demo = tmp_path / "autoppia_webs_demo"
+    pkg = webs_demo / "web_1_autocinema" / "package.json"
+    pkg.parent.mkdir(parents=True)
+    pkg.write_text(json.dumps({"version": "9.9.9"}), encoding="utf-8")
+    monkeypatch.setenv("WEBS_DEMO_PATH", str(webs_demo))
+    project = SimpleNamespace(id="autocinema", frontend_url="http://127.0.0.1:1/", version=None)
+
+    assert await utils.resolve_web_version(project) == "9.9.9"
+    assert project.version == "9.9.9"
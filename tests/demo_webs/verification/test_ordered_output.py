@@ -0,0 +1,58 @@
+import asyncio
+import sys
+
+import pytest
+
+from autoppia_iwa.src.demo_webs.web_verification.ordered_output import gather_in_order
+
+
+def _job(name: str, delay: float, log: list[str]):
+    async def run():
+        print(f"{name} start")
+        await asyncio.sleep(delay)
+        log.append(name)
+        print(f"{name} end")
+        return name
+
+    return run
+
+
+@pytest.mark.asyncio
+async def test_output_and_results_follow_job_order(capsys):
+    finished: list[str] = []
+    jobs = [_job("a", 0.03, finished), _job("b", 0.0, finished), _job("c", 0.01, finished)]
+
+    results = await gather_in_order(jobs, limit=3)
+
+    assert results == ["a", "b", "c"]
+    assert finished[0] == "b"  # Jobs really ran concurrently
+    assert capsys.readouterr().out == "a start\na end\nb start\nb end\nc start\nc end\n"
+    assert type(sys.stdout).__name__ != "_RoutingStdout"
+
+
+@pytest.mark.asyncio
+async def test_nested_calls_flush_into_the_parent_job(capsys):
+    async def parent(name: str, delay: float):
+        print(f"{name}:")
+        inner = await gather_in_order([_job(f"{name}.{i}", delay / (i + 1), []) for i in range(2)], limit=2)
+        return inner
+
+    results = await gather_in_order([lambda: parent("x", 0.02), lambda: parent("y", 0.0)], limit=2)
+
+    assert results == [["x.0", "x.1"], ["y.0", "y.1"]]
+    assert capsys.readouterr().out.split() == ["x:", "x.0", "start", "x.0", "end", "x.1", "start", "x.1", "end", "y:", "y.0", "start", "y.0", "end", "y.1", "start", "y.1", "end"]
+
+
+@pytest.mark.asyncio
+async def test_failure_cancels_remaining_jobs_and_keeps_earlier_output(capsys):
+    async def boom():
+        print("boom")
+        raise RuntimeError("failed")
+
+    never_finished: list[str] = []
+    with pytest.raises(RuntimeError):
+        await gather_in_order([_job("a", 0.0, []), boom, _job("c", 0.05, never_finished)], limit=3)
+
+    await asyncio.sleep(0.06)
+    assert never_finished == []
+    assert capsys.readouterr().out == "a start\na end\nboom\n"
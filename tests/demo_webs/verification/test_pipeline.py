@@ -267,6 +267,66 @@ async def test_pipeline_run_processes_use_cases_and_saves_results(monkeypatch):
     assert saved["called"] is True
 
 
+@pytest.mark.asyncio
+async def test_pipeline_run_processes_use_cases_concurrently_in_order(monkeypatch, capsys):
+    import asyncio
+
+    monkeypatch.setattr("autoppia_iwa.src.demo_webs.web_verification.pipeline.SimpleTaskGenerator", _DummyGenerator)
+    monkeypatch.setattr("autoppia_iwa.src.demo_webs.web_verification.pipeline.IWAPClient", _DummyIWAPClient)
+    monkeypatch.setattr("autoppia_iwa.src.demo_webs.web_verification.pipeline.LLMReviewer", _DummyLLMReviewer)
+    monkeypatch.setattr("autoppia_iwa.src.demo_webs.web_verification.pipeline.DynamicVerifier", _DummyDynamicVerifier)
+    monkeypatch.setattr("autoppia_iwa.src.demo_webs.web_verification.pipeline.DIContainer.llm_service", lambda: object())
+    use_cases = [UseCase(name=name, description="", event=object, event_source_code="", examples=[]) for name in ("A", "B", "C")]
+    pipeline = WebVerificationPipeline(_build_project(use_cases), _cfg_no_de(use_case_concurrency=3))
+    delays = {"A": 0.03, "B": 0.0, "C": 0.01}
+    in_flight = {"now": 0, "max": 0}
+
+    async def fake_process(u):
+        in_flight["now"] += 1
+        in_flight["max"] = max(in_flight["max"], in_flight["now"])
+        print(f"processing {u.name}")
+        await asyncio.sleep(delays[u.name])
+        in_flight["now"] -= 1
+        return {"processed": u.name}
+
+    async def fake_save():
+        return None
+
+    monkeypatch.setattr(pipeline, "_process_use_case", fake_process)
+    monkeypatch.setattr(pipeline, "_save_results", fake_save)
+
+    result = await pipeline.run()
+
+    assert in_flight["max"] == 3
+    assert list(result["use_cases"]) == ["A", "B", "C"]
+    assert [line for line in capsys.readouterr().out.splitlines() if line.startswith("processing")] == ["processing A", "processing B", "processing C"]
+
+
+@pytest.mark.asyncio
+async def test_pipeline_llm_calls_share_one_concurrency_limit(monkeypatch):
+    import asyncio
+
+    monkeypatch.setattr("autoppia_iwa.src.demo_webs.web_verification.pipeline.SimpleTaskGenerator", _DummyGenerator)
+    monkeypatch.setattr("autoppia_iwa.src.demo_webs.web_verification.pipeline.IWAPClient", _DummyIWAPClient)
+    monkeypatch.setattr("autoppia_iwa.src.demo_webs.web_verification.pipeline.LLMReviewer", _DummyLLMReviewer)
+    monkeypatch.setattr("autoppia_iwa.src.demo_webs.web_verification.pipeline.DynamicVerifier", _DummyDynamicVerifier)
+    monkeypatch.setattr("autoppia_iwa.src.demo_webs.web_verification.pipeline.DIContainer.llm_service", lambda: object())
+    pipeline = WebVerificationPipeline(_build_project([]), _cfg_no_de(llm_concurrency=2))
+    in_flight = {"now": 0, "max": 0}
+
+    async def fake_llm(i):
+        in_flight["now"] += 1
+        in_flight["max"] = max(in_flight["max"], in_flight["now"])
+        await asyncio.sleep(0.01)
+        in_flight["now"] -= 1
+        return i
+
+    results = await asyncio.gather(*(pipeline._llm_call(fake_llm(i)) for i in range(6)))
+
+    assert results == list(range(6))
+    assert in_flight["max"] == 2
+
+
 @pytest.mark.asyncio
 async def test_pipeline_use_case_filter_only_processes_matching(monkeypatch):
     monkeypatch.setattr(
@@ -334,7 +394,7 @@ async def test_pipeline_evaluate_trajectories_calls_verify_trajectory(monkeypatc
         def __init__(self, *args, **kwargs):
             pass
 
-        async def generate_tasks_for_use_case(self, use_case, number_of_prompts=1, dynamic=False, base_url=None):
+        async def generate_tasks_for_use_case(self, use_case, number_of_prompts=1, dynamic=False, base_url=None, random_seed=None):
             return [
                 Task(
                     url="http://localhost:8012/?seed=1",
@@ -427,3 +427,88 @@ async def test_run_stateful_result_uses_eval_id_in_stats(monkeypatch, tmp_path):
     assert result.web_agent_id == "eval-123"
     assert result.stats is not None
     assert result.stats.web_agent_id == "eval-123"
+
+
+@pytest.mark.asyncio
+async def test_only_browser_failures_count_against_adaptive_concurrency(monkeypatch, tmp_path):
+    from autoppia_iwa.src.data_generation.tasks.classes import Task
+    from autoppia_iwa.src.evaluation.benchmark import Benchmark, BenchmarkConfig
+    from autoppia_iwa.src.evaluation.shared.concurrency import AdaptiveConcurrencyConfig
+
+    fake_project = type("Project", (), {"id": "autobooks", "name": "Autobooks"})()
+    task = Task(url="http://localhost:3000", prompt="Do something", web_project_id="autobooks")
+
+    class FakeSnapshot:
+        html = "<html>state</html>"
+        url = "http://localhost:3000/page"
+        screenshot = b""
+
+    class FakeStepResult:
+        score = type("Score", (), {"success": False, "raw_score": 0.0, "tests_passed": 0, "total_tests": 1})()
+        snapshot = FakeSnapshot()
+        action_result = None
+
+    class FakeTaskExecutionSession:
+        browser_down = False
+
+        def __init__(self, **kwargs):
+            pass
+
+        async def reset(self):
+            if FakeTaskExecutionSession.browser_down:
+                raise RuntimeError("browser crashed")
+            return FakeStepResult()
+
+        async def close(self):
+            return None
+
+    class MisbehavingAgent:
+        id = "agent-1"
+        name = "Agent One"
+
+        async def step(self, **kwargs):
+            return 42  # not a list of actions
+
+    monkeypatch.setattr("autoppia_iwa.src.evaluation.benchmark.benchmark.TaskExecutionSession", FakeTaskExecutionSession)
+    config = BenchmarkConfig(
+        projects=[fake_project],
+        agents=[MisbehavingAgent()],
+        base_dir=tmp_path,
+        save_results_json=False,
+        print_summary=False,
+        adaptive_concurrency=AdaptiveConcurrencyConfig(),
+    )
+    benchmark = Benchmark(config)
+
+    agent_failure = await benchmark._run_eval_job(MisbehavingAgent(), task, 1, 1, 2)
+    FakeTaskExecutionSession.browser_down = True
+    browser_failure = await benchmark._run_eval_job(MisbehavingAgent(), task, 1, 2, 2)
+
+    assert agent_failure.stats.had_errors
+    assert browser_failure.stats.error_message == "Browser evaluation error: browser crashed"
+    assert benchmark.concurrency_metrics["completed"] == 2
+    assert benchmark.concurrency_metrics["errors"] == 1
+
+
+@pytest.mark.asyncio
+async def test_judge_cache_counters_are_per_run(monkeypatch, tmp_path):
+    from autoppia_iwa.src.data_generation.tests.judge_cache import HTMLJudgeCache
+    from autoppia_iwa.src.evaluation.benchmark import Benchmark, BenchmarkConfig, benchmark as benchmark_module
+
+    cache = HTMLJudgeCache()
+    monkeypatch.setattr(benchmark_module, "HTML_JUDGE_CACHE", cache)
+    fake_project = type("Project", (), {"id": "autobooks", "name": "Autobooks"})()
+    config = BenchmarkConfig(projects=[fake_project], agents=[type("Agent", (), {"id": "a", "name": "A"})()], base_dir=tmp_path, save_results_json=False, print_summary=False)
+    benchmark = Benchmark(config)
+
+    async def fake_run_project(project, run_idx):
+        cache.metrics.verdict_misses += 1
+        cache.metrics.verdict_hits += 2
+        return None
+
+    monkeypatch.setattr(benchmark, "_run_project", fake_run_project)
+
+    for _ in range(2):
+        await benchmark.run()
+        assert benchmark.judge_cache_metrics["verdict_misses"] == 1
+        assert benchmark.judge_cache_metrics["llm_calls_saved"] == 2
@@ -52,8 +52,8 @@ async def test_verify_for_project_filters_use_cases_and_aggregates(monkeypatch):
 
     verifier = EventTrajectoryVerifier(_make_project())
 
-    async def _fake_run_one(*, use_case_name: str, trajectory: Trajectory):
-        _ = trajectory
+    async def _fake_run_one(*, use_case_name: str, trajectory: Trajectory, replay_agent_id: str):
+        _ = trajectory, replay_agent_id
         if use_case_name == "UC_A":
             return True, "score=1.000 tests=1/1", {"score": 1.0, "tests_passed": 1, "total_tests": 1}
         return False, "score=0.000 tests=0/1", {"score": 0.0, "tests_passed": 0, "total_tests": 1}
@@ -71,3 +71,39 @@ async def test_verify_for_project_filters_use_cases_and_aggregates(monkeypatch):
     assert all_result["total_count"] == 2
     assert all_result["passed_count"] == 1
     assert all_result["all_passed"] is False
+
+
+@pytest.mark.asyncio
+async def test_verify_for_project_replays_concurrently_in_one_pool(monkeypatch):
+    import asyncio
+
+    trajectories = {name: Trajectory(name=name, prompt=name, actions=[NavigateAction(url="http://localhost:8000")], tests=[]) for name in ("UC_A", "UC_B", "UC_C")}
+    monkeypatch.setattr(verifier_module, "get_trajectory_map", lambda _project_id: trajectories)
+
+    verifier = EventTrajectoryVerifier(_make_project(), max_concurrency=3)
+    delays = {"UC_A": 0.03, "UC_B": 0.0, "UC_C": 0.01}
+    pools = set()
+    agent_ids = []
+    in_flight = {"now": 0, "max": 0}
+
+    async def _fake_run_one(*, use_case_name: str, trajectory: Trajectory, replay_agent_id: str):
+        pools.add(id(verifier._browser_pool))
+        agent_ids.append(replay_agent_id)
+        in_flight["now"] += 1
+        in_flight["max"] = max(in_flight["max"], in_flight["now"])
+        await asyncio.sleep(delays[use_case_name])
+        in_flight["now"] -= 1
+        return True, "score=1.000 tests=1/1", {"score": 1.0, "tests_passed": 1, "total_tests": 1, "replay_time": delays[use_case_name]}
+
+    monkeypatch.setattr(verifier, "_run_one", _fake_run_one)
+
+    result = await verifier.verify_for_project()
+
+    assert [item["use_case"] for item in result["results"]] == ["UC_A", "UC_B", "UC_C"]
+    assert in_flight["max"] == 3
+    assert len(pools) == 1
+    # Concurrent replays must not share the web agent id their events and resets are keyed by
+    assert sorted(agent_ids) == ["replay-0", "replay-1", "replay-2"]
+    assert verifier._browser_pool is None
+    assert result["replay_time"] == pytest.approx(0.04)
+    assert result["setup_time"] == 0.0
@@ -5,6 +5,7 @@ from pathlib import Path
 
 from autoppia_iwa.src.data_generation.tasks.classes import Task
 from autoppia_iwa.src.demo_webs.classes import WebProject
+from autoppia_iwa.src.evaluation.benchmark.benchmark import Benchmark
 from autoppia_iwa.src.evaluation.benchmark.config import BenchmarkConfig
 from autoppia_iwa.src.evaluation.benchmark.reporting import (
     aggregate_project_results,
@@ -18,6 +19,7 @@ from autoppia_iwa.src.evaluation.benchmark.reporting import (
 )
 from autoppia_iwa.src.evaluation.benchmark.utils.metrics import TimingMetrics
 from autoppia_iwa.src.evaluation.classes import EvaluationResult, EvaluationStats
+from autoppia_iwa.src.evaluation.shared.concurrency import AdaptiveConcurrencyConfig
 from autoppia_iwa.src.web_agents.classes import IWebAgent
 
 
@@ -117,6 +119,34 @@ def test_build_run_report_terminal_report_and_save(tmp_path):
     saved = save_run_report(run_report, output)
     assert saved == output
     assert json.loads(output.read_text())["summary"]["Autocinema"]["Agent One"]["passed"] == 1
+    assert "concurrency" not in run_report
+
+
+def test_run_report_includes_judge_cache_counts(tmp_path):
+    config = _config(tmp_path)
+    timing = TimingMetrics()
+    timing.start()
+    timing.end()
+    summary = {"Autocinema": {"Agent One": {"passed": 1, "total": 1, "success_rate": 1.0, "avg_score": 1.0}}}
+    judge_cache = {"verdict_hits": 4, "verdict_misses": 1, "coalesced": 2, "uncached_failures": 0, "diff_hits": 5, "diff_misses": 1, "llm_calls_saved": 6}
+
+    run_report = build_run_report(config=config, timing=timing, project_reports={"Autocinema": {"summary": summary["Autocinema"]}}, summary=summary, judge_cache=judge_cache)
+
+    assert run_report["judge_cache"]["llm_calls_saved"] == 6
+    assert "HTML judge cache: 4 hits, 2 coalesced, 1 LLM calls" in build_terminal_report(run_report, config=config)
+
+
+def test_run_report_includes_adaptive_concurrency_metrics(tmp_path):
+    config = _config(tmp_path)
+    config.adaptive_concurrency = AdaptiveConcurrencyConfig(max_limit=4)
+    benchmark = Benchmark(config)
+    benchmark._limiter.record(0.2)
+
+    report = benchmark._build_run_report()
+
+    assert report["config"]["adaptive_concurrency"]["max_limit"] == 4
+    assert report["concurrency"]["completed"] == 1
+    assert report["concurrency"]["limit"] == 1
 
 
 def test_build_legacy_results_payload_and_report(tmp_path):
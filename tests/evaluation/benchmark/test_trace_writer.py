@@ -2,7 +2,22 @@ from __future__ import annotations
 
 import json
 
-from autoppia_iwa.src.evaluation.benchmark.trace_writer import TraceWriter
+import pytest
+
+from autoppia_iwa.src.evaluation.benchmark.trace_writer import TraceWriter, iter_episode_records, load_episode, load_trace_index
+
+
+def _record(episode, step_index: int, html: str = "<html>same</html>", screenshot: str | None = None) -> None:
+    episode.record_step(
+        step_index,
+        before_url="http://localhost",
+        before_html=html,
+        before_screenshot=screenshot,
+        after_url="http://localhost/detail",
+        after_html=html,
+        after_screenshot=screenshot,
+        actions=[{"type": "ClickAction"}],
+    )
 
 
 def test_trace_writer_flush_and_episode_close(tmp_path):
@@ -29,10 +44,92 @@ def test_trace_writer_flush_and_episode_close(tmp_path):
     episode.close(success=True, score=1.0, total_steps=1, evaluation_time=1.2345, agent_name="Agent One")
     index_path = writer.flush()
 
-    episode_payload = json.loads((tmp_path / "traces" / "episodes" / "episode-1.json").read_text())
     index_payload = json.loads(index_path.read_text())
+    episode_file = tmp_path / "traces" / index_payload["episodes"][0]["file"]
+    episode_payload = load_episode(episode_file)
 
+    assert index_payload["episodes"][0]["file"] == "episodes/episode-1.jsonl.gz"
+    assert index_payload["episodes"][0]["status"] == "completed"
+    assert index_payload["project"] == "autocinema"
     assert episode_payload["episode"]["evaluation_time"] == 1.2345
+    assert episode_payload["episode"]["agent_name"] == "Agent One"
+    assert episode_payload["episode"]["task"] == {"prompt": "Open a film"}
     assert episode_payload["steps"][0]["actions"] == [{"type": "ClickAction"}]
-    assert index_payload["project"] == "autocinema"
-    assert index_payload["episodes"][0]["file"] == "episodes/episode-1.json"
+    assert episode_payload["steps"][0]["before"]["html"] == "<html>before</html>"
+    assert episode_payload["steps"][0]["after"]["html"] == "<html>after</html>"
+
+
+@pytest.mark.parametrize("compression", ["none", "gzip"])
+def test_html_and_screenshots_are_stored_once(tmp_path, compression):
+    writer = TraceWriter(tmp_path, compression=compression)
+    episode = writer.start_episode(episode_task_id="ep", task_id="t", use_case="UC")
+    for step_index in range(5):
+        _record(episode, step_index, screenshot="iVBORw0KGgo=")
+    episode.close(success=False, score=0.0, total_steps=5)
+    writer.flush()
+
+    blobs = [path for path in (tmp_path / "blobs").rglob("*") if path.is_file()]
+    payload = load_episode(episode.path)
+
+    assert len(blobs) == 2
+    assert len(payload["steps"]) == 5
+    assert all(step["after"]["screenshot"] == "iVBORw0KGgo=" for step in payload["steps"])
+
+
+def test_steps_are_on_disk_before_episode_close(tmp_path):
+    writer = TraceWriter(tmp_path)
+    episode = writer.start_episode(episode_task_id="ep", task_id="t", use_case="UC")
+    _record(episode, 0)
+    _record(episode, 1)
+    writer._queue.join()
+
+    index_payload = load_trace_index(tmp_path)
+    records = list(iter_episode_records(episode.path))
+
+    assert index_payload["episodes"][0]["status"] == "running"
+    assert [record["type"] for record in records] == ["episode", "step", "step"]
+
+
+def test_index_updates_are_appended_and_folded_on_flush(tmp_path):
+    writer = TraceWriter(tmp_path, run_metadata={"project": "demo"})
+    for index in range(3):
+        episode = writer.start_episode(episode_task_id=f"ep{index}", task_id="t", use_case="UC")
+        episode.close(success=True, score=1.0, total_steps=0)
+    writer._queue.join()
+
+    live_lines = (tmp_path / "trace_index.jsonl").read_text().splitlines()
+    live_index = load_trace_index(tmp_path)
+
+    # One header plus one line per start/close, not a rewrite per update
+    assert len(live_lines) == 1 + 3 * 2
+    assert json.loads((tmp_path / "trace_index.json").read_text())["episodes"] == []
+    assert [(e["episode_task_id"], e["status"]) for e in live_index["episodes"]] == [("ep0", "completed"), ("ep1", "completed"), ("ep2", "completed")]
+    assert live_index["project"] == "demo"
+
+    writer.flush()
+    final_index = json.loads((tmp_path / "trace_index.json").read_text())
+
+    assert not (tmp_path / "trace_index.jsonl").exists()
+    assert [e["episode_task_id"] for e in final_index["episodes"]] == ["ep0", "ep1", "ep2"]
+    assert load_trace_index(tmp_path) == final_index
+
+
+def test_truncated_episode_file_keeps_complete_steps(tmp_path):
+    writer = TraceWriter(tmp_path)
+    episode = writer.start_episode(episode_task_id="ep", task_id="t", use_case="UC")
+    _record(episode, 0)
+    _record(episode, 1)
+    writer.flush()
+
+    # Simulate a crash in the middle of writing the last record.
+    data = episode.path.read_bytes()
+    episode.path.write_bytes(data[:-10])
+
+    payload = load_episode(episode.path)
+    assert [step["step_index"] for step in payload["steps"]] == [0]
+    assert payload["steps"][0]["before"]["html"] == "<html>same</html>"
+
+
+def test_unknown_compression_is_rejected(tmp_path):
+    with pytest.raises(ValueError):
+        TraceWriter(tmp_path, compression="lz4")
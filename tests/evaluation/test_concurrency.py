@@ -0,0 +1,173 @@
+"""Tests for the AIMD evaluation concurrency controller."""
+
+import asyncio
+
+import aiohttp
+import pytest
+from aiohttp import web
+
+from autoppia_iwa.src.evaluation.classes import EvaluationStats
+from autoppia_iwa.src.evaluation.shared.concurrency import (
+    AdaptiveConcurrencyConfig,
+    AdaptiveConcurrencyLimiter,
+    is_timeout_error,
+    mean_step_latency,
+    record_evaluation_outcome,
+)
+
+
+def _limiter(initial: int = 2, memory: float | None = 0.5, **config) -> AdaptiveConcurrencyLimiter:
+    return AdaptiveConcurrencyLimiter(initial, AdaptiveConcurrencyConfig(**config), memory_probe=lambda: memory)
+
+
+def _complete(limiter: AdaptiveConcurrencyLimiter, count: int, latency: float | None = 0.1, **outcome) -> None:
+    """Record ``count`` jobs that each held every slot (the limit was saturated)."""
+    for _ in range(count):
+        limiter._in_flight = limiter.limit
+        limiter.record(latency, **outcome)
+    limiter._in_flight = 0
+
+
+def test_limit_grows_additively_while_saturated_and_healthy():
+    limiter = _limiter(initial=2, max_limit=4)
+
+    _complete(limiter, 2)
+    assert limiter.limit == 2
+    _complete(limiter, 1)
+    assert limiter.limit == 3
+    _complete(limiter, 50)
+    assert limiter.limit == 4
+    assert limiter.metrics.increases == 2
+    assert [d["reason"] for d in limiter.metrics.decisions] == ["increase", "increase"]
+
+
+def test_unsaturated_limit_does_not_grow():
+    limiter = _limiter(initial=4)
+    for _ in range(20):
+        limiter.record(0.1)
+    assert limiter.limit == 4
+
+
+def test_errors_and_timeouts_halve_the_limit_once_per_window():
+    limiter = _limiter(initial=16, window=4)
+
+    _complete(limiter, 2, error=True)
+    assert limiter.limit == 8
+    _complete(limiter, 3, timeout=True)
+    assert limiter.limit == 8
+    _complete(limiter, 1, timeout=True)
+    assert limiter.limit == 4
+    metrics = limiter.metrics.as_dict()
+    assert (metrics["errors"], metrics["timeouts"], metrics["decreases"]) == (2, 4, 2)
+    assert metrics["decisions"][-1]["reason"] == "errors"
+
+
+def test_latency_spike_decreases_and_low_memory_blocks_growth():
+    limiter = _limiter(initial=8, window=2)
+    _complete(limiter, 3, latency=0.1)
+    _complete(limiter, 3, latency=1.0)
+    assert limiter.limit < 8
+    assert limiter.metrics.decisions[-1]["reason"] == "latency"
+
+    starved = _limiter(initial=4, memory=0.05, min_limit=2)
+    _complete(starved, 30)
+    assert starved.limit == 2
+    assert {d["reason"] for d in starved.metrics.decisions} == {"memory"}
+
+
+def test_invalid_config_is_rejected():
+    with pytest.raises(ValueError):
+        AdaptiveConcurrencyConfig(min_limit=4, max_limit=2)
+    with pytest.raises(ValueError):
+        AdaptiveConcurrencyConfig(decrease_factor=1.0)
+
+
+def test_outcome_helpers():
+    stats = EvaluationStats(web_agent_id="a", task_id="t", action_count=2, start_time=0, action_execution_times=[0.2, 0.4])
+    assert mean_step_latency(stats) == pytest.approx(0.3)
+    assert mean_step_latency(None) is None
+    assert is_timeout_error(TimeoutError())
+    assert is_timeout_error("Timeout 10000ms exceeded.")
+    assert not is_timeout_error("Element not found")
+
+
+def test_only_browser_failures_and_timeouts_count_as_errors():
+    limiter = _limiter()
+    for message in ("Browser evaluation error: Target closed", "Browser evaluation error: Timeout 30000ms exceeded.", "Agent returned no actions", ""):
+        stats = EvaluationStats(web_agent_id="a", task_id="t", action_count=0, start_time=0, had_errors=bool(message), error_message=message)
+        record_evaluation_outcome(limiter, stats)
+
+    assert (limiter.metrics.completed, limiter.metrics.errors, limiter.metrics.timeouts) == (4, 1, 1)
+
+
+async def test_waiters_are_served_in_order_and_cancellation_frees_the_slot():
+    limiter = _limiter(initial=1)
+    order: list[int] = []
+    release = asyncio.Event()
+
+    async def job(index: int) -> None:
+        async with limiter:
+            order.append(index)
+            await release.wait()
+
+    first = asyncio.create_task(job(0))
+    await asyncio.sleep(0)
+    cancelled = asyncio.create_task(job(1))
+    rest = [asyncio.create_task(job(i)) for i in (2, 3)]
+    await asyncio.sleep(0)
+    assert limiter.in_flight == 1
+    cancelled.cancel()
+    release.set()
+    await asyncio.gather(first, *rest)
+
+    assert order == [0, 2, 3]
+    assert limiter.in_flight == 0
+
+
+async def test_limit_tracks_a_backend_that_degrades_under_load():
+    capacity = 6
+    active = 0
+
+    async def handler(request: web.Request) -> web.Response:
+        nonlocal active
+        active += 1
+        try:
+            if active > capacity:
+                return web.Response(status=503)
+            # Fast up to half the capacity, then every extra request slows everybody down.
+            await asyncio.sleep(0.004 * max(1, active - capacity // 2) ** 2)
+            return web.Response(text="ok")
+        finally:
+            active -= 1
+
+    app = web.Application()
+    app.router.add_get("/step", handler)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    url = f"http://127.0.0.1:{site._server.sockets[0].getsockname()[1]}/step"
+
+    limiter = _limiter(initial=1, max_limit=32, window=5)
+    try:
+        async with aiohttp.ClientSession() as session:
+
+            async def evaluation() -> None:
+                async with limiter:
+                    step_times, failed = [], False
+                    for _ in range(3):
+                        started = asyncio.get_running_loop().time()
+                        async with session.get(url) as response:
+                            failed = failed or response.status >= 500
+                        step_times.append(asyncio.get_running_loop().time() - started)
+                    limiter.record(sum(step_times) / len(step_times), error=failed)
+
+            await asyncio.gather(*(evaluation() for _ in range(300)))
+    finally:
+        await runner.cleanup()
+
+    metrics = limiter.metrics.as_dict()
+    assert metrics["increases"] >= 2
+    assert metrics["decreases"] >= 1
+    assert metrics["peak_in_flight"] <= 2 * capacity
+    assert limiter.limit <= capacity
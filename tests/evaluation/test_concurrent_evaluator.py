@@ -18,7 +18,7 @@ import pytest
 
 from autoppia_iwa.config.config import DEMO_WEB_SERVICE_PORT, DEMO_WEBS_ENDPOINT
 from autoppia_iwa.src.data_generation.tasks.classes import BrowserSpecification, Task
-from autoppia_iwa.src.data_generation.tests.classes import CheckEventTest
+from autoppia_iwa.src.data_generation.tests.classes import CheckEventTest, DataExtractionTest
 from autoppia_iwa.src.demo_webs.classes import BackendEvent
 from autoppia_iwa.src.demo_webs.config import demo_web_projects
 from autoppia_iwa.src.evaluation.classes import EvaluationResult, EvaluationStats, TestResult as EvalTestResult
@@ -40,6 +40,13 @@ PROJECT = next(p for p in demo_web_projects if getattr(p, "id", None) == "autobo
 PROJECT_AUTOCINEMA = next(p for p in demo_web_projects if getattr(p, "id", None) == "autocinema")
 
 
+@pytest.fixture(autouse=True)
+def _no_browser_warm_up():
+    """Browser execution is mocked in these tests; don't launch pooled browsers ahead of it."""
+    with patch.object(ConcurrentEvaluator, "_start_browser_warm_up", return_value=None):
+        yield
+
+
 def _allow_data_url(*, is_web_real: bool, task_url: str | None, candidate_url: str | None):
     """Allow data: URLs in tests so we can use mock HTML without a real server."""
     if candidate_url and candidate_url.strip().lower().startswith("data:"):
@@ -598,7 +605,7 @@ async def test_concurrent_evaluator_exception_in_try():
 
 @pytest.mark.asyncio
 async def test_concurrent_evaluator_gif_recording_success():
-    """With should_record_gif=True and make_gif returning data, gif_recording is set."""
+    """With should_record_gif=True and the GIF recorder returning data, gif_recording is set."""
     html = _make_mock_html()
     data_url = _data_url(html)
     task = _make_task(data_url)
@@ -632,7 +639,8 @@ async def test_concurrent_evaluator_gif_recording_success():
             return_value=_passing_test_results(),
         ),
         patch(
-            "autoppia_iwa.src.evaluation.legacy.concurrent_evaluator.make_gif_from_screenshots",
+            "autoppia_iwa.src.evaluation.legacy.concurrent_evaluator.GifRecorder.finish",
+            new_callable=AsyncMock,
             return_value=fake_gif,
         ),
     ):
@@ -819,11 +827,34 @@ async def test_concurrent_evaluator_evaluate_task_solutions():
     assert results[0].web_agent_id == "agent1"
     assert results[1].web_agent_id == "agent2"
     assert len(evaluator.evaluation_stats) == 2
-    mock_backend.reset_database.assert_any_call(web_agent_id="agent1")
-    mock_backend.reset_database.assert_any_call(web_agent_id="agent2")
+    mock_backend.reset_databases.assert_awaited_once_with(["agent1", "agent2"])
     mock_backend.close.assert_called()
 
 
+@pytest.mark.asyncio
+async def test_concurrent_evaluator_data_extraction_only_skips_backend():
+    """DataExtractionTest-only tasks are scored from extracted_data without resetting or polling the backend."""
+    task = Task(url="http://localhost:8001", prompt="How many books?", web_project_id=PROJECT.id, tests=[DataExtractionTest(expected_answer="42")])
+    mock_backend = AsyncMock()
+    mock_backend.close = AsyncMock()
+
+    with patch(
+        "autoppia_iwa.src.evaluation.legacy.concurrent_evaluator.BackendDemoWebService",
+        return_value=mock_backend,
+    ):
+        evaluator = ConcurrentEvaluator(web_project=PROJECT, config=EvaluatorConfig(verbose_logging=False))
+        solutions = [
+            TaskSolution(task_id=task.id, actions=[], web_agent_id="agent1", extracted_data="42"),
+            TaskSolution(task_id=task.id, actions=[], web_agent_id="agent2", extracted_data="41"),
+        ]
+        results = await evaluator.evaluate_task_solutions(task, solutions)
+
+    assert [r.final_score for r in results] == [1.0, 0.0]
+    assert "event_fetch" in results[0].stats.skipped_phases
+    mock_backend.reset_databases.assert_not_awaited()
+    mock_backend.get_backend_events.assert_not_awaited()
+
+
 @pytest.mark.asyncio
 async def test_concurrent_evaluator_grouping_disabled():
     """With enable_grouping_tasks=False, each solution is evaluated separately (no cloning)."""
@@ -0,0 +1,75 @@
+import base64
+import io
+
+import pytest
+
+Image = pytest.importorskip("PIL.Image")
+
+from autoppia_iwa.src.evaluation.shared.gif_recorder import GifEncoder, GifRecorder
+
+
+def _png(color, size=(40, 20)) -> str:
+    buf = io.BytesIO()
+    Image.new("RGB", size, color=color).save(buf, format="PNG")
+    return base64.b64encode(buf.getvalue()).decode("ascii")
+
+
+def _frames(encoded: bytes) -> list[tuple[tuple[int, int], int]]:
+    gif = Image.open(io.BytesIO(base64.b64decode(encoded)))
+    frames = []
+    for index in range(gif.n_frames):
+        gif.seek(index)
+        frames.append((gif.size, gif.info["duration"]))
+    return frames
+
+
+def test_repeated_frames_extend_the_previous_one():
+    encoder = GifEncoder(duration_ms=100)
+    red, blue = _png((255, 0, 0)), _png((0, 0, 255))
+
+    for screenshot in (red, red, "", blue, _png((0, 0, 255)), red):
+        encoder.add(screenshot)
+
+    assert encoder.frames == 3
+    assert encoder.duplicates == 2
+    assert [duration for _, duration in _frames(encoder.finish())] == [200, 200, 100]
+
+
+def test_frames_are_downscaled_to_the_first_frame_canvas():
+    encoder = GifEncoder(max_width=20)
+    encoder.add(_png((255, 0, 0), size=(40, 20)))
+    encoder.add(_png((0, 255, 0), size=(40, 80)))
+
+    assert [size for size, _ in _frames(encoder.finish())] == [(20, 10), (20, 10)]
+
+
+def test_invalid_screenshots_are_skipped():
+    encoder = GifEncoder()
+    encoder.add("not-valid-base64!!")
+    encoder.add(base64.b64encode(b"not an image").decode("ascii"))
+
+    assert encoder.finish() == b""
+
+
+async def test_recorder_matches_the_synchronous_encoder():
+    screenshots = [_png((i * 40, 0, 0)) for i in range(6)]
+    recorder = GifRecorder(duration_ms=100)
+
+    for screenshot in screenshots:
+        recorder.add_frame(screenshot)
+    result = await recorder.finish()
+
+    encoder = GifEncoder(duration_ms=100)
+    for screenshot in screenshots:
+        encoder.add(screenshot)
+    assert result == encoder.finish()
+    assert len(_frames(result)) == 6
+
+
+async def test_discarded_recording_is_empty():
+    recorder = GifRecorder()
+    recorder.add_frame(_png((255, 0, 0)))
+    recorder.discard()
+    recorder.add_frame(_png((0, 255, 0)))
+
+    assert await recorder.finish() == b""
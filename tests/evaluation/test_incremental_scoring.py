@@ -0,0 +1,203 @@
+"""
+Differential tests for incremental partial-test scoring in TaskExecutionSession.
+
+The incremental path must agree with the full recomputation (merge events into the
+last snapshot, then take the final row of run_partial_tests) at every step.
+"""
+
+import copy
+import random
+from datetime import UTC, datetime, timedelta
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from autoppia_iwa.src.data_generation.tasks.classes import Task
+from autoppia_iwa.src.data_generation.tests.classes import CheckEventTest, DataExtractionTest
+from autoppia_iwa.src.demo_webs.base_events import Event
+from autoppia_iwa.src.demo_webs.classes import BackendEvent
+from autoppia_iwa.src.demo_webs.config import demo_web_projects
+from autoppia_iwa.src.evaluation.shared.test_runner import IncrementalTestRunner
+from autoppia_iwa.src.evaluation.shared.utils import run_partial_tests
+from autoppia_iwa.src.evaluation.stateful_evaluator import TaskExecutionSession, _event_identity, _event_timestamp_utc
+from autoppia_iwa.src.execution.actions.actions import ClickAction
+from autoppia_iwa.src.execution.classes import ActionExecutionResult, BrowserSnapshot
+
+PROJECT = next(p for p in demo_web_projects if getattr(p, "id", None) == "autobooks")
+WEB_AGENT_ID = "agent-inc"
+
+
+def _make_task() -> Task:
+    return Task(
+        id="task-incremental",
+        url="http://localhost:8001",
+        prompt="Search for dune and log in",
+        web_project_id=PROJECT.id,
+        tests=[
+            CheckEventTest(event_name="SEARCH_BOOK", event_criteria={"query": "dune"}),
+            CheckEventTest(event_name="LOGIN_BOOK", event_criteria={"username": "user123"}),
+            CheckEventTest(event_name="BOOK_DETAIL", event_criteria={"year": "not-a-year"}),
+            CheckEventTest(event_name="LOGOUT_BOOK", event_criteria={}),
+            DataExtractionTest(expected_answer="42"),
+        ],
+    )
+
+
+def _random_event(rng: random.Random, ts: datetime) -> BackendEvent:
+    kind = rng.choice(["SEARCH_BOOK", "SEARCH_BOOK", "LOGIN_BOOK", "BOOK_DETAIL", "NOISE"])
+    if kind == "SEARCH_BOOK":
+        data = {"query": rng.choice(["dune", "emma", "it"])}
+    elif kind == "LOGIN_BOOK":
+        data = {"username": rng.choice(["user123", "user7"])}
+    elif kind == "BOOK_DETAIL":
+        data = {"name": "Dune", "year": 1965, "genres": ["Sci-Fi"], "rating": 4.5}
+    else:
+        data = {"value": rng.random()}
+    return BackendEvent(event_name=kind, data=data, web_agent_id=WEB_AGENT_ID, timestamp=ts.isoformat())
+
+
+def _action_result(step: int, events: list[BackendEvent]) -> ActionExecutionResult:
+    action = ClickAction(x=step, y=step)
+    return ActionExecutionResult(
+        action=action,
+        action_event=action.type,
+        successfully_executed=True,
+        browser_snapshot=BrowserSnapshot(
+            iteration=step,
+            action=action,
+            prev_html="<html></html>",
+            current_html="<html></html>",
+            screenshot_before="",
+            screenshot_after="",
+            backend_events=events,
+            current_url="http://localhost:8001",
+        ),
+    )
+
+
+def _build_episode(seed: int, steps: int):
+    """Return per-step (events emitted during the step, extracted answer) tuples."""
+    rng = random.Random(seed)
+    start = datetime.now(UTC)
+    episode = []
+    for step in range(steps):
+        ts = start + timedelta(seconds=step + 1)
+        emitted = [_random_event(rng, ts) for _ in range(rng.choice([0, 0, 1, 2]))]
+        # Stale events from a previous run must be ignored by both paths.
+        if rng.random() < 0.1:
+            emitted.append(BackendEvent(event_name="SEARCH_BOOK", data={"query": "dune"}, web_agent_id=WEB_AGENT_ID, timestamp=(start - timedelta(hours=1)).isoformat()))
+        extracted = rng.choice([None, "42", "41"])
+        episode.append((emitted, extracted))
+    return start, episode
+
+
+async def _reference_final_row(task, history, latest_events, session_floor, extracted_data):
+    """The pre-incremental algorithm: merge events into the last snapshot, rerun all partial tests."""
+    last_snapshot = history[-1].browser_snapshot
+    merged, seen = [], set()
+    for event in [*last_snapshot.backend_events, *latest_events]:
+        event_dt = _event_timestamp_utc(event)
+        if event_dt is not None and event_dt < session_floor:
+            continue
+        event_id = _event_identity(event)
+        if event_id in seen:
+            continue
+        seen.add(event_id)
+        merged.append(event)
+    last_snapshot.backend_events = merged
+    matrix = await run_partial_tests(PROJECT, task, history, extracted_data=extracted_data)
+    return [r.success for r in matrix[-1]]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("seed", [0, 1, 2, 3])
+async def test_incremental_scoring_matches_full_recomputation(seed):
+    task = _make_task()
+    session_floor, episode = _build_episode(seed, steps=40)
+
+    backend_log: list[BackendEvent] = []
+    backend = AsyncMock()
+    backend.get_backend_events = AsyncMock(side_effect=lambda _agent: list(backend_log))
+
+    session = TaskExecutionSession(task=task, web_agent_id=WEB_AGENT_ID)
+    session._project = PROJECT
+    session._backend = backend
+    session._session_start_utc = session_floor
+
+    reference_history: list[ActionExecutionResult] = []
+    for step, (emitted, extracted) in enumerate(episode):
+        backend_log.extend(emitted)
+        result = _action_result(step, list(emitted))
+        session._history.append(result)
+        reference_history.append(copy.deepcopy(result))
+        session.latest_extracted_data = extracted
+
+        score = await session._score_async()
+        expected = await _reference_final_row(task, reference_history, list(backend_log), session_floor, extracted)
+
+        assert score.tests_passed == sum(expected), f"step {step}"
+        assert score.total_tests == len(expected)
+        assert score.success == all(expected)
+
+
+@pytest.mark.asyncio
+async def test_incremental_scoring_parses_each_event_once_on_long_episodes():
+    task = _make_task()
+    session_floor, episode = _build_episode(seed=7, steps=200)
+    backend_log: list[BackendEvent] = []
+    backend = AsyncMock()
+    backend.get_backend_events = AsyncMock(side_effect=lambda _agent: list(backend_log))
+
+    session = TaskExecutionSession(task=task, web_agent_id=WEB_AGENT_ID)
+    session._project = PROJECT
+    session._backend = backend
+    session._session_start_utc = session_floor
+
+    parsed_counts: list[int] = []
+    original_parse_all = Event.parse_all
+
+    def _counting_parse_all(events):
+        parsed_counts.append(len(events))
+        return original_parse_all(events)
+
+    with patch.object(Event, "parse_all", side_effect=_counting_parse_all):
+        for step, (emitted, extracted) in enumerate(episode):
+            backend_log.extend(emitted)
+            session._history.append(_action_result(step, list(emitted)))
+            session.latest_extracted_data = extracted
+            await session._score_async()
+
+    fresh_events = [e for e in backend_log if _event_timestamp_utc(e) >= session_floor]
+    assert sum(parsed_counts) <= len(fresh_events)
+
+
+@pytest.mark.asyncio
+async def test_rescoring_without_new_step_keeps_passed_verdict():
+    task = Task(
+        id="t",
+        url="http://localhost:8001",
+        prompt="p",
+        web_project_id=PROJECT.id,
+        tests=[CheckEventTest(event_name="SEARCH_BOOK", event_criteria={"query": "dune"})],
+    )
+    event = BackendEvent(event_name="SEARCH_BOOK", data={"query": "dune"}, web_agent_id=WEB_AGENT_ID)
+    backend = AsyncMock()
+    backend.get_backend_events = AsyncMock(side_effect=[[], [event], []])
+
+    session = TaskExecutionSession(task=task, web_agent_id=WEB_AGENT_ID)
+    session._project = PROJECT
+    session._backend = backend
+    session._history.append(_action_result(0, []))
+
+    assert (await session._score_async()).success is False
+    # The event shows up late, after the step was already scored.
+    assert (await session.get_score_details()).success is True
+    # A flaky fetch no longer loses the verdict.
+    assert (await session.get_score_details()).success is True
+    assert session._history[-1].browser_snapshot.backend_events == [event]
+
+
+@pytest.mark.asyncio
+async def test_incremental_runner_returns_empty_before_first_snapshot():
+    runner = IncrementalTestRunner(PROJECT, "p", _make_task().tests)
+    assert await runner.evaluate() == []
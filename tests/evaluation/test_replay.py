@@ -0,0 +1,134 @@
+"""Recording and offline replay of evaluated episodes."""
+
+import gzip
+from pathlib import Path
+from unittest.mock import AsyncMock, patch
+
+from autoppia_iwa.src.data_generation.tasks.classes import Task
+from autoppia_iwa.src.data_generation.tests.classes import CheckEventTest, DataExtractionTest, JudgeBaseOnHTML
+from autoppia_iwa.src.demo_webs.classes import BackendEvent
+from autoppia_iwa.src.demo_webs.config import demo_web_projects
+from autoppia_iwa.src.evaluation.classes import EvaluationResult, TestResult
+from autoppia_iwa.src.evaluation.legacy.concurrent_config import EvaluatorConfig
+from autoppia_iwa.src.evaluation.legacy.concurrent_evaluator import ConcurrentEvaluator
+from autoppia_iwa.src.evaluation.shared.replay import EpisodeRecording, RecordingWriter, iter_recordings, replay_recording, replay_recordings
+from autoppia_iwa.src.execution.actions.actions import ClickAction
+from autoppia_iwa.src.execution.classes import ActionExecutionResult, BrowserSnapshot
+from autoppia_iwa.src.web_agents.classes import TaskSolution
+
+WEB_AGENT_ID = "agent-replay"
+
+
+def _task() -> Task:
+    return Task(
+        id="task-replay",
+        url="http://localhost:8001",
+        prompt="Search for dune",
+        web_project_id="autobooks",
+        tests=[
+            CheckEventTest(event_name="SEARCH_BOOK", event_criteria={"query": "dune"}),
+            DataExtractionTest(expected_answer="42"),
+            JudgeBaseOnHTML(success_criteria="The search results are shown"),
+        ],
+    )
+
+
+def _events() -> list[BackendEvent]:
+    return [BackendEvent(event_name="SEARCH_BOOK", data={"query": "dune"}, web_agent_id=WEB_AGENT_ID)]
+
+
+def _history(events: list[BackendEvent]) -> list[ActionExecutionResult]:
+    action = ClickAction(x=1, y=1)
+    snapshot = BrowserSnapshot(
+        iteration=0,
+        action=action,
+        prev_html="<html></html>",
+        current_html="<html></html>",
+        screenshot_before="",
+        screenshot_after="",
+        backend_events=events,
+        current_url="http://localhost:8001/search",
+    )
+    return [ActionExecutionResult(action=action, action_event=action.type, successfully_executed=True, browser_snapshot=snapshot)]
+
+
+def _recording(task: Task, verdicts: list[bool], extracted_data="42", partial: bool = False) -> EpisodeRecording:
+    events = _events()
+    results = [TestResult(success=ok, extra_data=test.model_dump()) for test, ok in zip(task.tests, verdicts, strict=True)]
+    result = EvaluationResult(web_agent_id=WEB_AGENT_ID, test_results=results, execution_history=_history(events))
+    return EpisodeRecording.from_evaluation(task, result, events, extracted_data=extracted_data, partial_results=results if partial else None)
+
+
+async def test_replay_matches_recorded_verdicts():
+    outcome = await replay_recording(_recording(_task(), [True, True, False], partial=True))
+
+    assert outcome.diffs == []
+    assert outcome.error is None
+    assert outcome.replayed_score == outcome.recorded_score
+
+
+async def test_replay_reports_changed_verdicts_and_keeps_judge_verdicts():
+    # Recorded before a (hypothetical) fix: the search test failed and the judge passed.
+    outcome = await replay_recording(_recording(_task(), [False, True, True], partial=True))
+
+    assert [(d.phase, d.test_index, d.recorded, d.replayed) for d in outcome.diffs] == [("global", 0, False, True), ("partial", 0, False, True)]
+    assert outcome.recorded_score == 2 / 3
+    assert outcome.replayed_score == 1.0
+
+
+async def test_recording_freezes_resolved_criteria():
+    task = _task()
+    task.tests[0].event_criteria = {"query": "<book_name>"}
+    # run_global_tests resolves placeholders on a copy; the results carry the criteria that ran.
+    resolved = _task()
+    results = [TestResult(success=True, extra_data=test.model_dump()) for test in resolved.tests]
+    result = EvaluationResult(web_agent_id=WEB_AGENT_ID, test_results=results)
+
+    recording = EpisodeRecording.from_evaluation(task, result, _events(), extracted_data="42")
+
+    assert recording.build_task().tests[0].event_criteria == {"query": "dune"}
+    assert (await replay_recording(recording)).diffs == []
+
+
+async def test_writer_round_trip_skips_torn_trailing_member(tmp_path: Path):
+    path = tmp_path / "recordings" / "run.jsonl.gz"
+    writer = RecordingWriter(path)
+    await writer.append_async(_recording(_task(), [True, True, False]))
+    writer.append(_recording(_task(), [False, True, False]))
+    with open(path, "ab") as f:
+        f.write(gzip.compress(b'{"episode_id": "torn"}\n')[:10])
+
+    recordings = list(iter_recordings(tmp_path))
+    assert [r.global_results for r in recordings] == [[True, True, False], [False, True, False]]
+
+    report = await replay_recordings(tmp_path)
+    assert len(report.episodes) == 2
+    assert [e.replayed_score for e in report.episodes] == [2 / 3, 2 / 3]
+    assert len(report.changed) == 1
+    assert "score 0.333 -> 0.667" in report.summary()
+
+
+async def test_evaluator_records_the_final_partial_row_and_replay_checks_it(tmp_path: Path):
+    task = _task()
+    task.tests = task.tests[:2]  # no LLM judge in the global tests
+    backend = AsyncMock()
+    backend.get_backend_events = AsyncMock(return_value=_events())
+    project = next(p for p in demo_web_projects if p.id == "autobooks")
+    config = EvaluatorConfig(verbose_logging=False, replay_recording_path=str(tmp_path / "run.jsonl.gz"))
+
+    with (
+        patch("autoppia_iwa.src.evaluation.legacy.concurrent_evaluator.BackendDemoWebService", return_value=backend),
+        patch.object(ConcurrentEvaluator, "_start_browser_warm_up", return_value=None),
+        patch.object(ConcurrentEvaluator, "_evaluate_in_browser", new_callable=AsyncMock, return_value=(_history(_events()), [0.1], None)),
+    ):
+        evaluator = ConcurrentEvaluator(web_project=project, config=config)
+        solution = TaskSolution(task_id=task.id, actions=[ClickAction(x=1, y=1)], web_agent_id=WEB_AGENT_ID)
+        solution.extracted_data = "42"
+        await evaluator.evaluate_single_task_solution(task, solution)
+
+    [recording] = list(iter_recordings(tmp_path))
+    outcome = await replay_recording(recording, project)
+
+    assert recording.partial_results == [True, True]
+    assert outcome.diffs == []
+    assert outcome.error is None
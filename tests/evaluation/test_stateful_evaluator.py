@@ -21,7 +21,7 @@ from playwright.async_api import Error as PlaywrightError
 
 from autoppia_iwa.config.config import DEMO_WEB_SERVICE_PORT, DEMO_WEBS_ENDPOINT
 from autoppia_iwa.src.data_generation.tasks.classes import BrowserSpecification, Task
-from autoppia_iwa.src.data_generation.tests.classes import CheckEventTest
+from autoppia_iwa.src.data_generation.tests.classes import CheckEventTest, DataExtractionTest
 from autoppia_iwa.src.demo_webs.classes import BackendEvent
 from autoppia_iwa.src.demo_webs.config import demo_web_projects
 from autoppia_iwa.src.evaluation.scoring import ScoreDetails
@@ -489,6 +489,47 @@ async def test_stateful_evaluator_wrong_solution():
             await evaluator.close()
 
 
+@pytest.mark.asyncio
+async def test_stateful_evaluator_data_extraction_only_skips_backend_work():
+    """DataExtractionTest-only tasks are scored from the extracted answer alone."""
+    html = _make_mock_html()
+    data_url = _data_url(html)
+    task = _make_task(data_url)
+    task.tests = [DataExtractionTest(expected_answer="42")]
+    mock_backend = AsyncMock()
+    mock_backend.close = AsyncMock()
+    action_result = _make_action_result(WaitAction(time_seconds=0.1), url=data_url, html=html)
+    async_playwright_patch, executor_patch, _scorer_patch, _executor_mock, _context = _build_runtime_patches(html=html, url=data_url, action_result=action_result, scores=[])
+
+    with (
+        patch(
+            "autoppia_iwa.src.evaluation.stateful_evaluator._is_navigation_url_allowed",
+            side_effect=_allow_data_url,
+        ),
+        patch(
+            "autoppia_iwa.src.evaluation.stateful_evaluator.BackendDemoWebService",
+            return_value=mock_backend,
+        ),
+        async_playwright_patch,
+        executor_patch as executor_cls,
+    ):
+        evaluator = AsyncStatefulEvaluator(task=task, web_agent_id=WEB_AGENT_ID)
+        try:
+            step_result = await evaluator.reset()
+            assert step_result.score.success is False
+            evaluator.latest_extracted_data = "42"
+            step_result = await evaluator.step(None)
+            assert step_result.score.success is True
+            assert step_result.snapshot.html == html
+            assert "event_fetch" in evaluator.skipped_phases
+        finally:
+            await evaluator.close()
+
+    mock_backend.reset_database.assert_not_awaited()
+    mock_backend.get_backend_events.assert_not_awaited()
+    assert executor_cls.call_args.kwargs["fetch_backend_events"] is False
+
+
 @pytest.mark.integration
 @pytest.mark.asyncio
 async def test_stateful_evaluator_real_server_film_detail():
@@ -41,7 +41,7 @@ def test_minimal_snapshot():
     assert out["html"] == "<p>"
     assert out["url"] == "http://x"
     assert out["error"] == "err"
-    assert out["screenshot"] == ""
+    assert out["screenshot"] == b""
 
 
 @pytest.mark.asyncio
@@ -169,3 +169,78 @@ async def test_executor_does_not_wait_for_load_state_after_type_action():
     assert result.successfully_executed is True
     page.fill.assert_awaited_once()
     page.wait_for_load_state.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_fetch_backend_events_uses_cursor_and_accumulates():
+    from autoppia_iwa.src.demo_webs.classes import WebProject
+    from autoppia_iwa.src.demo_webs.demo_webs_service import BackendDemoWebService
+    from autoppia_iwa.src.demo_webs.local_events_backend import LocalEventsBackend
+
+    async with LocalEventsBackend() as events_backend:
+        project = WebProject(id="local", name="Local", backend_url=events_backend.url, frontend_url=events_backend.url, use_cases=[])
+        service = BackendDemoWebService(project, web_agent_id="agent1")
+        executor = browser_executor.PlaywrightBrowserExecutor(BrowserSpecification(), page=AsyncMock(), backend_demo_webs_service=service)
+        start = datetime.now(UTC)
+
+        events_backend.record("agent1", "FIRST")
+        after_first = await executor._fetch_backend_events_filtered("agent1", start)
+        after_idle = await executor._fetch_backend_events_filtered("agent1", start)
+        events_backend.record("agent1", "SECOND")
+        after_second = await executor._fetch_backend_events_filtered("agent1", start)
+        await service.close()
+
+    assert [e.event_name for e in after_first] == ["FIRST"]
+    assert [e.event_name for e in after_idle] == ["FIRST"]
+    assert [e.event_name for e in after_second] == ["FIRST", "SECOND"]
+    assert executor._backend_events_cursor == 2
+
+
+@pytest.mark.asyncio
+async def test_executor_screenshots_follow_policy_and_reuse_unchanged_page():
+    from autoppia_iwa.src.execution.actions.actions import WaitAction
+    from autoppia_iwa.src.execution.screenshots import ScreenshotConfig
+
+    page = AsyncMock()
+    page.content = AsyncMock(return_value="<html>static</html>")
+    page.url = "http://example.com"
+    page.screenshot = AsyncMock(return_value=b"\xff\xd8jpeg")
+    config = BrowserSpecification()
+
+    executor = browser_executor.PlaywrightBrowserExecutor(config, page=page)
+    result = await executor.execute_single_action(WaitAction(time_seconds=0), "agent1", 0, is_web_real=True)
+    assert result.browser_snapshot.screenshot_after == b""
+    page.screenshot.assert_not_called()
+
+    executor = browser_executor.PlaywrightBrowserExecutor(config, page=page, screenshot_config=ScreenshotConfig(policy="every_n", every_n=2))
+    for iteration in range(3):
+        result = await executor.execute_single_action(WaitAction(time_seconds=0), "agent1", iteration, is_web_real=True)
+    assert result.browser_snapshot.screenshot_before == b"\xff\xd8jpeg"
+    # Steps 0 and 2 are captured; each "before" reuses the previous image of the unchanged page.
+    assert page.screenshot.await_count == 3
+    page.screenshot.assert_awaited_with(type="jpeg", full_page=False, quality=85)
+
+
+@pytest.mark.asyncio
+async def test_events_recorded_before_the_first_action_are_not_attributed_to_it():
+    from autoppia_iwa.src.demo_webs.classes import WebProject
+    from autoppia_iwa.src.demo_webs.demo_webs_service import BackendDemoWebService
+    from autoppia_iwa.src.demo_webs.local_events_backend import LocalEventsBackend
+    from autoppia_iwa.src.execution.actions.actions import WaitAction
+
+    page = AsyncMock()
+    page.content = AsyncMock(return_value="<html></html>")
+    page.url = "http://example.com"
+    async with LocalEventsBackend() as events_backend:
+        project = WebProject(id="local", name="Local", backend_url=events_backend.url, frontend_url=events_backend.url, use_cases=[])
+        service = BackendDemoWebService(project, web_agent_id="agent1")
+        executor = browser_executor.PlaywrightBrowserExecutor(BrowserSpecification(), page=page, backend_demo_webs_service=service)
+        events_backend.record("agent1", "LEFT_OVER")
+
+        first = await executor.execute_single_action(WaitAction(time_seconds=0), "agent1", 0, is_web_real=False)
+        events_backend.record("agent1", "CLICK")
+        second = await executor.execute_single_action(WaitAction(time_seconds=0), "agent1", 1, is_web_real=False)
+        await service.close()
+
+    assert first.browser_snapshot.backend_events == []
+    assert [e.event_name for e in second.browser_snapshot.backend_events] == ["CLICK"]
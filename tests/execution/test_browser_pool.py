@@ -0,0 +1,343 @@
+"""Unit tests for BrowserPool using fake Playwright objects (no Chromium required)."""
+
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from autoppia_iwa.src.data_generation.tasks.classes import BrowserSpecification, Task
+from autoppia_iwa.src.evaluation.legacy.concurrent_config import EvaluatorConfig
+from autoppia_iwa.src.evaluation.legacy.concurrent_evaluator import ConcurrentEvaluator
+from autoppia_iwa.src.execution.browser_pool import BrowserPool, BrowserPoolMetrics
+
+
+class FakeContext:
+    def __init__(self, options):
+        self.options = options
+        self.closed = False
+        self.cookies_cleared = False
+        self.unrouted = False
+
+    async def unroute_all(self, behavior=None):
+        self.unrouted = True
+
+    async def clear_cookies(self):
+        self.cookies_cleared = True
+
+    async def close(self):
+        self.closed = True
+
+
+class FakeBrowser:
+    def __init__(self, args):
+        self.args = args
+        self.connected = True
+        self.closed = False
+        self.contexts: list[FakeContext] = []
+
+    def is_connected(self):
+        return self.connected and not self.closed
+
+    async def new_context(self, **options):
+        context = FakeContext(options)
+        self.contexts.append(context)
+        return context
+
+    async def close(self):
+        self.closed = True
+
+
+class FakeChromium:
+    def __init__(self, launch_delay: float = 0.0):
+        self.launch_delay = launch_delay
+        self.browsers: list[FakeBrowser] = []
+
+    async def launch(self, headless=True, args=None):
+        if self.launch_delay:
+            await asyncio.sleep(self.launch_delay)
+        browser = FakeBrowser(args or [])
+        self.browsers.append(browser)
+        return browser
+
+
+class FakePlaywright:
+    def __init__(self, chromium: FakeChromium):
+        self.chromium = chromium
+        self.stopped = False
+
+    async def start(self):
+        return self
+
+    async def stop(self):
+        self.stopped = True
+
+
+def _make_pool(**kwargs):
+    chromium = FakeChromium(kwargs.pop("launch_delay", 0.0))
+    playwright = FakePlaywright(chromium)
+    pool = BrowserPool(playwright_factory=lambda: playwright, headless=True, **kwargs)
+    return pool, chromium, playwright
+
+
+@pytest.mark.asyncio
+async def test_lease_reuses_running_browser():
+    pool, chromium, _ = _make_pool(size=1)
+
+    async with pool.lease() as first:
+        pass
+    async with pool.lease() as second:
+        pass
+
+    assert len(chromium.browsers) == 1
+    assert first is not second
+    assert pool.metrics.leases == 2
+    assert pool.metrics.hits == 1
+    assert pool.metrics.launches == 1
+    assert pool.metrics.hit_rate == 0.5
+    await pool.aclose()
+
+
+@pytest.mark.asyncio
+async def test_returned_context_is_scrubbed_and_closed():
+    pool, _, _ = _make_pool(size=1)
+
+    async with pool.lease(extra_http_headers={"X-WebAgent-Id": "a1"}, no_viewport=True) as context:
+        assert context.options == {"extra_http_headers": {"X-WebAgent-Id": "a1"}, "no_viewport": True}
+
+    assert context.unrouted is True
+    assert context.cookies_cleared is True
+    assert context.closed is True
+    await pool.aclose()
+
+
+@pytest.mark.asyncio
+async def test_browser_recycled_after_max_uses():
+    pool, chromium, _ = _make_pool(size=1, max_uses_per_browser=2)
+
+    for _ in range(3):
+        async with pool.lease():
+            pass
+
+    assert len(chromium.browsers) == 2
+    assert chromium.browsers[0].closed is True
+    assert chromium.browsers[1].closed is False
+    assert pool.metrics.recycles == 1
+    await pool.aclose()
+
+
+@pytest.mark.asyncio
+async def test_disconnected_browser_is_replaced():
+    pool, chromium, _ = _make_pool(size=1)
+
+    async with pool.lease():
+        pass
+    chromium.browsers[0].connected = False
+    async with pool.lease():
+        pass
+
+    assert len(chromium.browsers) == 2
+    assert pool.metrics.recycles == 1
+    await pool.aclose()
+
+
+@pytest.mark.asyncio
+async def test_leases_wait_when_pool_is_saturated():
+    pool, chromium, _ = _make_pool(size=1, max_contexts_per_browser=1)
+    release = asyncio.Event()
+    order: list[str] = []
+
+    async def holder():
+        async with pool.lease():
+            order.append("holder")
+            await release.wait()
+
+    async def waiter():
+        async with pool.lease():
+            order.append("waiter")
+
+    holder_task = asyncio.create_task(holder())
+    await asyncio.sleep(0)
+    waiter_task = asyncio.create_task(waiter())
+    await asyncio.sleep(0.05)
+    assert order == ["holder"]
+
+    release.set()
+    await asyncio.gather(holder_task, waiter_task)
+
+    assert order == ["holder", "waiter"]
+    assert len(chromium.browsers) == 1
+    assert pool.metrics.max_wait_time >= 0.04
+    await pool.aclose()
+
+
+@pytest.mark.asyncio
+async def test_concurrent_leases_spread_over_browsers_up_to_size():
+    pool, chromium, _ = _make_pool(size=2, max_contexts_per_browser=2, launch_delay=0.01)
+    active = 0
+    peak = 0
+
+    async def use():
+        nonlocal active, peak
+        async with pool.lease():
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.02)
+            active -= 1
+
+    await asyncio.gather(*(use() for _ in range(8)))
+
+    assert len(chromium.browsers) == 2
+    assert peak == pool.capacity == 4
+    assert pool.metrics.leases == 8
+    await pool.aclose()
+
+
+@pytest.mark.asyncio
+async def test_mismatched_launch_args_never_share_a_browser():
+    pool, chromium, _ = _make_pool(size=1)
+
+    async with pool.lease(launch_args=["--window-size=800,600"]):
+        pass
+    async with pool.lease(launch_args=["--window-size=1920,1080"]):
+        pass
+
+    assert [b.args for b in chromium.browsers] == [["--window-size=800,600"], ["--window-size=1920,1080"]]
+    assert chromium.browsers[0].closed is True
+    await pool.aclose()
+
+
+@pytest.mark.asyncio
+async def test_launch_failure_frees_slot_and_is_counted():
+    pool, chromium, _ = _make_pool(size=1)
+    chromium.launch = AsyncMock(side_effect=RuntimeError("chromium not found"))
+
+    with pytest.raises(RuntimeError, match="chromium not found"):
+        async with pool.lease():
+            pass
+
+    assert pool.metrics.launch_failures == 1
+    assert pool._launching == 0
+    await pool.aclose()
+
+
+@pytest.mark.asyncio
+async def test_aclose_closes_browsers_and_rejects_new_leases():
+    pool, chromium, playwright = _make_pool(size=2)
+    async with pool.lease():
+        pass
+
+    await pool.aclose()
+
+    assert all(b.closed for b in chromium.browsers)
+    assert playwright.stopped is True
+    with pytest.raises(RuntimeError, match="closed"):
+        async with pool.lease():
+            pass
+
+
+def test_invalid_sizes_rejected():
+    with pytest.raises(ValueError):
+        BrowserPool(size=0)
+    with pytest.raises(ValueError):
+        BrowserPool(max_contexts_per_browser=0)
+    with pytest.raises(ValueError):
+        BrowserPool(max_uses_per_browser=0)
+
+
+def test_metrics_as_dict():
+    metrics = BrowserPoolMetrics()
+    metrics.record_lease(0.5, hit=False)
+    metrics.record_lease(0.1, hit=True)
+    data = metrics.as_dict()
+    assert data["leases"] == 2
+    assert data["hit_rate"] == 0.5
+    assert data["max_wait_time"] == 0.5
+    assert data["avg_wait_time"] == 0.3
+
+
+@pytest.mark.asyncio
+async def test_concurrent_evaluator_leases_from_injected_pool():
+    """An injected pool is used for browser execution and is not closed by the evaluator."""
+    from autoppia_iwa.src.demo_webs.config import demo_web_projects
+
+    project = next(p for p in demo_web_projects if getattr(p, "id", None) == "autobooks")
+    pool, chromium, _ = _make_pool(size=1)
+    task = Task(id="pool-task", url="http://localhost:8001", prompt="p", web_project_id=project.id, specifications=BrowserSpecification(), tests=[])
+    mock_backend = AsyncMock()
+
+    with patch("autoppia_iwa.src.evaluation.legacy.concurrent_evaluator.BackendDemoWebService", return_value=mock_backend):
+        evaluator = ConcurrentEvaluator(web_project=project, config=EvaluatorConfig(), browser_pool=pool)
+        evaluator._execute_actions_in_context = AsyncMock(return_value=([], [], None))
+        await evaluator._evaluate_in_browser(task, "agent-1", [], is_web_real=False)
+        await evaluator._evaluate_in_browser(task, "agent-2", [], is_web_real=False)
+        await evaluator.aclose()
+
+    assert len(chromium.browsers) == 1
+    assert not pool.closed
+    assert evaluator.browser_pool_metrics["leases"] == 2
+    context = evaluator._execute_actions_in_context.await_args_list[1].args[0]
+    assert context.options["extra_http_headers"]["X-WebAgent-Id"] == "agent-2"
+    await pool.aclose()
+
+
+def test_concurrent_evaluator_pool_disabled_reports_no_metrics():
+    from autoppia_iwa.src.demo_webs.config import demo_web_projects
+
+    project = next(p for p in demo_web_projects if getattr(p, "id", None) == "autobooks")
+    evaluator = ConcurrentEvaluator(web_project=project, config=EvaluatorConfig(browser_pool_size=0))
+    assert evaluator._get_browser_pool() is None
+    assert evaluator.browser_pool_metrics is None
+
+
+@pytest.mark.asyncio
+async def test_warm_up_launches_browsers_without_consuming_uses():
+    pool, chromium, _ = _make_pool(size=2, max_uses_per_browser=1)
+
+    assert await pool.warm_up(5, launch_args=["--a"]) == 2
+    assert await pool.warm_up(2, launch_args=["--a"]) == 0
+    async with pool.lease(launch_args=["--a"]):
+        pass
+
+    assert len(chromium.browsers) == 2
+    assert pool.metrics.hits == 1
+    assert pool.metrics.launches == 2
+    await pool.aclose()
+    assert await pool.warm_up() == 0
+
+
+@pytest.mark.asyncio
+async def test_concurrent_evaluator_resets_backend_while_browsers_warm_up():
+    from autoppia_iwa.src.data_generation.tests.classes import CheckEventTest
+    from autoppia_iwa.src.demo_webs.config import demo_web_projects
+    from autoppia_iwa.src.web_agents.classes import TaskSolution
+
+    project = next(p for p in demo_web_projects if getattr(p, "id", None) == "autobooks")
+    pool, chromium, _ = _make_pool(size=1, launch_delay=0.2)
+    task = Task(
+        id="warm-task",
+        url="http://localhost:8001",
+        prompt="p",
+        web_project_id=project.id,
+        tests=[CheckEventTest(event_name="LOGIN_BOOK", event_criteria={})],
+    )
+    solutions = [TaskSolution(task_id=task.id, actions=[], web_agent_id=f"agent-{i}") for i in range(3)]
+    mock_backend = AsyncMock()
+
+    async def _slow_reset(web_agent_ids):
+        await asyncio.sleep(0.2)
+        return True
+
+    mock_backend.reset_databases = AsyncMock(side_effect=_slow_reset)
+
+    with patch("autoppia_iwa.src.evaluation.legacy.concurrent_evaluator.BackendDemoWebService", return_value=mock_backend):
+        evaluator = ConcurrentEvaluator(web_project=project, config=EvaluatorConfig(), browser_pool=pool)
+        evaluator._group_and_evaluate_task_solutions = AsyncMock(return_value=[])
+        started = asyncio.get_running_loop().time()
+        await evaluator.evaluate_task_solutions(task, solutions)
+        elapsed = asyncio.get_running_loop().time() - started
+
+    mock_backend.reset_databases.assert_awaited_once_with(["agent-0", "agent-1", "agent-2"])
+    assert len(chromium.browsers) == 1
+    assert chromium.browsers[0].args == ["--window-size=1920,1080"]
+    assert elapsed < 0.35
+    await pool.aclose()
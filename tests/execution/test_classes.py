@@ -1,8 +1,12 @@
 """Tests for execution.classes."""
 
+import base64
+import json
+
 from autoppia_iwa.src.demo_webs.classes import BackendEvent
 from autoppia_iwa.src.execution.actions.actions import NavigateAction
 from autoppia_iwa.src.execution.classes import ActionExecutionResult, BrowserSnapshot
+from autoppia_iwa.src.execution.html_history import HtmlHistory
 
 
 def test_browser_snapshot_model_dump():
@@ -28,6 +32,53 @@ def test_browser_snapshot_model_dump():
     assert "screenshot_before" not in out
 
 
+def test_browser_snapshot_html_fields_stay_declared_with_html_refs():
+    history = HtmlHistory()
+    snapshot = BrowserSnapshot(
+        iteration=1,
+        action=NavigateAction(url="http://example.com"),
+        prev_html=history.add("<p>before</p>"),
+        current_html=history.add("<p>after</p>"),
+        screenshot_before="",
+        screenshot_after="",
+        backend_events=[],
+        current_url="http://example.com",
+    )
+
+    assert {"prev_html", "current_html"} <= set(BrowserSnapshot.model_fields)
+    assert BrowserSnapshot.model_json_schema()["properties"]["current_html"]["type"] == "string"
+    assert snapshot.current_html == "<p>after</p>"
+    dumped = json.loads(snapshot.model_dump_json())
+    assert dumped["prev_html"] == "<p>before</p>"
+    assert dumped["current_html"] == "<p>after</p>"
+    assert BrowserSnapshot.model_validate(dumped).current_html == "<p>after</p>"
+
+    snapshot.current_html = history.add("<p>later</p>")
+    assert snapshot.current_html == "<p>later</p>"
+
+
+def test_browser_snapshot_screenshot_bytes_round_trip_through_json():
+    png = b"\x89PNG\r\n\x1a\n\x00\xff"
+    snapshot = BrowserSnapshot(
+        iteration=0,
+        action=NavigateAction(url="http://example.com"),
+        prev_html="",
+        current_html="",
+        screenshot_before=png,
+        screenshot_after="",
+        backend_events=[],
+        current_url="",
+    )
+
+    dumped = json.loads(snapshot.model_dump_json())
+    restored = BrowserSnapshot.model_validate_json(snapshot.model_dump_json())
+
+    assert dumped["screenshot_before"] == base64.b64encode(png).decode("ascii")
+    assert restored.screenshot_before == png
+    assert snapshot.model_dump(mode="json")["html"] == ""
+    assert snapshot.model_dump()["prev_html"] == ""
+
+
 def test_action_execution_result_model_dump():
     action = NavigateAction(url="http://example.com")
     snapshot = BrowserSnapshot(
@@ -0,0 +1,97 @@
+"""Tests for execution.html_history."""
+
+import copy
+import pickle
+import random
+import tracemalloc
+
+import pytest
+
+from autoppia_iwa.src.execution.actions.actions import ClickAction
+from autoppia_iwa.src.execution.classes import BrowserSnapshot
+from autoppia_iwa.src.execution.html_history import HtmlHistory, HtmlRef
+
+
+def _page(step: int, rows: int = 4000) -> str:
+    body = "".join(f"<tr><td>row {i}</td><td>{'x' * 40}</td></tr>" for i in range(rows))
+    return f"<html><body><span id='counter'>{step}</span><table>{body}</table><footer>{step % 7}</footer></body></html>"
+
+
+def test_every_version_round_trips_in_any_read_order():
+    rng = random.Random(7)
+    history = HtmlHistory(keyframe_interval=4)
+    pages = []
+    text = "<html><body>" + "abc" * 200 + "</body></html>"
+    for _ in range(40):
+        position = rng.randrange(len(text))
+        text = text[:position] + rng.choice(["", "<b>new</b>", "zz"]) + text[position + rng.randrange(5) :]
+        pages.append(text)
+    refs = [history.add(page) for page in pages]
+
+    order = list(range(len(refs)))
+    rng.shuffle(order)
+    for index in order + list(range(len(refs))):
+        assert str(refs[index]) == pages[index]
+
+
+def test_identical_documents_share_one_version_and_empty_is_not_stored():
+    history = HtmlHistory()
+    first = history.add("<html>a</html>")
+
+    assert history.add("<html>" + "a</html>") is first
+    assert history.add("") == ""
+    assert len(history) == 1
+
+
+def test_large_rewrites_are_stored_as_keyframes():
+    history = HtmlHistory()
+    history.add("a" * 1000)
+    history.add("b" * 1000)
+
+    assert history.stored_chars == 2000
+
+
+def test_ref_equality_copy_and_pickle():
+    history = HtmlHistory()
+    ref = history.add("<p>one</p>")
+
+    assert ref == "<p>one</p>"
+    assert ref == HtmlRef(history, 0)
+    assert copy.deepcopy(ref) is ref
+    assert str(pickle.loads(pickle.dumps(ref))) == "<p>one</p>"
+
+
+def test_invalid_keyframe_interval_is_rejected():
+    with pytest.raises(ValueError):
+        HtmlHistory(keyframe_interval=0)
+
+
+def test_snapshots_of_a_long_episode_use_a_fraction_of_the_memory():
+    def record(history: HtmlHistory | None) -> tuple[list[BrowserSnapshot], int]:
+        tracemalloc.start()
+        snapshots = []
+        for step in range(100):
+            # page.content() returns a new string every call, even for an unchanged page.
+            before, after = _page(step), _page(step + 1)
+            snapshots.append(
+                BrowserSnapshot(
+                    iteration=step,
+                    action=ClickAction(x=1, y=1),
+                    prev_html=history.add(before) if history is not None else before,
+                    current_html=history.add(after) if history is not None else after,
+                    screenshot_before="",
+                    screenshot_after="",
+                    backend_events=[],
+                    current_url="http://localhost",
+                )
+            )
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        return snapshots, peak
+
+    full, full_peak = record(None)
+    delta, delta_peak = record(HtmlHistory())
+
+    assert delta_peak * 10 < full_peak
+    assert [snapshot.current_html for snapshot in delta] == [snapshot.current_html for snapshot in full]
+    assert delta[42].prev_html == _page(42)
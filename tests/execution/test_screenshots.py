@@ -0,0 +1,96 @@
+"""Tests for execution.screenshots."""
+
+import base64
+import io
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import pytest
+from PIL import Image
+
+from autoppia_iwa.src.execution.screenshots import (
+    ScreenshotConfig,
+    capture_screenshot,
+    screenshot_data_url,
+    screenshot_mime_type,
+    screenshot_to_base64,
+    screenshot_to_bytes,
+    task_has_screenshot_judge,
+)
+
+
+def _png(width: int = 40, height: int = 20) -> bytes:
+    out = io.BytesIO()
+    Image.new("RGB", (width, height), "red").save(out, format="PNG")
+    return out.getvalue()
+
+
+@pytest.mark.parametrize(
+    ("config", "expected"),
+    [
+        (ScreenshotConfig(policy="never"), [False, False, False, False]),
+        (ScreenshotConfig(policy="on_demand"), [False, False, True, False]),
+        (ScreenshotConfig(policy="judge"), [False, True, True, False]),
+        (ScreenshotConfig(policy="every_n", every_n=3), [True, True, True, False]),
+    ],
+)
+def test_policy_decides_which_steps_are_captured(config, expected):
+    calls = [
+        config.wants(0),
+        config.wants(0, judge=True),
+        config.wants(4, requested=True),
+        config.wants(4),
+    ]
+    if config.policy == "every_n":
+        calls[1] = config.wants(3, judge=True)
+    assert calls == expected
+
+
+@pytest.mark.parametrize("kwargs", [{"policy": "sometimes"}, {"image_format": "gif"}, {"every_n": 0}, {"quality": 101}, {"scale": 0}])
+def test_invalid_settings_are_rejected(kwargs):
+    with pytest.raises(ValueError):
+        ScreenshotConfig(**kwargs)
+
+
+@pytest.mark.asyncio
+async def test_jpeg_and_png_are_taken_directly_by_playwright():
+    page = SimpleNamespace(screenshot=AsyncMock(return_value=b"img"))
+
+    assert await capture_screenshot(page, ScreenshotConfig(quality=60)) == b"img"
+    page.screenshot.assert_awaited_with(type="jpeg", full_page=False, quality=60)
+
+    await capture_screenshot(page, ScreenshotConfig(image_format="png", full_page=True))
+    page.screenshot.assert_awaited_with(type="png", full_page=True)
+
+
+@pytest.mark.asyncio
+async def test_webp_and_downscale_are_reencoded_from_png():
+    page = SimpleNamespace(screenshot=AsyncMock(return_value=_png()))
+
+    data = await capture_screenshot(page, ScreenshotConfig(image_format="webp", scale=0.5))
+
+    page.screenshot.assert_awaited_with(type="png", full_page=False)
+    image = Image.open(io.BytesIO(data))
+    assert image.format == "WEBP"
+    assert image.size == (20, 10)
+    assert screenshot_mime_type(data) == "image/webp"
+
+
+def test_serialization_helpers_round_trip_bytes_and_legacy_base64():
+    png = _png()
+    encoded = base64.b64encode(png).decode("ascii")
+
+    assert screenshot_to_base64(png) == encoded
+    assert screenshot_to_base64(encoded) == encoded
+    assert screenshot_to_bytes(encoded) == png
+    assert screenshot_to_bytes(f"data:image/png;base64,{encoded}") == png
+    assert screenshot_data_url(png) == f"data:image/png;base64,{encoded}"
+    assert screenshot_data_url(b"\xff\xd8\xff").startswith("data:image/jpeg;base64,")
+    assert screenshot_data_url(b"") is None
+    assert screenshot_mime_type("bm90IGFuIGltYWdl", default="image/jpeg") == "image/jpeg"
+
+
+def test_task_has_screenshot_judge():
+    assert task_has_screenshot_judge(SimpleNamespace(tests=[SimpleNamespace(type="JudgeBaseOnScreenshot")]))
+    assert not task_has_screenshot_judge(SimpleNamespace(tests=[SimpleNamespace(type="CheckEventTest")]))
+    assert not task_has_screenshot_judge(SimpleNamespace(tests=None))
@@ -0,0 +1,228 @@
+"""
+Concurrent task generation against a local fake OpenAI-compatible LLM server.
+
+The server injects per-prompt latency (so completion order differs from submission
+order) and answers the first requests with HTTP 429.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import random
+import time
+
+import pytest
+from aiohttp import web
+
+from autoppia_iwa.src.data_generation.tasks.simple.simple_task_generator import SimpleTaskGenerator
+from autoppia_iwa.src.demo_webs.base_events import Event
+from autoppia_iwa.src.demo_webs.classes import UseCase, WebProject
+from autoppia_iwa.src.llms import rate_limiter as rate_limiter_module
+from autoppia_iwa.src.llms.interfaces import LLMConfig
+from autoppia_iwa.src.llms.providers.chutes import ChutesLLMService
+from autoppia_iwa.src.llms.rate_limiter import LLMRateLimiter
+
+
+class _GenEvent(Event):
+    event_name: str = "GEN_EVENT"
+
+
+class FakeLLMServer:
+    """Chat-completions endpoint with deterministic per-prompt answers and latency."""
+
+    def __init__(self, max_latency: float = 0.05, rate_limited_requests: int = 0) -> None:
+        self.max_latency = max_latency
+        self.rate_limited_requests = rate_limited_requests
+        self.requests = 0
+        self.in_flight = 0
+        self.peak_in_flight = 0
+        self._runner: web.AppRunner | None = None
+        self.url = ""
+
+    async def _handle(self, request: web.Request) -> web.Response:
+        self.requests += 1
+        if self.requests <= self.rate_limited_requests:
+            return web.json_response({"error": "rate limited"}, status=429, headers={"Retry-After": "0.05"})
+
+        body = await request.json()
+        user_prompt = body["messages"][-1]["content"]
+        digest = hashlib.sha256(user_prompt.encode()).hexdigest()
+        self.in_flight += 1
+        self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(int(digest[:4], 16) / 0xFFFF * self.max_latency)
+        finally:
+            self.in_flight -= 1
+        return web.json_response({"choices": [{"message": {"content": json.dumps([f"Task {digest[:8]}"])}}]})
+
+    async def __aenter__(self) -> FakeLLMServer:
+        app = web.Application()
+        app.router.add_post("/v1/chat/completions", self._handle)
+        self._runner = web.AppRunner(app)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, "127.0.0.1", 0)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]
+        self.url = f"http://127.0.0.1:{port}/v1"
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self._runner.cleanup()
+
+
+def _make_project(n_use_cases: int) -> WebProject:
+    use_cases = [
+        UseCase(
+            name=f"USE_CASE_{i}",
+            description=f"Use case number {i}",
+            event=_GenEvent,
+            event_source_code="class GenEvent: pass",
+            examples=[{"prompt": f"Do {i}", "prompt_for_task_generation": f"Do {i}"}],
+        )
+        for i in range(n_use_cases)
+    ]
+    return WebProject(id="fake", name="Fake", backend_url="http://fake/api/", frontend_url="http://fake/", use_cases=use_cases)
+
+
+def _generator(server: FakeLLMServer, max_concurrency: int, n_use_cases: int) -> SimpleTaskGenerator:
+    llm = ChutesLLMService(LLMConfig(model="fake", max_tokens=64), base_url=server.url, api_key="key")
+    return SimpleTaskGenerator(web_project=_make_project(n_use_cases), llm_service=llm, retry_delay=0.01, max_concurrency=max_concurrency)
+
+
+async def _generate(server: FakeLLMServer, max_concurrency: int, n_use_cases: int = 4, prompts: int = 3) -> list[tuple[str, str]]:
+    random.seed(1234)
+    tasks = await _generator(server, max_concurrency, n_use_cases).generate(prompts_per_use_case=prompts, dynamic=True)
+    return [(task.url, task.prompt) for task in tasks]
+
+
+async def _generate_one_use_case_at_a_time(server: FakeLLMServer, n_use_cases: int = 4, prompts: int = 3) -> list[tuple[str, str]]:
+    random.seed(1234)
+    generator = _generator(server, 1, n_use_cases)
+    tasks = []
+    for use_case in generator.web_project.use_cases:
+        tasks.extend(await generator.generate_tasks_for_use_case(use_case, number_of_prompts=prompts, dynamic=True))
+    return [(task.url, task.prompt) for task in tasks]
+
+
+@pytest.fixture
+def shared_rate_limiter(monkeypatch):
+    limiter = LLMRateLimiter()
+    monkeypatch.setattr(rate_limiter_module, "_shared_rate_limiter", limiter)
+    return limiter
+
+
+@pytest.mark.asyncio
+async def test_concurrent_generation_matches_sequential_output(shared_rate_limiter):
+    async with FakeLLMServer() as server:
+        sequential = await _generate(server, max_concurrency=1)
+        assert server.peak_in_flight == 1
+
+        server.peak_in_flight = 0
+        concurrent = await _generate(server, max_concurrency=6)
+
+    assert len(sequential) == 12
+    assert concurrent == sequential
+    assert 1 < server.peak_in_flight <= 6
+
+
+@pytest.mark.asyncio
+async def test_concurrent_generation_matches_one_use_case_at_a_time(shared_rate_limiter):
+    async with FakeLLMServer() as server:
+        one_at_a_time = await _generate_one_use_case_at_a_time(server)
+        server.max_latency = 0.2  # different completion order
+        concurrent = await _generate(server, max_concurrency=12)
+
+    assert len(one_at_a_time) == 12
+    assert len({url for url, _ in one_at_a_time}) > 1
+    assert concurrent == one_at_a_time
+
+
+@pytest.mark.asyncio
+async def test_output_does_not_depend_on_where_dataset_loads_suspend(shared_rate_limiter, monkeypatch):
+    async def _suspending_load(self, seed):
+        await asyncio.sleep((seed % 7) / 1000)
+        return None
+
+    monkeypatch.setattr(SimpleTaskGenerator, "_load_dataset", _suspending_load)
+    async with FakeLLMServer() as server:
+        one_at_a_time = await _generate_one_use_case_at_a_time(server)
+        concurrent = await _generate(server, max_concurrency=12)
+
+    assert len(concurrent) == 12
+    assert concurrent == one_at_a_time
+
+
+@pytest.mark.asyncio
+async def test_random_stream_is_only_swapped_in_while_its_coroutine_runs():
+    from autoppia_iwa.src.data_generation.tasks.simple.simple_task_generator import _RandomStream
+
+    async def _draws(delay: float) -> list[int]:
+        values = []
+        for _ in range(3):
+            values.append(random.randint(1, 999))
+            await asyncio.sleep(delay)
+        return values
+
+    expected = [await _RandomStream(seed).run(_draws(0)) for seed in (1, 2)]
+    random.seed(99)
+    interleaved = await asyncio.gather(_RandomStream(1).run(_draws(0.002)), _RandomStream(2).run(_draws(0.001)))
+
+    assert list(interleaved) == expected
+    assert random.random() == random.Random(99).random()
+
+
+@pytest.mark.asyncio
+async def test_generation_does_not_disturb_the_global_random_stream(shared_rate_limiter):
+    async with FakeLLMServer() as server:
+        await _generate(server, max_concurrency=6)
+        after_generation = random.random()
+
+    random.seed(1234)
+    for _ in range(4):  # one stream seed per use case
+        random.getrandbits(64)
+    assert after_generation == random.random()
+
+
+@pytest.mark.asyncio
+async def test_concurrent_generation_is_faster_than_sequential(shared_rate_limiter):
+    async with FakeLLMServer(max_latency=0.2) as server:
+        await _generate(server, max_concurrency=1, n_use_cases=1, prompts=1)  # warm-up
+
+        started = time.perf_counter()
+        await _generate(server, max_concurrency=1)
+        sequential_elapsed = time.perf_counter() - started
+
+        started = time.perf_counter()
+        tasks = await _generate(server, max_concurrency=12)
+        concurrent_elapsed = time.perf_counter() - started
+
+    assert len(tasks) == 12
+    assert concurrent_elapsed < sequential_elapsed / 2
+
+
+@pytest.mark.asyncio
+async def test_rate_limited_responses_pause_and_are_retried(shared_rate_limiter):
+    async with FakeLLMServer(rate_limited_requests=3) as server:
+        tasks = await _generate(server, max_concurrency=4, n_use_cases=2, prompts=2)
+
+    assert len(tasks) == 4
+    assert server.requests == 4 + 3
+
+
+@pytest.mark.asyncio
+async def test_requests_per_minute_limit_applies_to_generation(monkeypatch):
+    limiter = LLMRateLimiter(requests_per_minute=600)
+    monkeypatch.setattr(rate_limiter_module, "_shared_rate_limiter", limiter)
+    for _ in range(599):
+        await limiter.acquire()
+
+    async with FakeLLMServer(max_latency=0.0) as server:
+        started = time.perf_counter()
+        tasks = await _generate(server, max_concurrency=4, n_use_cases=1, prompts=4)
+        elapsed = time.perf_counter() - started
+
+    assert len(tasks) == 4
+    # One request fits in the bucket; the other three wait ~0.1s each.
+    assert elapsed >= 0.25
@@ -0,0 +1,118 @@
+"""Unit tests for data_generation.tests.judge_cache and its use by JudgeBaseOnHTML."""
+
+import asyncio
+
+from autoppia_iwa.src.data_generation.tests import judge_cache as judge_cache_module
+from autoppia_iwa.src.data_generation.tests.classes import JudgeBaseOnHTML
+from autoppia_iwa.src.data_generation.tests.judge_cache import HTMLJudgeCache
+from autoppia_iwa.src.execution.actions.actions import ClickAction
+from autoppia_iwa.src.execution.classes import BrowserSnapshot
+
+
+def _judge(verdicts: list[bool | None], calls: list[int]):
+    async def judge():
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        return verdicts[len(calls) - 1]
+
+    return judge
+
+
+async def test_verdict_is_computed_once_per_key():
+    cache = HTMLJudgeCache()
+    calls: list[int] = []
+    key = cache.verdict_key("test", "prompt", 2, ["<p>a</p>", "<p>b</p>"])
+
+    assert await cache.verdict(key, _judge([True], calls)) is True
+    assert await cache.verdict(key, _judge([False], calls)) is True
+    assert cache.verdict_key("test", "prompt", 2, ["<p>a</p>", "<p>c</p>"]) != key
+    assert cache.verdict_key("other test", "prompt", 2, ["<p>a</p>", "<p>b</p>"]) != key
+    assert cache.verdict_key("test", "prompt", 3, ["<p>a</p>", "<p>b</p>"]) != key
+    assert calls == [1]
+    assert cache.metrics.verdict_hits == 1
+
+
+async def test_concurrent_identical_judgements_share_one_call():
+    cache = HTMLJudgeCache()
+    calls: list[int] = []
+    key = cache.verdict_key("test", "prompt", 2, ["<p>a</p>"])
+
+    results = await asyncio.gather(*(cache.verdict(key, _judge([True], calls)) for _ in range(4)))
+
+    assert results == [True] * 4
+    assert calls == [1]
+    assert cache.metrics.coalesced == 3
+    assert cache.metrics.as_dict()["llm_calls_saved"] == 3
+
+
+async def test_cancelled_judgement_does_not_cancel_coalesced_ones():
+    cache = HTMLJudgeCache()
+    calls: list[int] = []
+    key = cache.verdict_key("test", "prompt", 2, ["<p>a</p>"])
+    first = asyncio.create_task(cache.verdict(key, _judge([True], calls)))
+    await asyncio.sleep(0)
+    second = asyncio.create_task(cache.verdict(key, _judge([True], calls)))
+    await asyncio.sleep(0)
+
+    first.cancel()
+
+    assert await second is True
+    assert first.cancelled()
+    assert calls == [1]
+    assert await cache.verdict(key, _judge([False], calls)) is True
+
+
+async def test_failed_judgement_is_not_cached():
+    cache = HTMLJudgeCache()
+    calls: list[int] = []
+    key = cache.verdict_key("test", "prompt", 2, ["<p>a</p>"])
+
+    assert await cache.verdict(key, _judge([None, True], calls)) is False
+    assert await cache.verdict(key, _judge([None, True], calls)) is True
+    assert cache.metrics.uncached_failures == 1
+
+
+def test_differences_are_shared_per_page_pair():
+    cache = HTMLJudgeCache()
+
+    first = cache.differences(["<p>a</p>\n", "<p>b</p>\n", "<p>b</p>\n"])
+    second = cache.differences(["<p>a</p>\n", "<p>b</p>\n"])
+
+    assert len(first) == 2 and second == first
+    assert cache.metrics.diff_misses == 2
+    assert cache.metrics.diff_hits == 1
+
+
+def _snapshot(prev_html: str, current_html: str) -> BrowserSnapshot:
+    return BrowserSnapshot(
+        iteration=0,
+        action=ClickAction(x=1, y=1),
+        prev_html=prev_html,
+        current_html=current_html,
+        screenshot_before="",
+        screenshot_after="",
+        backend_events=[],
+        current_url="http://localhost:8001",
+    )
+
+
+async def test_judge_reaches_llm_once_for_identical_pages(monkeypatch):
+    monkeypatch.setattr(judge_cache_module, "HTML_JUDGE_CACHE", HTMLJudgeCache())
+    monkeypatch.setattr("autoppia_iwa.src.data_generation.tests.classes.HTML_JUDGE_CACHE", judge_cache_module.HTML_JUDGE_CACHE)
+    llm_calls: list[list[str]] = []
+
+    async def fake_analyze(self, task_prompt, total_iteration, differences):
+        llm_calls.append(differences)
+        return True
+
+    monkeypatch.setattr(JudgeBaseOnHTML, "_analyze_htmls", fake_analyze)
+    snapshots = [_snapshot("<html><body><p>search</p></body></html>", "<html><body><p>results</p></body></html>")]
+
+    for _ in range(3):  # Three agents landing on the same pages
+        test = JudgeBaseOnHTML(success_criteria="The search results are shown")
+        assert await test.execute_test(None, 0, "Search for dune", snapshots[0], snapshots, 1) is True
+    other = JudgeBaseOnHTML(success_criteria="Something else")
+    assert await other.execute_test(None, 0, "Search for dune", snapshots[0], snapshots, 1) is True
+
+    assert len(llm_calls) == 2
+    assert judge_cache_module.HTML_JUDGE_CACHE.metrics.verdict_hits == 2
@@ -0,0 +1,108 @@
+import asyncio
+import json
+import threading
+
+from autoppia_iwa.src.data_generation.tests.usage_log import UsageLogWriter, get_usage_log_writer
+
+
+def _lines(path):
+    return [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+
+
+def test_records_are_written_in_order_and_flushed(tmp_path):
+    writer = UsageLogWriter(tmp_path / "logs" / "usage.jsonl", batch_size=4)
+
+    for i in range(10):
+        writer.submit({"i": i})
+    writer.flush()
+
+    assert [r["i"] for r in _lines(writer.path)] == list(range(10))
+    writer.close()
+
+
+def test_close_writes_every_record_with_a_tiny_queue(tmp_path):
+    writer = UsageLogWriter(tmp_path / "usage.jsonl", max_pending=2, batch_size=2)
+
+    producers = [threading.Thread(target=lambda n=n: [writer.submit({"p": n, "i": i}) for i in range(50)]) for n in range(4)]
+    for producer in producers:
+        producer.start()
+    for producer in producers:
+        producer.join()
+    writer.close()
+
+    lines = _lines(writer.path)
+    assert len(lines) == writer.written == 200
+    for n in range(4):
+        assert [r["i"] for r in lines if r["p"] == n] == list(range(50))
+    # A closed writer appends late records itself instead of starting another thread
+    writer.submit({"late": True})
+    writer.close()
+    assert writer._thread is None
+    assert _lines(writer.path)[-1] == {"late": True}
+    assert writer.written == 201
+
+
+def _stalled_writer(tmp_path, monkeypatch):
+    writer = UsageLogWriter(tmp_path / "usage.jsonl", max_pending=1, batch_size=1)
+    writing, release = threading.Event(), threading.Event()
+    write = writer._write
+
+    def slow_write(batch):
+        writing.set()
+        release.wait(5)
+        write(batch)
+
+    monkeypatch.setattr(writer, "_write", slow_write)
+    writer.submit({"i": 0})
+    assert writing.wait(5)
+    writer.submit({"i": 1})  # fills the queue while record 0 is being written
+    return writer, release
+
+
+def test_submit_waits_for_room_instead_of_dropping(tmp_path, monkeypatch):
+    writer, release = _stalled_writer(tmp_path, monkeypatch)
+
+    submitter = threading.Thread(target=writer.submit, args=({"i": 2},))
+    submitter.start()
+    submitter.join(0.1)
+    assert submitter.is_alive()  # blocked on the full queue
+
+    release.set()
+    submitter.join(5)
+    writer.close()
+
+    assert [r["i"] for r in _lines(writer.path)] == [0, 1, 2]
+
+
+async def test_asubmit_waits_for_room_off_the_event_loop(tmp_path, monkeypatch):
+    writer, release = _stalled_writer(tmp_path, monkeypatch)
+
+    pending = [asyncio.create_task(writer.asubmit({"i": i})) for i in (2, 3)]
+    await asyncio.sleep(0.05)  # the loop keeps running while both records wait for room
+    assert not any(task.done() for task in pending)
+
+    release.set()
+    await asyncio.gather(*pending)
+    writer.close()
+
+    assert sorted(r["i"] for r in _lines(writer.path)) == [0, 1, 2, 3]
+
+
+def test_rotation_keeps_backup_count_files(tmp_path):
+    path = tmp_path / "usage.jsonl"
+    writer = UsageLogWriter(path, batch_size=1, max_bytes=40, backup_count=2)
+
+    for i in range(6):
+        writer.submit({"record": i, "pad": "x" * 10})
+        writer.flush()
+    writer.close()
+
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["usage.jsonl", "usage.jsonl.1", "usage.jsonl.2"]
+    assert _lines(path) == [{"record": 5, "pad": "x" * 10}]
+    assert _lines(tmp_path / "usage.jsonl.1") == [{"record": 4, "pad": "x" * 10}]
+    assert _lines(tmp_path / "usage.jsonl.2") == [{"record": 3, "pad": "x" * 10}]
+
+
+def test_writer_is_shared_per_path(tmp_path):
+    assert get_usage_log_writer(tmp_path / "a.jsonl") is get_usage_log_writer(tmp_path / "." / "a.jsonl")
+    assert get_usage_log_writer(tmp_path / "a.jsonl") is not get_usage_log_writer(tmp_path / "b.jsonl")
@@ -0,0 +1,146 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+from aiohttp import web
+
+from autoppia_iwa.src.llms import http_client
+from autoppia_iwa.src.llms.http_client import PooledHTTPClient, aclose_llm_clients
+from autoppia_iwa.src.llms.interfaces import LLMConfig
+from autoppia_iwa.src.llms.providers.local import LocalLLMService
+
+
+@pytest.fixture
+async def echo_server():
+    peers: list[tuple] = []
+
+    async def generate(request: web.Request) -> web.Response:
+        peers.append(request.transport.get_extra_info("peername"))
+        body = await request.json()
+        return web.json_response({"output": body["messages"][-1]["content"]})
+
+    app = web.Application()
+    app.router.add_post("/generate", generate)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    yield f"http://127.0.0.1:{port}/generate", peers
+    await runner.cleanup()
+
+
+@pytest.mark.asyncio
+async def test_async_predict_reuses_one_keepalive_connection(echo_server):
+    url, peers = echo_server
+    service = LocalLLMService(LLMConfig(model="local"), endpoint_url=url)
+
+    outputs = [await service.async_predict([{"role": "user", "content": f"msg {i}"}]) for i in range(3)]
+
+    assert outputs == ["msg 0", "msg 1", "msg 2"]
+    assert len(peers) == 3
+    assert len(set(peers)) == 1
+
+    client = service._http.async_client
+    await aclose_llm_clients()
+    assert client.is_closed
+    assert service._http._async_client is None
+
+
+@pytest.mark.asyncio
+async def test_sync_predict_reuses_client(echo_server):
+    url, peers = echo_server
+    service = LocalLLMService(LLMConfig(model="local"), endpoint_url=url)
+
+    assert await asyncio.to_thread(service.predict, [{"role": "user", "content": "a"}]) == "a"
+    assert await asyncio.to_thread(service.predict, [{"role": "user", "content": "b"}]) == "b"
+
+    assert len(set(peers)) == 1
+    await service.aclose()
+    assert service._http._sync_client is None
+
+
+def test_async_client_is_rebuilt_for_a_new_event_loop():
+    pool = PooledHTTPClient()
+
+    async def grab():
+        return pool.async_client
+
+    first = asyncio.run(grab())
+    second = asyncio.run(grab())
+
+    assert first is not second
+
+
+@pytest.fixture
+def keepalive_server():
+    disconnected = threading.Event()
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_GET(self):
+            self.send_response(200)
+            self.send_header("Content-Length", "2")
+            self.end_headers()
+            self.wfile.write(b"ok")
+
+        def finish(self):
+            super().finish()
+            disconnected.set()
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}/", disconnected
+    server.shutdown()
+    server.server_close()
+
+
+def test_stale_client_of_a_finished_loop_releases_its_connections(keepalive_server):
+    url, disconnected = keepalive_server
+    pool = PooledHTTPClient()
+
+    async def fetch():
+        return (await pool.async_client.get(url)).text
+
+    assert asyncio.run(fetch()) == "ok"
+    assert not disconnected.is_set()
+
+    assert asyncio.run(fetch()) == "ok"
+
+    assert disconnected.wait(5)
+
+
+def test_stale_client_of_a_running_loop_is_closed_on_that_loop():
+    pool = PooledHTTPClient()
+    loop = asyncio.new_event_loop()
+    thread = threading.Thread(target=loop.run_forever, daemon=True)
+    thread.start()
+    try:
+        first = asyncio.run_coroutine_threadsafe(_grab(pool), loop).result(5)
+
+        asyncio.run(_grab(pool))
+        asyncio.run_coroutine_threadsafe(asyncio.sleep(0.05), loop).result(5)
+
+        assert first.is_closed
+    finally:
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join(5)
+        loop.close()
+
+
+async def _grab(pool: PooledHTTPClient):
+    return pool.async_client
+
+
+def test_http2_falls_back_when_h2_is_missing(monkeypatch):
+    monkeypatch.setattr(http_client, "http2_available", lambda: False)
+
+    assert PooledHTTPClient(http2=True).http2 is False
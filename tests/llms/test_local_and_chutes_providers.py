@@ -15,10 +15,8 @@ def test_local_prepare_payload_and_predict_return_raw(monkeypatch):
     response.json.return_value = {"output": "hello", "meta": {"ok": True}}
     client = Mock()
     client.post.return_value = response
-    httpx_client = Mock()
-    httpx_client.__enter__ = Mock(return_value=client)
-    httpx_client.__exit__ = Mock(return_value=None)
-    monkeypatch.setattr("autoppia_iwa.src.llms.providers.local.httpx.Client", Mock(return_value=httpx_client))
+    client.is_closed = False
+    monkeypatch.setattr("autoppia_iwa.src.llms.http_client.httpx.Client", Mock(return_value=client))
 
     service = LocalLLMService(LLMConfig(model="local"), endpoint_url="http://localhost/generate")
 
@@ -35,10 +33,8 @@ async def test_local_async_predict_returns_output(monkeypatch):
     response.json.return_value = {"output": "async hello"}
     client = Mock()
     client.post = AsyncMock(return_value=response)
-    async_ctx = Mock()
-    async_ctx.__aenter__ = AsyncMock(return_value=client)
-    async_ctx.__aexit__ = AsyncMock(return_value=None)
-    monkeypatch.setattr("autoppia_iwa.src.llms.providers.local.httpx.AsyncClient", Mock(return_value=async_ctx))
+    client.is_closed = False
+    monkeypatch.setattr("autoppia_iwa.src.llms.http_client.httpx.AsyncClient", Mock(return_value=client))
 
     service = LocalLLMService(LLMConfig(model="local"), endpoint_url="http://localhost/generate")
 
@@ -69,10 +65,8 @@ def test_chutes_predict_uses_httpx_response(monkeypatch):
     response.json.return_value = {"choices": [{"message": {"content": "hello"}}]}
     client = Mock()
     client.post.return_value = response
-    httpx_client = Mock()
-    httpx_client.__enter__ = Mock(return_value=client)
-    httpx_client.__exit__ = Mock(return_value=None)
-    monkeypatch.setattr("autoppia_iwa.src.llms.providers.chutes.httpx.Client", Mock(return_value=httpx_client))
+    client.is_closed = False
+    monkeypatch.setattr("autoppia_iwa.src.llms.http_client.httpx.Client", Mock(return_value=client))
 
     service = ChutesLLMService(LLMConfig(model="m"), base_url="https://x.chutes.ai/v1", api_key="key")
 
@@ -86,10 +80,8 @@ async def test_chutes_async_predict_return_raw(monkeypatch):
     response.json.return_value = {"choices": [{"message": {"content": "hello"}}], "usage": {"prompt_tokens": 1}}
     client = Mock()
     client.post = AsyncMock(return_value=response)
-    async_ctx = Mock()
-    async_ctx.__aenter__ = AsyncMock(return_value=client)
-    async_ctx.__aexit__ = AsyncMock(return_value=None)
-    monkeypatch.setattr("autoppia_iwa.src.llms.providers.chutes.httpx.AsyncClient", Mock(return_value=async_ctx))
+    client.is_closed = False
+    monkeypatch.setattr("autoppia_iwa.src.llms.http_client.httpx.AsyncClient", Mock(return_value=client))
 
     service = ChutesLLMService(LLMConfig(model="m"), base_url="https://x.chutes.ai/v1", api_key="key")
 
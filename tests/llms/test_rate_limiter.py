@@ -0,0 +1,117 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from autoppia_iwa.src.llms import rate_limiter as rate_limiter_module
+from autoppia_iwa.src.llms.rate_limiter import LLMRateLimiter, configure_llm_rate_limiter, estimate_tokens, get_llm_rate_limiter, retry_after_seconds
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+        self.sleeps: list[float] = []
+
+    def __call__(self) -> float:
+        return self.now
+
+    async def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+def _limiter(clock: FakeClock, **limits) -> LLMRateLimiter:
+    return LLMRateLimiter(clock=clock, sleep=clock.sleep, **limits)
+
+
+@pytest.mark.asyncio
+async def test_disabled_limiter_never_waits():
+    clock = FakeClock()
+    limiter = _limiter(clock)
+    for _ in range(100):
+        assert await limiter.acquire(10_000) == 0.0
+    assert clock.sleeps == []
+    assert limiter.enabled is False
+
+
+@pytest.mark.asyncio
+async def test_requests_per_minute_spaces_requests_after_burst():
+    clock = FakeClock()
+    limiter = _limiter(clock, requests_per_minute=60)
+
+    for _ in range(60):
+        await limiter.acquire()
+    assert clock.now == 0.0
+
+    await limiter.acquire()
+    assert clock.now == pytest.approx(1.0)
+
+
+@pytest.mark.asyncio
+async def test_tokens_per_minute_waits_for_refill():
+    clock = FakeClock()
+    limiter = _limiter(clock, tokens_per_minute=600)
+
+    await limiter.acquire(500)
+    waited = await limiter.acquire(200)
+
+    # 100 tokens left, 100 more needed at 10 tokens/s.
+    assert waited == pytest.approx(10.0)
+
+
+@pytest.mark.asyncio
+async def test_oversized_request_is_capped_to_bucket_capacity():
+    clock = FakeClock()
+    limiter = _limiter(clock, tokens_per_minute=100)
+
+    await limiter.acquire(1_000)
+    waited = await limiter.acquire(1_000)
+
+    assert waited == pytest.approx(60.0)
+
+
+@pytest.mark.asyncio
+async def test_pause_blocks_every_caller():
+    clock = FakeClock()
+    limiter = _limiter(clock)
+
+    limiter.pause(2.5)
+    assert limiter.enabled is True
+    assert await limiter.acquire() == pytest.approx(2.5)
+    assert limiter.enabled is False
+
+
+@pytest.mark.asyncio
+async def test_concurrent_acquires_are_served_in_order():
+    limiter = LLMRateLimiter(requests_per_minute=600)
+    for _ in range(600):
+        await limiter.acquire()
+
+    order: list[int] = []
+
+    async def acquire(index: int) -> None:
+        await limiter.acquire()
+        order.append(index)
+
+    await asyncio.gather(*(acquire(i) for i in range(3)))
+    assert order == [0, 1, 2]
+
+
+def test_estimate_tokens_counts_prompt_and_completion_budget():
+    messages = [{"role": "system", "content": "a" * 40}, {"role": "user", "content": "b" * 40}]
+    assert estimate_tokens(messages, max_tokens=100) == 120
+
+
+def test_retry_after_seconds_parses_headers():
+    assert retry_after_seconds({"retry-after": "3"}) == 3.0
+    assert retry_after_seconds({"retry-after-ms": "250"}) == 0.25
+    assert retry_after_seconds({"retry-after": "Wed, 21 Oct 2015 07:28:00 GMT"}) is None
+    assert retry_after_seconds(None) is None
+
+
+def test_configure_replaces_shared_limiter(monkeypatch):
+    monkeypatch.setattr(rate_limiter_module, "_shared_rate_limiter", rate_limiter_module._shared_rate_limiter)
+    limiter = configure_llm_rate_limiter(requests_per_minute=30)
+    assert get_llm_rate_limiter() is limiter
+    assert limiter.enabled is True
@@ -0,0 +1,191 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+from pathlib import Path
+
+import pytest
+
+from autoppia_iwa.src.llms import response_cache as response_cache_module
+from autoppia_iwa.src.llms.interfaces import ILLM, LLMConfig
+from autoppia_iwa.src.llms.response_cache import CachedLLM, LLMCacheMissError, LLMResponseCache, maybe_cache_llm, request_fingerprint
+
+MESSAGES = [{"role": "system", "content": "You write tasks."}, {"role": "user", "content": "Generate one task."}]
+
+
+class CountingLLM(ILLM):
+    def __init__(self) -> None:
+        self.config = LLMConfig(model="m", temperature=0.5, max_tokens=64)
+        self.calls = 0
+
+    def predict(self, messages, json_format=False, schema=None, return_raw=False, temperature=None):
+        self.calls += 1
+        if return_raw:
+            return {"output": f"answer {self.calls}", "usage": {"prompt_tokens": 11, "completion_tokens": 7}}
+        return f"answer {self.calls}"
+
+    async def async_predict(self, messages, json_format=False, schema=None, return_raw=False, temperature=None):
+        await asyncio.sleep(0.01)
+        return self.predict(messages, json_format, schema, return_raw, temperature)
+
+
+def _cached(tmp_path: Path, mode: str = "write_through", llm: ILLM | None = None, **cache_kwargs) -> CachedLLM:
+    return CachedLLM(llm or CountingLLM(), LLMResponseCache(tmp_path / "llm.sqlite3", **cache_kwargs), mode=mode)
+
+
+def test_fingerprint_ignores_key_order():
+    assert request_fingerprint({"a": 1, "b": [{"x": 1, "y": 2}]}) == request_fingerprint({"b": [{"y": 2, "x": 1}], "a": 1})
+    assert request_fingerprint({"a": 1}) != request_fingerprint({"a": 2})
+
+
+async def test_write_through_serves_repeats_from_cache(tmp_path):
+    llm = _cached(tmp_path)
+
+    assert await llm.async_predict(MESSAGES) == "answer 1"
+    assert await llm.async_predict(MESSAGES) == "answer 1"
+    assert llm.predict(MESSAGES) == "answer 1"
+    assert await llm.async_predict(MESSAGES, temperature=0.9) == "answer 2"
+
+    assert llm.llm.calls == 2
+    assert llm.metrics.hits == 2
+    assert llm.metrics.misses == 2
+    assert llm.metrics.saved_prompt_tokens > 0
+
+
+async def test_raw_responses_keep_their_usage(tmp_path):
+    llm = _cached(tmp_path)
+
+    first = await llm.async_predict(MESSAGES, return_raw=True)
+    second = await llm.async_predict(MESSAGES, return_raw=True)
+
+    assert second == first
+    assert llm.metrics.saved_prompt_tokens == 11
+    assert llm.metrics.saved_completion_tokens == 7
+
+
+async def test_offline_replays_previous_run_and_fails_on_miss(tmp_path):
+    await _cached(tmp_path).async_predict(MESSAGES)
+
+    offline = _cached(tmp_path, mode="offline")
+    assert await offline.async_predict(MESSAGES) == "answer 1"
+    with pytest.raises(LLMCacheMissError):
+        await offline.async_predict([{"role": "user", "content": "never asked"}])
+    assert offline.llm.calls == 0
+
+
+async def test_read_only_does_not_store_and_refresh_overwrites(tmp_path):
+    read_only = _cached(tmp_path, mode="read_only")
+    await read_only.async_predict(MESSAGES)
+    assert len(read_only.cache) == 0
+
+    await _cached(tmp_path).async_predict(MESSAGES)
+    refresh = _cached(tmp_path, mode="refresh", llm=CountingLLM())
+    refresh.llm.calls = 41
+    assert await refresh.async_predict(MESSAGES) == "answer 42"
+    assert await _cached(tmp_path).async_predict(MESSAGES) == "answer 42"
+
+
+async def test_expired_entries_are_misses(tmp_path, monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(response_cache_module.time, "time", lambda: now[0])
+    llm = _cached(tmp_path, ttl_s=60)
+
+    await llm.async_predict(MESSAGES)
+    now[0] += 61
+    assert await llm.async_predict(MESSAGES) == "answer 2"
+    assert llm.metrics.expired == 1
+
+
+def test_size_cap_evicts_least_recently_used(tmp_path, monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(response_cache_module.time, "time", lambda: now[0])
+    # Each entry is ~23 bytes: room for three
+    llm = _cached(tmp_path, max_bytes=70)
+
+    for prompt in ("a", "b", "c"):
+        now[0] += 1
+        llm.predict([{"role": "user", "content": prompt}])
+    now[0] += 1
+    llm.predict([{"role": "user", "content": "a"}])  # hit, "b" is now the oldest
+    now[0] += 1
+    llm.predict([{"role": "user", "content": "d"}])
+
+    assert llm.cache.size_bytes <= 70
+    assert llm.metrics.evictions == 1
+    calls = llm.llm.calls
+    llm.predict([{"role": "user", "content": "a"}])
+    assert llm.llm.calls == calls
+    llm.predict([{"role": "user", "content": "b"}])
+    assert llm.llm.calls == calls + 1
+
+
+async def test_concurrent_identical_requests_share_one_call(tmp_path):
+    llm = _cached(tmp_path)
+
+    results = await asyncio.gather(*(llm.async_predict(MESSAGES) for _ in range(5)))
+
+    assert results == ["answer 1"] * 5
+    assert llm.llm.calls == 1
+    assert llm.metrics.coalesced == 4
+
+
+async def test_cancelling_the_first_caller_does_not_cancel_coalesced_callers(tmp_path):
+    llm = _cached(tmp_path)
+    first = asyncio.create_task(llm.async_predict(MESSAGES))
+    await asyncio.sleep(0)
+    second = asyncio.create_task(llm.async_predict(MESSAGES))
+    await asyncio.sleep(0)
+
+    first.cancel()
+
+    assert await second == "answer 1"
+    assert first.cancelled()
+    assert llm.llm.calls == 1
+    assert llm.metrics.coalesced == 1
+
+
+async def test_refresh_calls_do_not_join_each_other(tmp_path):
+    llm = _cached(tmp_path, mode="refresh")
+
+    results = await asyncio.gather(*(llm.async_predict(MESSAGES) for _ in range(3)))
+
+    assert sorted(results) == ["answer 1", "answer 2", "answer 3"]
+    assert llm.metrics.coalesced == 0
+
+
+def test_maybe_cache_llm_off_returns_provider(tmp_path):
+    provider = CountingLLM()
+    assert maybe_cache_llm(provider, mode="off") is provider
+    assert isinstance(maybe_cache_llm(provider, mode="offline", path=tmp_path / "x.sqlite3"), CachedLLM)
+    with pytest.raises(ValueError):
+        maybe_cache_llm(provider, mode="sometimes", path=tmp_path / "x.sqlite3")
+
+
+async def test_closing_llm_clients_logs_the_cache_summary(tmp_path, monkeypatch):
+    from autoppia_iwa.src.llms.http_client import aclose_llm_clients
+
+    llm = _cached(tmp_path)
+    await llm.async_predict(MESSAGES)
+    await llm.async_predict(MESSAGES)
+    lines: list[str] = []
+    monkeypatch.setattr(response_cache_module.logger, "info", lines.append)
+
+    await aclose_llm_clients()
+
+    assert any("LLM cache (write_through): 1/2 hits" in line for line in lines)
+
+
+def test_metrics_updates_from_threads_are_not_lost(tmp_path):
+    metrics = _cached(tmp_path).metrics
+
+    def bump() -> None:
+        for _ in range(2000):
+            metrics.add(hits=1, saved_prompt_tokens=3)
+
+    threads = [threading.Thread(target=bump) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert (metrics.hits, metrics.saved_prompt_tokens) == (16000, 48000)
@@ -74,3 +74,21 @@ def test_resolve_trace_dir_accepts_safe_relative_alias(monkeypatch, tmp_path):
     (trace_dir / "trace_index.json").write_text("{}", encoding="utf-8")
 
     assert server._resolve_trace_dir("./benchmark-output/traces/run_1") == trace_dir
+
+
+def test_load_episode_reads_streamed_trace_with_blobs(tmp_path):
+    from autoppia_iwa.src.evaluation.benchmark.trace_writer import TraceWriter
+
+    writer = TraceWriter(tmp_path, run_metadata={"project": "autocinema"})
+    episode = writer.start_episode(episode_task_id="ep-1", task_id="task-1", use_case="UC")
+    episode.record_step(0, before_html="<div>a</div>", after_html="<div>b</div>", actions=[{"type": "click"}])
+    episode.close(success=True, score=1.0, total_steps=1, evaluation_time=0.5)
+    writer.flush()
+
+    bundle = server._load_trace_bundle(tmp_path)
+    payload = server._load_episode(tmp_path, "ep-1")
+
+    assert bundle["episodes"][0]["task_seconds"] == 0.5
+    assert payload["steps"][0]["before"]["html"] == "<div>a</div>"
+    assert "<div>b</div>" in payload["steps"][0]["diffs"]["html"]
+    assert payload["step_summaries"][0]["action_types"] == ["click"]
@@ -0,0 +1,74 @@
+"""Unit tests for the per-phase span profiler."""
+
+import pytest
+
+from autoppia_iwa.src.shared.profiling import PHASE_ACTION_EXECUTION, PHASE_DB_RESET, PhaseProfiler, StreamingHistogram
+
+
+class TestStreamingHistogram:
+    def test_quantiles_within_relative_accuracy(self):
+        histogram = StreamingHistogram()
+        values = [i / 1000 for i in range(1, 1001)]
+        for value in values:
+            histogram.add(value)
+
+        assert histogram.count == 1000
+        assert histogram.quantile(0.5) == pytest.approx(0.5, rel=0.02)
+        assert histogram.quantile(0.9) == pytest.approx(0.9, rel=0.02)
+        assert histogram.quantile(0.99) == pytest.approx(0.99, rel=0.02)
+        assert histogram.summary()["max_s"] == 1.0
+
+    def test_merge_matches_single_histogram(self):
+        combined, left, right = StreamingHistogram(), StreamingHistogram(), StreamingHistogram()
+        for i in range(1, 201):
+            combined.add(i / 100)
+            (left if i % 2 else right).add(i / 100)
+
+        left.merge(StreamingHistogram.from_state(right.to_state()))
+
+        assert left.summary() == combined.summary()
+
+    def test_empty_histogram_summary(self):
+        assert StreamingHistogram().summary()["p99_s"] == 0.0
+
+
+class TestPhaseProfiler:
+    def test_span_records_phase_and_action_type(self):
+        profiler = PhaseProfiler()
+        with profiler.span(PHASE_ACTION_EXECUTION, action_type="ClickAction"):
+            pass
+        profiler.record(PHASE_DB_RESET, 0.25)
+
+        report = profiler.as_dict()
+        assert report["phases"][PHASE_ACTION_EXECUTION]["count"] == 1
+        assert report["phases"][PHASE_DB_RESET]["p50_s"] == pytest.approx(0.25, rel=0.01)
+        assert list(report["action_types"]) == ["ClickAction"]
+
+    def test_span_records_when_block_raises(self):
+        profiler = PhaseProfiler()
+        with pytest.raises(RuntimeError), profiler.span(PHASE_DB_RESET):
+            raise RuntimeError("reset failed")
+
+        assert profiler.as_dict()["phases"][PHASE_DB_RESET]["count"] == 1
+
+    def test_disabled_profiler_is_a_shared_noop(self):
+        profiler = PhaseProfiler(enabled=False)
+        with profiler.span(PHASE_ACTION_EXECUTION, action_type="ClickAction"):
+            pass
+        profiler.record(PHASE_DB_RESET, 1.0)
+
+        assert profiler.span(PHASE_DB_RESET) is profiler.span(PHASE_ACTION_EXECUTION)
+        assert profiler.as_dict() == {"phases": {}, "action_types": {}}
+
+    def test_merge_state_combines_shards(self):
+        main, shard = PhaseProfiler(), PhaseProfiler()
+        main.record(PHASE_DB_RESET, 0.1)
+        shard.record(PHASE_DB_RESET, 0.3)
+        shard.record(PHASE_ACTION_EXECUTION, 0.2, action_type="TypeAction")
+
+        main.merge_state(shard.to_state())
+
+        report = main.as_dict()
+        assert report["phases"][PHASE_DB_RESET]["count"] == 2
+        assert report["phases"][PHASE_DB_RESET]["total_s"] == pytest.approx(0.4)
+        assert report["action_types"]["TypeAction"]["count"] == 1
@@ -0,0 +1,69 @@
+"""Unit tests for the per-key single-flight helper."""
+
+import asyncio
+
+import pytest
+
+from autoppia_iwa.src.shared.single_flight import SingleFlight
+
+
+def _gated_load(gate: asyncio.Event, calls: list, result="data"):
+    async def load():
+        calls.append(1)
+        await gate.wait()
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    return load
+
+
+@pytest.mark.asyncio
+async def test_cancelling_the_first_caller_does_not_cancel_the_others():
+    flights, gate, calls = SingleFlight(), asyncio.Event(), []
+    leader = asyncio.create_task(flights.run("k", _gated_load(gate, calls)))
+    await asyncio.sleep(0)
+    assert "k" in flights
+    follower = asyncio.create_task(flights.run("k", _gated_load(gate, calls)))
+    await asyncio.sleep(0)
+
+    leader.cancel()
+    await asyncio.sleep(0)
+    gate.set()
+
+    assert await follower == "data"
+    assert leader.cancelled()
+    assert calls == [1]
+    assert len(flights) == 0
+
+
+@pytest.mark.asyncio
+async def test_load_is_cancelled_when_every_caller_gave_up():
+    flights, gate, calls = SingleFlight(), asyncio.Event(), []
+    callers = [asyncio.create_task(flights.run("k", _gated_load(gate, calls))) for _ in range(2)]
+    await asyncio.sleep(0.01)
+
+    for caller in callers:
+        caller.cancel()
+    await asyncio.gather(*callers, return_exceptions=True)
+    await asyncio.sleep(0)
+
+    assert "k" not in flights
+    gate.set()
+    assert await flights.run("k", _gated_load(gate, calls)) == "data"
+    assert calls == [1, 1]
+
+
+@pytest.mark.asyncio
+async def test_failure_reaches_every_caller_and_is_retried():
+    flights, gate, calls = SingleFlight(), asyncio.Event(), []
+    callers = [asyncio.create_task(flights.run("k", _gated_load(gate, calls, result=ValueError("boom")))) for _ in range(3)]
+    await asyncio.sleep(0)
+    gate.set()
+
+    results = await asyncio.gather(*callers, return_exceptions=True)
+
+    assert all(isinstance(result, ValueError) for result in results)
+    assert calls == [1]
+    assert await flights.run("k", _gated_load(gate, calls)) == "data"
+    assert calls == [1, 1]
@@ -2,6 +2,7 @@
 
 from unittest.mock import patch
 
+from autoppia_iwa.src.shared import web_utils
 from autoppia_iwa.src.shared.web_utils import clean_html, generate_html_differences
 
 
@@ -78,6 +79,24 @@ class TestCleanHtml:
         with patch("autoppia_iwa.src.shared.web_utils.BeautifulSoup", return_value=_BrokenDoc()):
             assert clean_html("<p>x</p>") == ""
 
+    def test_empty_leaves_removed_but_their_parents_kept(self):
+        html = "<html><body><div><span> </span><img src='a.png'></div><section><p>kept</p><b></b></section></body></html>"
+        result = clean_html(html)
+        assert "<div>" in result
+        assert "span" not in result and "img" not in result and "<b>" not in result
+        assert "kept" in result
+
+    def test_memoizes_by_content(self):
+        html = "<html><body><p>memo</p></body></html>"
+        first = clean_html(html)
+        with patch("autoppia_iwa.src.shared.web_utils.BeautifulSoup", side_effect=AssertionError("parsed again")):
+            assert clean_html(html) == first
+        assert len(web_utils._CLEAN_HTML_CACHE) <= web_utils._CLEAN_HTML_CACHE_SIZE
+
+    def test_unknown_parser_falls_back_to_html_parser(self):
+        html = "<html><body><p>fallback</p></body></html>"
+        assert clean_html(html, parser="no-such-parser") == clean_html(html)
+
 
 class TestGenerateHtmlDifferences:
     """Tests for generate_html_differences()."""
@@ -1,9 +1,11 @@
 """Tests for ApifiedWebAgent (iterative /step endpoint agent)."""
 
+import asyncio
 import json
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
+from aiohttp import web
 
 from autoppia_iwa.src.data_generation.tasks.classes import Task
 from autoppia_iwa.src.execution.actions.actions import GoBackAction, NavigateAction, RequestUserInputAction, TypeAction
@@ -431,3 +433,48 @@ class TestStep:
                 step_index=0,
             )
         assert result == []
+
+    @pytest.mark.asyncio
+    async def test_steps_share_one_keepalive_connection_until_aclose(self):
+        peers = []
+
+        async def step_handler(request):
+            peers.append(request.transport.get_extra_info("peername"))
+            return web.json_response({"actions": [{"type": "ClickAction", "x": 1, "y": 2}]})
+
+        app = web.Application()
+        app.router.add_post("/step", step_handler)
+        runner = web.AppRunner(app)
+        await runner.setup()
+        site = web.TCPSite(runner, "127.0.0.1", 0)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]
+        agent = ApifiedWebAgent(base_url=f"http://127.0.0.1:{port}")
+        task = Task(url="https://example.com", prompt="P", web_project_id="dummy")
+        try:
+            for step_index in range(3):
+                assert len(await agent.step(task=task, html="", url="http://localhost:8000/", step_index=step_index)) == 1
+            session = agent._session
+            await agent.aclose()
+        finally:
+            await runner.cleanup()
+
+        assert len(peers) == 3
+        assert len(set(peers)) == 1
+        assert session.closed
+        assert agent._session is None
+
+    def test_session_of_a_finished_event_loop_is_released(self):
+        agent = ApifiedWebAgent(base_url="http://127.0.0.1:1")
+
+        async def _session():
+            return agent._get_session()
+
+        first = asyncio.run(_session())
+        connector = first.connector
+        second = asyncio.run(_session())
+        agent._release_stale_session(second, None)
+
+        assert second is not first
+        assert first.closed
+        assert connector.closed